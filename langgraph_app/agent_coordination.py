@@ -9,6 +9,64 @@ import json
 
 logger = logging.getLogger(__name__)
 
+# Style-profile lookup tables, built once at import
+STRUCTURE_TYPES = {
+    'phd_academic': 'research_paper',
+    'technical_dive': 'technical_analysis',
+    'business_professional': 'executive_brief',
+    'popular_science': 'narrative_explanation',
+    'startup_storytelling': 'problem_solution_story'
+}
+
+RESEARCH_DEPTH = {
+    'phd_academic': 'deep',
+    'technical_dive': 'expert',
+    'business_professional': 'strategic',
+    'popular_science': 'accessible'
+}
+
+GENERIC_PHRASES = {
+    'phd_academic': (
+        'hey there', 'hi there', 'what\'s up', 'greetings',
+        'let\'s dive in', 'buckle up', 'hang tight',
+        'awesome', 'cool', 'neat', 'sweet',
+        'trust me', 'believe me', 'take my word'
+    ),
+    'technical_dive': (
+        'hey there', 'what\'s up', 'awesome sauce',
+        'super cool', 'mind-blowing', 'crazy good'
+    ),
+    'business_professional': (
+        'hey there', 'what\'s up', 'awesome',
+        'super', 'totally', 'really really'
+    )
+}
+
+REQUIRED_ELEMENTS = {
+    'phd_academic': (
+        'clear thesis statement',
+        'evidence-based arguments',
+        'logical progression',
+        'scholarly tone',
+        'analytical depth'
+    ),
+    'technical_dive': (
+        'technical precision',
+        'practical examples',
+        'implementation details',
+        'best practices',
+        'troubleshooting insights'
+    ),
+    'business_professional': (
+        'executive summary mindset',
+        'strategic implications',
+        'actionable insights',
+        'professional tone',
+        'clear recommendations'
+    )
+}
+
+
 @dataclass
 class AgentContext:
     """Rich context passed between agents"""
@@ -86,12 +144,7 @@ class AgentCoordinator:
             context.writing_requirements['unique_angles'] = planning_output.get('unique_angles', [])
         
         # Set research depth based on style profile
-        research_depth = {
-            'phd_academic': 'deep',
-            'technical_dive': 'expert',
-            'business_professional': 'strategic',
-            'popular_science': 'accessible'
-        }.get(context.style_profile, 'moderate')
+        research_depth = RESEARCH_DEPTH.get(context.style_profile, 'moderate')
         
         context.writing_requirements['research_depth'] = research_depth
         return context
@@ -179,63 +232,15 @@ class AgentCoordinator:
     
     def _determine_structure_type(self, style_profile: str) -> str:
         """Determine content structure based on style profile"""
-        structure_map = {
-            'phd_academic': 'research_paper',
-            'technical_dive': 'technical_analysis',
-            'business_professional': 'executive_brief',
-            'popular_science': 'narrative_explanation',
-            'startup_storytelling': 'problem_solution_story'
-        }
-        return structure_map.get(style_profile, 'standard_article')
+        return STRUCTURE_TYPES.get(style_profile, 'standard_article')
     
     def _get_generic_phrases(self, style_profile: str) -> List[str]:
         """Get phrases to avoid for specific style profiles"""
-        generic_phrases = {
-            'phd_academic': [
-                'hey there', 'hi there', 'what\'s up', 'greetings',
-                'let\'s dive in', 'buckle up', 'hang tight',
-                'awesome', 'cool', 'neat', 'sweet',
-                'trust me', 'believe me', 'take my word'
-            ],
-            'technical_dive': [
-                'hey there', 'what\'s up', 'awesome sauce',
-                'super cool', 'mind-blowing', 'crazy good'
-            ],
-            'business_professional': [
-                'hey there', 'what\'s up', 'awesome',
-                'super', 'totally', 'really really'
-            ]
-        }
-        
-        return generic_phrases.get(style_profile, generic_phrases['phd_academic'])
+        return list(GENERIC_PHRASES.get(style_profile, GENERIC_PHRASES['phd_academic']))
     
     def _get_required_elements(self, style_profile: str) -> List[str]:
         """Get required elements for specific style profiles"""
-        required_elements = {
-            'phd_academic': [
-                'clear thesis statement',
-                'evidence-based arguments',
-                'logical progression',
-                'scholarly tone',
-                'analytical depth'
-            ],
-            'technical_dive': [
-                'technical precision',
-                'practical examples',
-                'implementation details',
-                'best practices',
-                'troubleshooting insights'
-            ],
-            'business_professional': [
-                'executive summary mindset',
-                'strategic implications',
-                'actionable insights',
-                'professional tone',
-                'clear recommendations'
-            ]
-        }
-        
-        return required_elements.get(style_profile, required_elements['phd_academic'])
+        return list(REQUIRED_ELEMENTS.get(style_profile, REQUIRED_ELEMENTS['phd_academic']))
     
     def create_enhanced_prompt(self, agent_name: str, context: AgentContext, base_prompt: str) -> str:
         """Create enhanced prompt with coordination context"""
@@ -305,11 +310,23 @@ ELIMINATE GENERIC CONTENT: Avoid cliché openings, overused transitions, and gen
         else:
             return "Output processed successfully"
 
+# Global coordinator instance (singleton pattern)
+_agent_coordinator: Optional[AgentCoordinator] = None
+
+
+def get_agent_coordinator() -> AgentCoordinator:
+    """Get or create global agent coordinator instance"""
+    global _agent_coordinator
+    if _agent_coordinator is None:
+        _agent_coordinator = AgentCoordinator()
+    return _agent_coordinator
+
+
 # Integration function for existing workflow
 def enhance_agent_with_coordination(agent_function, agent_name: str):
     """Decorator to enhance agents with coordination"""
     def wrapper(state: Dict[str, Any]) -> Dict[str, Any]:
-        coordinator = AgentCoordinator()
+        coordinator = get_agent_coordinator()
         
         # Create enhanced context
         context = coordinator.create_agent_context(state, agent_name)
@@ -331,4 +348,4 @@ def enhance_agent_with_coordination(agent_function, agent_name: str):
     return wrapper
 
 # Export for use in orchestration
-__all__ = ['AgentCoordinator', 'AgentContext', 'enhance_agent_with_coordination']
\ No newline at end of file
+__all__ = ['AgentCoordinator', 'AgentContext', 'get_agent_coordinator', 'enhance_agent_with_coordination']
\ No newline at end of file
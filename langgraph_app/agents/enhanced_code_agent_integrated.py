@@ -4,8 +4,11 @@ Enterprise Code Agent with LLM-driven code generation and validation.
 """
 
 import os
+import hashlib
 import logging
 import re
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
 
 from langchain_core.messages import SystemMessage, HumanMessage
@@ -13,10 +16,17 @@ from langchain_core.tools import tool
 
 from langgraph_app.core.state import EnrichedContentState, AgentType, ContentPhase
 from langgraph_app.core.types import CodeGenerationContext
+from langgraph_app.core.code_validation import check_code_syntax, get_code_validator
+from langgraph_app.core.coordination_bundles import config_version
 from langgraph_app.enhanced_model_registry import get_model_for_generation
 
 logger = logging.getLogger(__name__)
 
+# Enhanced content per (input, languages, configs, model, settings); only clean outputs are kept
+MAX_CACHED_ENHANCEMENTS = 64
+_enhancement_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_enhancement_lock = threading.Lock()
+
 
 @tool
 def validate_code_syntax(code: str, language: str) -> Dict[str, Any]:
@@ -29,38 +39,7 @@ def validate_code_syntax(code: str, language: str) -> Dict[str, Any]:
     Returns:
         Validation results
     """
-    issues = []
-    
-    if language.lower() == "python":
-        # Basic Python syntax checks
-        if "print(" in code and not code.strip().endswith(")"):
-            issues.append("Unclosed print statement")
-        
-        # Check indentation consistency
-        lines = code.split('\n')
-        indent_levels = set()
-        for line in lines:
-            if line.strip():
-                indent = len(line) - len(line.lstrip())
-                if indent > 0:
-                    indent_levels.add(indent % 4)
-        
-        if len(indent_levels) > 1:
-            issues.append("Inconsistent indentation detected")
-    
-    elif language.lower() == "javascript":
-        # Basic JS checks
-        if code.count('{') != code.count('}'):
-            issues.append("Mismatched braces")
-        
-        if code.count('(') != code.count(')'):
-            issues.append("Mismatched parentheses")
-    
-    return {
-        "is_valid": len(issues) == 0,
-        "issues": issues,
-        "language": language
-    }
+    return check_code_syntax(code, language)
 
 
 @tool
@@ -199,16 +178,35 @@ class EnhancedCodeAgent:
         code_context = self._create_code_context(state, template_config)
         state.code_generation = code_context
         
-        # LLM-driven code enhancement
-        enhanced_content = self._llm_enhance_with_code(
-            content,
-            code_context,
-            template_config,
-            state
-        )
-        
-        # Extract generated code
+        # LLM-driven code enhancement, skipped when this exact input was already enhanced cleanly
+        cache_key = self._enhancement_key(content, code_context, template_config, state)
+        with _enhancement_lock:
+            enhanced_content = _enhancement_cache.get(cache_key)
+        reused = enhanced_content is not None
+        if reused:
+            logger.info("♻️ CODE: Content unchanged, reusing validated code examples")
+        else:
+            enhanced_content = self._llm_enhance_with_code(
+                content,
+                code_context,
+                template_config,
+                state
+            )
+        
+        # Extract generated code and validate all blocks in parallel
         code_blocks = self._extract_code_blocks(enhanced_content)
+        validations = get_code_validator().validate_blocks(code_blocks)
+        for block, validation in zip(code_blocks, validations):
+            block['validation'] = validation
+        invalid_blocks = [cb for cb in code_blocks if cb['validation'].get('is_valid') is False]
+        timed_out_blocks = [cb for cb in code_blocks if cb['validation'].get('timed_out')]
+        if invalid_blocks:
+            logger.warning(f"⚠️ CODE: {len(invalid_blocks)} code blocks failed validation")
+        elif not reused and not timed_out_blocks:
+            with _enhancement_lock:
+                _enhancement_cache[cache_key] = enhanced_content
+                while len(_enhancement_cache) > MAX_CACHED_ENHANCEMENTS:
+                    _enhancement_cache.popitem(last=False)
         
         # Update state
         state.content = enhanced_content
@@ -218,6 +216,9 @@ class EnhancedCodeAgent:
         state.log_agent_execution(self.agent_type, {
             "status": "completed",
             "code_blocks_generated": len(code_blocks),
+            "invalid_code_blocks": len(invalid_blocks),
+            "validation_timeouts": len(timed_out_blocks),
+            "reused_cached_examples": reused,
             "languages": list(set(cb.get('language', 'text') for cb in code_blocks))
         })
         
@@ -267,6 +268,34 @@ class EnhancedCodeAgent:
             generation_confidence=0.85
         )
     
+    def _enhancement_key(
+        self,
+        content: str,
+        code_context: CodeGenerationContext,
+        template_config: Dict,
+        state: EnrichedContentState
+    ) -> bytes:
+        """Hash of everything that shapes the code enhancement: input, prompt configs, model and settings."""
+        
+        dyn = state.dynamic_parameters if isinstance(state.dynamic_parameters, dict) else {}
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (
+            content,
+            ",".join(code_context.programming_languages),
+            code_context.documentation_style,
+            self._select_model(),
+            config_version(template_config, state.style_config, dyn.get('generation_settings'))
+        ):
+            digest.update(part.encode('utf-8', 'surrogatepass'))
+            digest.update(b"\0")
+        return digest.digest()
+    
+    def _select_model(self) -> str:
+        return get_model_for_generation(
+            settings={},
+            mode="code_generation"
+        )
+    
     def _llm_enhance_with_code(
         self,
         content: str,
@@ -277,10 +306,7 @@ class EnhancedCodeAgent:
         """Use LLM to enhance content with code examples."""
         
         # Select model
-        model = get_model_for_generation(
-            settings={},
-            mode="code_generation"
-        )
+        model = self._select_model()
         
         # Bind tools
         model_with_tools = model.bind_tools(self.tools)
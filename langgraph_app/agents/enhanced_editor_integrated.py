@@ -10,8 +10,12 @@ import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from langgraph_app.core.circuit_breaker import get_circuit_breaker
+from langgraph_app.core.tool_prepass import run_tools_locally, format_tool_results
+from langgraph_app.core.text_stats import get_text_stats
+from langgraph_app.core.ai_tells import get_forbidden_matcher, get_tell_matcher
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.tools import tool
@@ -22,6 +26,17 @@ from langgraph_app.enhanced_model_registry import get_model, get_model_for_gener
 
 logger = logging.getLogger(__name__)
 
+# Drafts at least this long are edited section by section
+EDIT_CHUNK_MIN_WORDS = int(os.getenv("EDITOR_CHUNK_MIN_WORDS", "800"))
+EDIT_CHUNK_CONCURRENCY = int(os.getenv("EDITOR_CHUNK_CONCURRENCY", "4"))
+# Sections longer than this are split further at paragraph breaks
+EDIT_CHUNK_MAX_WORDS = 900
+# Readability alone sends a section to the LLM only below this Flesch score;
+# technical sections routinely score under the whole-article minimum
+EDIT_SECTION_MIN_READABILITY = float(os.getenv("EDITOR_SECTION_MIN_READABILITY", "30"))
+
+_HEADING_LINE = re.compile(r"^#{1,6}\s", re.M)
+
 
 # Tool definitions for Editor agent
 @tool
@@ -61,20 +76,12 @@ def analyze_readability(text: str) -> Dict[str, Any]:
     Returns:
         Readability scores and recommendations
     """
-    words = text.split()
-    sentences = re.split(r'[.!?]+', text)
-    
-    avg_word_length = sum(len(w) for w in words) / max(len(words), 1)
-    avg_sentence_length = len(words) / max(len(sentences), 1)
-    
-    # Flesch Reading Ease approximation
-    syllables = sum(len(re.findall(r'[aeiouy]+', word)) for word in words)
-    avg_syllables = syllables / max(len(words), 1)
-    
-    score = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables
+    stats = get_text_stats(text)
+    avg_word_length = stats.avg_word_length
+    avg_sentence_length = stats.avg_sentence_length
     
     return {
-        "flesch_score": max(0, min(100, score)),
+        "flesch_score": stats.flesch_score,
         "avg_word_length": round(avg_word_length, 2),
         "avg_sentence_length": round(avg_sentence_length, 2),
         "recommendations": [
@@ -94,27 +101,15 @@ def detect_ai_tells(text: str) -> Dict[str, Any]:
     Returns:
         List of detected AI tells and replacements
     """
-    ai_tells = {
-        r'\bdelve\b': 'examine',
-        r'\bdelving\b': 'examining',
-        r'\bshowcase\b': 'demonstrate',
-        r'\bleverage\b': 'use',
-        r'\bin conclusion\b': 'finally',
-        r'\bin summary\b': 'overall',
-        r'\bit\'s important to note\b': 'notably',
-        r'\bit should be noted\b': 'note that'
-    }
-    
-    detected = []
-    for pattern, replacement in ai_tells.items():
-        matches = re.findall(pattern, text, re.I)
-        if matches:
-            detected.append({
-                "pattern": pattern,
-                "found": matches[0],
-                "replacement": replacement,
-                "count": len(matches)
-            })
+    detected = [
+        {
+            "pattern": hit.phrase,
+            "found": hit.found,
+            "replacement": hit.replacement,
+            "count": hit.count
+        }
+        for hit in get_tell_matcher().scan(text)
+    ]
     
     return {
         "total_ai_tells": len(detected),
@@ -123,11 +118,46 @@ def detect_ai_tells(text: str) -> Dict[str, Any]:
     }
 
 
+def split_sections(content: str) -> List[str]:
+    """
+    Split Markdown into heading-led sections whose concatenation is the input.
+
+    Headings inside fenced code blocks are ignored. Sections over
+    EDIT_CHUNK_MAX_WORDS are split again at blank lines.
+    """
+    starts = [0]
+    in_fence = False
+    offset = 0
+    for line in content.splitlines(keepends=True):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and offset > 0 and _HEADING_LINE.match(line):
+            starts.append(offset)
+        offset += len(line)
+    starts.append(len(content))
+
+    sections = []
+    for start, end in zip(starts, starts[1:]):
+        section = content[start:end]
+        if len(section.split()) <= EDIT_CHUNK_MAX_WORDS or "```" in section:
+            sections.append(section)
+            continue
+        # Long section: cut at paragraph breaks into roughly equal pieces
+        piece_start, words = 0, 0
+        for match in re.finditer(r"\n\s*\n", section):
+            words = len(section[piece_start:match.end()].split())
+            if words >= EDIT_CHUNK_MAX_WORDS // 2:
+                sections.append(section[piece_start:match.end()])
+                piece_start = match.end()
+        sections.append(section[piece_start:])
+    return [section for section in sections if section]
+
+
 class EnhancedEditorAgent:
     """
     Enterprise Editor Agent with:
     - LLM-driven intelligent editing
-    - Tool use (grammar, readability, AI tell detection)
+    - Local tool pre-pass (grammar, readability, AI tell detection)
     - Self-refinement loop with quality validation
     - Dynamic model selection (OpenAI GPT-4o / Anthropic Claude Sonnet 4)
     """
@@ -256,6 +286,12 @@ class EnhancedEditorAgent:
 
         circuit_breaker = get_circuit_breaker()
 
+        # Long drafts: only sections that fail the local checks go to the LLM
+        if len(content.split()) >= EDIT_CHUNK_MIN_WORDS:
+            sections = split_sections(content)
+            if len(sections) > 1:
+                return self._chunked_edit(sections, template_config, style_config, context)
+
         # Select model based on complexity
         task_complexity = len(content.split()) / 1000  # Words in thousands
         generation_settings = context.get('generation_settings', {'max_tokens': 4000, 'temperature': 1.0})
@@ -275,8 +311,8 @@ class EnhancedEditorAgent:
             )
             return content, [{"tool": "passthrough", "result": "circuit_breaker_open"}]
 
-        # Bind tools to model
-        model_with_tools = model.bind_tools(self.tools)
+        # Tools run locally up front; the model gets their results, not tool schemas
+        analysis = self._local_checks(content, style_config)
 
         # Build editing prompts
         system_prompt = self._build_editing_system_prompt(
@@ -287,16 +323,18 @@ class EnhancedEditorAgent:
 
         user_prompt = f"""Edit the following content to improve quality, clarity, and alignment with requirements.
 
+    **Pre-computed Analysis:**
+    {format_tool_results(self._as_tool_results(analysis))}
+
     **Content to Edit:**
     {content}
 
     **Instructions:**
-    1. Use check_grammar tool to identify grammar issues
-    2. Use analyze_readability tool to assess readability
-    3. Use detect_ai_tells tool to find AI-generated markers
-    4. Apply intelligent edits based on tool results
-    5. Ensure research insights and key messages are integrated
-    6. Maintain template and style requirements
+    1. Fix the grammar issues reported by check_grammar
+    2. Address the readability recommendations from analyze_readability
+    3. Replace the AI-generated markers reported by detect_ai_tells
+    4. Ensure research insights and key messages are integrated
+    5. Maintain template and style requirements
 
     Provide the edited content with improvements applied."""
 
@@ -305,15 +343,36 @@ class EnhancedEditorAgent:
             HumanMessage(content=user_prompt)
         ]
 
+        response, error = self._invoke_with_retries(model, messages, provider)
+        if response is None:
+            # Return original content as fallback
+            return content, [{"tool": "error_fallback", "result": error}]
+
+        # Extract edited content
+        edited_content = response.content if hasattr(response, 'content') else content
+
+        # Re-run the checks on the edit so quality validation scores the output
+        tool_results = self._as_tool_results(self._local_checks(edited_content, style_config))
+
+        return edited_content, tool_results
+
+    def _invoke_with_retries(self, runnable, messages: List, provider: str) -> tuple[Any, Optional[str]]:
+        """
+        Invoke the model with circuit breaker recording and backoff.
+
+        Returns (response, None) on success, or (None, error) once retries
+        are exhausted or the error is not retryable.
+        """
+        circuit_breaker = get_circuit_breaker()
+
         # Retry loop with circuit breaker
         max_attempts = 3
         delays = [2.0, 5.0, 10.0]
 
         for attempt in range(max_attempts):
             try:
-                # Invoke with tools
                 logger.info(f"Editor invoking LLM (attempt {attempt + 1}/{max_attempts})...")
-                response = model_with_tools.invoke(messages)
+                response = runnable.invoke(messages)
 
                 # Success - record with circuit breaker
                 circuit_breaker.record_success(provider)
@@ -322,20 +381,7 @@ class EnhancedEditorAgent:
                 if attempt > 0:
                     logger.info(f"✅ Editor LLM call succeeded on retry {attempt + 1}/{max_attempts}")
 
-                # Extract tool calls
-                tool_results = []
-                if hasattr(response, 'tool_calls') and response.tool_calls:
-                    for tool_call in response.tool_calls:
-                        logger.info(f"🔧 Tool called: {tool_call['name']}")
-                        tool_results.append({
-                            "tool": tool_call['name'],
-                            "result": tool_call.get('args', {})
-                        })
-
-                # Extract edited content
-                edited_content = response.content if hasattr(response, 'content') else content
-
-                return edited_content, tool_results
+                return response, None
 
             except Exception as e:
                 error_str = str(e).lower()
@@ -364,13 +410,131 @@ class EnhancedEditorAgent:
                         f"❌ Editor LLM call failed after {max_attempts} attempts: {error_type} - {str(e)}"
                     )
                     logger.warning("Returning original content as fallback")
-
-                    # Return original content as fallback
-                    return content, [{"tool": "error_fallback", "result": str(e)}]
+                    return None, str(e)
 
         # Fallback (should not reach here, but for safety)
         logger.warning("Editor retry loop exhausted - returning original content")
-        return content, []
+        return None, "retries_exhausted"
+
+    def _local_checks(self, text: str, style_config: Dict) -> Dict[str, Any]:
+        """Run the editor tools locally on one piece of text"""
+        checks = {
+            entry["tool"]: entry.get("result", {})
+            for entry in run_tools_locally([(t, {"text": text}) for t in self.tools])
+        }
+        forbidden = [hit.phrase for hit in get_forbidden_matcher(style_config).scan(text)]
+        checks["forbidden_patterns"] = {"found": forbidden}
+        return checks
+
+    def _as_tool_results(self, checks: Dict[str, Any]) -> List[Dict]:
+        return [{"tool": name, "result": result} for name, result in checks.items()]
+
+    def _section_issues(self, section: str, style_config: Dict) -> List[str]:
+        """Problems the local checks find in a section; empty means leave it as is"""
+        if len(section.split()) < 40:
+            # Headings and short transitions: too little text to score
+            return []
+        checks = self._local_checks(section, style_config)
+        issues = list(checks["check_grammar"].get("suggestions", []))
+        for tell in checks["detect_ai_tells"].get("detected_patterns", []):
+            issues.append(f"AI tell \"{tell['found']}\" (prefer \"{tell['replacement']}\")")
+        for pattern in checks["forbidden_patterns"]["found"]:
+            issues.append(f"Forbidden pattern \"{pattern}\"")
+
+        # Readability is a note on sections already being edited; on its own it
+        # only counts when very low, and code blocks are not scored at all
+        if "```" not in section:
+            flesch = checks["analyze_readability"].get("flesch_score", 100)
+            threshold = self.min_readability if issues else EDIT_SECTION_MIN_READABILITY
+            if flesch < threshold:
+                issues.append(
+                    f"Readability {flesch:.0f} is below {threshold:.0f}: "
+                    + "; ".join(checks["analyze_readability"].get("recommendations", []))
+                )
+        return issues
+
+    def _chunked_edit(
+        self,
+        sections: List[str],
+        template_config: Dict,
+        style_config: Dict,
+        context: Dict
+    ) -> tuple[str, List[Dict]]:
+        """
+        Edit only the sections that fail local checks, concurrently.
+
+        Sections are merged back by position; clean sections and any section
+        whose edit fails are kept verbatim. Tool results are the local checks
+        on the merged text.
+        """
+        started = time.time()
+        flagged = {
+            idx: issues for idx, section in enumerate(sections)
+            if (issues := self._section_issues(section, style_config))
+        }
+
+        generation_settings = context.get('generation_settings', {'max_tokens': 4000, 'temperature': 1.0})
+        model = get_model("editor", generation_settings)
+        provider = "anthropic" if "claude" in str(model).lower() else "openai"
+
+        if flagged and not get_circuit_breaker().can_execute(provider):
+            logger.warning(f"⚠️ Circuit breaker OPEN for {provider} - returning content without LLM edits")
+            return "".join(sections), [{"tool": "passthrough", "result": "circuit_breaker_open"}]
+
+        edited = list(sections)
+        if flagged:
+            system_prompt = self._build_editing_system_prompt(template_config, style_config, context)
+            with ThreadPoolExecutor(
+                max_workers=min(EDIT_CHUNK_CONCURRENCY, len(flagged)), thread_name_prefix="editor-section"
+            ) as pool:
+                futures = {
+                    idx: pool.submit(self._edit_section, model, provider, system_prompt, sections[idx], issues)
+                    for idx, issues in flagged.items()
+                }
+                for idx, future in futures.items():
+                    edited[idx] = future.result()
+
+        merged = "".join(edited)
+        sent_words = sum(len(sections[idx].split()) for idx in flagged)
+        logger.info(
+            f"✅ Chunked edit: {len(flagged)}/{len(sections)} sections sent to LLM "
+            f"({sent_words}/{len(merged.split())} words) in {time.time() - started:.1f}s"
+        )
+
+        return merged, self._as_tool_results(self._local_checks(merged, style_config))
+
+    def _edit_section(self, model, provider: str, system_prompt: str, section: str, issues: List[str]) -> str:
+        """Edit one section; falls back to the original text on failure or a suspicious result"""
+        heading = section.lstrip().splitlines()[0] if _HEADING_LINE.match(section.lstrip()) else None
+        issue_lines = "\n".join(f"- {issue}" for issue in issues)
+
+        user_prompt = f"""Edit this section of a longer article. Fix the listed issues and tighten the prose; do not add new sections.
+
+    **Issues Found:**
+    {issue_lines}
+
+    **Content to Edit:**
+    {section.strip()}
+
+    **Instructions:**
+    Return ONLY the edited section{f', starting with the unchanged heading "{heading}"' if heading else ''}."""
+
+        response, _ = self._invoke_with_retries(
+            model, [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)], provider
+        )
+        content = getattr(response, 'content', None) if response is not None else None
+        # Anthropic may return a list of content blocks; keep the original then
+        if not isinstance(content, str):
+            return section
+        text = content.strip()
+        if len(text.split()) < len(section.split()) // 2:
+            return section
+        if heading and not text.startswith(heading):
+            text = f"{heading}\n\n{text}"
+
+        # Keep the original spacing between sections
+        trailing = section[len(section.rstrip()):]
+        return text + (trailing or "\n\n")
 
     def _build_editing_system_prompt(
         self,
@@ -416,7 +580,7 @@ class EnhancedEditorAgent:
         prompt += """
 
 **Critical Instructions:**
-1. Use available tools to analyze content quality
+1. Use the pre-computed tool analysis to target edits
 2. Apply data-driven edits based on tool feedback
 3. Maintain factual accuracy - never fabricate
 4. Preserve author's core arguments and evidence
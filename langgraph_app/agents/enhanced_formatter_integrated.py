@@ -15,6 +15,8 @@ from langchain_core.tools import tool
 from langgraph_app.core.state import EnrichedContentState, AgentType, ContentPhase
 from langgraph_app.core.types import FormattedContent, FormattingRequirements
 from langgraph_app.enhanced_model_registry import get_model, get_model_for_generation
+from langgraph_app.core.ai_tells import get_tell_matcher
+from langgraph_app.core.markdown_renderer import render_markdown
 
 logger = logging.getLogger(__name__)
 
@@ -23,34 +25,12 @@ logger = logging.getLogger(__name__)
 @tool
 def remove_ai_tells(text: str) -> Dict[str, Any]:
     """Remove AI-generated content markers from text."""
-    ai_tell_patterns = {
-        r'\bdelve into\b': 'examine',
-        r'\bdelving\b': 'examining',
-        r'\bshowcase\b': 'demonstrate',
-        r'\bleverage\b': 'use',
-        r'\butilize\b': 'use',
-        r'\bin the realm of\b': 'in',
-        r'\bit\'s worth noting that\b': 'notably',
-        r'\bit is important to note that\b': 'importantly',
-        r'\bin conclusion\b': 'finally',
-        r'\bin summary\b': 'overall',
-        r'\bcrucial\b': 'important',
-        r'\bparadigm shift\b': 'change',
-        r'\bgame-changer\b': 'significant innovation'
-    }
-    
-    cleaned = text
-    removals = []
-    
-    for pattern, replacement in ai_tell_patterns.items():
-        matches = re.findall(pattern, cleaned, re.I)
-        if matches:
-            cleaned = re.sub(pattern, replacement, cleaned, flags=re.I)
-            removals.append({
-                "pattern": pattern,
-                "replacement": replacement,
-                "count": len(matches)
-            })
+    matcher = get_tell_matcher()
+    cleaned, counts = matcher.replace(text)
+    removals = [
+        {"pattern": phrase, "replacement": matcher.table[phrase], "count": count}
+        for phrase, count in counts.items()
+    ]
     
     return {
         "cleaned_text": cleaned,
@@ -254,20 +234,5 @@ class EnhancedFormatterAgent:
         return prompt
     
     def _convert_to_html(self, markdown: str) -> str:
-        """Convert markdown to HTML (basic implementation)."""
-        
-        html = markdown
-        
-        # Headers
-        html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.M)
-        html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.M)
-        html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.M)
-        
-        # Bold
-        html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-        
-        # Paragraphs
-        html = re.sub(r'\n\n', '</p><p>', html)
-        html = f'<p>{html}</p>'
-        
-        return html
\ No newline at end of file
+        """Convert markdown to HTML (shared single-pass renderer, memoized by content hash)."""
+        return render_markdown(markdown)
\ No newline at end of file
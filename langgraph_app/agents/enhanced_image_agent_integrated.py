@@ -3,17 +3,16 @@
 Enterprise Image Agent with LLM-driven prompt generation and DALL-E 3 integration.
 """
 
-import os
 import logging
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
-from openai import OpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_core.tools import tool
 
 from langgraph_app.core.state import EnrichedContentState, AgentType, ContentPhase
 from langgraph_app.core.types import GeneratedImage
+from langgraph_app.core.image_pipeline import ImageRequest, PLACEHOLDER_PREFIX, get_image_pipeline
 from langgraph_app.enhanced_model_registry import get_model_for_generation
 
 logger = logging.getLogger(__name__)
@@ -106,15 +105,15 @@ class EnhancedImageAgent:
     """
     Enterprise Image Agent with:
     - LLM-driven prompt optimization
-    - DALL-E 3 integration
+    - DALL-E 3 integration via the shared async image pipeline
     - Tool use (requirement analysis, prompt generation)
     - Smart image placement
+    - Non-blocking: returns placeholders, the publisher resolves them
     """
     
     def __init__(self):
         self.agent_type = AgentType.IMAGE
         self.tools = [analyze_image_requirements, generate_image_prompt]
-        self.openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     
     def execute(self, state: EnrichedContentState) -> EnrichedContentState:
         """Execute image generation with LLM."""
@@ -139,7 +138,7 @@ class EnhancedImageAgent:
         # Analyze requirements
         requirements = analyze_image_requirements.invoke({
             "content": content,
-            "template_type": template_config.get('template_type', '')
+            "template_type": template_config.get('template_type') or ''
         })
         
         if not requirements.get("needs_images"):
@@ -154,13 +153,16 @@ class EnhancedImageAgent:
         )
         
         state.generated_images = generated_images
+        pending = sum(1 for img in generated_images if img.url.startswith(PLACEHOLDER_PREFIX))
         
         state.log_agent_execution(self.agent_type, {
             "status": "completed",
-            "images_generated": len(generated_images)
+            "images_requested": len(generated_images),
+            "images_cached": len(generated_images) - pending,
+            "images_pending": pending
         })
         
-        logger.info(f"✅ IMAGE: Generated {len(generated_images)} images")
+        logger.info(f"✅ IMAGE: {len(generated_images)} images ({pending} generating in background)")
         
         return state
     
@@ -168,12 +170,13 @@ class EnhancedImageAgent:
         """Check if images required."""
         
         # Check template config
-        image_config = template_config.get('image_generation_config', {})
+        # Validated configs carry image_generation_config: null when unset
+        image_config = template_config.get('image_generation_config') or {}
         if image_config.get('enabled'):
             return True
         
         # Check template type
-        template_type = template_config.get('template_type', '').lower()
+        template_type = (template_config.get('template_type') or '').lower()
         image_templates = ['proposal', 'pitch', 'marketing', 'presentation']
         
         return any(t in template_type for t in image_templates)
@@ -194,9 +197,7 @@ class EnhancedImageAgent:
         template_config: Dict,
         requirements: Dict
     ) -> List[GeneratedImage]:
-        """Generate images using LLM + DALL-E."""
-        
-        generated = []
+        """Queue all images on the image pipeline; returns cached images and placeholders."""
         
         # Get context
         topic = state.content_spec.topic if state.content_spec else "content"
@@ -204,54 +205,39 @@ class EnhancedImageAgent:
         
         # Determine style
         style = self._determine_style(template_config)
+        image_config = template_config.get('image_generation_config', {}) or {}
+        placements = requirements.get("placement_sections", [])
         
         # Generate up to suggested count
-        count = min(requirements.get("suggested_count", 1), 3)  # Max 3 images
+        count = min(image_config.get("count") or requirements.get("suggested_count") or 1, 3)  # Max 3 images
         
+        requests = []
         for i in range(count):
-            try:
-                # Generate optimized prompt
-                context = f"Image {i+1} for {template_config.get('template_type', 'content')}"
-                
-                prompt = generate_image_prompt.invoke({
-                    "topic": topic,
-                    "style": style,
-                    "context": context,
-                    "platform": platform
-                })
-                
-                # Call DALL-E 3
-                logger.info(f"🎨 Generating image with prompt: {prompt[:100]}...")
-                
-                response = self.openai_client.images.generate(
-                    model="dall-e-3",
-                    prompt=prompt,
-                    size="1024x1024",
-                    quality="standard",
-                    n=1
-                )
-                
-                image_url = response.data[0].url
-                
-                generated.append(GeneratedImage(
-                    prompt=prompt,
-                    url=image_url,
-                    alt_text=f"{topic} - {style} illustration",
-                    width=1024,
-                    height=1024
-                ))
-                
-                logger.info(f"✅ Generated image {i+1}/{count}")
-                
-            except Exception as e:
-                logger.error(f"Failed to generate image {i+1}: {e}")
-        
-        return generated
+            # Generate optimized prompt
+            context = f"Image {i+1} for {template_config.get('template_type', 'content')}"
+            
+            prompt = generate_image_prompt.invoke({
+                "topic": topic,
+                "style": style,
+                "context": context,
+                "platform": platform
+            })
+            
+            requests.append(ImageRequest(
+                prompt=prompt,
+                alt_text=f"{topic} - {style} illustration",
+                style={"style": style, "platform": platform, "config": image_config},
+                size=image_config.get("size", "1024x1024"),
+                quality=image_config.get("quality", "standard"),
+                placement=placements[min(i, len(placements) - 1)] if placements else None
+            ))
+        
+        return get_image_pipeline().submit(requests)
     
     def _determine_style(self, template_config: Dict) -> str:
         """Determine image style from template."""
         
-        template_type = template_config.get('template_type', '').lower()
+        template_type = (template_config.get('template_type') or '').lower()
         
         if 'technical' in template_type or 'documentation' in template_type:
             return ImageStyle.TECHNICAL.value
@@ -5,12 +5,13 @@ Combines LLM intelligence, tool use, YAML constraints, and self-refinement
 """
 from __future__ import annotations
 import time
+import contextvars
 from anthropic._exceptions import OverloadedError
 import logging
 import json
 import os
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 import random
 
@@ -19,14 +20,97 @@ from ..core.state import EnrichedContentState
 from ..core.types import AgentType, GenerationStatus, ContentPhase, PlanningOutput
 from ..core.exceptions import StateValidationError, AgentExecutionError
 from langgraph_app.core.circuit_breaker import get_circuit_breaker
+from langgraph_app.core.prompt_cache import PromptBuilder, get_prompt_cache_stats, prefix_hash
+from langgraph_app.core.model_router import get_model_router
+from langgraph_app.core.model_registry import ModelCapability
+from langgraph_app.core.planner_metrics import PlannerRun, get_planner_metrics
+from langgraph_app.enhanced_model_registry import create_openai_client, create_anthropic_client
 
-import openai
-import anthropic
 from dotenv import load_dotenv
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# Models the planner's call shape supports (temperature + max_tokens, JSON output)
+PLANNER_MODEL_CANDIDATES = ("gpt-4o", "gpt-4o-mini", "claude-haiku-4.5", "claude-sonnet-4.5")
+
+# sequential: original five-phase pipeline (baseline)
+# speculative: structured output, first-pass plan without waiting on tools,
+#              critique skipped for templates with high plan confidence, tools
+#              discovered only when the plan is going to be refined
+PLANNER_MODES = ("sequential", "speculative")
+
+# Counters for the planner run executing in the current context
+_active_run: contextvars.ContextVar[Optional[PlannerRun]] = contextvars.ContextVar(
+    "planner_active_run", default=None
+)
+
+PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "content_strategy": {"type": "string"},
+        "structure_approach": {"type": "string"},
+        "key_messages": {"type": "array", "items": {"type": "string"}},
+        "research_priorities": {"type": "array", "items": {"type": "string"}},
+        "audience_insights": {
+            "type": "object",
+            "properties": {
+                "primary_audience": {"type": "string"},
+                "complexity_level": {"type": "string"},
+                "platform": {"type": "string"}
+            }
+        },
+        "competitive_positioning": {"type": "string"},
+        "success_metrics": {"type": "object", "additionalProperties": {"type": "number"}},
+        "estimated_sections": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "estimated_words": {"type": "integer"}
+                },
+                "required": ["name", "estimated_words"]
+            }
+        },
+        "planning_confidence": {"type": "number"}
+    },
+    "required": [
+        "content_strategy", "structure_approach", "key_messages", "research_priorities",
+        "audience_insights", "competitive_positioning", "success_metrics", "estimated_sections"
+    ]
+}
+
+TOOL_PLAN_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "tools": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "tool_name": {"type": "string"},
+                    "parameters": {"type": "object"},
+                    "rationale": {"type": "string"}
+                },
+                "required": ["tool_name", "parameters", "rationale"]
+            }
+        }
+    },
+    "required": ["tools"]
+}
+
+CRITIQUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "confidence": {"type": "number"},
+        "strengths": {"type": "array", "items": {"type": "string"}},
+        "weaknesses": {"type": "array", "items": {"type": "string"}},
+        "improvement_suggestions": {"type": "array", "items": {"type": "string"}}
+    },
+    "required": ["confidence", "strengths", "weaknesses", "improvement_suggestions"]
+}
+
 
 @dataclass
 class ToolCall:
@@ -50,11 +134,15 @@ class EnhancedPlannerAgent(BaseAgent):
         super().__init__(AgentType.PLANNER)
         self.available_tools = self._register_tools()
         self.max_refinement_loops = 1
-        self.openai_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        self.anthropic_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+        self.openai_client = create_openai_client()
+        self.anthropic_client = create_anthropic_client()
 
     def execute(self, state: EnrichedContentState) -> EnrichedContentState:
         """Execute planning with tools, LLM, and refinement"""
+        started = time.time()
+        mode = self._planner_mode(state)
+        run = PlannerRun(mode=mode, template=self._template_key(state))
+        run_token = _active_run.set(run)
         try:
             self.log_execution_start(state)
             self.validate_state(state, ["template_config", "style_config", "content_spec"])
@@ -62,33 +150,50 @@ class EnhancedPlannerAgent(BaseAgent):
             if not state.content_spec.topic:
                 raise StateValidationError("ENTERPRISE: content_spec.topic required")
 
-            # Select model based on complexity
-            complexity = state.template_config.get("metadata", {}).get("complexity", 5)
+            # Complexity-based default; routed on live latency/error stats when configured
+            model_name = self._select_model(state)
 
-            # Faster, more stable, avoids timeouts
-            if complexity <= 4:
-                model_name = "gpt-4o"
-            else:
-                model_name = "gpt-4o-mini"
+            logger.info(f"Planner using: {model_name} ({mode})")
 
-            logger.info(f"Planner using: {model_name}")
+            if mode == "speculative":
+                # Phase 3 first: plan straight away, tools are only needed for refinement
+                tool_plan, tool_results = [], {}
+                initial_plan = self._llm_generate_planning(state, model_name, {}, structured=True)
 
-            # Phase 1: Tool Discovery
-            tool_plan = self._discover_needed_tools(state, model_name)
+                # Phase 4: Self-Critique, unless this template's plans reliably pass it
+                if get_planner_metrics().should_skip_critique(run.template):
+                    logger.info(f"Skipping critique - {run.template} has high historical plan confidence")
+                    run.critique_skipped = True
+                    critique = None
+                else:
+                    critique = self._self_critique_plan(initial_plan, state, model_name, structured=True)
 
-            # Phase 2: Tool Execution
-            tool_results = self._execute_tools(tool_plan, state)
-            
-            # Phase 3: Initial Planning
-            initial_plan = self._llm_generate_planning(state, model_name, tool_results)
-            
-            # Phase 4: Self-Critique
-            critique = self._self_critique_plan(initial_plan, state, model_name)
+                # Phases 1-2 only for a plan that will be refined
+                if critique is not None and critique.confidence < 0.9:
+                    tool_plan, tool_results = self._discover_and_execute_tools(state, model_name)
+            else:
+                # Phase 1: Tool Discovery
+                tool_plan = self._discover_needed_tools(state, model_name)
+
+                # Phase 2: Tool Execution
+                tool_results = self._execute_tools(tool_plan, state)
+                
+                # Phase 3: Initial Planning
+                initial_plan = self._llm_generate_planning(state, model_name, tool_results)
+                
+                # Phase 4: Self-Critique
+                critique = self._self_critique_plan(initial_plan, state, model_name)
 
             # Phase 5: Refinement if needed
-            final_plan = self._refine_plan_if_needed(
-                initial_plan, critique, state, model_name, tool_results
-            )
+            if critique is not None:
+                get_planner_metrics().record_confidence(run.template, critique.confidence)
+                final_plan = self._refine_plan_if_needed(
+                    initial_plan, critique, state, model_name, tool_results,
+                    structured=(mode == "speculative")
+                )
+            else:
+                final_plan = initial_plan
+            run.refined = final_plan is not initial_plan
 
             # Update state
             state.planning_output = final_plan
@@ -96,11 +201,19 @@ class EnhancedPlannerAgent(BaseAgent):
             state.status = GenerationStatus.PLANNING
             state.update_phase(ContentPhase.RESEARCH)
 
+            run.wall_time_s = time.time() - started
+            get_planner_metrics().record_run(run)
+
             self.log_execution_complete(state, {
                 "model": model_name,
+                "planner_mode": mode,
                 "tools_used": [t.tool_name for t in tool_plan],
-                "refinement_loops": 1 if critique.confidence < 0.9 else 0,
-                "final_confidence": final_plan.planning_confidence
+                "refinement_loops": 1 if critique and critique.confidence < 0.9 else 0,
+                "critique_skipped": run.critique_skipped,
+                "llm_calls": run.llm_calls,
+                "wall_time_s": round(run.wall_time_s, 3),
+                "final_confidence": final_plan.planning_confidence,
+                "prompt_cache": get_prompt_cache_stats().get_agent_stats("planner")
             })
 
             return state
@@ -108,6 +221,53 @@ class EnhancedPlannerAgent(BaseAgent):
         except Exception as e:
             logger.error(f"Planner failed: {e}", exc_info=True)
             raise AgentExecutionError(f"Planner failed: {e}") from e
+        finally:
+            _active_run.reset(run_token)
+
+    def _planner_mode(self, state: EnrichedContentState) -> str:
+        """Planner mode from request parameters, then PLANNER_MODE env (default: sequential)"""
+        dynamic_params = state.dynamic_parameters or {}
+        mode = dynamic_params.get("planner_mode") or os.getenv("PLANNER_MODE", "sequential")
+        if mode not in PLANNER_MODES:
+            logger.warning(f"Unknown planner mode '{mode}' - using sequential")
+            return "sequential"
+        return mode
+
+    def _template_key(self, state: EnrichedContentState) -> str:
+        template_config = state.template_config or {}
+        return str(template_config.get("id") or template_config.get("template_type") or "unknown")
+
+    def _discover_and_execute_tools(
+        self,
+        state: EnrichedContentState,
+        model_name: str
+    ) -> Tuple[List[ToolCall], Dict[str, Any]]:
+        tool_plan = self._discover_needed_tools(state, model_name, structured=True)
+        return tool_plan, self._execute_tools(tool_plan, state)
+
+    def _select_model(self, state: EnrichedContentState) -> str:
+        """Pick the planner model; the latency/cost-aware router decides once a priority or budget is set"""
+        if os.getenv("PLANNER_MODEL"):
+            return os.getenv("PLANNER_MODEL")
+
+        dynamic_params = state.dynamic_parameters or {}
+        priority = dynamic_params.get("routing_priority") or os.getenv("PLANNER_ROUTING_PRIORITY")
+        budget = dynamic_params.get("latency_budget_s") or os.getenv("PLANNER_LATENCY_BUDGET_S")
+        if not priority and not budget:
+            # Faster, more stable, avoids timeouts
+            complexity = (state.template_config or {}).get("metadata", {}).get("complexity", 5)
+            return "gpt-4o" if complexity <= 4 else "gpt-4o-mini"
+
+        spec = get_model_router().route(
+            "planner",
+            template_config=state.template_config,
+            priority=priority,
+            latency_budget_s=float(budget) if budget else None,
+            required_capabilities=[ModelCapability.REASONING, ModelCapability.STRUCTURED_OUTPUT],
+            allowed_models=PLANNER_MODEL_CANDIDATES,
+            expected_output_tokens=3000
+        )
+        return spec.model_name
 
     def _register_tools(self) -> Dict[str, callable]:
         return {
@@ -117,7 +277,12 @@ class EnhancedPlannerAgent(BaseAgent):
             "calculate_optimal_metrics": self._tool_calculate_optimal_metrics
         }
 
-    def _discover_needed_tools(self, state: EnrichedContentState, model_name: str) -> List[ToolCall]:
+    def _discover_needed_tools(
+        self,
+        state: EnrichedContentState,
+        model_name: str,
+        structured: bool = False
+    ) -> List[ToolCall]:
         """LLM decides which tools to use"""
         system_prompt = """You are a strategic planner. Decide which tools you need.
 Available: analyze_similar_campaigns, get_trending_topics, analyze_competitor_content, calculate_optimal_metrics"""
@@ -128,7 +293,15 @@ Template: {state.template_config.get('template_type')}
 Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why"}}]"""
 
         try:
+            if structured:
+                tool_data = self._structured_call(
+                    model_name, system_prompt, user_prompt, "tool_plan", TOOL_PLAN_SCHEMA,
+                    temperature=0.3, max_tokens=1000
+                )
+                return [ToolCall(**t) for t in tool_data.get("tools", [])]
+
             if "gpt" in model_name:
+                started = time.time()
                 response = self.openai_client.chat.completions.create(
                     model=model_name,
                     messages=[
@@ -138,8 +311,10 @@ Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why
                     temperature=0.3,
                     max_tokens=1000
                 )
+                self._record_call(response, "openai", model_name, system_prompt, started)
                 content = response.choices[0].message.content
             else:
+                started = time.time()
                 response = self.anthropic_client.messages.create(
                     model=model_name,
                     system=system_prompt,
@@ -147,6 +322,7 @@ Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why
                     temperature=0.3,
                     max_tokens=1000
                 )
+                self._record_call(response, "anthropic", model_name, system_prompt, started)
                 content = response.content[0].text
             
             json_match = re.search(r'\[.*\]', content, re.DOTALL)
@@ -181,11 +357,12 @@ Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why
         self,
         state: EnrichedContentState,
         model_name: str,
-        tool_results: dict
+        tool_results: dict,
+        structured: bool = False
     ) -> PlanningOutput:
 
-        system_prompt = self._build_system_prompt(state)
-        user_prompt = self._build_user_prompt(state, tool_results)
+        prompt = self._build_planning_prompt(state, tool_results)
+        system_prompt, user_prompt = prompt.build()
 
         max_attempts = 4
         circuit_breaker = get_circuit_breaker()
@@ -194,6 +371,7 @@ Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why
         delays = [2.0, 5.0, 12.0, 30.0]
 
         for attempt in range(max_attempts):
+            started = time.time()
             try:
                 if not circuit_breaker.can_execute(provider):
                     logger.error(
@@ -205,7 +383,12 @@ Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why
                         f"Provider may be experiencing outage. Please try again later."
                     )
 
-                if "gpt" in model_name:
+                if structured:
+                    planning_data = self._structured_call(
+                        model_name, system_prompt, user_prompt, "content_plan", PLAN_SCHEMA,
+                        temperature=0.4, max_tokens=3000, anthropic_system=prompt.to_anthropic_system()
+                    )
+                elif "gpt" in model_name:
                     response = self.openai_client.chat.completions.create(
                         model=model_name,
                         messages=[
@@ -216,15 +399,17 @@ Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why
                         max_tokens=3000,
                         response_format={"type": "json_object"}
                     )
+                    self._record_call(response, provider, model_name, system_prompt, started)
                     planning_data = json.loads(response.choices[0].message.content)
                 else:
                     response = self.anthropic_client.messages.create(
                         model=model_name,
-                        system=system_prompt,
+                        system=prompt.to_anthropic_system(),
                         messages=[{"role": "user", "content": user_prompt}],
                         temperature=0.4,
                         max_tokens=3000
                     )
+                    self._record_call(response, provider, model_name, system_prompt, started)
                     content = response.content[0].text
                     json_match = re.search(r'\{.*\}', content, re.DOTALL)
                     planning_data = json.loads(json_match.group(0))
@@ -277,6 +462,8 @@ Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why
                 last_exception = e
                 error_type = "overloaded"
                 circuit_breaker.record_failure(provider, error_type)
+                get_model_router().record_call(model_name, time.time() - started, success=False)
+                self._count_llm_call()
 
                 if attempt < max_attempts - 1:
                     base_delay = delays[attempt]
@@ -306,6 +493,9 @@ Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why
                 error_type = type(e).__name__
                 logger.error(f"❌ Planner failed with non-retryable error: {error_type} - {str(e)}")
                 circuit_breaker.record_failure(provider, error_type)
+                if not isinstance(e, AgentExecutionError):
+                    get_model_router().record_call(model_name, time.time() - started, success=False)
+                    self._count_llm_call()
                 raise AgentExecutionError(f"Plan generation failed: {error_type} - {str(e)}")
 
         raise AgentExecutionError(f"Plan generation failed after {max_attempts} attempts: {last_exception}")    
@@ -314,7 +504,8 @@ Output JSON array: [{{"tool_name": "name", "parameters": {{}}, "rationale": "why
         self,
         plan: PlanningOutput,
         state: EnrichedContentState,
-        model_name: str
+        model_name: str,
+        structured: bool = False
     ) -> PlanCritique:
         """Self-critique the generated plan"""
         system_prompt = """You are an expert critic evaluating content plans.
@@ -327,7 +518,15 @@ STRATEGY: {plan.content_strategy}
 Output JSON: {{"confidence": 0.0-1.0, "strengths": [], "weaknesses": [], "improvement_suggestions": []}}"""
 
         try:
+            if structured:
+                critique_data = self._structured_call(
+                    model_name, system_prompt, user_prompt, "plan_critique", CRITIQUE_SCHEMA,
+                    temperature=0.3, max_tokens=1500
+                )
+                return PlanCritique(**critique_data)
+
             if "gpt" in model_name:
+                started = time.time()
                 response = self.openai_client.chat.completions.create(
                     model=model_name,
                     messages=[
@@ -337,8 +536,10 @@ Output JSON: {{"confidence": 0.0-1.0, "strengths": [], "weaknesses": [], "improv
                     temperature=0.3,
                     max_tokens=1500
                 )
+                self._record_call(response, "openai", model_name, system_prompt, started)
                 content = response.choices[0].message.content
             else:
+                started = time.time()
                 response = self.anthropic_client.messages.create(
                     model=model_name,
                     system=system_prompt,
@@ -346,6 +547,7 @@ Output JSON: {{"confidence": 0.0-1.0, "strengths": [], "weaknesses": [], "improv
                     temperature=0.3,
                     max_tokens=1500
                 )
+                self._record_call(response, "anthropic", model_name, system_prompt, started)
                 content = response.content[0].text
             
             json_match = re.search(r'\{.*\}', content, re.DOTALL)
@@ -374,7 +576,8 @@ Output JSON: {{"confidence": 0.0-1.0, "strengths": [], "weaknesses": [], "improv
         critique: PlanCritique,
         state: EnrichedContentState,
         model_name: str,
-        tool_results: Dict[str, Any]
+        tool_results: Dict[str, Any],
+        structured: bool = False
     ) -> PlanningOutput:
         """Refine plan if confidence < 0.9"""
         if critique.confidence >= 0.9:
@@ -383,16 +586,23 @@ Output JSON: {{"confidence": 0.0-1.0, "strengths": [], "weaknesses": [], "improv
         
         logger.info(f"Plan confidence {critique.confidence:.2f} - refining...")
         
-        system_prompt = self._build_system_prompt(state)
+        prompt = self._build_planning_prompt(state, tool_results)
+        system_prompt = prompt.system_text()
         user_prompt = f"""PREVIOUS PLAN HAD ISSUES:
 Weaknesses: {critique.weaknesses}
 Suggestions: {critique.improvement_suggestions}
 
 Generate IMPROVED plan addressing these issues.
-{self._build_user_prompt(state, tool_results)}"""
+{prompt.user_text()}"""
 
         try:
-            if "gpt" in model_name:
+            if structured:
+                refined_data = self._structured_call(
+                    model_name, system_prompt, user_prompt, "content_plan", PLAN_SCHEMA,
+                    temperature=0.5, max_tokens=3000, anthropic_system=prompt.to_anthropic_system()
+                )
+            elif "gpt" in model_name:
+                started = time.time()
                 response = self.openai_client.chat.completions.create(
                     model=model_name,
                     messages=[
@@ -403,15 +613,18 @@ Generate IMPROVED plan addressing these issues.
                     max_tokens=3000,
                     response_format={"type": "json_object"}
                 )
+                self._record_call(response, "openai", model_name, system_prompt, started)
                 refined_data = json.loads(response.choices[0].message.content)
             else:
+                started = time.time()
                 response = self.anthropic_client.messages.create(
                     model=model_name,
-                    system=system_prompt,
+                    system=prompt.to_anthropic_system(),
                     messages=[{"role": "user", "content": user_prompt}],
                     temperature=0.5,
                     max_tokens=3000
                 )
+                self._record_call(response, "anthropic", model_name, system_prompt, started)
                 content = response.content[0].text
                 json_match = re.search(r'\{.*\}', content, re.DOTALL)
                 refined_data = json.loads(json_match.group(0))
@@ -464,6 +677,14 @@ Generate IMPROVED plan addressing these issues.
         }
 
     # Prompt builders
+    def _build_planning_prompt(self, state: EnrichedContentState, tool_results: Dict[str, Any]) -> PromptBuilder:
+        """Static style/template/schema prefix first, per-request topic and tool insights last"""
+        builder = PromptBuilder()
+        builder.add_static("style", self._build_system_prompt(state), cache_breakpoint=True)
+        builder.add_static("template", self._build_template_prompt(state))
+        builder.add_dynamic("request", self._build_user_prompt(state, tool_results))
+        return builder
+
     def _build_system_prompt(self, state: EnrichedContentState) -> str:
         """Build system prompt with style guidance"""
         style_config = state.style_config
@@ -479,23 +700,16 @@ STYLE PROFILE: {style_config.get('name')}
 
 Create optimal plans that achieve user intent."""
 
-    def _build_user_prompt(self, state: EnrichedContentState, tool_results: Dict[str, Any]) -> str:
-        """Build user prompt with YAML constraints and tool context"""
+    def _build_template_prompt(self, state: EnrichedContentState) -> str:
+        """Build template constraints and output schema - identical for every request on a template"""
         template_config = state.template_config
-        content_spec = state.content_spec
-        
         constraints = self._extract_constraints(template_config)
-        tool_context = f"\n\nTOOL INSIGHTS:\n{json.dumps(tool_results, indent=2)}" if tool_results else ""
-        
-        return f"""Create an optimal content plan.
 
-TOPIC: {content_spec.topic}
-TEMPLATE: {template_config.get('template_type')}
+        return f"""TEMPLATE: {template_config.get('template_type')}
 DESCRIPTION: {template_config.get('description')}
 
 CONSTRAINTS:
 {self._format_constraints(constraints)}
-{tool_context}
 
 Output ONLY valid JSON:
 {{
@@ -514,6 +728,84 @@ Output ONLY valid JSON:
   "planning_confidence": 0.85
 }}"""
 
+    def _build_user_prompt(self, state: EnrichedContentState, tool_results: Dict[str, Any]) -> str:
+        """Build per-request user prompt with topic and tool context"""
+        content_spec = state.content_spec
+        tool_context = f"\n\nTOOL INSIGHTS:\n{json.dumps(tool_results, indent=2)}" if tool_results else ""
+        
+        return f"""Create an optimal content plan.
+
+TOPIC: {content_spec.topic}{tool_context}"""
+
+    def _record_call(
+        self,
+        response: Any,
+        provider: str,
+        model_name: str,
+        system_prompt: str,
+        started: float
+    ) -> None:
+        """Feed latency/tokens to the model router and cached vs uncached input tokens to prompt cache stats"""
+        self._count_llm_call()
+        usage = getattr(response, "usage", None)
+        output_tokens = (getattr(usage, "completion_tokens", None) or getattr(usage, "output_tokens", 0)) if usage else 0
+        get_model_router().record_call(model_name, time.time() - started, success=True, output_tokens=output_tokens or 0)
+        get_prompt_cache_stats().record_usage(
+            "planner", provider, usage, prefix_hash=prefix_hash(system_prompt)
+        )
+
+    def _count_llm_call(self) -> None:
+        run = _active_run.get()
+        if run is not None:
+            run.llm_calls += 1
+
+    def _structured_call(
+        self,
+        model_name: str,
+        system_prompt: str,
+        user_prompt: str,
+        schema_name: str,
+        schema: Dict[str, Any],
+        temperature: float,
+        max_tokens: int,
+        anthropic_system: Any = None
+    ) -> Dict[str, Any]:
+        """Provider-native structured output: OpenAI json_schema response format, Anthropic forced tool use"""
+        started = time.time()
+        if "gpt" in model_name:
+            response = self.openai_client.chat.completions.create(
+                model=model_name,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={
+                    "type": "json_schema",
+                    "json_schema": {"name": schema_name, "schema": schema}
+                }
+            )
+            self._record_call(response, "openai", model_name, system_prompt, started)
+            return json.loads(response.choices[0].message.content)
+
+        response = self.anthropic_client.messages.create(
+            model=model_name,
+            system=anthropic_system or system_prompt,
+            messages=[{"role": "user", "content": user_prompt}],
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tools=[{
+                "name": schema_name,
+                "description": f"Submit the {schema_name.replace('_', ' ')}",
+                "input_schema": schema
+            }],
+            tool_choice={"type": "tool", "name": schema_name}
+        )
+        self._record_call(response, "anthropic", model_name, system_prompt, started)
+        tool_use = next(block for block in response.content if block.type == "tool_use")
+        return tool_use.input
+
     def _extract_constraints(self, template_config: Dict[str, Any]) -> Dict[str, Any]:
         """Extract YAML constraints"""
         return {
@@ -5,7 +5,6 @@ Enterprise Publisher Agent with LLM integration, distribution strategy, and qual
 
 import os
 import logging
-import re
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -14,6 +13,9 @@ from langchain_core.tools import tool
 
 from langgraph_app.core.state import EnrichedContentState, AgentType, ContentPhase
 from langgraph_app.enhanced_model_registry import get_model_for_generation
+from langgraph_app.core.text_stats import get_text_stats
+from langgraph_app.core.ai_tells import get_tell_matcher
+from langgraph_app.core.image_pipeline import embed_images, get_image_pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +33,8 @@ def validate_content_quality(text: str) -> Dict[str, Any]:
     """
     issues = []
     
-    word_count = len(text.split())
+    stats = get_text_stats(text)
+    word_count = stats.word_count
     if word_count < 300:
         issues.append(f"Word count too low: {word_count} (minimum 300)")
     
@@ -52,6 +55,7 @@ def validate_content_quality(text: str) -> Dict[str, Any]:
     return {
         "quality_score": round(quality_score, 2),
         "word_count": word_count,
+        "flesch_score": round(stats.flesch_score, 1),
         "issues": issues,
         "ready_to_publish": len(issues) == 0
     }
@@ -210,12 +214,22 @@ class EnhancedPublisherAgent:
         #    Treat formatter output as final body.
         final_content = content
 
+        # 3b. Embed images; placeholders from the image node are awaited only now
+        if state.generated_images:
+            state.generated_images = get_image_pipeline().resolve(
+                state.generated_images,
+                timeout_s=float(os.getenv("IMAGE_RESOLVE_TIMEOUT_S", "60"))
+            )
+            final_content = embed_images(final_content, state.generated_images)
+            logger.info(f"🖼️ PUBLISHER: Embedded {len(state.generated_images)} images")
+
         # 4. Build base publication metadata
         publication_metadata: Dict[str, Any] = {
             "platform": platform,
             "template_type": template_type,
             "word_count": word_count,
             "header_count": header_count,
+            "images_embedded": len(state.generated_images or []),
         }
 
         # 5. Optional: add engagement predictions using the tool
@@ -275,16 +289,13 @@ class EnhancedPublisherAgent:
     ) -> tuple[str, Dict]:
         """Skip LLM - just return formatted content."""
         
-        # Simple AI tell removal
-        cleaned = content
-        ai_tells = ['delve into', 'leverage', 'utilize', 'in conclusion', 'paradigm shift']
-        for tell in ai_tells:
-            cleaned = re.sub(r'\b' + tell + r'\b', '', cleaned, flags=re.I)
+        # Single-pass AI tell replacement (shared matcher for this style profile)
+        cleaned, counts = get_tell_matcher(style_config).replace(content)
         
         metadata = {
             "platform": platform,
             "confidence": 0.9,
-            "ai_tells_removed": len(content) - len(cleaned)
+            "ai_tells_removed": sum(counts.values())
         }
         
         return cleaned, metadata   
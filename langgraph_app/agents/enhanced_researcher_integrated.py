@@ -9,6 +9,15 @@ from langgraph_app.core.state import (
     ContentPhase,
     ResearchFindings
 )
+from langgraph_app.enhanced_model_registry import fake_llm_enabled
+from langgraph_app.core.research_executor import SearchOutcome, SearchQuery, get_research_executor
+from langgraph_app.core.research_corpus import get_research_corpus
+
+# Search queries issued for template evidence types
+EVIDENCE_QUERIES = {
+    "market_data": "{topic} market size growth",
+    "financial_metrics": "{topic} ROI benchmarks",
+}
 
 class EnhancedResearcherAgent:
     """Integrated Researcher Agent using EnrichedContentState with Template Configuration Support"""
@@ -59,12 +68,28 @@ class EnhancedResearcherAgent:
         except Exception as e:
             print(f"DEBUG: Failed to log priorities: {e}")
 
+        # Gather supporting data with template awareness
+        evidence_types = []
+        if instructions and hasattr(instructions, 'specific_requirements'):
+            evidence_types = instructions.specific_requirements.get("evidence_types", [])
+
+         # Add template-specific evidence types
+        template_evidence = template_config.get('required_evidence_types', [])
+        evidence_types.extend(template_evidence)
+
+        # Fan out every priority and evidence query at once; latency is that of the slowest query
+        search_outcomes = self._run_research_queries(research_priorities, evidence_types, spec)
+
          # Execute research for each priority
-        primary_insights = []
+        insights_by_priority = []
         for priority in research_priorities:
             try:
-                insights = self._research_priority(priority, spec, instructions, template_config)
-                primary_insights.extend(insights)
+                outcome = search_outcomes.get(f"priority:{priority}")
+                insights = self._research_priority(
+                    priority, spec, instructions, template_config,
+                    search_results=outcome.results if outcome else None
+                )
+                insights_by_priority.append(insights)
             except Exception as e:
                 print(f"DEBUG: Failed to research {priority}: {e}")
                 try:
@@ -74,17 +99,15 @@ class EnhancedResearcherAgent:
                 except:
                     pass
                 continue
-            
-        # Gather supporting data with template awareness
-        evidence_types = []
-        if instructions and hasattr(instructions, 'specific_requirements'):
-            evidence_types = instructions.specific_requirements.get("evidence_types", [])
 
-         # Add template-specific evidence types
-        template_evidence = template_config.get('required_evidence_types', [])
-        evidence_types.extend(template_evidence)
+        # Interleave so the insight cap below keeps the top finding of every priority
+        primary_insights = [
+            insights[rank]
+            for rank in range(max((len(i) for i in insights_by_priority), default=0))
+            for insights in insights_by_priority if rank < len(insights)
+        ]
 
-        supporting_data = self._gather_supporting_data(evidence_types, spec, template_config)
+        supporting_data = self._gather_supporting_data(evidence_types, spec, template_config, search_outcomes)
 
         # LIMIT RESEARCH OUTPUT TO REDUCE PROMPT SIZE
         primary_insights = primary_insights[:5] if primary_insights else []
@@ -112,20 +135,97 @@ class EnhancedResearcherAgent:
             research_gaps=["Further analysis on long-term impact is needed."]
         )
     
-    def _gather_supporting_data(self, evidence_types: list, spec, template_config: dict) -> dict:
-        """Gather supporting data via web search"""
+    def _gather_supporting_data(
+        self,
+        evidence_types: list,
+        spec,
+        template_config: dict,
+        search_outcomes: Optional[Dict[str, Any]] = None
+    ) -> dict:
+        """Gather supporting data via web search (reusing batch results when available)"""
         supporting_data = {}
+        search_outcomes = search_outcomes or {}
 
         for evidence_type in evidence_types:
-            if evidence_type == "market_data":
-                results = self._web_search(f"{spec.topic} market size growth")
-                supporting_data["market_data"] = {"findings": results[:2]}
-            elif evidence_type == "financial_metrics":
-                results = self._web_search(f"{spec.topic} ROI benchmarks")
-                supporting_data["financial_metrics"] = {"findings": results[:2]}
+            if evidence_type not in EVIDENCE_QUERIES:
+                continue
+            outcome = search_outcomes.get(f"evidence:{evidence_type}")
+            if outcome is not None:
+                results = self._to_findings(outcome.results)
+            else:
+                results = self._web_search(EVIDENCE_QUERIES[evidence_type].format(topic=spec.topic))
+            supporting_data[evidence_type] = {"findings": results[:2]}
 
         return supporting_data
 
+    def _run_research_queries(self, research_priorities: list, evidence_types: list, spec) -> Dict[str, Any]:
+        """
+        Answer priorities from the local corpus where it has recall, then issue
+        the remaining priority and evidence searches as one concurrent batch
+        """
+        topic = str(getattr(spec, "topic", "") or "")
+        corpus = get_research_corpus()
+        outcomes: Dict[str, Any] = {}
+        queries = []
+
+        for priority in research_priorities:
+            key = f"priority:{priority}"
+            query = priority if topic.lower() in priority.lower() else f"{topic} {priority}".strip()
+            try:
+                hits = corpus.search(query, k=3)
+            except Exception as e:
+                logger.warning(f"Local corpus lookup failed: {e}")
+                hits = []
+            if corpus.has_recall(hits):
+                outcomes[key] = SearchOutcome(
+                    key=key, query=query, cache="local",
+                    results=[h.to_search_result() for h in hits if h.coverage >= corpus.min_coverage]
+                )
+            else:
+                queries.append(SearchQuery(key=key, query=query, evidence_type="priority", source="priority"))
+
+        queries.extend(
+            SearchQuery(
+                key=f"evidence:{evidence_type}",
+                query=EVIDENCE_QUERIES[evidence_type].format(topic=topic),
+                evidence_type=evidence_type,
+                source=evidence_type
+            )
+            for evidence_type in dict.fromkeys(evidence_types) if evidence_type in EVIDENCE_QUERIES
+        )
+
+        if outcomes:
+            logger.info(f"Local corpus answered {len(outcomes)}/{len(research_priorities)} research priorities")
+        if not queries or not self._search_available():
+            return outcomes
+
+        try:
+            fetched = get_research_executor().run(queries)
+        except Exception as e:
+            logger.error(f"Research batch failed: {e}")
+            return outcomes
+
+        # Fold new external snippets into the local corpus for later runs
+        new_results = [r for o in fetched.values() if o.cache == "miss" for r in o.results]
+        if new_results:
+            try:
+                corpus.add_findings(topic, new_results)
+            except Exception as e:
+                logger.warning(f"Could not index research findings: {e}")
+
+        outcomes.update(fetched)
+        return outcomes
+
+    def _search_available(self) -> bool:
+        return bool(self.tavily_api_key) or fake_llm_enabled()
+
+    def _to_findings(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [{
+            "finding": r.get("content", "")[:500],
+            "source": r.get("url", ""),
+            "relevance": "high"
+        } for r in results]
+
     def _research_industry_context(self, spec, template_config: dict) -> dict:
         """Research industry context via web search"""
         results = self._web_search(f"{spec.topic} industry trends challenges")
@@ -295,8 +395,15 @@ class EnhancedResearcherAgent:
     
 
 
-    def _research_priority(self, priority: str, spec, instructions, template_config: dict) -> list:
-        """Generic research based on priority keywords"""
+    def _research_priority(
+        self,
+        priority: str,
+        spec,
+        instructions,
+        template_config: dict,
+        search_results: Optional[List[Dict[str, Any]]] = None
+    ) -> list:
+        """Generic research based on priority keywords, backed by search results when available"""
         
         insights = []
         priority_lower = str(priority).lower()
@@ -310,6 +417,18 @@ class EnhancedResearcherAgent:
             (("trend", "emerging", "future"), ("trend_analysis", "trend_report")),
         ]
         
+        research_type, source_type = "general_research", "general_analysis"
+        for keywords, pattern_types in research_patterns:
+            if any(k in priority_lower for k in keywords):
+                research_type, source_type = pattern_types
+                break
+
+        if search_results:
+            return [
+                {**finding, "type": research_type, "source_type": source_type, "priority": priority}
+                for finding in self._to_findings(search_results)
+            ]
+
         for keywords, (research_type, source_type) in research_patterns:
             if any(k in priority_lower for k in keywords):
                 insights.append({
@@ -333,28 +452,31 @@ class EnhancedResearcherAgent:
         return insights
     
     def _web_search(self, query: str) -> List[Dict[str, Any]]:
-       if not self.tavily_api_key:
+       if not self._search_available():
            logger.warning(f"No Tavily key for: {query}")
            return []
        
        try:
-           from tavily import TavilyClient
-           client = TavilyClient(api_key=self.tavily_api_key)
-           response = client.search(query=query, max_results=3)
-           
-           return [{
-               "finding": r.get("content", "")[:500],
-               "source": r.get("url", ""),
-               "relevance": "high"
-           } for r in response.get("results", [])]
+           # Pooled client with per-query timeout
+           outcome = get_research_executor().search(SearchQuery(key="query", query=query))
+           return self._to_findings(outcome.results)
        except Exception as e:
            logger.error(f"Search failed: {e}")
            return []
 
     # langgraph_app/agents/enhanced_researcher_integrated.py
-    def search_recent_events(self, topic: str, timeframe: str = "24h"):
-        results = self.web_search(f"{topic} {timeframe}")
-        return self.validate_and_synthesize(results)
+    async def search_recent_events(self, topic: str, timeframe: str = "24h") -> Dict[str, Any]:
+        """Timeframe-bound search for RealTimeSearchMixin; cached for a fraction of the timeframe"""
+        query = topic if topic.rstrip().endswith(timeframe) else f"{topic} {timeframe}"
+        outcomes = await get_research_executor().search_many([
+            SearchQuery(key="recent", query=query, max_results=5, timeframe=timeframe, source="realtime")
+        ])
+        results = outcomes["recent"].results
+        return {
+            "results": results,
+            "sources": [r.get("url") for r in results if r.get("url")],
+            "query": query
+        }
 
     def _validate_sources(self, template_config: dict) -> list:
         """Dynamic source validation based on template metadata"""
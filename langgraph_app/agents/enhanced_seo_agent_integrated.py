@@ -4,6 +4,7 @@ Enterprise SEO Agent with LLM integration, tool use, and optimization loops.
 """
 
 import os
+import asyncio
 import logging
 import re
 from typing import Dict, List, Any, Optional
@@ -15,6 +16,9 @@ from langgraph_app.enhanced_model_registry import get_model
 from langgraph_app.core.state import EnrichedContentState, AgentType, ContentPhase
 from langgraph_app.core.types import SeoAnalysis, SEOOptimizationContext
 from langgraph_app.enhanced_model_registry import get_model_for_generation
+from langgraph_app.core.tool_prepass import run_tools_locally, format_tool_results
+from langgraph_app.core.keyword_engine import analyze_keywords
+from langgraph_app.core.text_stats import get_text_stats
 
 logger = logging.getLogger(__name__)
 
@@ -33,23 +37,17 @@ def analyze_keyword_density(text: str, target_keywords: List[str]) -> Dict[str,
     Returns:
         Keyword analysis with density percentages
     """
-    text_lower = text.lower()
-    words = re.findall(r'\b\w+\b', text_lower)
-    total_words = len(words)
+    # One pass over the text for all keywords (cached Aho-Corasick automaton)
+    analysis = analyze_keywords(text, target_keywords)
+    total_words = analysis["total_words"]
     
     if total_words == 0:
         return {"densities": {}, "total_words": 0, "recommendations": ["Content is empty"]}
     
-    densities = {}
-    for keyword in target_keywords:
-        kw_lower = keyword.lower()
-        count = text_lower.count(kw_lower)
-        density = (count / total_words) * 100
-        densities[keyword] = {
-            "count": count,
-            "density": round(density, 2),
-            "optimal": 1.0 <= density <= 3.0
-        }
+    densities = {
+        keyword: {"count": data["count"], "density": data["density"], "optimal": data["optimal"]}
+        for keyword, data in analysis["keywords"].items()
+    }
     
     recommendations = []
     for kw, data in densities.items():
@@ -115,18 +113,9 @@ def check_readability_seo(text: str) -> Dict[str, Any]:
     Returns:
         Readability metrics and SEO impact
     """
-    words = text.split()
-    sentences = re.split(r'[.!?]+', text)
-    
-    word_count = len(words)
-    sentence_count = max(1, len([s for s in sentences if s.strip()]))
-    avg_sentence_length = word_count / sentence_count
-    
-    # Flesch Reading Ease
-    syllables = sum(len(re.findall(r'[aeiouy]+', word)) for word in words)
-    avg_syllables = syllables / max(word_count, 1)
-    flesch = 206.835 - 1.015 * avg_sentence_length - 84.6 * avg_syllables
-    flesch_score = max(0, min(100, flesch))
+    stats = get_text_stats(text)
+    avg_sentence_length = stats.avg_sentence_length
+    flesch_score = stats.flesch_score
     
     # SEO impact assessment
     if flesch_score >= 60:
@@ -151,7 +140,7 @@ class EnhancedSEOAgent:
     """
     Enterprise SEO Agent with:
     - LLM-driven optimization (GPT-4o / Claude Sonnet 4)
-    - Tool use (keyword analysis, meta generation, readability)
+    - Local tool pre-pass (keyword analysis, meta generation, readability)
     - Self-refinement loop for SEO score validation
     - Dynamic search intent determination
     """
@@ -213,15 +202,14 @@ class EnhancedSEOAgent:
             else:
                 logger.info(f"⚠️ SEO score too low: {seo_score:.2f}, refining...")
         
-        # Generate meta tags
-        meta_result = generate_meta_tags.invoke({
+        # Meta tags and keyword analysis of the optimized content come from the last round's checks
+        results = {r["tool"]: r.get("result", {}) for r in tool_results}
+        meta_result = results.get("generate_meta_tags") or generate_meta_tags.invoke({
             "text": optimized_content,
             "keywords": target_keywords,
             "max_title_length": 60
         })
-        
-        # Create SEO analysis
-        keyword_analysis = analyze_keyword_density.invoke({
+        keyword_analysis = results.get("analyze_keyword_density") or analyze_keyword_density.invoke({
             "text": optimized_content,
             "target_keywords": target_keywords
         })
@@ -276,8 +264,8 @@ class EnhancedSEOAgent:
                 }
             )
 
-            # Bind tools
-            model_with_tools = model.bind_tools(self.tools)
+            # Tools run locally up front; the model gets their results, not tool schemas
+            analysis = self._run_seo_tools(content, keywords)
 
             # Build SEO prompt
             system_prompt = self._build_seo_system_prompt(keywords, intent, template_config)
@@ -287,13 +275,16 @@ class EnhancedSEOAgent:
     **Target Keywords:** {', '.join(keywords)}
     **Search Intent:** {intent}
 
+    **Pre-computed Analysis:**
+    {format_tool_results(analysis)}
+
     **Content to Optimize:**
     {content}
 
     **Instructions:**
-    1. Use analyze_keyword_density to check current keyword usage
-    2. Use check_readability_seo to assess SEO impact of readability
-    3. Use generate_meta_tags to create optimized meta tags
+    1. Use the analyze_keyword_density results to rebalance keyword usage
+    2. Use the check_readability_seo results to judge the SEO impact of readability
+    3. Improve on the generate_meta_tags draft where the content allows
     4. Adjust keyword placement naturally (1-3% density per keyword)
     5. Maintain content quality while improving discoverability
     6. Ensure headers include target keywords
@@ -306,26 +297,25 @@ class EnhancedSEOAgent:
                 HumanMessage(content=user_prompt)
             ]
 
-            # Invoke with tools
-            response = model_with_tools.invoke(messages)
+            # Single call: no tool round trips
+            response = model.invoke(messages)
 
-            # Extract tool results
-            tool_results = []
-            if hasattr(response, 'tool_calls') and response.tool_calls:
-                for tool_call in response.tool_calls:
-                    logger.info(f"🔧 Tool called: {tool_call['name']}")
-                    tool_results.append({
-                        "tool": tool_call['name'],
-                        "result": tool_call.get('args', {})
-                    })
+            # Extract optimized content
+            optimized = response.content if hasattr(response, 'content') else content
 
-            # Calculate SEO score
+            # Score the optimized content, not the input
+            tool_results = self._run_seo_tools(optimized, keywords)
             seo_score = self._calculate_seo_score(tool_results, keywords)
 
-            # Extract optimized content
-            optimized = response.content if hasattr(response, 'content') else content
+            return optimized, tool_results, seo_score
 
-            return optimized, tool_results, seo_score    
+    def _run_seo_tools(self, content: str, keywords: List[str]) -> List[Dict]:
+        """Run the SEO tools locally and concurrently"""
+        return run_tools_locally([
+            (analyze_keyword_density, {"text": content, "target_keywords": keywords}),
+            (check_readability_seo, {"text": content}),
+            (generate_meta_tags, {"text": content, "keywords": keywords, "max_title_length": 60}),
+        ])
     
     def _build_seo_system_prompt(
         self,
@@ -358,7 +348,7 @@ class EnhancedSEOAgent:
 6. Meta optimization: Compelling titles/descriptions with keywords
 
 **Critical Instructions:**
-- Use available tools to analyze and validate optimizations
+- Use the pre-computed tool analysis to guide and validate optimizations
 - Never sacrifice content quality for SEO tactics
 - Maintain factual accuracy and authority
 - Focus on user value - search engines reward helpful content
@@ -440,4 +430,44 @@ class EnhancedSEOAgent:
         elif any(w in template_type for w in ['brand', 'about', 'company']):
             return "navigational"
         
-        return "informational"  # Default
\ No newline at end of file
+        return "informational"  # Default
+
+
+async def invoke_seo_agent(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Local SEO analysis for /api/analyze/content (tools only, no LLM call).
+
+    Keywords come from payload["keywords"], falling back to the H1 title.
+    """
+    content = payload.get("final_content") or ""
+    keywords = [str(k).strip() for k in payload.get("keywords") or [] if str(k).strip()]
+    if not keywords:
+        heading = re.search(r'^#\s+(.+)$', content, re.M)
+        keywords = [heading.group(1).strip()] if heading else []
+
+    def _analyze() -> Dict[str, Any]:
+        agent = EnhancedSEOAgent()
+        tool_results = agent._run_seo_tools(content, keywords)
+        results = {r["tool"]: r.get("result", {}) for r in tool_results}
+        keyword_analysis = results.get("analyze_keyword_density", {})
+        readability = results.get("check_readability_seo", {})
+
+        suggestions = list(keyword_analysis.get("recommendations", [])) if keywords else []
+        if readability.get("recommendation"):
+            suggestions.append(readability["recommendation"])
+
+        return {
+            "readability_score": readability.get("flesch_score", 50),
+            "seo_optimization": {
+                "score": round(agent._calculate_seo_score(tool_results, keywords) * 100),
+                "keyword_density": {
+                    kw: data["density"] for kw, data in keyword_analysis.get("densities", {}).items()
+                },
+                "suggestions": suggestions
+            },
+            "meta_tags": results.get("generate_meta_tags", {}),
+            "text_stats": get_text_stats(content).to_dict()
+        }
+
+    # Keyword and readability scans are CPU-bound on large documents
+    return await asyncio.to_thread(_analyze)
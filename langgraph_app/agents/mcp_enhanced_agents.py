@@ -48,6 +48,8 @@ import uvicorn
 from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST, CollectorRegistry
 import structlog
 
+from ..core.config_registry import ConfigRegistry, memoize_per_registry
+
 # Enhanced model registry
 try:
     from ..enhanced_model_registry import get_model, EnhancedModelRegistry
@@ -355,115 +357,95 @@ def parse_template_parameters(parameters_data: Any) -> Dict[str, TemplateParamet
     
     return processed_parameters
 
-def load_templates() -> List[ContentTemplate]:
-    """Load and validate all content templates"""
+def _build_templates(registry: ConfigRegistry) -> tuple:
+    """ContentTemplate models for every template in the registry"""
     templates = []
     
-    for template_dir in get_template_paths():
-        if not os.path.exists(template_dir):
-            continue
-            
+    for record in registry.templates():
+        template_data = record.to_dict()
         try:
-            files = os.listdir(template_dir)
+            template_id = record.id
+            parameters_data = template_data.get("parameters", {})
+            processed_parameters = parse_template_parameters(parameters_data)
+            
+            template = ContentTemplate(
+                id=template_id,
+                slug=template_data.get('slug', template_id),
+                name=template_data.get("name", template_id.replace('_', ' ').title()),
+                description=template_data.get("description", ""),
+                category=template_data.get("category", "general"),
+                defaults=template_data.get("defaults", {}),
+                system_prompt=template_data.get("system_prompt"),
+                structure=template_data.get("structure", {}),
+                research=template_data.get("research", {}),
+                parameters=processed_parameters,
+                metadata=template_data.get("metadata", {}),
+                version=template_data.get("version", "1.0.0"),
+                filename=record.path.name
+            )
+            templates.append(template)
             
-            for filename in files:
-                if not filename.endswith('.yaml'):
-                    continue
-                
-                file_path = os.path.join(template_dir, filename)
-                template_data = load_yaml_file_safe(file_path)
-                
-                if not template_data:
-                    continue
-                
-                try:
-                    template_id = template_data.get('id', filename.replace('.yaml', ''))
-                    parameters_data = template_data.get("parameters", {})
-                    processed_parameters = parse_template_parameters(parameters_data)
-                    
-                    template = ContentTemplate(
-                        id=template_id,
-                        slug=template_data.get('slug', template_id),
-                        name=template_data.get("name", template_id.replace('_', ' ').title()),
-                        description=template_data.get("description", ""),
-                        category=template_data.get("category", "general"),
-                        defaults=template_data.get("defaults", {}),
-                        system_prompt=template_data.get("system_prompt"),
-                        structure=template_data.get("structure", {}),
-                        research=template_data.get("research", {}),
-                        parameters=processed_parameters,
-                        metadata=template_data.get("metadata", {}),
-                        version=template_data.get("version", "1.0.0"),
-                        filename=filename
-                    )
-                    templates.append(template)
-                    logger.info(f"✅ Loaded template: {template.name} ({template.id})")
-                    
-                except Exception as e:
-                    logger.error(f"Invalid template format in {filename}: {e}")
-                    continue
-        
         except Exception as e:
-            logger.error(f"Error loading templates from {template_dir}: {e}")
+            logger.error(f"Invalid template format in {record.path.name}: {e}")
             continue
     
     logger.info(f"📊 Total templates loaded: {len(templates)}")
-    return templates
+    return tuple(templates)
 
-def load_style_profiles() -> List[StyleProfile]:
-    """Load and validate all style profiles"""
+def _build_style_profiles(registry: ConfigRegistry) -> tuple:
+    """StyleProfile models for every style profile in the registry"""
     profiles = []
     
-    for profile_dir in get_style_profile_paths():
-        if not os.path.exists(profile_dir):
-            continue
-            
+    for record in registry.style_profiles():
+        profile_data = record.to_dict()
         try:
-            files = os.listdir(profile_dir)
+            profile_id = record.id
+            
+            profile = StyleProfile(
+                id=profile_id,
+                name=profile_data.get("name", profile_id.replace('_', ' ').title()),
+                description=profile_data.get("description", ""),
+                category=profile_data.get("category", "general"),
+                platform=profile_data.get("platform"),
+                tone=profile_data.get("tone"),
+                voice=profile_data.get("voice"),
+                structure=profile_data.get("structure"),
+                audience=profile_data.get("audience"),
+                system_prompt=profile_data.get("system_prompt"),
+                length_limit=profile_data.get("length_limit", {}),
+                settings=profile_data.get("settings", {}),
+                formatting=profile_data.get("formatting", {}),
+                metadata=profile_data.get("metadata", {}),
+                filename=record.path.name
+            )
+            profiles.append(profile)
             
-            for filename in files:
-                if not filename.endswith('.yaml'):
-                    continue
-                
-                file_path = os.path.join(profile_dir, filename)
-                profile_data = load_yaml_file_safe(file_path)
-                
-                if not profile_data:
-                    continue
-                
-                try:
-                    profile_id = profile_data.get('id', filename.replace('.yaml', ''))
-                    
-                    profile = StyleProfile(
-                        id=profile_id,
-                        name=profile_data.get("name", profile_id.replace('_', ' ').title()),
-                        description=profile_data.get("description", ""),
-                        category=profile_data.get("category", "general"),
-                        platform=profile_data.get("platform"),
-                        tone=profile_data.get("tone"),
-                        voice=profile_data.get("voice"),
-                        structure=profile_data.get("structure"),
-                        audience=profile_data.get("audience"),
-                        system_prompt=profile_data.get("system_prompt"),
-                        length_limit=profile_data.get("length_limit", {}),
-                        settings=profile_data.get("settings", {}),
-                        formatting=profile_data.get("formatting", {}),
-                        metadata=profile_data.get("metadata", {}),
-                        filename=filename
-                    )
-                    profiles.append(profile)
-                    logger.info(f"✅ Loaded style profile: {profile.name} ({profile.id})")
-                    
-                except Exception as e:
-                    logger.error(f"Invalid style profile format in {filename}: {e}")
-                    continue
-        
         except Exception as e:
-            logger.error(f"Error loading style profiles from {profile_dir}: {e}")
+            logger.error(f"Invalid style profile format in {record.path.name}: {e}")
             continue
     
     logger.info(f"📊 Total style profiles loaded: {len(profiles)}")
-    return profiles
+    return tuple(profiles)
+
+# Built once per registry version instead of re-parsing YAML on every request
+_cached_templates = memoize_per_registry(_build_templates)
+_cached_style_profiles = memoize_per_registry(_build_style_profiles)
+
+def load_templates() -> List[ContentTemplate]:
+    """Load and validate all content templates"""
+    try:
+        return list(_cached_templates())
+    except FileNotFoundError as e:
+        logger.error(f"Error loading templates: {e}")
+        return []
+
+def load_style_profiles() -> List[StyleProfile]:
+    """Load and validate all style profiles"""
+    try:
+        return list(_cached_style_profiles())
+    except FileNotFoundError as e:
+        logger.error(f"Error loading style profiles: {e}")
+        return []
 
 # FIXED: Unified content generation function with proper exception handling
 async def execute_content_generation(
@@ -6,24 +6,36 @@ import yaml
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-import tiktoken
 from types import SimpleNamespace
 import asyncio
 from dotenv import load_dotenv
-from openai import OpenAI
 from langchain_core.runnables import RunnableLambda
 from langgraph_app.enhanced_model_registry import get_model
 from langgraph_app.core.circuit_breaker import get_circuit_breaker
+from langgraph_app.core.prompt_cache import PromptBuilder, get_prompt_cache_stats, prefix_hash
+from langgraph_app.core.prompt_templates import compile_template
+from langgraph_app.core.model_router import get_model_router
+from langgraph_app.core.model_registry import MODEL_SPECS
+from langgraph_app.core.generation_stream import ParagraphAccumulator, get_stream_registry
+from langgraph_app.core.ai_tells import get_forbidden_matcher
+from langgraph_app.core.token_budget import (
+    BudgetItem,
+    BudgetSection,
+    get_token_budget_service,
+    relevance_value
+)
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
 from langgraph_app.core.state import EnrichedContentState
 from langchain_core.messages import SystemMessage, HumanMessage
 from langgraph_app.agents.realtime_search import RealTimeSearchMixin
 from langgraph_app.enhanced_model_registry import get_model_for_generation
+from langgraph_app.enhanced_model_registry import create_openai_client, fake_llm_enabled
 from langgraph_app.core.state import (
     EnrichedContentState,
     AgentType,
@@ -33,6 +45,19 @@ from langgraph_app.core.state import (
 logger = logging.getLogger(__name__)
 load_dotenv()
 
+# Outlines at least this long are written section by section in parallel
+SECTIONAL_MIN_WORDS = int(os.getenv("WRITER_SECTIONAL_MIN_WORDS", "3000"))
+SECTION_CONCURRENCY = int(os.getenv("WRITER_SECTION_CONCURRENCY", "6"))
+# Prompt token limit for the writer (generation_settings.max_prompt_tokens overrides per request)
+PROMPT_TOKEN_LIMIT = int(os.getenv("WRITER_PROMPT_TOKEN_LIMIT", "8000"))
+
+# YAML front matter stripped from blog output; the match can span paragraphs
+_FRONT_MATTER = re.compile(r"^---[\s\S]*?---\s*", re.MULTILINE)
+
+
+def _normalize_blank_lines(text: str) -> str:
+    return re.sub(r"\n{3,}", "\n\n", text).strip()
+
 class WritingMode(Enum):
     CREATIVE = "creative"
     ANALYTICAL = "analytical" 
@@ -113,16 +138,6 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
         - Graceful failure with clear error messages
         """
         
-        circuit_breaker = get_circuit_breaker()
-        provider = "openai"
-        
-        # Check circuit breaker before attempting API call
-        if not circuit_breaker.can_execute(provider):
-            raise RuntimeError(
-                "OpenAI API circuit breaker is OPEN due to repeated failures. "
-                "The service may be experiencing issues. Please try again in a few minutes."
-            )
-        
         # Check if model supports custom temperature
         supports_temperature = self._supports_temperature(model_name)
     
@@ -142,69 +157,197 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
             api_kwargs["temperature"] = float(temperature)
         else:
             logger.info(f"Model {model_name} does not support custom temperature, using default")
-    
+
+        def send(kwargs):
+            response = self.client.chat.completions.create(**kwargs)
+            return response, getattr(response, "usage", None)
+
+        return self._openai_with_retries(model_name, system_content, api_kwargs, send, "Writer API call")
+
+    def _call_openai_stream(self, model_name, system_content, user_content, max_tokens, temperature, on_text):
+        """
+        Streaming variant of _call_openai: pushes text deltas to on_text as they arrive.
+
+        Retries transient errors only before the first token - a partially
+        streamed completion cannot be resumed. Returns (raw_text, finish_reason).
+        """
+        api_kwargs = {
+            "model": model_name,
+            "messages": [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": user_content}
+            ],
+            "max_completion_tokens": max_tokens,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+            "timeout": 800.0
+        }
+        if self._supports_temperature(model_name):
+            api_kwargs["temperature"] = float(temperature)
+
+        parts: List[str] = []
+
+        def send(kwargs):
+            parts.clear()
+            finish_reason = None
+            usage = None
+            for chunk in self.client.chat.completions.create(**kwargs):
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                choice = chunk.choices[0]
+                delta = getattr(choice.delta, "content", None)
+                if delta:
+                    parts.append(delta)
+                    on_text(delta)
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+            return ("".join(parts), finish_reason), usage
+
+        return self._openai_with_retries(
+            model_name, system_content, api_kwargs, send, "Writer stream", delivered=lambda: len(parts)
+        )
+
+    def _openai_with_retries(
+        self,
+        model_name: str,
+        system_content: str,
+        api_kwargs: Dict[str, Any],
+        send: Callable[[Dict[str, Any]], Tuple[Any, Any]],
+        label: str,
+        delivered: Callable[[], int] = lambda: 0
+    ) -> Any:
+        """
+        Circuit breaker, retry and usage accounting shared by the writer's OpenAI calls.
+
+        send(api_kwargs) makes one attempt and returns (result, usage).
+        delivered() counts output already handed to the caller; once it is
+        non-zero a failure is final, since a partial stream cannot be resumed.
+        """
+        circuit_breaker = get_circuit_breaker()
+        router = get_model_router()
+        provider = "openai"
+
+        # Check circuit breaker before attempting API call
+        if not circuit_breaker.can_execute(provider):
+            raise RuntimeError(
+                "OpenAI API circuit breaker is OPEN due to repeated failures. "
+                "The service may be experiencing issues. Please try again in a few minutes."
+            )
+
         # Retry configuration
         max_attempts = 3
         delays = [2.0, 5.0, 10.0]  # Exponential-ish backoff
-        
+
         for attempt in range(max_attempts):
+            started = time.time()
             try:
-                # Attempt API call
-                response = self.client.chat.completions.create(**api_kwargs)
-                
-                # Success - record with circuit breaker
+                result, usage = send(api_kwargs)
+
+                # Success - record with circuit breaker and router
                 circuit_breaker.record_success(provider)
-                
+                router.record_call(
+                    model_name, time.time() - started, success=True,
+                    output_tokens=getattr(usage, "completion_tokens", 0) or 0
+                )
+                get_prompt_cache_stats().record_usage(
+                    "writer", provider, usage, prefix_hash=prefix_hash(system_content)
+                )
+
                 # Log retry success if not first attempt
                 if attempt > 0:
-                    logger.info(f"✅ Writer API call succeeded on retry {attempt + 1}/{max_attempts}")
-                
-                return response
-                
+                    logger.info(f"✅ {label} succeeded on retry {attempt + 1}/{max_attempts}")
+
+                return result
+
             except Exception as e:
                 error_str = str(e).lower()
                 error_type = type(e).__name__
-                
+                chunks = delivered()
+
                 # Special handling for temperature parameter error
-                if "temperature" in error_str and "unsupported" in error_str:
+                if not chunks and "temperature" in error_str and "unsupported" in error_str:
                     logger.warning(f"Temperature not supported for {model_name}, retrying without temperature parameter")
                     api_kwargs.pop("temperature", None)
                     continue  # Immediate retry without recording failure
-                
-                # Record failure with circuit breaker
+
+                # Record failure with circuit breaker and router
                 circuit_breaker.record_failure(provider, error_type)
-                
+                router.record_call(model_name, time.time() - started, success=False)
+
                 # Determine if error is retryable
                 is_retryable = any(keyword in error_str for keyword in [
                     'timeout', 'rate_limit', 'overloaded', '429', '500', '503', '529'
                 ])
-                
+
                 # Retry on transient errors
-                if attempt < max_attempts - 1 and is_retryable:
+                if not chunks and attempt < max_attempts - 1 and is_retryable:
                     delay = delays[attempt] + random.uniform(0, 1.0)  # Add jitter
                     logger.warning(
-                        f"⚠️ Writer API call failed with {error_type} "
+                        f"⚠️ {label} failed with {error_type} "
                         f"(attempt {attempt + 1}/{max_attempts}). "
                         f"Retrying in {delay:.1f}s..."
                     )
                     time.sleep(delay)
                 else:
-                    # Final attempt or non-retryable error
+                    # Final attempt, non-retryable error or partial stream
                     logger.error(
-                        f"❌ Writer API call failed: {error_type} - {str(e)}. "
+                        f"❌ {label} failed: {error_type} - {str(e)}"
+                        f"{f' after {chunks} chunks' if chunks else ''}. "
                         f"Attempt {attempt + 1}/{max_attempts}."
                     )
                     raise
-                
+
         # Should never reach here, but for safety
-        raise RuntimeError(f"Writer API call failed after {max_attempts} attempts")
+        raise RuntimeError(f"{label} failed after {max_attempts} attempts")
+
+    def _stream_and_sanitize(self, state: EnrichedContentState, stream_channel, **call_kwargs) -> Tuple[str, str]:
+        """
+        Stream the completion and run _sanitize_and_enforce per paragraph as each completes.
+
+        Paragraph splitting keeps code fences and a leading front matter block
+        whole. The blog front-matter strip is the one pass that can span
+        paragraphs (it removes everything between two `---` lines), so when the
+        assembled text contains such a span the final content comes from one
+        full-text pass instead. Returns (raw_content, final_content).
+        """
+        accumulator = ParagraphAccumulator()
+        paragraphs: List[str] = []
+
+        def emit(paragraph: str) -> None:
+            cleaned = self._sanitize_and_enforce(paragraph, template_config=state.template_config, state=state)
+            if cleaned:
+                paragraphs.append(cleaned)
+                if stream_channel:
+                    stream_channel.publish_paragraph(cleaned, agent="writer")
+
+        def on_text(text: str) -> None:
+            if stream_channel:
+                stream_channel.publish_token(text, agent="writer")
+            for paragraph in accumulator.feed(text):
+                emit(paragraph)
+
+        raw, finish_reason = self._call_openai_stream(on_text=on_text, **call_kwargs)
+        for paragraph in accumulator.flush():
+            emit(paragraph)
+
+        if finish_reason == 'length' and not raw.strip():
+            raise RuntimeError(
+                "ENTERPRISE: Model hit token limit before generating content. "
+                "Increase max_tokens in settings or reduce prompt complexity."
+            )
+
+        if self._strips_front_matter(state.template_config) and _FRONT_MATTER.search(_normalize_blank_lines(raw)):
+            return raw, self._sanitize_and_enforce(raw, template_config=state.template_config, state=state)
+        return raw, "\n\n".join(paragraphs).strip()
 
     def __init__(self):
         api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
+        if not api_key and not fake_llm_enabled():
             raise RuntimeError("OPENAI_API_KEY environment variable required")
         
-        self.client = OpenAI(api_key=api_key)
+        self.client = create_openai_client(api_key)
         self.researcher_agent = None  # Will be set by MCP graph
         self.web_search_tool = None   # Will be set by MCP graph
         self.max_real_time_age_hours = 72
@@ -268,10 +411,10 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
             return {}
 
     def _validate_style_requirements(self, content: str, style_config: Dict) -> str:
-        forbidden = style_config.get('forbidden_patterns', [])
-        for pattern in forbidden:
-            if pattern in content.lower():
-                content = content.replace(pattern, "[professional alternative needed]")
+        # Forbidden patterns only; shared tells are left to the editor and publisher
+        content, _ = get_forbidden_matcher(style_config).replace(
+            content, forbidden_replacement="[professional alternative needed]"
+        )
         required_openings = style_config.get('required_opening_patterns', [])
         if required_openings and not any(pattern in content for pattern in required_openings):
             content = f"{required_openings[0]}:\n\n{content}"
@@ -285,8 +428,7 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
 
     def build_from_template_schema(self, template_config: Dict, context: Dict) -> str:
         prompt_schema = template_config.get('prompt_schema')
-        system_preamble = prompt_schema.get('system_preamble')
-        content_template = prompt_schema.get('content_template')
+        compiled = compile_template(prompt_schema.get('system_preamble') + "\n\n" + prompt_schema.get('content_template'))
         dynamic_params = template_config.get('dynamic_parameters', {})
         full_context = {
             'newsletter_type': dynamic_params.get('newsletter_type', 'weekly_roundup'),
@@ -298,16 +440,35 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
             'performance_notes': 'Include optimization notes'
         }
         full_context.update(context)
-        final_prompt = system_preamble + "\n\n" + content_template
-        for key, value in full_context.items():
-            final_prompt = final_prompt.replace(f"{{{{{key}}}}}", str(value))
-        return final_prompt
+        return compiled.render(full_context)
 
 
     # In writer.py, replace _get_template_prompt() with:
 
-    def _build_comprehensive_prompt(self, state: EnrichedContentState) -> tuple[str, str]:
-        """Build system and user prompts from YAML configs - NO FILE DEPENDENCIES"""
+    def _build_comprehensive_prompt(
+        self,
+        state: EnrichedContentState,
+        research_context: Optional[str] = None
+    ) -> tuple[str, str]:
+        """Build system and user prompts from YAML configs - NO FILE DEPENDENCIES
+
+        Static template/style content forms the system prompt so the prefix is
+        byte-identical across requests (provider prompt caching); everything
+        request-specific, including research, goes in the user prompt.
+        Pass research_context to use an already budgeted research block.
+        """
+
+        builder = self._comprehensive_prompt_builder(state)
+
+        # Research changes every request - keep it out of the cached prefix
+        if research_context is None:
+            research_context = self._build_research_context(state)
+        builder.add_dynamic("research", research_context)
+
+        return builder.build()
+
+    def _comprehensive_prompt_builder(self, state: EnrichedContentState) -> PromptBuilder:
+        """Prompt builder with every section except research"""
 
         template_config = state.template_config
         style_config = state.style_config
@@ -325,53 +486,38 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
         tone = style_config.get('tone', 'professional')
         voice = style_config.get('voice', 'authoritative')
 
-        # Build system prompt
-        system_parts = []
-
-        if system_prompt:
-            system_parts.append(system_prompt)
-
-        if style_prompt:
-            system_parts.append(f"\nStyle Guide: {style_prompt}")
-
-        system_parts.append(f"\nTone: {tone} | Voice: {voice}")
+        builder = PromptBuilder(separator="\n")
 
+        # Static prefix: template first, then style
+        builder.add_static("template_system", system_prompt)
         if instructions:
-            system_parts.append(f"\nInstructions: {instructions}")
-
-        # Add structure requirements
+            builder.add_static("template_instructions", f"\nInstructions: {instructions}")
         if structure:
             structure_text = self._format_structure_requirements(structure)
-            system_parts.append(f"\nStructure: {structure_text}")
-
-        # Integrate research if available
-        research_context = self._build_research_context(state)
-        if research_context:
-            system_parts.append(f"\n{research_context}")
+            builder.add_static("template_structure", f"\nStructure: {structure_text}")
+        if style_prompt:
+            builder.add_static("style_guide", f"\nStyle Guide: {style_prompt}")
+        builder.add_static("style_voice", f"\nTone: {tone} | Voice: {voice}", cache_breakpoint=True)
 
-        # Build user prompt
-        user_parts = [
+        # Dynamic suffix: request data
+        builder.add_dynamic("request", "\n".join([
             f"Topic: {state.content_spec.topic}",
             f"Audience: {state.content_spec.target_audience}",
             f"Platform: {state.content_spec.platform}"
-        ]
+        ]))
 
         # Add planning context
         if state.planning_output:
-            planning_context = self._format_planning_context(state.planning_output)
-            user_parts.append(f"\n{planning_context}")
+            builder.add_dynamic("planning", self._format_planning_context(state.planning_output))
 
         # Add dynamic parameters
         dynamic_params = self._extract_user_inputs(state)
         if dynamic_params:
-            user_parts.append("\nParameters:")
-            for key, value in dynamic_params.items():
-                user_parts.append(f"- {key}: {value}")
-
-        system_content = "\n".join(system_parts)
-        user_content = "\n".join(user_parts)
+            builder.add_dynamic("parameters", "\n".join(
+                ["Parameters:"] + [f"- {key}: {value}" for key, value in dynamic_params.items()]
+            ))
 
-        return system_content, user_content
+        return builder
 
     def _format_structure_requirements(self, structure: Dict) -> str:
         """Format structure requirements from template"""
@@ -764,34 +910,36 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
     
     def _build_research_context(self, state: EnrichedContentState) -> str:
         """Extract research for writer prompt"""
-        
-        research = getattr(state, 'research_findings', None)
-        if not research:
-            return ""
+        return "\n".join(
+            section.render() for section in self._research_sections(state) if section.items
+        )
+
+    def _research_sections(self, state: EnrichedContentState) -> List[BudgetSection]:
+        """Research context as budgetable sections - each insight/priority can be dropped individually"""
+        sections = []
 
-        context_parts = []
-        
         # Primary insights
-        insights = getattr(research, 'primary_insights', [])
-        if insights:
-            context_parts.append("## KEY RESEARCH INSIGHTS:")
-            for insight in insights[:5]:
-                if isinstance(insight, dict):
-                    finding = insight.get('finding', '')
-                    if finding:
-                        context_parts.append(f"- {finding}")
-        
-        # Planning priorities
+        research = getattr(state, 'research_findings', None)
+        insights = getattr(research, 'primary_insights', []) if research else []
+        items = []
+        for position, insight in enumerate(insights[:5]):
+            if isinstance(insight, dict) and insight.get('finding'):
+                items.append(BudgetItem(f"- {insight['finding']}", relevance_value(insight, position)))
+        if items:
+            sections.append(BudgetSection("research_insights", "## KEY RESEARCH INSIGHTS:", items, priority=1))
+
+        # Planning priorities - planner direction outranks individual findings
         planning = getattr(state, 'planning_output', None)
-        if planning:
-            priorities = getattr(planning, 'research_priorities', [])
-            if priorities:
-                context_parts.append("\n## CONTENT PRIORITIES:")
-                for priority in priorities[:3]:
-                    context_parts.append(f"- {priority}")
-        
-        return "\n".join(context_parts) if context_parts else ""
-   
+        priorities = getattr(planning, 'research_priorities', []) if planning else []
+        if priorities:
+            sections.append(BudgetSection(
+                "content_priorities",
+                "\n## CONTENT PRIORITIES:",
+                [BudgetItem(f"- {priority}", 1.0 / (1 + 0.1 * i)) for i, priority in enumerate(priorities[:3])],
+                priority=2
+            ))
+
+        return sections
 
     def _generate_adaptive_content(self, state: Dict[str, Any]) -> str:
         template_config = state.template_config or {}
@@ -1065,17 +1213,16 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
         text = raw or ""
 
         # Basic cleanup
-        text = re.sub(r"\n{3,}", "\n\n", text).strip()
+        text = _normalize_blank_lines(text)
 
         if not template_config:
             return text
 
         template_type = template_config.get('template_type', '')
-        template_id = str(template_config.get('id', template_config.get('slug', '')))
 
-        if template_type == 'blog_article' or 'blog' in template_id.lower():
+        if self._strips_front_matter(template_config):
             # Remove YAML front matter
-            text = re.sub(r"^---[\s\S]*?---\s*", "", text, flags=re.MULTILINE)
+            text = _FRONT_MATTER.sub("", text)
 
             # Remove explicit section labels
             forbidden_headings = [
@@ -1113,6 +1260,13 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
             return self._basic_code_removal(text)
 
 
+    def _strips_front_matter(self, template_config: Optional[Dict]) -> bool:
+        """Blog templates get the narrative clean-up, starting with the front-matter strip"""
+        if not template_config:
+            return False
+        template_id = str(template_config.get('id', template_config.get('slug', '')))
+        return template_config.get('template_type', '') == 'blog_article' or 'blog' in template_id.lower()
+
     def _enforce_blog_narrative_style(self, text: str) -> str:
         # Remove code blocks and inline code
         text = re.sub(r"```[\s\S]*?```", "", text, flags=re.DOTALL)
@@ -1195,8 +1349,14 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
         if not state.style_config:
             raise RuntimeError("ENTERPRISE: style_config required")
     
-        # Build prompts
-        system_content, user_content = self._build_comprehensive_prompt(state)
+        # Generation settings
+        generation_settings = self._get_user_generation_settings(state)
+        model_name = get_model("writer", generation_settings).model_name
+    
+        # Build prompts within the token budget
+        system_content, user_content, available_tokens = self._enforce_token_budget(
+            state, model_name, prompt_limit=generation_settings.get("max_prompt_tokens")
+        )
     
         logger.info(f"System content type: {type(system_content)}, length: {len(str(system_content))}")
         logger.info(f"User content type: {type(user_content)}, length: {len(str(user_content))}")
@@ -1211,10 +1371,6 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
         if len(user_content) < 20:
             raise RuntimeError("ENTERPRISE: User prompt too short")
     
-        # Generation settings
-        generation_settings = self._get_user_generation_settings(state)
-        model_name = get_model("writer", generation_settings).model_name
-    
         # Token limit
         max_completion = (
             generation_settings.get("max_completion_tokens")
@@ -1222,30 +1378,75 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
         )
         if not max_completion:
             raise ValueError("ENTERPRISE: max_tokens or max_completion_tokens required in generation_settings")
+        if max_completion > available_tokens:
+            logger.warning(f"⚠️ Capping max_completion_tokens {max_completion} -> {available_tokens} (prompt budget)")
+            max_completion = available_tokens
+    
+        # Stream whenever the request has a progress channel, unless settings opt out
+        stream_channel = get_stream_registry().get(getattr(state, "request_id", None))
+        use_streaming = generation_settings.get("stream", stream_channel is not None)
+    
+        # Long planner outlines are written section by section in parallel
+        outline = self._sectional_outline(state, generation_settings)
     
         try:
-            # Single unified model call
-            response = self._call_openai(
-                model_name=model_name,
-                system_content=system_content,
-                user_content=user_content,
-                max_tokens=max_completion,
-                temperature=generation_settings.get("temperature", 1.0),
-                generation_settings=generation_settings,
-            )
+            content = None
+            if outline:
+                try:
+                    content, final_content = self._write_sections(
+                        state,
+                        stream_channel,
+                        outline,
+                        model_name=model_name,
+                        system_content=system_content,
+                        user_content=user_content,
+                        max_tokens=max_completion,
+                        temperature=generation_settings.get("temperature", 1.0),
+                        generation_settings=generation_settings,
+                    )
+                except Exception as e:
+                    # A failed section costs the parallel speed-up, not the request
+                    logger.warning(f"⚠️ Sectional writing failed, falling back to a single completion: {e}")
+
+            if content is not None:
+                if len(content.strip()) < 100:
+                    raise RuntimeError("ENTERPRISE: Insufficient content generated")
+            elif use_streaming:
+                # Paragraphs are sanitized and published as they complete
+                content, final_content = self._stream_and_sanitize(
+                    state,
+                    stream_channel,
+                    model_name=model_name,
+                    system_content=system_content,
+                    user_content=user_content,
+                    max_tokens=max_completion,
+                    temperature=generation_settings.get("temperature", 1.0),
+                )
+                if not content or len(content.strip()) < 100:
+                    raise RuntimeError("ENTERPRISE: Insufficient content generated")
+            else:
+                # Single unified model call
+                response = self._call_openai(
+                    model_name=model_name,
+                    system_content=system_content,
+                    user_content=user_content,
+                    max_tokens=max_completion,
+                    temperature=generation_settings.get("temperature", 1.0),
+                    generation_settings=generation_settings,
+                )
     
-            # Extract content
-            content = self._extract_content_from_openai_response(response)
+                # Extract content
+                content = self._extract_content_from_openai_response(response)
     
-            if not content or len(content.strip()) < 100:
-                raise RuntimeError("ENTERPRISE: Insufficient content generated")
+                if not content or len(content.strip()) < 100:
+                    raise RuntimeError("ENTERPRISE: Insufficient content generated")
     
-            # Final sanitization/formatting
-            final_content = self._sanitize_and_enforce(
-                content,
-                template_config=state.template_config,
-                state=state
-            )
+                # Final sanitization/formatting
+                final_content = self._sanitize_and_enforce(
+                    content,
+                    template_config=state.template_config,
+                    state=state
+                )
     
             state.content = final_content
             state.draft_content = final_content
@@ -1257,23 +1458,231 @@ class TemplateAwareWriterAgent(RealTimeSearchMixin):
             logger.error(f"Writer execution failed: {e}")
             raise RuntimeError(f"ENTERPRISE: Writer failed - {e}")
 
-    def _enforce_token_budget(self, system_prompt: str, user_prompt: str, model_name: str, target_max: int = 24000) -> Tuple[str, str, int]:
-        """Estimate token usage and trim or summarize prompts to stay within safe model limits."""
-        enc = tiktoken.encoding_for_model(model_name if "gpt" in model_name else "gpt-4o")
-        system_tokens = len(enc.encode(system_prompt))
-        user_tokens = len(enc.encode(user_prompt))
-        total_tokens = system_tokens + user_tokens
-
-        # Safe cap margin (keep ~10% buffer)
-        if total_tokens > target_max * 0.9:
-            logger.warning(f"⚠️ Token budget exceeded ({total_tokens}). Summarizing user prompt to reduce length.")
-            # Keep last 1500 characters of user prompt (most relevant research)
-            user_prompt = user_prompt[-1500:]
-            total_tokens = len(enc.encode(system_prompt)) + len(enc.encode(user_prompt))
-
-        # Remaining token budget for generation
-        available = max(1000, target_max - total_tokens)
-        return system_prompt, user_prompt, available
+    def _sectional_outline(self, state: EnrichedContentState, generation_settings: Dict[str, Any]) -> List[Dict]:
+        """
+        Planner sections to write in parallel, or [] for a single completion.
+
+        generation_settings["sectional"] forces the mode on or off; otherwise it
+        applies when the outline totals at least SECTIONAL_MIN_WORDS words.
+        """
+        setting = generation_settings.get("sectional")
+        if setting is False:
+            return []
+
+        planning = state.planning_output
+        outline = [
+            section for section in (getattr(planning, "estimated_sections", None) or [])
+            if isinstance(section, dict) and section.get("name")
+        ]
+        if len(outline) < 2:
+            return []
+
+        total_words = sum(int(section.get("estimated_words") or 0) for section in outline)
+        if setting is True or total_words >= SECTIONAL_MIN_WORDS:
+            logger.info(f"Sectional writing: {len(outline)} sections, ~{total_words} words")
+            return outline
+        return []
+
+    def _write_sections(
+        self,
+        state: EnrichedContentState,
+        stream_channel,
+        outline: List[Dict],
+        model_name: str,
+        system_content: str,
+        user_content: str,
+        max_tokens: int,
+        temperature: float,
+        generation_settings: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """
+        Write outline sections concurrently, then stitch them.
+
+        Every section call shares the system prompt and the full request
+        prompt (same cacheable prefix), followed by the outline and the
+        section to write. Token budgets are split by estimated words. Sections
+        are published to the stream in outline order once every section has
+        been written, so a failed section leaves the stream untouched for the
+        single-completion fallback. Returns (raw_content, final_content).
+        """
+        words = [max(int(section.get("estimated_words") or 0), 100) for section in outline]
+        total_words = sum(words)
+        started = time.time()
+
+        def write(idx: int) -> str:
+            # Reasoning models spend completion tokens before text: leave headroom
+            budget = min(max_tokens, max(int(max_tokens * words[idx] / total_words * 1.5), words[idx] * 2 + 1000))
+            response = self._call_openai(
+                model_name=model_name,
+                system_content=system_content,
+                user_content=self._section_prompt(user_content, outline, idx),
+                max_tokens=budget,
+                temperature=temperature,
+                generation_settings=generation_settings,
+            )
+            return self._normalize_section(
+                self._extract_content_from_openai_response(response), outline[idx]["name"]
+            )
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(SECTION_CONCURRENCY, len(outline)), thread_name_prefix="writer-section"
+        )
+        try:
+            futures = [pool.submit(write, idx) for idx in range(len(outline))]
+            sections = [future.result() for future in futures]
+        except Exception:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+
+        if stream_channel:
+            for section in sections:
+                stream_channel.publish_paragraph(
+                    self._sanitize_and_enforce(section, template_config=state.template_config, state=state),
+                    agent="writer"
+                )
+
+        logger.info(f"Wrote {len(sections)} sections concurrently in {time.time() - started:.1f}s")
+
+        raw = self._stitch_sections(state, outline, sections, model_name, system_content, max_tokens, generation_settings)
+        final = self._sanitize_and_enforce(raw, template_config=state.template_config, state=state)
+        return raw, final
+
+    def _section_prompt(self, user_content: str, outline: List[Dict], idx: int) -> str:
+        """Shared request prompt + outline, then the one section to write"""
+        section = outline[idx]
+        outline_lines = [
+            f"{n + 1}. {s['name']} (~{s.get('estimated_words', 300)} words)"
+            for n, s in enumerate(outline)
+        ]
+        neighbours = []
+        if idx > 0:
+            neighbours.append(f'The previous section is "{outline[idx - 1]["name"]}".')
+        if idx < len(outline) - 1:
+            neighbours.append(f'The next section is "{outline[idx + 1]["name"]}".')
+        scope = (
+            "This is the final section and may close the piece."
+            if idx == len(outline) - 1 else
+            "Do not conclude or summarize the whole piece."
+        )
+        return f"""{user_content}
+
+FULL OUTLINE (each section is written separately):
+{chr(10).join(outline_lines)}
+
+Write ONLY section {idx + 1}: "{section['name']}" (about {section.get('estimated_words', 300)} words).
+Start with the heading "## {section['name']}". Do not add an article title or introduce the whole piece unless this is section 1.
+Do not repeat material that belongs to other sections. {scope} {' '.join(neighbours)}"""
+
+    def _normalize_section(self, text: str, name: str) -> str:
+        """Drop stray article titles and make sure the section opens with its heading"""
+        text = (text or "").strip()
+        text = re.sub(r"\A#\s+[^\n]*\n+", "", text)
+        if not re.match(r"#{2,6}\s", text):
+            text = f"## {name}\n\n{text}"
+        return text
+
+    def _stitch_sections(
+        self,
+        state: EnrichedContentState,
+        outline: List[Dict],
+        sections: List[str],
+        model_name: str,
+        system_content: str,
+        max_tokens: int,
+        generation_settings: Dict[str, Any]
+    ) -> str:
+        """
+        Join sections, adding a title and one transition sentence per boundary.
+
+        The smoothing call only sees the tail of each section and the next
+        heading, so its output stays short regardless of article length. It is
+        best-effort: on failure the sections are joined as written.
+        """
+        boundaries = []
+        for idx in range(len(sections) - 1):
+            tail = " ".join(sections[idx].split()[-60:])
+            boundaries.append(
+                f'BOUNDARY {idx + 1}: "{outline[idx]["name"]}" ends with: ...{tail}\n'
+                f'Next section: "{outline[idx + 1]["name"]}"'
+            )
+
+        smoothing_prompt = f"""The sections of one article were written separately. Make it read as one piece.
+
+Topic: {state.content_spec.topic}
+
+{chr(10).join(boundaries)}
+
+For each boundary write one sentence to append to the end of the earlier section that leads naturally into the next one.
+Output JSON: {{"title": "article title", "transitions": ["one sentence per boundary, in order"]}}"""
+
+        title, transitions = "", []
+        try:
+            response = self._call_openai(
+                model_name=model_name,
+                system_content=system_content,
+                user_content=smoothing_prompt,
+                max_tokens=min(max_tokens, 1500 + 100 * len(boundaries)),
+                temperature=0.3,
+                generation_settings=generation_settings,
+            )
+            content = self._extract_content_from_openai_response(response)
+            json_match = re.search(r'\{.*\}', content, re.DOTALL)
+            if json_match:
+                smoothing = json.loads(json_match.group(0))
+                title = str(smoothing.get("title") or "").strip()
+                transitions = [str(t).strip() for t in smoothing.get("transitions", [])]
+        except Exception as e:
+            logger.warning(f"⚠️ Section smoothing pass failed, joining sections as written: {e}")
+
+        stitched = []
+        for idx, section in enumerate(sections):
+            if idx < len(transitions) and idx < len(sections) - 1 and transitions[idx]:
+                last_line = section.rstrip().splitlines()[-1].lstrip()
+                # Lists, tables and code blocks get the transition as its own paragraph
+                joiner = "\n\n" if re.match(r"([-*|>]|```|\d+\.)", last_line) else " "
+                section = section.rstrip() + joiner + transitions[idx]
+            stitched.append(section)
+
+        body = "\n\n".join(stitched)
+        return f"# {title}\n\n{body}" if title else body
+
+    def _enforce_token_budget(
+        self,
+        state: EnrichedContentState,
+        model_name: str,
+        target_max: Optional[int] = None,
+        prompt_limit: Optional[int] = None
+    ) -> Tuple[str, str, int]:
+        """Build prompts within the prompt token limit, dropping the lowest-value research items first."""
+        if target_max is None:
+            spec = MODEL_SPECS.get(get_model_router().resolve_key(model_name))
+            target_max = spec.context_window if spec else 24000
+
+        builder = self._comprehensive_prompt_builder(state)
+        system_prompt, user_prompt = builder.build()
+        research_sections = self._research_sections(state)
+
+        result = get_token_budget_service().fit(
+            [
+                BudgetSection("system", system_prompt, required=True, static=True),
+                BudgetSection("user", user_prompt, required=True),
+                *research_sections
+            ],
+            model_name,
+            target_max,
+            prompt_limit or PROMPT_TOKEN_LIMIT
+        )
+
+        if result.trimmed:
+            logger.warning(f"⚠️ Token budget: dropped {result.dropped} ({result.prompt_tokens} prompt tokens)")
+
+        builder.add_dynamic("research", "\n".join(
+            result.sections[section.name] for section in research_sections
+            if result.sections[section.name]
+        ))
+        system_prompt, user_prompt = builder.build()
+        return system_prompt, user_prompt, result.available_tokens
 
     def _extract_sources(self, result: Any) -> List[str]:
         sources = []
@@ -1,6 +1,7 @@
 # langgraph_app/api/content/crud.py
 from fastapi import APIRouter, Header, HTTPException
 from langgraph_app.db_client import prisma
+from langgraph_app.core.markdown_renderer import render_markdown
 
 router = APIRouter()
 
@@ -25,7 +26,7 @@ async def get_single_content(
         "id": content.id,
         "title": content.title,
         "content": content.content,
-        "contentHtml": content.contentHtml,
+        "contentHtml": content.contentHtml or render_markdown(content.content or ""),
         "status": content.status,
         "type": content.type,
         "createdAt": content.createdAt.isoformat(),
@@ -1,20 +1,24 @@
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
+import html
 import io
+from langgraph_app.core.markdown_renderer import render_markdown, stream_markdown
 
 router = APIRouter()
 
 def markdown_to_html(content: str) -> str:
     """Convert markdown to HTML"""
-    import re
-    html = content
-    html = re.sub(r'^### (.*)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.*)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^# (.*)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-    html = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html)
-    html = re.sub(r'\*(.*?)\*', r'<em>\1</em>', html)
-    html = re.sub(r'\n\n', '</p><p>', html)
-    return f'<p>{html}</p>'
+    return render_markdown(content)
+
+def _stream_html_document(title: str, content: str):
+    """Yield an HTML document block by block as the markdown is rendered"""
+    safe_title = html.escape(title)
+    yield f"""<!DOCTYPE html>
+<html><head><title>{safe_title}</title></head>
+<body><h1>{safe_title}</h1>""".encode()
+    for block in stream_markdown(content):
+        yield block.encode()
+    yield b"</body></html>"
 
 @router.post("/content/export")
 async def export_content(data: dict):
@@ -29,12 +33,12 @@ async def export_content(data: dict):
         filename = f"{title.replace(' ', '_')}.md"
     
     elif format_type == "html":
-        html_content = markdown_to_html(content)
-        output = f"""<!DOCTYPE html>
-<html><head><title>{title}</title></head>
-<body><h1>{title}</h1>{html_content}</body></html>"""
-        media_type = "text/html"
         filename = f"{title.replace(' ', '_')}.html"
+        return StreamingResponse(
+            _stream_html_document(title, content),
+            media_type="text/html",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+        )
     
     else:
         output = content
@@ -54,9 +54,9 @@ async def start_generation(
         template_config = config_manager.get_template(req.template_id)
         style_config = config_manager.get_style_profile(req.style_profile_id)
         
-        # 2. Merge user_input into the template_config for the engine
-        # This provides dynamic parameters
-        template_config.update(req.user_input)
+        # 2. Merge user_input into a copy of the template_config for the engine
+        # This provides dynamic parameters without touching the shared config
+        template_config = {**template_config, **req.user_input}
 
         # 3. Add the job to the background tasks
         # We call the GenerationEngine's method, not a local function
@@ -0,0 +1,148 @@
+# langgraph_app/core/ai_tells.py
+
+"""
+Compiled AI-Tell Matcher
+
+One table of AI-tell phrases and their replacements, shared by the
+writer, editor, formatter and publisher. Each style profile gets a
+matcher compiled once: the tells plus the profile's forbidden_patterns
+in a single case-insensitive alternation (longest phrase first, so
+"delve into" wins over "delve"). Detection and replacement are one pass
+over the text with per-phrase counts.
+
+Forbidden patterns are detect-only unless the caller supplies a
+replacement; a forbidden pattern that is also a shared tell is still
+reported as forbidden and gets the tell's replacement. Replacements keep the capitalization of the matched text,
+and straight and curly apostrophes match each other.
+
+Purpose: Stop re-scanning and re-compiling a regex per phrase in every
+agent, and keep every agent working from the same list.
+"""
+
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Phrase -> plain replacement
+AI_TELLS: Dict[str, str] = {
+    "delve into": "examine",
+    "delve": "examine",
+    "delving": "examining",
+    "showcase": "demonstrate",
+    "leverage": "use",
+    "utilize": "use",
+    "in the realm of": "in",
+    "it's worth noting that": "notably",
+    "it is important to note that": "importantly",
+    "it's important to note": "notably",
+    "it should be noted": "note that",
+    "in conclusion": "finally",
+    "in summary": "overall",
+    "crucial": "important",
+    "paradigm shift": "change",
+    "game-changer": "significant innovation",
+}
+
+
+def _normalize(phrase: str) -> str:
+    return " ".join(phrase.replace("’", "'").lower().split())
+
+
+def _phrase_pattern(phrase: str) -> str:
+    escaped = re.escape(phrase)
+    # Any whitespace run between words; either apostrophe style
+    escaped = re.sub(r"(?:\\ )+", r"\\s+", escaped)
+    return escaped.replace("'", "['’]")
+
+
+@dataclass
+class TellHit:
+    """All occurrences of one phrase in a text"""
+    phrase: str
+    replacement: Optional[str]
+    count: int
+    found: str
+    forbidden: bool = False
+
+
+class TellMatcher:
+    """Single compiled alternation over a phrase table"""
+
+    def __init__(self, table: Dict[str, Optional[str]], forbidden: Tuple[str, ...] = ()):
+        self.table = {_normalize(p): r for p, r in table.items() if _normalize(p)}
+        self.forbidden = {_normalize(p) for p in forbidden}
+        phrases = sorted(self.table, key=len, reverse=True)
+        self.pattern = re.compile(
+            r"(?<!\w)(?:" + "|".join(_phrase_pattern(p) for p in phrases) + r")(?!\w)",
+            re.IGNORECASE
+        ) if phrases else None
+
+    def scan(self, text: str) -> List[TellHit]:
+        """Per-phrase counts, in order of first appearance"""
+        if not self.pattern or not text:
+            return []
+        counts: Counter = Counter()
+        first: Dict[str, str] = {}
+        for match in self.pattern.finditer(text):
+            key = _normalize(match.group())
+            counts[key] += 1
+            first.setdefault(key, match.group())
+        return [
+            TellHit(
+                phrase=key, replacement=self.table.get(key), count=counts[key],
+                found=found, forbidden=key in self.forbidden
+            )
+            for key, found in first.items()
+        ]
+
+    def replace(self, text: str, forbidden_replacement: Optional[str] = None) -> Tuple[str, Counter]:
+        """
+        Replace every tell in one pass; returns (text, replacement counts).
+
+        Forbidden patterns are left in place unless forbidden_replacement is given.
+        """
+        counts: Counter = Counter()
+        if not self.pattern or not text:
+            return text, counts
+
+        def _substitute(match: "re.Match") -> str:
+            key = _normalize(match.group())
+            replacement = self.table.get(key)
+            if replacement is None:
+                replacement = forbidden_replacement
+            if replacement is None:
+                return match.group()
+            counts[key] += 1
+            if replacement and match.group()[0].isupper():
+                replacement = replacement[0].upper() + replacement[1:]
+            return replacement
+
+        return self.pattern.sub(_substitute, text), counts
+
+
+@lru_cache(maxsize=128)
+def _matcher_for(forbidden: Tuple[str, ...], include_tells: bool = True) -> TellMatcher:
+    table: Dict[str, Optional[str]] = {p: None for p in forbidden}
+    if include_tells:
+        table.update(AI_TELLS)
+    return TellMatcher(table, forbidden=forbidden)
+
+
+def _forbidden_patterns(style_config: Optional[Dict]) -> Tuple[str, ...]:
+    patterns = (style_config or {}).get("forbidden_patterns") or []
+    return tuple(sorted({str(p) for p in patterns if isinstance(p, str) and p.strip()}))
+
+
+def get_tell_matcher(style_config: Optional[Dict] = None) -> TellMatcher:
+    """Matcher for the shared AI tells plus the style profile's forbidden_patterns"""
+    return _matcher_for(_forbidden_patterns(style_config))
+
+
+def get_forbidden_matcher(style_config: Optional[Dict] = None) -> TellMatcher:
+    """Matcher for the style profile's forbidden_patterns only (no shared tells)"""
+    return _matcher_for(_forbidden_patterns(style_config), include_tells=False)
@@ -0,0 +1,257 @@
+# langgraph_app/core/code_validation.py
+
+"""
+Parallel, Cached Code-Block Validation
+
+Validates fenced code blocks across a process pool so documents with
+dozens of snippets validate in roughly the time of the slowest block.
+Python is compiled, JSON and YAML are parsed, JavaScript/TypeScript get
+bracket-balance checks. Every block has a time limit counted from when a
+worker picks it up (blocks are handed out one per worker, so queued
+blocks are never charged): a block that does not finish is reported as
+timed out and the pool is recycled so a stuck parse cannot hold a
+worker; blocks interrupted by the recycle are resubmitted.
+
+Results are cached by (language, code hash), so unchanged snippets are
+never re-validated across runs.
+
+Configuration:
+- CODE_VALIDATION_WORKERS: worker processes (default min(4, CPU count))
+- CODE_VALIDATION_TIMEOUT_S: per-block time limit in seconds (default 5)
+
+Purpose: Keep validation of code-heavy templates off the request path's
+critical time budget.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_RESULTS = 4096
+
+_BRACKETS = {")": "(", "]": "[", "}": "{"}
+
+# JS/TS string literals (', ", `) and comments; an unterminated one runs to the end
+_JS_SKIPPED = re.compile(
+    r"""'(?:\\.|[^'\\\n])*'?|"(?:\\.|[^"\\\n])*"?|`(?:\\.|[^`\\])*`?|//[^\n]*|/\*[\s\S]*?(?:\*/|$)"""
+)
+
+
+def check_code_syntax(code: str, language: str) -> Dict[str, Any]:
+    """Syntax issues for one block; runs inside pool workers, so stdlib + yaml only"""
+    issues: List[str] = []
+    lang = (language or "").lower()
+
+    if lang in ("python", "py"):
+        try:
+            compile(code, "<code block>", "exec", dont_inherit=True)
+        except SyntaxError as e:
+            issues.append(f"SyntaxError line {e.lineno}: {e.msg}")
+
+        # Check indentation consistency
+        indent_levels = set()
+        for line in code.split("\n"):
+            if line.strip():
+                indent = len(line) - len(line.lstrip())
+                if indent > 0:
+                    indent_levels.add(indent % 4)
+        if len(indent_levels) > 1:
+            issues.append("Inconsistent indentation detected")
+
+    elif lang == "json":
+        try:
+            json.loads(code)
+        except ValueError as e:
+            issues.append(f"Invalid JSON: {e}")
+
+    elif lang in ("yaml", "yml"):
+        try:
+            import yaml
+            yaml.safe_load(code)
+        except ImportError:
+            pass
+        except Exception as e:
+            issues.append(f"Invalid YAML: {e}")
+
+    elif lang in ("javascript", "js", "typescript", "ts"):
+        stack: List[str] = []
+        # Brackets inside strings and comments do not count
+        for char in _JS_SKIPPED.sub(" ", code):
+            if char in "([{":
+                stack.append(char)
+            elif char in _BRACKETS:
+                if not stack or stack.pop() != _BRACKETS[char]:
+                    issues.append(f"Mismatched '{char}'")
+                    break
+        if stack and not issues:
+            issues.append(f"Unclosed '{stack[-1]}'")
+
+    return {
+        "is_valid": len(issues) == 0,
+        "issues": issues,
+        "language": language
+    }
+
+
+def code_key(language: str, code: str) -> Tuple[str, bytes]:
+    """Cache key: (language, content hash)"""
+    digest = hashlib.blake2b((code or "").encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return (language or "").lower(), digest
+
+
+class CodeValidator:
+    """Process-pool validator with a per-block time limit and a result cache"""
+
+    def __init__(self, workers: Optional[int] = None, timeout_s: Optional[float] = None):
+        self.workers = workers or int(os.getenv("CODE_VALIDATION_WORKERS", str(min(4, os.cpu_count() or 1))))
+        self.timeout_s = timeout_s or float(os.getenv("CODE_VALIDATION_TIMEOUT_S", "5"))
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._cache: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.stats = {"validated": 0, "cache_hits": 0, "timeouts": 0}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # spawn: forking a threaded server process is unsafe
+                pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                # Warm the workers so interpreter startup is not charged to the first blocks
+                list(pool.map(check_code_syntax, [""] * self.workers, ["json"] * self.workers))
+                self._pool = pool
+            return self._pool
+
+    def _recycle_pool(self) -> None:
+        """Drop a pool with stuck workers; the next batch starts a fresh one"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        for process in list(getattr(pool, "_processes", {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def validate_blocks(self, blocks: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Validation results in block order for [{'language', 'code'}, ...]"""
+        started = time.time()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(blocks)
+        pending: Dict[Tuple[str, bytes], List[int]] = {}
+
+        with self._cache_lock:
+            for idx, block in enumerate(blocks):
+                key = code_key(block.get("language", ""), block.get("code", ""))
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    results[idx] = cached
+                    self.stats["cache_hits"] += 1
+                else:
+                    pending.setdefault(key, []).append(idx)
+
+        if pending:
+            fresh = self._run(
+                {key: blocks[indexes[0]] for key, indexes in pending.items()}
+            )
+            with self._cache_lock:
+                for key, result in fresh.items():
+                    if not result.get("timed_out"):
+                        self._cache[key] = result
+                    for idx in pending[key]:
+                        results[idx] = result
+                while len(self._cache) > MAX_CACHED_RESULTS:
+                    self._cache.popitem(last=False)
+
+        logger.info(
+            f"Validated {len(blocks)} code blocks ({len(blocks) - sum(map(len, pending.values()))} cached) "
+            f"in {time.time() - started:.2f}s"
+        )
+        return results
+
+    def _run(self, unique: Dict[Tuple, Dict[str, str]]) -> Dict[Tuple, Dict[str, Any]]:
+        try:
+            pool = self._get_pool()
+        except Exception as e:
+            logger.warning(f"⚠️ Code validation pool unavailable, validating inline: {e}")
+            return self._run_inline(unique)
+
+        results: Dict[Tuple, Dict[str, Any]] = {}
+        queue = list(reversed(unique.items()))
+        in_flight: Dict[Future, Tuple[Tuple, float]] = {}
+        while queue or in_flight:
+            # At most one block per worker is submitted, so a block starts when it is
+            # submitted and its time limit runs from then; waiting blocks are not charged
+            while queue and len(in_flight) < max(self.workers, 1):
+                key, block = queue.pop()
+                future = pool.submit(check_code_syntax, block.get("code", ""), block.get("language", ""))
+                in_flight[future] = (key, time.monotonic() + self.timeout_s)
+
+            next_deadline = min(deadline for _, deadline in in_flight.values())
+            done, _ = wait(in_flight, timeout=max(0.0, next_deadline - time.monotonic()),
+                           return_when=FIRST_COMPLETED)
+            for future in done:
+                key, _ = in_flight.pop(future)
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    results[key] = {"is_valid": False, "issues": [f"Validation error: {e}"],
+                                    "language": unique[key].get("language")}
+                self.stats["validated"] += 1
+
+            now = time.monotonic()
+            expired = [f for f, (_, deadline) in in_flight.items() if deadline <= now and not f.done()]
+            if not expired:
+                continue
+            for future in expired:
+                key, _ = in_flight.pop(future)
+                results[key] = {
+                    "is_valid": None,
+                    "issues": [f"Validation timed out after {self.timeout_s:g}s"],
+                    "language": unique[key].get("language"),
+                    "timed_out": True
+                }
+            self.stats["timeouts"] += len(expired)
+
+            # A stuck worker cannot be reclaimed: restart the pool and resubmit the blocks it interrupted
+            logger.warning(f"⚠️ {len(expired)} code blocks timed out; recycling validation pool")
+            queue.extend((key, unique[key]) for key, _ in in_flight.values())
+            in_flight.clear()
+            self._recycle_pool()
+            if queue:
+                try:
+                    pool = self._get_pool()
+                except Exception as e:
+                    logger.warning(f"⚠️ Code validation pool unavailable, validating inline: {e}")
+                    results.update(self._run_inline(dict(queue)))
+                    queue = []
+        return results
+
+    @staticmethod
+    def _run_inline(unique: Dict[Tuple, Dict[str, str]]) -> Dict[Tuple, Dict[str, Any]]:
+        return {
+            key: check_code_syntax(block.get("code", ""), block.get("language", ""))
+            for key, block in unique.items()
+        }
+
+
+# Global code validator instance (singleton pattern)
+_code_validator: Optional[CodeValidator] = None
+
+
+def get_code_validator() -> CodeValidator:
+    """Get or create global code validator instance"""
+    global _code_validator
+    if _code_validator is None:
+        _code_validator = CodeValidator()
+    return _code_validator
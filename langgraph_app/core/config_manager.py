@@ -1,15 +1,15 @@
 # src/langgraph_app/core/config_manager.py
 from __future__ import annotations
 
-import os
+import logging
 from pathlib import Path
-from typing import Dict, List, Tuple
-
-import yaml
-from pydantic import ValidationError
+from typing import Dict, FrozenSet, List
 
+from .config_registry import STYLE_PROFILE, TEMPLATE, get_config_registry, locate_data_root
 from .schemas import Template, StyleProfile
 
+logger = logging.getLogger(__name__)
+
 
 class ConfigManagerError(RuntimeError):
     pass
@@ -25,6 +25,9 @@ class ConfigManager:
     """
     Loads and validates all YAML configs at startup and stores them in-memory.
     Fails fast (raises) if any file is invalid.
+
+    Follows registry hot reloads: changed ids are swapped in, deleted ones
+    dropped. An edit that fails validation keeps the last valid version.
     """
 
     def __init__(
@@ -74,91 +77,56 @@ class ConfigManager:
     def list_style_profiles(self) -> List[str]:
         return sorted(self.styles_by_id.keys())
 
+    def reload(self) -> Dict[str, List[str]]:
+        """Pick up edited files now instead of waiting for the watcher; returns changed ids"""
+        changed = get_config_registry(self.base_dir).refresh()
+        return {kind: sorted(ids) for kind, ids in changed.items()}
+
     # --- Internals --------------------------------------------------------------------------------
 
     def _locate_data_root(self) -> Path:
-        """
-        Resolve the absolute data directory.
-        Priority:
-          1) WRITERZ_DATA_DIR env
-          2) explicit base_dir (if given)
-          3) nearest 'data/' up from this file
-          4) CWD/data
-        """
-        env_dir = os.getenv("WRITERZ_DATA_DIR")
-        if env_dir:
-            candidate = Path(env_dir).expanduser().resolve()
-            if candidate.exists():
-                return candidate
-
-        if self.base_dir:
-            candidate = self.base_dir / "data"
-            if candidate.exists():
-                return candidate.resolve()
-
-        # Walk up from this file to find a sibling 'data'
-        current = Path(__file__).resolve()
-        for parent in [current.parent, *current.parents]:
-            candidate = parent / "data"
-            if candidate.exists():
-                return candidate.resolve()
-
-        # Fallback to CWD/data
-        cwd_candidate = Path.cwd() / "data"
-        if cwd_candidate.exists():
-            return cwd_candidate.resolve()
-
-        raise ConfigManagerError("Could not locate 'data/' directory.")
+        """Resolve the absolute data directory (see config_registry.locate_data_root)."""
+        try:
+            return locate_data_root(self.base_dir)
+        except FileNotFoundError as e:
+            raise ConfigManagerError(str(e))
 
     def _load_all_or_raise(self) -> None:
-        errors: List[str] = []
+        # Parsed and validated once per process by the shared registry
+        registry = get_config_registry(self.base_dir)
 
-        tpl_items = self._load_yaml_dir(self.templates_dir)
-        stl_items = self._load_yaml_dir(self.styles_dir)
+        for record in registry.templates(valid_only=True):
+            self._template_models[record.id] = record.model
+            self.templates_by_id[record.id] = record.validated_dict()
 
-        # Validate templates
-        for path, data in tpl_items:
-            try:
-                model = Template.model_validate(data)
-            except ValidationError as ve:
-                errors.append(f"[TEMPLATE] {path.name}: {ve}")
-                continue
+        for record in registry.style_profiles(valid_only=True):
+            self._style_models[record.id] = record.model
+            self.styles_by_id[record.id] = record.validated_dict()
 
-            tid = model.id
-            if tid in self.templates_by_id:
-                errors.append(f"[TEMPLATE] Duplicate id '{tid}' in {path.name}")
-                continue
-
-            self._template_models[tid] = model
-            self.templates_by_id[tid] = model.model_dump(mode="python")
+        if registry.errors:
+            # Fail fast so the app never boots with invalid configs
+            raise ConfigValidationError(list(registry.errors))
 
-        # Validate styles
-        for path, data in stl_items:
-            try:
-                model = StyleProfile.model_validate(data)
-            except ValidationError as ve:
-                errors.append(f"[STYLE] {path.name}: {ve}")
-                continue
+        registry.subscribe(self._on_config_change)
 
-            sid = model.id
-            if sid in self.styles_by_id:
-                errors.append(f"[STYLE] Duplicate id '{sid}' in {path.name}")
+    def _on_config_change(self, changed: Dict[str, FrozenSet[str]]) -> None:
+        registry = get_config_registry(self.base_dir)
+        for kind, by_id, models in (
+            (TEMPLATE, "templates_by_id", self._template_models),
+            (STYLE_PROFILE, "styles_by_id", self._style_models),
+        ):
+            if kind not in changed:
                 continue
-
-            self._style_models[sid] = model
-            self.styles_by_id[sid] = model.model_dump(mode="python")
-
-        if errors:
-            # Fail fast so the app never boots with invalid configs
-            raise ConfigValidationError(errors)
-
-    @staticmethod
-    def _load_yaml_dir(directory: Path) -> List[Tuple[Path, Dict]]:
-        if not directory.exists():
-            return []
-        items: List[Tuple[Path, Dict]] = []
-        for path in sorted(directory.glob("*.y*ml")):
-            with path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
-                items.append((path, data))
-        return items
+            # Copy-on-write so readers never see a half-applied reload
+            updated = dict(getattr(self, by_id))
+            for config_id in changed[kind]:
+                record = registry.get(kind, config_id, by_stem=False)
+                if record is None:
+                    updated.pop(config_id, None)
+                    models.pop(config_id, None)
+                elif record.validated is None:
+                    logger.warning(f"⚠️ Keeping last valid '{config_id}': {record.error}")
+                else:
+                    updated[config_id] = record.validated_dict()
+                    models[config_id] = record.model
+            setattr(self, by_id, updated)
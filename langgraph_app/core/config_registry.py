@@ -0,0 +1,522 @@
+# langgraph_app/core/config_registry.py
+
+"""
+Shared, Indexed Configuration Registry
+
+Parses every template and style profile YAML file once per process into
+immutable records: the raw document (deep-frozen), the schema-validated
+dump (when validation passes) and a content version. Every YAML consumer
+(ConfigManager, TemplateLoader, DynamicStyleProfileLoader, the MCP API,
+the universal template system and the utils helpers) reads from the same
+registry instead of re-parsing the files.
+
+Records are looked up by id or file stem. Secondary indexes on category,
+platform, audience and template_type answer filtered listings without a
+scan. Index values are lowercased; list-valued fields index every item.
+
+Invalid files do not stop the registry from loading: parse failures and
+schema errors are collected in `errors` (ConfigManager turns them into
+its fail-fast ConfigValidationError), and schema-invalid documents are
+still served raw to the permissive loaders, as before.
+
+Hot reload: refresh() stats every file and re-parses only those whose
+mtime/size changed (and whose content hash actually differs), then swaps
+in a new immutable ConfigSnapshot with a bumped generation and version.
+Subscribers get the changed ids per kind, so derived caches invalidate
+exactly the affected entries. start_watching() runs refresh() on a
+background poll; readers always see one complete snapshot.
+
+Boot reads the binary snapshot (config_snapshot.py) first, so only files
+changed since the snapshot was written are parsed; files are parsed with
+the libyaml CSafeLoader when it is available.
+
+Configuration:
+- WRITERZ_DATA_DIR: data directory holding content_templates/ and style_profiles/
+- CONFIG_SNAPSHOT_DIR: boot snapshot directory (see config_snapshot.py)
+- CONFIG_RELOAD_INTERVAL_S: watcher poll interval in seconds (default 2, 0 disables)
+
+Purpose: One parse of the config tree per process instead of one per
+consumer (and one per request in the MCP API).
+"""
+
+import hashlib
+import inspect
+import logging
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+import yaml
+from pydantic import BaseModel, ValidationError
+
+from langgraph_app.core.config_snapshot import SnapshotEntries, read_snapshot, snapshot_path, write_snapshot
+from langgraph_app.core.coordination_bundles import freeze, thaw
+from langgraph_app.core.schemas import StyleProfile, Template
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE = "template"
+STYLE_PROFILE = "style_profile"
+
+# kind -> (subdirectory, schema, error tag)
+KINDS: Dict[str, Tuple[str, type, str]] = {
+    TEMPLATE: ("content_templates", Template, "TEMPLATE"),
+    STYLE_PROFILE: ("style_profiles", StyleProfile, "STYLE"),
+}
+
+# index name -> raw keys it is read from (first present wins)
+INDEXED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "category": ("category",),
+    "platform": ("platform",),
+    "audience": ("audience", "target_audience", "targetAudience"),
+    "template_type": ("template_type",),
+}
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def locate_data_root(base_dir: Optional[Path] = None) -> Path:
+    """
+    Resolve the absolute data directory.
+    Priority:
+      1) WRITERZ_DATA_DIR env
+      2) explicit base_dir (if given)
+      3) nearest 'data/' up from this file
+      4) CWD/data
+    """
+    env_dir = os.getenv("WRITERZ_DATA_DIR")
+    if env_dir:
+        candidate = Path(env_dir).expanduser().resolve()
+        if candidate.exists():
+            return candidate
+
+    if base_dir:
+        candidate = Path(base_dir) / "data"
+        if candidate.exists():
+            return candidate.resolve()
+
+    # Walk up from this file to find a sibling 'data'
+    current = Path(__file__).resolve()
+    for parent in [current.parent, *current.parents]:
+        candidate = parent / "data"
+        if candidate.exists():
+            return candidate.resolve()
+
+    # Fallback to CWD/data
+    cwd_candidate = Path.cwd() / "data"
+    if cwd_candidate.exists():
+        return cwd_candidate.resolve()
+
+    raise FileNotFoundError("Could not locate 'data/' directory.")
+
+
+@dataclass(frozen=True)
+class ConfigRecord:
+    """One parsed YAML file; `validated` is None when the schema rejected it"""
+    kind: str
+    id: str
+    path: Path
+    version: str
+    data: Mapping[str, Any]
+    validated: Optional[Mapping[str, Any]] = None
+    model: Optional[BaseModel] = None
+    error: Optional[str] = None
+
+    @property
+    def stem(self) -> str:
+        return self.path.stem
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable copy of the raw YAML document"""
+        return thaw(self.data)
+
+    def validated_dict(self) -> Optional[Dict[str, Any]]:
+        return thaw(self.validated) if self.validated is not None else None
+
+
+def _index_values(data: Mapping[str, Any], keys: Tuple[str, ...]) -> List[str]:
+    for key in keys:
+        value = data.get(key)
+        if value is None:
+            continue
+        items = value if isinstance(value, tuple) else (value,)
+        return [str(v).strip().lower() for v in items if isinstance(v, (str, int, float)) and str(v).strip()]
+    return []
+
+
+@dataclass(frozen=True)
+class _FileState:
+    """Last parse of one file; reused until its mtime/size (then content) changes"""
+    kind: str
+    mtime_ns: int
+    size: int
+    version: str
+    record: Optional[ConfigRecord]
+    errors: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable registry contents at one generation"""
+    generation: int
+    version: str
+    records: Mapping[str, Mapping[str, ConfigRecord]]
+    by_stem: Mapping[str, Mapping[str, ConfigRecord]]
+    indexes: Mapping[str, Mapping[str, Mapping[str, Tuple[str, ...]]]]
+    errors: Tuple[str, ...]
+
+
+ConfigListener = Callable[[Dict[str, FrozenSet[str]]], None]
+
+
+class ConfigRegistry:
+    """Indexed view of the template and style profile directories, swapped atomically on reload"""
+
+    def __init__(self, data_root: Path):
+        self.data_root = Path(data_root)
+        self.dirs = {kind: self.data_root / subdir for kind, (subdir, _, _) in KINDS.items()}
+        self._files: Dict[Path, _FileState] = {}
+        self._refresh_lock = threading.Lock()
+        self._listeners: List[Any] = []
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+        self.reloads = 0
+        self.snapshot_path = snapshot_path(self.data_root)
+
+        started = time.time()
+        cached = self._import_files(read_snapshot(self.snapshot_path))
+        self._files, parsed = self._scan(cached)
+        self._snapshot = self._build_snapshot(self._files, generation=1)
+        self.snapshot_stats = {"reused": len(self._files) - parsed, "parsed": parsed, "written": False}
+        if parsed or cached.keys() != self._files.keys():
+            self.snapshot_stats["written"] = write_snapshot(self.snapshot_path, self._export_files(self._files))
+        self.load_ms = (time.time() - started) * 1000
+
+        logger.info(
+            f"✅ Config registry: {len(self._snapshot.records[TEMPLATE])} templates, "
+            f"{len(self._snapshot.records[STYLE_PROFILE])} style profiles, {len(self.errors)} errors "
+            f"in {self.load_ms:.0f}ms ({parsed} parsed, {len(self._files) - parsed} from snapshot; {self.data_root})"
+        )
+
+    # --- Loading ---------------------------------------------------------------------------------
+
+    def _scan(self, previous: Dict[Path, _FileState]) -> Tuple[Dict[Path, _FileState], int]:
+        """Stat every file; re-parse only new files and files whose mtime/size changed"""
+        files: Dict[Path, _FileState] = {}
+        parsed = 0
+        for kind in KINDS:
+            directory = self.dirs[kind]
+            if not directory.exists():
+                if not previous:
+                    logger.warning(f"⚠️ Config directory missing: {directory}")
+                continue
+            for path in sorted(directory.glob("*.y*ml")):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                state = previous.get(path)
+                if state is None or (state.mtime_ns, state.size) != (stat.st_mtime_ns, stat.st_size):
+                    state = self._parse_file(kind, path, stat, state)
+                    parsed += 1
+                files[path] = state
+        return files, parsed
+
+    @staticmethod
+    def _parse_file(kind: str, path: Path, stat: os.stat_result, previous: Optional[_FileState]) -> _FileState:
+        _, schema, tag = KINDS[kind]
+        try:
+            raw = path.read_bytes()
+        except OSError as e:
+            return _FileState(kind, stat.st_mtime_ns, stat.st_size, "", None, (f"[{tag}] {path.name}: {e}",))
+
+        version = hashlib.blake2b(raw, digest_size=12).hexdigest()
+        if previous is not None and previous.version == version:
+            # Touched but unchanged: keep the parsed record
+            return _FileState(kind, stat.st_mtime_ns, stat.st_size, version, previous.record, previous.errors)
+
+        try:
+            data = next(yaml.load_all(raw, Loader=_Loader), None)
+        except yaml.YAMLError as e:
+            return _FileState(kind, stat.st_mtime_ns, stat.st_size, version, None, (f"[{tag}] {path.name}: {e}",))
+        if not isinstance(data, dict):
+            errors = () if data is None else (f"[{tag}] {path.name}: expected a mapping, got {type(data).__name__}",)
+            return _FileState(kind, stat.st_mtime_ns, stat.st_size, version, None, errors)
+
+        model, validated, error = None, None, None
+        try:
+            model = schema.model_validate(data)
+            validated = freeze(model.model_dump(mode="python"))
+        except ValidationError as ve:
+            error = f"[{tag}] {path.name}: {ve}"
+
+        record = ConfigRecord(
+            kind=kind,
+            id=str(data.get("id") or path.stem),
+            path=path,
+            version=version,
+            data=freeze(data),
+            validated=validated,
+            model=model,
+            error=error
+        )
+        return _FileState(kind, stat.st_mtime_ns, stat.st_size, version, record, (error,) if error else ())
+
+    def _export_files(self, files: Dict[Path, _FileState]) -> SnapshotEntries:
+        entries: SnapshotEntries = {}
+        for path, state in files.items():
+            record = state.record
+            fields = None if record is None else (
+                record.id, thaw(record.data), record.validated_dict(), record.model, record.error
+            )
+            entries[str(path.relative_to(self.data_root))] = (
+                state.kind, state.mtime_ns, state.size, state.version, fields, state.errors
+            )
+        return entries
+
+    def _import_files(self, entries: SnapshotEntries) -> Dict[Path, _FileState]:
+        files: Dict[Path, _FileState] = {}
+        for relpath, (kind, mtime_ns, size, version, fields, errors) in entries.items():
+            path = self.data_root / relpath
+            record = None
+            if fields is not None:
+                record_id, data, validated, model, error = fields
+                record = ConfigRecord(
+                    kind=kind, id=record_id, path=path, version=version, data=freeze(data),
+                    validated=freeze(validated) if validated is not None else None, model=model, error=error
+                )
+            files[path] = _FileState(kind, mtime_ns, size, version, record, tuple(errors))
+        return files
+
+    @staticmethod
+    def _build_snapshot(files: Dict[Path, _FileState], generation: int) -> ConfigSnapshot:
+        records: Dict[str, Dict[str, ConfigRecord]] = {kind: {} for kind in KINDS}
+        by_stem: Dict[str, Dict[str, ConfigRecord]] = {kind: {} for kind in KINDS}
+        errors: List[str] = []
+
+        for path in sorted(files, key=lambda p: (list(KINDS).index(files[p].kind), p)):
+            state = files[path]
+            errors.extend(state.errors)
+            record = state.record
+            if record is None:
+                continue
+            if record.id in records[state.kind]:
+                errors.append(f"[{KINDS[state.kind][2]}] Duplicate id '{record.id}' in {path.name}")
+                continue
+            records[state.kind][record.id] = record
+            by_stem[state.kind].setdefault(path.stem, record)
+
+        indexes: Dict[str, Dict[str, Dict[str, Tuple[str, ...]]]] = {}
+        for kind, kind_records in records.items():
+            values: Dict[str, Dict[str, List[str]]] = {name: {} for name in INDEXED_FIELDS}
+            for record in kind_records.values():
+                for name, keys in INDEXED_FIELDS.items():
+                    for value in _index_values(record.data, keys):
+                        values[name].setdefault(value, []).append(record.id)
+            indexes[kind] = {name: {v: tuple(ids) for v, ids in vs.items()} for name, vs in values.items()}
+
+        digest = hashlib.blake2b(digest_size=12)
+        for kind in KINDS:
+            for record in records[kind].values():
+                digest.update(f"{kind}:{record.id}:{record.version}\0".encode("utf-8"))
+
+        return ConfigSnapshot(
+            generation=generation,
+            version=digest.hexdigest(),
+            records=freeze(records),
+            by_stem=freeze(by_stem),
+            indexes=freeze(indexes),
+            errors=tuple(errors)
+        )
+
+    # --- Hot reload ------------------------------------------------------------------------------
+
+    def refresh(self) -> Dict[str, FrozenSet[str]]:
+        """Re-parse changed files, swap in a new snapshot and notify listeners; returns changed ids per kind"""
+        with self._refresh_lock:
+            files, parsed = self._scan(self._files)
+            previous = self._snapshot
+            if files.keys() == self._files.keys() and all(
+                files[p].record is self._files[p].record and files[p].errors == self._files[p].errors
+                for p in files
+            ):
+                self._files = files
+                return {}
+
+            snapshot = self._build_snapshot(files, previous.generation + 1)
+            changed: Dict[str, FrozenSet[str]] = {}
+            for kind in KINDS:
+                old, new = previous.records[kind], snapshot.records[kind]
+                ids = frozenset(i for i in old.keys() | new.keys() if old.get(i) is not new.get(i))
+                if ids:
+                    changed[kind] = ids
+
+            self._files = files
+            self._snapshot = snapshot
+            write_snapshot(self.snapshot_path, self._export_files(files))
+            self.reloads += 1
+            logger.info(
+                f"♻️ Config reload: {parsed} files re-read, generation {snapshot.generation}, "
+                f"changed {dict((k, sorted(v)) for k, v in changed.items())}"
+            )
+            if changed:
+                self._notify(changed)
+            return changed
+
+    def subscribe(self, listener: ConfigListener) -> None:
+        """Call `listener(changed_ids_by_kind)` after each reload that changes records"""
+        ref = weakref.WeakMethod(listener) if inspect.ismethod(listener) else (lambda: listener)
+        self._listeners.append(ref)
+
+    def _notify(self, changed: Dict[str, FrozenSet[str]]) -> None:
+        alive = []
+        for ref in self._listeners:
+            listener = ref()
+            if listener is None:
+                continue
+            alive.append(ref)
+            try:
+                listener(changed)
+            except Exception as e:
+                logger.error(f"Config reload listener {getattr(listener, '__qualname__', listener)} failed: {e}")
+        self._listeners = alive
+
+    def start_watching(self, interval_s: Optional[float] = None) -> None:
+        """Poll for changed files in a daemon thread (CONFIG_RELOAD_INTERVAL_S, 0 disables)"""
+        interval = interval_s if interval_s is not None else float(os.getenv("CONFIG_RELOAD_INTERVAL_S", "2"))
+        if interval <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
+        self._stop_watching.clear()
+
+        def watch() -> None:
+            while not self._stop_watching.wait(interval):
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.error(f"Config reload failed: {e}")
+
+        self._watcher = threading.Thread(target=watch, name="config-registry-watch", daemon=True)
+        self._watcher.start()
+        logger.info(f"✅ Watching {self.data_root} for config changes every {interval:g}s")
+
+    def stop_watching(self) -> None:
+        self._stop_watching.set()
+
+    # --- Public API ------------------------------------------------------------------------------
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        return self._snapshot
+
+    @property
+    def generation(self) -> int:
+        return self._snapshot.generation
+
+    @property
+    def version(self) -> str:
+        return self._snapshot.version
+
+    @property
+    def errors(self) -> List[str]:
+        return list(self._snapshot.errors)
+
+    def records(self, kind: str, valid_only: bool = False) -> List[ConfigRecord]:
+        return [r for r in self._snapshot.records[kind].values() if not valid_only or r.validated is not None]
+
+    def templates(self, valid_only: bool = False) -> List[ConfigRecord]:
+        return self.records(TEMPLATE, valid_only)
+
+    def style_profiles(self, valid_only: bool = False) -> List[ConfigRecord]:
+        return self.records(STYLE_PROFILE, valid_only)
+
+    def get(self, kind: str, key: str, by_stem: bool = True) -> Optional[ConfigRecord]:
+        """Record by id, falling back to file stem"""
+        if not key:
+            return None
+        snapshot = self._snapshot
+        record = snapshot.records[kind].get(key)
+        if record is None and by_stem:
+            record = snapshot.by_stem[kind].get(key)
+        return record
+
+    def template(self, key: str) -> Optional[ConfigRecord]:
+        return self.get(TEMPLATE, key)
+
+    def style_profile(self, key: str) -> Optional[ConfigRecord]:
+        return self.get(STYLE_PROFILE, key)
+
+    def ids(self, kind: str) -> List[str]:
+        return list(self._snapshot.records[kind])
+
+    def index_values(self, kind: str, field: str) -> List[str]:
+        return sorted(self._snapshot.indexes[kind][field])
+
+    def find(self, kind: str, **filters: str) -> List[ConfigRecord]:
+        """Records matching every filter, e.g. find(STYLE_PROFILE, platform="linkedin")"""
+        snapshot = self._snapshot
+        matched: Optional[set] = None
+        for field, value in filters.items():
+            if field not in INDEXED_FIELDS:
+                raise ValueError(f"Field '{field}' is not indexed; indexed: {sorted(INDEXED_FIELDS)}")
+            ids = set(snapshot.indexes[kind][field].get(str(value).strip().lower(), ()))
+            matched = ids if matched is None else matched & ids
+        return [r for r in snapshot.records[kind].values() if matched is None or r.id in matched]
+
+    def get_stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            "data_root": str(self.data_root),
+            "generation": snapshot.generation,
+            "version": snapshot.version,
+            "templates": len(snapshot.records[TEMPLATE]),
+            "style_profiles": len(snapshot.records[STYLE_PROFILE]),
+            "invalid": sum(1 for records in snapshot.records.values() for r in records.values() if r.error),
+            "errors": len(snapshot.errors),
+            "load_ms": round(self.load_ms, 1),
+            "reloads": self.reloads,
+            "snapshot": dict(self.snapshot_stats, path=str(self.snapshot_path) if self.snapshot_path else None),
+            "watching": self._watcher is not None and self._watcher.is_alive() and not self._stop_watching.is_set(),
+            "indexes": {
+                kind: {name: len(values) for name, values in indexes.items()}
+                for kind, indexes in snapshot.indexes.items()
+            }
+        }
+
+
+# Global config registry instances, one per data root (singleton pattern)
+_registries: Dict[Path, ConfigRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_config_registry(base_dir: Optional[Path] = None) -> ConfigRegistry:
+    """Get or create the shared registry; raises FileNotFoundError when there is no data directory"""
+    data_root = locate_data_root(base_dir)
+    registry = _registries.get(data_root)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.get(data_root)
+            if registry is None:
+                registry = ConfigRegistry(data_root)
+                _registries[data_root] = registry
+    return registry
+
+
+def memoize_per_registry(build: Callable[[ConfigRegistry], Any]) -> Callable[[], Any]:
+    """Cache a value derived from the registry until the registry changes"""
+    cache: Dict[str, Any] = {}
+    lock = threading.Lock()
+
+    def cached() -> Any:
+        registry = get_config_registry()
+        key = f"{registry.data_root}:{registry.version}"
+        with lock:
+            if key not in cache:
+                cache.clear()
+                cache[key] = build(registry)
+            return cache[key]
+
+    return cached
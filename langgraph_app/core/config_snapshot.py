@@ -0,0 +1,129 @@
+# langgraph_app/core/config_snapshot.py
+
+"""
+Binary Configuration Snapshot
+
+The config registry's parsed and validated files, serialized to one
+compact binary file so later boots skip YAML parsing and pydantic
+validation. A manifest of per-file mtime, size and content hash sits in
+front of the body: on boot the registry stats every file, reuses the
+snapshot entry when the file is unchanged (by mtime/size, else by hash)
+and parses YAML only for files that actually changed.
+
+Layout: MAGIC | u32 manifest length | manifest pickle | body pickle.
+The file is read through mmap. The manifest carries a fingerprint of the
+schema source, pydantic and Python versions; any mismatch discards the
+whole snapshot. Snapshots are pickles, so they are only read from an
+explicitly configured directory: snapshots are off unless
+CONFIG_SNAPSHOT_DIR is set, and a relative value is resolved against the
+data root rather than the current working directory.
+
+Build one ahead of time (e.g. in the Docker image) with:
+    CONFIG_SNAPSHOT_DIR=/app/.config_snapshot python -m langgraph_app.core.config_snapshot
+
+Configuration:
+- CONFIG_SNAPSHOT_DIR: snapshot directory (unset or empty disables snapshots)
+
+Purpose: Boot from a snapshot instead of re-parsing and re-validating
+every YAML file on every start.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import struct
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pydantic
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"WZCFGSNP"
+FORMAT_VERSION = 1
+_HEADER = struct.Struct("<I")
+
+# relpath -> (kind, mtime_ns, size, version, record fields or None, errors)
+SnapshotEntries = Dict[str, Tuple[Any, ...]]
+
+
+def snapshot_path(data_root: Path) -> Optional[Path]:
+    """Snapshot file for a data root; None when snapshots are disabled"""
+    directory = os.getenv("CONFIG_SNAPSHOT_DIR", "")
+    if not directory:
+        return None
+    data_root = Path(data_root).resolve()
+    digest = hashlib.blake2b(str(data_root).encode("utf-8"), digest_size=6).hexdigest()
+    return (data_root / directory).resolve() / f"config-{digest}.bin"
+
+
+@lru_cache(maxsize=1)
+def fingerprint() -> str:
+    """Changes whenever cached models could deserialize differently"""
+    from langgraph_app.core import schemas
+
+    digest = hashlib.blake2b(digest_size=12)
+    digest.update(Path(schemas.__file__).read_bytes())
+    digest.update(f"{FORMAT_VERSION}:{pydantic.VERSION}:{sys.version_info[:2]}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def read_snapshot(path: Optional[Path]) -> SnapshotEntries:
+    """Entries from a valid snapshot; empty when missing, stale or unreadable"""
+    if path is None or not path.exists():
+        return {}
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                if bytes(view[:len(MAGIC)]) != MAGIC:
+                    return {}
+                offset = len(MAGIC) + _HEADER.size
+                (manifest_len,) = _HEADER.unpack_from(view, len(MAGIC))
+                manifest = pickle.loads(view[offset:offset + manifest_len])
+                if manifest.get("fingerprint") != fingerprint():
+                    logger.info("♻️ Config snapshot built for another schema/runtime; rebuilding")
+                    return {}
+                entries = pickle.loads(view[offset + manifest_len:])
+            finally:
+                view.release()
+    except Exception as e:
+        logger.warning(f"⚠️ Ignoring unreadable config snapshot {path}: {e}")
+        return {}
+    return entries
+
+
+def write_snapshot(path: Optional[Path], entries: SnapshotEntries) -> bool:
+    if path is None:
+        return False
+    manifest = pickle.dumps({
+        "fingerprint": fingerprint(),
+        "files": {relpath: entry[1:4] for relpath, entry in entries.items()}
+    }, protocol=pickle.HIGHEST_PROTOCOL)
+    body = pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER.pack(len(manifest)))
+            f.write(manifest)
+            f.write(body)
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(f"⚠️ Could not write config snapshot {path}: {e}")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    from langgraph_app.core.config_registry import get_config_registry
+
+    registry = get_config_registry()
+    print(f"Config snapshot: {registry.get_stats()['snapshot']}")
@@ -0,0 +1,174 @@
+# langgraph_app/core/coordination_bundles.py
+
+"""
+Precompiled Coordination Bundles
+
+Everything the coordination layer derives from template and style YAML
+alone (coordination rules, merged requirements, each agent's
+coordination dict) is compiled once per (template id, style id, config
+version) into an immutable CoordinationBundle and cached.
+get_coordinated_context() serves its config-derived parts from the
+bundle as thawed (plain, mutable) copies and builds only the
+state-dependent parts (previous agent outputs) per call; callers that
+only read can share the frozen bundle through get_bundle().
+
+Bundles are deep-frozen (dicts become read-only mappings, lists become
+tuples) so one cached object can be shared across concurrent runs.
+The config version is a content fingerprint of both configs, taken on
+every lookup: config dicts are shared and some callers update them in
+place, so object identity says nothing about their content. An edited
+template or style profile (on disk or in memory) therefore compiles a
+fresh bundle. Config registry reloads drop the bundles of the changed
+templates and styles.
+
+Purpose: Take coordination context building off the per-node hot path.
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_BUNDLES = 256
+
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def freeze(value: Any) -> Any:
+    """Deep read-only copy: dicts -> mappingproxy, lists/sets -> tuples"""
+    # Concrete types first: the ABC check is the slow path when freezing whole config trees
+    if isinstance(value, _SCALARS):
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Mutable deep copy of a frozen value"""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+def config_version(*configs: Optional[Dict[str, Any]]) -> str:
+    """
+    Content fingerprint of the given configs.
+
+    Pickled bytes are a lossless encoding of plain config data, so different
+    content never shares a version; equal configs with a different key order
+    may get different versions, which only costs an extra compile.
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    try:
+        for config in configs:
+            digest.update(pickle.dumps(config or {}, protocol=pickle.HIGHEST_PROTOCOL))
+            digest.update(b"\0")
+    except Exception:
+        # Values pickle can't handle: slower canonical JSON
+        digest = hashlib.blake2b(digest_size=12)
+        for config in configs:
+            digest.update(json.dumps(config or {}, sort_keys=True, default=str).encode("utf-8"))
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class CoordinationBundle:
+    """Config-derived coordination context for one template/style pair"""
+    template_id: str
+    style_id: str
+    version: str
+    coordination_rules: Mapping[str, Any]
+    template_style_requirements: Mapping[str, Any]
+    agent_contexts: Mapping[Any, Mapping[str, Any]]
+
+    def for_agent(self, agent_type: Any) -> Mapping[str, Any]:
+        return self.agent_contexts.get(agent_type, MappingProxyType({}))
+
+
+BundleKey = Tuple[str, str, str]
+
+
+class BundleCache:
+    """LRU of compiled bundles keyed by (template id, style id, config version)"""
+
+    def __init__(self, max_size: int = MAX_CACHED_BUNDLES):
+        self.max_size = max_size
+        self._bundles: "OrderedDict[BundleKey, CoordinationBundle]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: BundleKey, build: Callable[[], CoordinationBundle]) -> CoordinationBundle:
+        with self._lock:
+            bundle = self._bundles.get(key)
+            if bundle is not None:
+                self._bundles.move_to_end(key)
+                self.hits += 1
+                return bundle
+            self.misses += 1
+
+        bundle = build()
+        logger.info(f"🔀 Compiled coordination bundle {key[0]}/{key[1]} ({key[2][:8]})")
+        with self._lock:
+            self._bundles[key] = bundle
+            while len(self._bundles) > self.max_size:
+                self._bundles.popitem(last=False)
+        return bundle
+
+    def invalidate(self, template_id: Optional[str] = None, style_id: Optional[str] = None) -> int:
+        """Drop bundles for a template and/or style id (all bundles when both are None)"""
+        with self._lock:
+            doomed = [
+                key for key in self._bundles
+                if (template_id is None or key[0] == template_id)
+                and (style_id is None or key[1] == style_id)
+            ]
+            for key in doomed:
+                del self._bundles[key]
+        return len(doomed)
+
+    def on_config_change(self, changed: Mapping[str, Any]) -> None:
+        """Config registry reload: drop bundles built from the changed templates/styles"""
+        from langgraph_app.core.config_registry import STYLE_PROFILE, TEMPLATE
+
+        dropped = sum(self.invalidate(template_id=i) for i in changed.get(TEMPLATE, ()))
+        dropped += sum(self.invalidate(style_id=i) for i in changed.get(STYLE_PROFILE, ()))
+        if dropped:
+            logger.info(f"♻️ Dropped {dropped} coordination bundles after config reload")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"bundles": len(self._bundles), "hits": self.hits, "misses": self.misses}
+
+
+# Global bundle cache instance (singleton pattern)
+_bundle_cache: Optional[BundleCache] = None
+
+
+def get_bundle_cache() -> BundleCache:
+    """Get or create global bundle cache instance"""
+    global _bundle_cache
+    if _bundle_cache is None:
+        _bundle_cache = BundleCache()
+        try:
+            from langgraph_app.core.config_registry import get_config_registry
+            get_config_registry().subscribe(_bundle_cache.on_config_change)
+        except FileNotFoundError:
+            pass
+    return _bundle_cache
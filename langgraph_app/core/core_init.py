@@ -7,6 +7,22 @@ Exports:
 - Circuit breaker for provider failure tracking
 - Provider pool for load balancing across API keys
 - Retry utilities with exponential backoff
+- Prefix-stable prompt assembly and prompt cache accounting
+- Latency/cost-aware model router
+- Planner run metrics
+- Concurrent research executor
+- Freshness-aware research cache
+- Local BM25 research corpus
+- Local tool pre-pass for agent analysis tools
+- Single-pass multi-keyword density engine
+- Shared, memoized text statistics
+- Compiled one-pass AI-tell matcher
+- Single-pass streaming Markdown renderer
+- Parallel, cached code-block validation
+- Async image pipeline with disk asset cache
+- Precompiled coordination bundles
+- Shared, indexed configuration registry
+- Compiled prompt templates cached per template text
 """
 
 from langgraph_app.core.circuit_breaker import (
@@ -30,6 +46,103 @@ from langgraph_app.core.retry_utils import (
     RETRY_CONFIGS
 )
 
+from langgraph_app.core.prompt_cache import (
+    get_prompt_cache_stats,
+    PromptBuilder,
+    PromptCacheStats
+)
+
+from langgraph_app.core.model_router import (
+    get_model_router,
+    ModelRouter,
+    RoutingDecision
+)
+
+from langgraph_app.core.planner_metrics import (
+    get_planner_metrics,
+    PlannerMetrics,
+    PlannerRun
+)
+
+from langgraph_app.core.research_executor import (
+    get_research_executor,
+    ResearchExecutor,
+    SearchQuery,
+    canonical_url
+)
+
+from langgraph_app.core.research_cache import (
+    get_research_cache,
+    ResearchCache,
+    normalize_query
+)
+
+from langgraph_app.core.research_corpus import (
+    get_research_corpus,
+    ResearchCorpus,
+    CorpusHit
+)
+
+from langgraph_app.core.tool_prepass import (
+    run_tools_locally,
+    format_tool_results
+)
+
+from langgraph_app.core.keyword_engine import (
+    analyze_keywords,
+    get_keyword_automaton,
+    KeywordAutomaton
+)
+
+from langgraph_app.core.text_stats import (
+    get_text_stats,
+    TextStats
+)
+
+from langgraph_app.core.ai_tells import (
+    get_tell_matcher,
+    get_forbidden_matcher,
+    TellMatcher,
+    AI_TELLS
+)
+
+from langgraph_app.core.markdown_renderer import (
+    render_markdown,
+    stream_markdown,
+    iter_html
+)
+
+from langgraph_app.core.code_validation import (
+    CodeValidator,
+    get_code_validator,
+    check_code_syntax
+)
+
+from langgraph_app.core.image_pipeline import (
+    ImagePipeline,
+    ImageRequest,
+    get_image_pipeline,
+    embed_images
+)
+
+from langgraph_app.core.coordination_bundles import (
+    CoordinationBundle,
+    BundleCache,
+    get_bundle_cache
+)
+
+from langgraph_app.core.config_registry import (
+    ConfigRegistry,
+    ConfigRecord,
+    get_config_registry
+)
+
+from langgraph_app.core.prompt_templates import (
+    CompiledPrompt,
+    compile_template,
+    get_prompt_template_stats
+)
+
 __all__ = [
     # Circuit breaker
     "get_circuit_breaker",
@@ -48,4 +161,85 @@ __all__ = [
     "retry_api_call",
     "RetryConfig",
     "RETRY_CONFIGS",
+    
+    # Prompt cache
+    "get_prompt_cache_stats",
+    "PromptBuilder",
+    "PromptCacheStats",
+    
+    # Model router
+    "get_model_router",
+    "ModelRouter",
+    "RoutingDecision",
+    
+    # Planner metrics
+    "get_planner_metrics",
+    "PlannerMetrics",
+    "PlannerRun",
+    
+    # Research executor
+    "get_research_executor",
+    "ResearchExecutor",
+    "SearchQuery",
+    "canonical_url",
+    
+    # Research cache
+    "get_research_cache",
+    "ResearchCache",
+    "normalize_query",
+    
+    # Research corpus
+    "get_research_corpus",
+    "ResearchCorpus",
+    "CorpusHit",
+    
+    # Tool pre-pass
+    "run_tools_locally",
+    "format_tool_results",
+    
+    # Keyword engine
+    "analyze_keywords",
+    "get_keyword_automaton",
+    "KeywordAutomaton",
+    
+    # Text statistics
+    "get_text_stats",
+    "TextStats",
+    
+    # AI-tell matcher
+    "get_tell_matcher",
+    "get_forbidden_matcher",
+    "TellMatcher",
+    "AI_TELLS",
+    
+    # Markdown renderer
+    "render_markdown",
+    "stream_markdown",
+    "iter_html",
+    
+    # Code validation
+    "CodeValidator",
+    "get_code_validator",
+    "check_code_syntax",
+    
+    # Image pipeline
+    "ImagePipeline",
+    "ImageRequest",
+    "get_image_pipeline",
+    "embed_images",
+    
+    # Coordination bundles
+    "CoordinationBundle",
+    "BundleCache",
+    "get_bundle_cache",
+    
+    # Config registry
+    "ConfigRegistry",
+    "ConfigRecord",
+    "get_config_registry",
+    
+    # Prompt templates
+    "CompiledPrompt",
+    "compile_template",
+    "get_prompt_template_stats",
 ]
@@ -0,0 +1,236 @@
+# langgraph_app/core/generation_stream.py
+
+"""
+Per-Request Generation Progress and Token Channels
+
+Agents run inside the graph's worker threads while the status and stream
+APIs run on the event loop, so each request gets a thread-safe, append-only
+event log. Producers publish tokens, completed paragraphs and progress;
+consumers poll `events_since(seq)` without blocking the writer.
+
+Purpose: Surface partial content within seconds instead of after the full
+completion, and give the status/stream APIs live agent progress.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Closed channels are kept this long so late pollers can drain them
+CHANNEL_RETENTION_SECONDS = 600
+
+_FENCE = re.compile(r"^\s*```")
+
+
+@dataclass
+class StreamEvent:
+    """One event on a generation channel"""
+    seq: int
+    type: str  # token | paragraph | progress | done | error
+    data: Any
+    agent: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "type": self.type,
+            "agent": self.agent,
+            "data": self.data,
+            "timestamp": self.timestamp
+        }
+
+
+class GenerationStream:
+    """Append-only event log for one generation request"""
+
+    def __init__(self, request_id: str, max_events: int = 20000):
+        self.request_id = request_id
+        self.max_events = max_events
+        self._lock = threading.Lock()
+        self._events: List[StreamEvent] = []
+        self._first_seq = 0
+        self._next_seq = 0
+        self._paragraphs: List[str] = []
+        self.current_agent: Optional[str] = None
+        self.progress: float = 0.0
+        self.tokens_streamed = 0
+        self.closed_at: Optional[float] = None
+        self.first_token_at: Optional[float] = None
+        self.created_at = time.time()
+
+    def _append(self, event_type: str, data: Any, agent: Optional[str]) -> None:
+        with self._lock:
+            self._events.append(StreamEvent(self._next_seq, event_type, data, agent or self.current_agent))
+            self._next_seq += 1
+            # Token events are bulky; keep the log bounded
+            if len(self._events) > self.max_events:
+                overflow = len(self._events) - self.max_events
+                del self._events[:overflow]
+                self._first_seq += overflow
+
+    def publish_token(self, text: str, agent: Optional[str] = None) -> None:
+        if not text:
+            return
+        if self.first_token_at is None:
+            self.first_token_at = time.time()
+            logger.info(f"[{self.request_id}] First token after {self.first_token_at - self.created_at:.1f}s")
+        self.tokens_streamed += 1
+        self._append("token", text, agent)
+
+    def publish_paragraph(self, text: str, agent: Optional[str] = None) -> None:
+        """Publish a post-processed paragraph; paragraphs form the partial content"""
+        if not text:
+            return
+        with self._lock:
+            self._paragraphs.append(text)
+        self._append("paragraph", text, agent)
+
+    def set_progress(self, agent: str, progress: Optional[float] = None) -> None:
+        self.current_agent = agent
+        if progress is not None:
+            self.progress = progress
+        self._append("progress", {"agent": agent, "progress": self.progress}, agent)
+
+    def close(self, error: Optional[str] = None) -> None:
+        if self.closed_at is not None:
+            return
+        self._append("error" if error else "done", error, None)
+        self.closed_at = time.time()
+
+    @property
+    def closed(self) -> bool:
+        return self.closed_at is not None
+
+    @property
+    def partial_content(self) -> str:
+        with self._lock:
+            return "\n\n".join(self._paragraphs)
+
+    def events_since(self, seq: int = 0, limit: int = 500) -> List[Dict[str, Any]]:
+        """Events with sequence number >= seq (older events may have been evicted)"""
+        with self._lock:
+            start = max(0, seq - self._first_seq)
+            return [e.to_dict() for e in self._events[start:start + limit]]
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "current_agent": self.current_agent,
+            "progress": self.progress,
+            "tokens_streamed": self.tokens_streamed,
+            "time_to_first_token_s": (
+                round(self.first_token_at - self.created_at, 3) if self.first_token_at else None
+            ),
+            "closed": self.closed,
+            "last_seq": self._next_seq - 1
+        }
+
+
+class ParagraphAccumulator:
+    """
+    Buffers streamed text and yields complete paragraphs.
+
+    A paragraph ends at a blank line, except inside ``` code fences or a
+    leading YAML front matter block, which are kept whole so downstream
+    sanitization sees the same blocks it would in the full text.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._started = False
+
+    def feed(self, text: str) -> Iterator[str]:
+        self._buffer += text
+        while True:
+            split_at = self._find_boundary()
+            if split_at is None:
+                return
+            paragraph, self._buffer = self._buffer[:split_at], self._buffer[split_at:].lstrip("\n")
+            self._started = True
+            if paragraph.strip():
+                yield paragraph.strip("\n")
+
+    def flush(self) -> Iterator[str]:
+        remaining, self._buffer = self._buffer, ""
+        if remaining.strip():
+            yield remaining.strip("\n")
+
+    def _find_boundary(self) -> Optional[int]:
+        in_fence = False
+        in_front_matter = False
+        offset = 0
+        lines = self._buffer.split("\n")
+
+        # The last element may be an incomplete line
+        for idx, line in enumerate(lines[:-1]):
+            if idx == 0 and not self._started and line.strip() == "---":
+                in_front_matter = True
+            elif in_front_matter and line.strip() == "---":
+                in_front_matter = False
+            elif _FENCE.match(line):
+                in_fence = not in_fence
+            elif not line.strip() and not in_fence and not in_front_matter and offset > 0:
+                return offset
+            offset += len(line) + 1
+
+        return None
+
+
+async def sse_events(stream: GenerationStream, since: int = 0, poll_interval: float = 0.1) -> AsyncIterator[str]:
+    """Server-sent event frames for a channel from seq `since` until it is closed and drained"""
+    seq = since
+    while True:
+        events = stream.events_since(seq)
+        for event in events:
+            seq = event["seq"] + 1
+            yield f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+        if not events:
+            if stream.closed:
+                break
+            await asyncio.sleep(poll_interval)
+
+
+class GenerationStreamRegistry:
+    """Process-wide lookup of generation channels by request id"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._streams: Dict[str, GenerationStream] = {}
+
+    def open(self, request_id: str) -> GenerationStream:
+        with self._lock:
+            self._prune()
+            stream = GenerationStream(request_id)
+            self._streams[request_id] = stream
+            return stream
+
+    def get(self, request_id: Optional[str]) -> Optional[GenerationStream]:
+        if not request_id:
+            return None
+        with self._lock:
+            return self._streams.get(request_id)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - CHANNEL_RETENTION_SECONDS
+        expired = [rid for rid, s in self._streams.items() if s.closed_at and s.closed_at < cutoff]
+        for rid in expired:
+            del self._streams[rid]
+
+
+# Global generation stream registry (singleton pattern)
+_stream_registry: Optional[GenerationStreamRegistry] = None
+
+
+def get_stream_registry() -> GenerationStreamRegistry:
+    """Get or create global generation stream registry"""
+    global _stream_registry
+    if _stream_registry is None:
+        _stream_registry = GenerationStreamRegistry()
+    return _stream_registry
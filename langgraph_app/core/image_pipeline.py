@@ -0,0 +1,330 @@
+# langgraph_app/core/image_pipeline.py
+
+"""
+Async Image Pipeline with a Disk Asset Cache
+
+Generates every requested image for an article concurrently, capped by a
+semaphore (the provider limit) shared by all articles in the process,
+with a per-image timeout and the shared circuit breaker. Batches run on
+the pipeline's own long-lived event loop. Assets are cached on disk keyed by normalized prompt +
+style hash, so a repeated prompt never hits the image API again.
+
+submit() does not wait: it returns one GeneratedImage per request right
+away, cached ones already resolved and the rest as placeholders
+(url = "image-pending:<key>"). Generation continues in the background
+while the downstream nodes run; the publisher calls resolve() at the end
+and only waits for whatever is still in flight.
+
+Configuration:
+- IMAGE_MAX_CONCURRENCY: simultaneous image requests (default 3)
+- IMAGE_TIMEOUT_S: per-image timeout in seconds (default 90)
+- IMAGE_CACHE_DIR: asset cache directory (default storage/image_cache)
+
+Purpose: Let the image node run in the graph without adding the sum of
+all image calls to end-to-end latency.
+"""
+
+import asyncio
+import base64
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from langgraph_app.core.circuit_breaker import get_circuit_breaker
+from langgraph_app.core.types import GeneratedImage
+from langgraph_app.enhanced_model_registry import create_openai_client
+
+logger = logging.getLogger(__name__)
+
+IMAGE_PROVIDER = "openai_images"
+IMAGE_MODEL = "dall-e-3"
+PLACEHOLDER_PREFIX = "image-pending:"
+ASSET_URL_PREFIX = "/api/images/"
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Case, whitespace and trailing punctuation do not change the image"""
+    return " ".join((prompt or "").lower().split()).rstrip(" .!")
+
+
+def style_hash(style: Any) -> str:
+    payload = json.dumps(style, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@dataclass
+class ImageRequest:
+    """One image to generate; `placement` is the heading it belongs under"""
+    prompt: str
+    alt_text: str
+    style: Any = None
+    size: str = "1024x1024"
+    quality: str = "standard"
+    placement: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        source = f"{normalize_prompt(self.prompt)}\0{style_hash([self.style, self.size, self.quality])}"
+        return hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+
+    @property
+    def dimensions(self) -> List[int]:
+        width, _, height = self.size.partition("x")
+        return [int(width), int(height or width)]
+
+
+class ImageAssetCache:
+    """Image metadata (<key>.json) and bytes (<key>.png) on disk"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or os.getenv("IMAGE_CACHE_DIR", "storage/image_cache"))
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def asset_path(self, key: str) -> Optional[Path]:
+        if not re.fullmatch(r"[0-9a-f]{32}", key or ""):
+            return None
+        path = self._path(key, ".png")
+        return path if path.exists() else None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._path(key, ".json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, meta: Dict[str, Any], image_bytes: Optional[bytes] = None) -> None:
+        target = self._path(key, ".json")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if image_bytes:
+            self._write(self._path(key, ".png"), image_bytes)
+        # Metadata last, so a reader never sees it without its asset
+        self._write(target, json.dumps(meta).encode("utf-8"))
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+
+class ImagePipeline:
+    """Concurrent, cached image generation over a single image client"""
+
+    def __init__(
+        self,
+        client: Any = None,
+        max_concurrency: Optional[int] = None,
+        timeout_s: Optional[float] = None,
+        cache: Optional[ImageAssetCache] = None
+    ):
+        self._client = client
+        self._client_lock = threading.Lock()
+        self.max_concurrency = max_concurrency or int(os.getenv("IMAGE_MAX_CONCURRENCY", "3"))
+        self.timeout_s = timeout_s or float(os.getenv("IMAGE_TIMEOUT_S", "90"))
+        self.cache = cache or ImageAssetCache()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrency * 2, thread_name_prefix="image-generate"
+        )
+        # One loop and one semaphore for every article, so the provider limit is process-wide
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # key -> Future[Optional[GeneratedImage]] for images still being generated
+        self._pending: Dict[str, Future] = {}
+        self._pending_lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = create_openai_client()
+        return self._client
+
+    def submit(self, requests: Sequence[ImageRequest]) -> List[GeneratedImage]:
+        """Start generation in the background; returns cached images and placeholders immediately"""
+        images: List[GeneratedImage] = []
+        batch: List[ImageRequest] = []
+
+        with self._pending_lock:
+            for request in requests:
+                cached = self._from_cache(request)
+                if cached is not None:
+                    images.append(cached)
+                    continue
+                if request.key not in self._pending:
+                    self._pending[request.key] = Future()
+                    batch.append(request)
+                width, height = request.dimensions
+                images.append(GeneratedImage(
+                    prompt=request.prompt,
+                    url=f"{PLACEHOLDER_PREFIX}{request.key}",
+                    alt_text=request.alt_text,
+                    width=width,
+                    height=height,
+                    asset_key=request.key,
+                    placement=request.placement
+                ))
+
+        if batch:
+            asyncio.run_coroutine_threadsafe(self.generate_many(batch), self._event_loop())
+        logger.info(
+            f"🖼️ Image batch: {len(requests)} requested, {len(requests) - len(batch)} cached or in flight, "
+            f"{len(batch)} generating in background"
+        )
+        return images
+
+    def resolve(self, images: Sequence[GeneratedImage], timeout_s: Optional[float] = None) -> List[GeneratedImage]:
+        """Swap placeholders for finished images; drops images that failed or are still pending at the deadline"""
+        deadline = time.time() + (self.timeout_s if timeout_s is None else timeout_s)
+        resolved: List[GeneratedImage] = []
+        for image in images:
+            if not image.url.startswith(PLACEHOLDER_PREFIX):
+                resolved.append(image)
+                continue
+            with self._pending_lock:
+                future = self._pending.get(image.asset_key)
+            result = None
+            if future is not None:
+                try:
+                    result = future.result(timeout=max(0.0, deadline - time.time()))
+                except FutureTimeoutError:
+                    logger.warning(f"⚠️ Image {image.asset_key} still generating at publish time; omitted")
+            else:
+                result = self._from_cache(ImageRequest(prompt=image.prompt, alt_text=image.alt_text), image.asset_key)
+            if result is not None:
+                result.placement = image.placement
+                result.alt_text = image.alt_text
+                resolved.append(result)
+        return resolved
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, name="image-pipeline", daemon=True).start()
+                    self._loop = loop
+        return self._loop
+
+    async def generate_many(self, requests: Sequence[ImageRequest]) -> List[Optional[GeneratedImage]]:
+        """Generate all requests concurrently under the pipeline-wide semaphore"""
+        loop = self._event_loop()
+        if asyncio.get_running_loop() is not loop:
+            # The semaphore belongs to the pipeline loop; run the batch there
+            return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self.generate_many(requests), loop))
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.time()
+        results = await asyncio.gather(*(self._generate_one(r, self._semaphore) for r in requests))
+        logger.info(
+            f"🖼️ Generated {sum(1 for r in results if r)}/{len(requests)} images in {time.time() - started:.1f}s"
+        )
+        return list(results)
+
+    async def _generate_one(self, request: ImageRequest, semaphore: asyncio.Semaphore) -> Optional[GeneratedImage]:
+        circuit_breaker = get_circuit_breaker()
+        image: Optional[GeneratedImage] = None
+        try:
+            async with semaphore:
+                if not circuit_breaker.can_execute(IMAGE_PROVIDER):
+                    logger.warning(f"⚠️ Image circuit open, skipping: {request.prompt[:60]}")
+                    return None
+                try:
+                    loop = asyncio.get_running_loop()
+                    response = await asyncio.wait_for(
+                        loop.run_in_executor(self._pool, functools.partial(
+                            self.client.images.generate,
+                            model=IMAGE_MODEL, prompt=request.prompt, size=request.size,
+                            quality=request.quality, n=1, response_format="b64_json"
+                        )),
+                        timeout=self.timeout_s
+                    )
+                    circuit_breaker.record_success(IMAGE_PROVIDER)
+                    image = self._store(request, response.data[0])
+                except asyncio.TimeoutError:
+                    circuit_breaker.record_failure(IMAGE_PROVIDER, "timeout")
+                    logger.warning(f"⚠️ Image timed out after {self.timeout_s:.0f}s: {request.prompt[:60]}")
+                except Exception as e:
+                    circuit_breaker.record_failure(IMAGE_PROVIDER, type(e).__name__)
+                    logger.error(f"Image generation failed for '{request.prompt[:60]}': {e}")
+            return image
+        finally:
+            with self._pending_lock:
+                future = self._pending.pop(request.key, None)
+            if future is not None:
+                future.set_result(image)
+
+    def _store(self, request: ImageRequest, data: Any) -> GeneratedImage:
+        b64 = getattr(data, "b64_json", None)
+        image_bytes = base64.b64decode(b64) if b64 else None
+        url = f"{ASSET_URL_PREFIX}{request.key}" if image_bytes else getattr(data, "url", "")
+        width, height = request.dimensions
+        self.cache.put(request.key, {
+            "prompt": request.prompt,
+            "url": url,
+            "width": width,
+            "height": height,
+            "created_at": time.time()
+        }, image_bytes)
+        return GeneratedImage(
+            prompt=request.prompt, url=url, alt_text=request.alt_text,
+            width=width, height=height, asset_key=request.key, placement=request.placement
+        )
+
+    def _from_cache(self, request: ImageRequest, key: Optional[str] = None) -> Optional[GeneratedImage]:
+        key = key or request.key
+        meta = self.cache.get(key)
+        if not meta or not meta.get("url"):
+            return None
+        return GeneratedImage(
+            prompt=request.prompt, url=meta["url"], alt_text=request.alt_text,
+            width=meta.get("width"), height=meta.get("height"),
+            asset_key=key, placement=request.placement
+        )
+
+
+def embed_images(content: str, images: Sequence[GeneratedImage]) -> str:
+    """Insert resolved images under their placement headings (after the first heading otherwise)"""
+    lines = content.split("\n")
+    insert_after: Dict[int, List[str]] = {}
+    headings = [i for i, line in enumerate(lines) if line.lstrip().startswith("#")]
+    for image in images:
+        if not image.url or image.url.startswith(PLACEHOLDER_PREFIX) or image.url in content:
+            continue
+        target = next(
+            (i for i in headings if image.placement and lines[i].strip() == image.placement.strip()),
+            headings[0] if headings else -1
+        )
+        alt = image.alt_text.replace("]", "")
+        insert_after.setdefault(target, []).extend(["", f"![{alt}]({image.url})"])
+
+    out: List[str] = insert_after.get(-1, [])[1:] + ([""] if -1 in insert_after else [])
+    for i, line in enumerate(lines):
+        out.append(line)
+        out.extend(insert_after.get(i, []))
+    return "\n".join(out)
+
+
+# Global image pipeline instance (singleton pattern)
+_image_pipeline: Optional[ImagePipeline] = None
+
+
+def get_image_pipeline() -> ImagePipeline:
+    """Get or create global image pipeline instance"""
+    global _image_pipeline
+    if _image_pipeline is None:
+        _image_pipeline = ImagePipeline()
+    return _image_pipeline
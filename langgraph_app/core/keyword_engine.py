@@ -0,0 +1,145 @@
+# langgraph_app/core/keyword_engine.py
+
+"""
+Single-Pass Multi-Keyword Density Engine
+
+Builds an Aho-Corasick automaton over the word tokens of a keyword set,
+then scans a document's token stream once to count every keyword,
+multi-word phrases included, with their character positions. Matching is
+on whole words ("ai" does not match inside "said") and case-insensitive.
+
+Automatons are cached by the normalized keyword set, so repeated analyses
+with the same keywords (SEO rounds, the analysis endpoint) skip the build.
+
+Purpose: Keep keyword analysis linear in document length regardless of
+how many keywords are tracked.
+"""
+
+import logging
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"\b\w+\b")
+
+# Density band (percent) considered optimal per keyword
+OPTIMAL_DENSITY = (1.0, 3.0)
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Lowercased word tokens of a keyword joined by single spaces"""
+    return " ".join(_WORD.findall(str(keyword or "").lower()))
+
+
+@dataclass
+class KeywordScan:
+    """Counts and match positions for one document, keyed by normalized keyword"""
+    total_words: int
+    counts: Dict[str, int] = field(default_factory=dict)
+    positions: Dict[str, List[int]] = field(default_factory=dict)
+
+    def density(self, keyword: str) -> float:
+        """Occurrences per 100 words"""
+        if not self.total_words:
+            return 0.0
+        return self.counts.get(normalize_keyword(keyword), 0) / self.total_words * 100
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton whose alphabet is word tokens"""
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords: List[str] = list(keywords)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, int]]] = [[]]  # (keyword index, phrase length in tokens)
+
+        for idx, phrase in enumerate(self.keywords):
+            tokens = phrase.split()
+            node = 0
+            for token in tokens:
+                child = self._goto[node].get(token)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[node][token] = child
+                node = child
+            if tokens:
+                self._out[node].append((idx, len(tokens)))
+
+        # Breadth-first failure links; outputs inherit along them
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(token, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def scan(self, text: str) -> KeywordScan:
+        """Count every keyword in one pass over the text's word tokens"""
+        goto, fail, out = self._goto, self._fail, self._out
+        counts = [0] * len(self.keywords)
+        positions: List[List[int]] = [[] for _ in self.keywords]
+        starts: List[int] = []
+
+        node = 0
+        for match in _WORD.finditer(text or ""):
+            token = match.group().lower()
+            starts.append(match.start())
+            while node and token not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(token, 0)
+            if out[node]:
+                end = len(starts)
+                for idx, length in out[node]:
+                    counts[idx] += 1
+                    positions[idx].append(starts[end - length])
+
+        return KeywordScan(
+            total_words=len(starts),
+            counts=dict(zip(self.keywords, counts)),
+            positions=dict(zip(self.keywords, positions)),
+        )
+
+
+@lru_cache(maxsize=256)
+def _automaton_for(keyword_set: Tuple[str, ...]) -> KeywordAutomaton:
+    logger.debug(f"Building keyword automaton for {len(keyword_set)} keywords")
+    return KeywordAutomaton(keyword_set)
+
+
+def get_keyword_automaton(keywords: Sequence[str]) -> KeywordAutomaton:
+    """Cached automaton for the normalized, deduplicated keyword set"""
+    keyword_set = tuple(sorted({normalize_keyword(k) for k in keywords} - {""}))
+    return _automaton_for(keyword_set)
+
+
+def analyze_keywords(text: str, keywords: Sequence[str]) -> Dict[str, Any]:
+    """
+    Word total plus count, density and positions for each keyword as given.
+
+    Keywords that normalize to the same phrase share one result.
+    """
+    scan = get_keyword_automaton(keywords).scan(text)
+    low, high = OPTIMAL_DENSITY
+    analysis = {}
+    for keyword in keywords:
+        normalized = normalize_keyword(keyword)
+        density = scan.density(normalized)
+        analysis[keyword] = {
+            "count": scan.counts.get(normalized, 0),
+            "density": round(density, 2),
+            "optimal": low <= density <= high,
+            "positions": scan.positions.get(normalized, []),
+        }
+    return {"total_words": scan.total_words, "keywords": analysis}
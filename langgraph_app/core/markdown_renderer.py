@@ -0,0 +1,319 @@
+# langgraph_app/core/markdown_renderer.py
+
+"""
+Single-Pass Markdown-to-HTML Renderer
+
+Reads Markdown line by line, once, and emits each HTML block as soon as
+it closes, so exports can stream while the rest of the document is still
+being read. Supported blocks: ATX headings, paragraphs, fenced code,
+nested ordered/unordered lists, blockquotes, pipe tables and horizontal
+rules. Inline spans (code, strong, emphasis, links, images, bare URLs)
+are tokenized with one compiled alternation per text run. All text is
+HTML-escaped and link targets with script schemes are dropped.
+
+Full renders are memoized by content hash (LRU), so the formatter, the
+export endpoint and the content detail API render each article once.
+
+Purpose: Give every consumer the same correct HTML without re-running a
+chain of full-text substitutions per request.
+"""
+
+import hashlib
+import html
+import re
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator, List, Optional, Union
+
+MAX_CACHED_RENDERS = 256
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)(?:\s+#+)?\s*$")
+_FENCE = re.compile(r"^\s*(`{3,}|~{3,})\s*([\w+#.-]*)")
+_HR = re.compile(r"^\s{0,3}([-*_])(?:\s*\1){2,}\s*$")
+_LIST_ITEM = re.compile(r"^(\s*)([-*+]|\d{1,9}[.)])\s+(.*)$")
+_QUOTE = re.compile(r"^\s{0,3}>\s?(.*)$")
+_TABLE_SEPARATOR = re.compile(r"^\s*\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$")
+
+# Link targets may contain one level of balanced parentheses; span tails are lazy
+# so "**a** and **b**" closes at the first marker
+_INLINE = re.compile(
+    r"(?P<code>`+)(?P<code_text>.+?)(?P=code)"
+    r"|!\[(?P<img_alt>[^\]]*)\]\((?P<img_src>(?:[^()\s]|\([^()\s]*\))+)(?:\s+\"(?P<img_title>[^\"]*)\")?\)"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<link_href>(?:[^()\s]|\([^()\s]*\))+)(?:\s+\"(?P<link_title>[^\"]*)\")?\)"
+    r"|\*\*(?P<strong>[^\s*](?:.*?[^\s])??)\*\*"
+    r"|(?<!\w)__(?P<strong_u>[^\s_](?:.*?[^\s])??)__(?!\w)"
+    r"|\*(?P<em>[^\s*](?:.*?[^\s*])??)\*"
+    r"|(?<!\w)_(?P<em_u>[^\s_](?:.*?[^\s_])??)_(?!\w)"
+    r"|(?P<url>https?://[^\s<>()\[\]]*[^\s<>()\[\].,;:!?'\"])"
+)
+
+_UNSAFE_SCHEME = re.compile(r"^\s*(javascript|vbscript|data):", re.I)
+
+
+def _attr(value: str) -> str:
+    return html.escape(value, quote=True)
+
+
+def _href(url: str) -> str:
+    return "#" if _UNSAFE_SCHEME.match(url) else _attr(url)
+
+
+def render_inline(text: str) -> str:
+    """Escape text and render inline Markdown spans"""
+    out: List[str] = []
+    pos = 0
+    for match in _INLINE.finditer(text):
+        out.append(html.escape(text[pos:match.start()], quote=False))
+        pos = match.end()
+        groups = match.groupdict()
+        if groups["code"]:
+            out.append(f"<code>{html.escape(groups['code_text'].strip(), quote=False)}</code>")
+        elif groups["img_src"] is not None:
+            title = f' title="{_attr(groups["img_title"])}"' if groups["img_title"] else ""
+            out.append(f'<img src="{_href(groups["img_src"])}" alt="{_attr(groups["img_alt"])}"{title}>')
+        elif groups["link_href"] is not None:
+            title = f' title="{_attr(groups["link_title"])}"' if groups["link_title"] else ""
+            out.append(f'<a href="{_href(groups["link_href"])}"{title}>{render_inline(groups["link_text"])}</a>')
+        elif groups["strong"] is not None or groups["strong_u"] is not None:
+            out.append(f"<strong>{render_inline(groups['strong'] or groups['strong_u'])}</strong>")
+        elif groups["em"] is not None or groups["em_u"] is not None:
+            out.append(f"<em>{render_inline(groups['em'] or groups['em_u'])}</em>")
+        else:
+            url = groups["url"]
+            out.append(f'<a href="{_href(url)}">{html.escape(url, quote=False)}</a>')
+    out.append(html.escape(text[pos:], quote=False))
+    return "".join(out)
+
+
+def _split_row(line: str) -> List[str]:
+    line = line.strip()
+    if line.startswith("|"):
+        line = line[1:]
+    if line.endswith("|") and not line.endswith("\\|"):
+        line = line[:-1]
+    return [cell.strip().replace("\\|", "|") for cell in re.split(r"(?<!\\)\|", line)]
+
+
+def _render_list(lines: List[str]) -> str:
+    """Render collected list lines (items, continuations, nested items)"""
+    out: List[str] = []
+    stack: List[tuple] = []  # (indent, tag)
+    for line in lines:
+        match = _LIST_ITEM.match(line)
+        if not match:
+            # Continuation of the current item
+            if stack and line.strip():
+                out.append(" " + render_inline(line.strip()))
+            continue
+        indent = len(match.group(1).expandtabs(4))
+        marker = match.group(2)
+        tag = "ul" if marker in "-*+" else "ol"
+
+        while stack and indent < stack[-1][0]:
+            out.append(f"</li></{stack.pop()[1]}>")
+        if stack and indent == stack[-1][0] and tag != stack[-1][1]:
+            out.append(f"</li></{stack.pop()[1]}>")
+
+        if not stack or indent > stack[-1][0]:
+            start = ""
+            if tag == "ol" and marker[:-1] != "1":
+                start = f' start="{int(marker[:-1])}"'
+            out.append(f"<{tag}{start}>")
+            stack.append((indent, tag))
+        else:
+            out.append("</li>")
+        out.append(f"<li>{render_inline(match.group(3))}")
+    while stack:
+        out.append(f"</li></{stack.pop()[1]}>")
+    return "".join(out)
+
+
+class MarkdownStreamRenderer:
+    """
+    Incremental block renderer: feed lines, get finished HTML blocks back.
+
+    A block is returned once the line that ends it has been seen; finish()
+    flushes the last one.
+    """
+
+    def __init__(self):
+        self._kind: Optional[str] = None  # paragraph | code | list | quote | table
+        self._lines: List[str] = []
+        self._fence = ""
+        self._lang = ""
+        self._list_blank = False
+
+    def feed(self, line: str) -> List[str]:
+        line = line.rstrip("\n").rstrip("\r")
+        blocks: List[str] = []
+
+        if self._kind == "code":
+            if line.strip().startswith(self._fence) and not line.strip()[len(self._fence):].strip():
+                blocks.append(self._close())
+            else:
+                self._lines.append(line)
+            return blocks
+
+        if self._kind == "list":
+            if not line.strip():
+                self._list_blank = True
+                return blocks
+            indented = line[:1] in (" ", "\t") and not _FENCE.match(line)
+            lazy = not self._list_blank and not self._starts_block(line)
+            if _LIST_ITEM.match(line) or indented or lazy:
+                self._lines.append(line)
+                self._list_blank = False
+                return blocks
+            blocks.append(self._close())
+
+        if self._kind == "quote":
+            quoted = _QUOTE.match(line)
+            if quoted:
+                self._lines.append(quoted.group(1))
+                return blocks
+            if line.strip() and self._lines and self._lines[-1].strip():
+                self._lines.append(line)  # lazy continuation
+                return blocks
+            blocks.append(self._close())
+
+        if self._kind == "table":
+            if line.strip() and "|" in line:
+                self._lines.append(line)
+                return blocks
+            blocks.append(self._close())
+
+        if not line.strip():
+            if self._kind:
+                blocks.append(self._close())
+            return blocks
+
+        if self._kind == "paragraph" and len(self._lines) == 1 and "|" in self._lines[0] \
+                and _TABLE_SEPARATOR.match(line):
+            self._kind = "table"
+            self._lines.append(line)
+            return blocks
+
+        fence = _FENCE.match(line)
+        heading = _HEADING.match(line)
+        if self._starts_block(line):
+            if self._kind:
+                blocks.append(self._close())
+            if fence:
+                self._kind, self._fence, self._lang = "code", fence.group(1), fence.group(2)
+            elif heading:
+                level = len(heading.group(1))
+                blocks.append(f"<h{level}>{render_inline(heading.group(2))}</h{level}>\n")
+            elif _HR.match(line):
+                blocks.append("<hr>\n")
+            elif _LIST_ITEM.match(line):
+                self._kind, self._lines, self._list_blank = "list", [line], False
+            else:
+                self._kind, self._lines = "quote", [_QUOTE.match(line).group(1)]
+            return blocks
+
+        if self._kind != "paragraph":
+            self._kind, self._lines = "paragraph", []
+        self._lines.append(line.strip())
+        return blocks
+
+    @staticmethod
+    def _starts_block(line: str) -> bool:
+        return bool(
+            _FENCE.match(line) or _HEADING.match(line) or _HR.match(line)
+            or _LIST_ITEM.match(line) or _QUOTE.match(line)
+        )
+
+    def finish(self) -> List[str]:
+        return [self._close()] if self._kind else []
+
+    def _close(self) -> str:
+        kind, lines = self._kind, self._lines
+        self._kind, self._lines = None, []
+
+        if kind == "paragraph":
+            return f"<p>{render_inline(chr(10).join(lines))}</p>\n"
+        if kind == "code":
+            lang = f' class="language-{_attr(self._lang)}"' if self._lang else ""
+            return f"<pre><code{lang}>{html.escape(chr(10).join(lines), quote=False)}</code></pre>\n"
+        if kind == "list":
+            return _render_list(lines) + "\n"
+        if kind == "quote":
+            return f"<blockquote>\n{render_markdown(chr(10).join(lines))}</blockquote>\n"
+        if kind == "table":
+            header, rows = _split_row(lines[0]), [_split_row(row) for row in lines[2:]]
+            head = "".join(f"<th>{render_inline(cell)}</th>" for cell in header)
+            body = "".join(
+                "<tr>" + "".join(f"<td>{render_inline(cell)}</td>" for cell in row) + "</tr>"
+                for row in rows
+            )
+            return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>\n"
+        return ""
+
+
+def _iter_lines(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    if isinstance(source, str):
+        yield from source.split("\n")
+        return
+    # Arbitrary chunks (e.g. a token stream): re-split on newlines
+    pending = ""
+    for chunk in source:
+        pending += chunk
+        *complete, pending = pending.split("\n")
+        yield from complete
+    if pending:
+        yield pending
+
+
+def iter_html(source: Union[str, Iterable[str]]) -> Iterator[str]:
+    """Yield HTML blocks as the Markdown source (string or chunk iterable) is read"""
+    renderer = MarkdownStreamRenderer()
+    for line in _iter_lines(source):
+        yield from renderer.feed(line)
+    yield from renderer.finish()
+
+
+_cache: "OrderedDict[bytes, str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _key(markdown: str) -> bytes:
+    return hashlib.blake2b((markdown or "").encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _cached(key: bytes) -> Optional[str]:
+    with _cache_lock:
+        rendered = _cache.get(key)
+        if rendered is not None:
+            _cache.move_to_end(key)
+        return rendered
+
+
+def _store(key: bytes, rendered: str) -> None:
+    with _cache_lock:
+        _cache[key] = rendered
+        while len(_cache) > MAX_CACHED_RENDERS:
+            _cache.popitem(last=False)
+
+
+def render_markdown(markdown: str) -> str:
+    """Render a full document, memoized by content hash"""
+    key = _key(markdown)
+    rendered = _cached(key)
+    if rendered is None:
+        rendered = "".join(iter_html(markdown or ""))
+        _store(key, rendered)
+    return rendered
+
+
+def stream_markdown(markdown: str) -> Iterator[str]:
+    """Stream a document's HTML, serving (and filling) the render cache"""
+    key = _key(markdown)
+    rendered = _cached(key)
+    if rendered is not None:
+        yield rendered
+        return
+    blocks: List[str] = []
+    for block in iter_html(markdown or ""):
+        blocks.append(block)
+        yield block
+    _store(key, "".join(blocks))
@@ -143,6 +143,19 @@ MODEL_SPECS = {
         context_window=128000,
         cost_per_1k_tokens=0.005
     ),
+    "gpt-4o-mini": ModelSpec(
+        provider=ModelProvider.OPENAI,
+        model_name="gpt-4o-mini",
+        capabilities=[
+            ModelCapability.REASONING,
+            ModelCapability.ANALYSIS,
+            ModelCapability.STRUCTURED_OUTPUT,
+            ModelCapability.SPEED
+        ],
+        max_tokens=16384,
+        context_window=128000,
+        cost_per_1k_tokens=0.00015
+    ),
     
     # ========================================================================
     # Anthropic Claude 4 Family (Released May-October 2025)
@@ -0,0 +1,293 @@
+# langgraph_app/core/model_router.py
+
+"""
+Latency- and Cost-Aware Model Router
+
+Routes each agent call to a model from MODEL_SPECS using live performance
+data. Every completed call updates an exponentially weighted moving average
+(EWMA) of latency, error rate and output tokens/second per model; routing
+then picks the cheapest (or fastest) model that has the required
+capabilities and is expected to finish inside the request's latency budget.
+
+Every decision is kept in a bounded audit log (and optionally appended to a
+JSONL file via MODEL_ROUTING_AUDIT_LOG) so model choices can be reviewed.
+
+Purpose: Stop hard-coding model names per agent and react to provider
+slowdowns/outages without code changes.
+"""
+
+import json
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence
+
+from langgraph_app.core.circuit_breaker import CircuitState, get_circuit_breaker
+from langgraph_app.core.model_registry import (
+    MODEL_SPECS,
+    ModelCapability,
+    ModelProvider,
+    ModelSpec,
+    _analyze_task_requirements,
+    _select_by_priority,
+)
+
+logger = logging.getLogger(__name__)
+
+# Prior latency (seconds) for models with no observations yet
+DEFAULT_PRIOR_LATENCY_S = 20.0
+FAST_PRIOR_LATENCY_S = 8.0
+
+# Models whose smoothed error rate exceeds this are skipped while alternatives exist
+MAX_ERROR_RATE = 0.5
+MIN_SAMPLES_FOR_ERROR_GATE = 3
+
+
+@dataclass
+class ModelPerformance:
+    """EWMA performance statistics for one model"""
+    alpha: float = 0.2
+    samples: int = 0
+    ewma_latency_s: Optional[float] = None
+    ewma_error_rate: float = 0.0
+    ewma_tokens_per_s: Optional[float] = None
+    last_updated: Optional[str] = None
+
+    def _ewma(self, current: Optional[float], value: float) -> float:
+        return value if current is None else self.alpha * value + (1 - self.alpha) * current
+
+    def update(self, latency_s: float, success: bool, output_tokens: int = 0) -> None:
+        self.samples += 1
+        self.ewma_error_rate = self._ewma(
+            self.ewma_error_rate if self.samples > 1 else None, 0.0 if success else 1.0
+        )
+        if success:
+            self.ewma_latency_s = self._ewma(self.ewma_latency_s, latency_s)
+            if output_tokens and latency_s > 0:
+                self.ewma_tokens_per_s = self._ewma(self.ewma_tokens_per_s, output_tokens / latency_s)
+        self.last_updated = datetime.now().isoformat()
+
+
+@dataclass
+class RoutingDecision:
+    """Audit record for a single routing decision"""
+    timestamp: str
+    agent: str
+    model_key: str
+    model_name: str
+    provider: str
+    priority: str
+    reason: str
+    latency_budget_s: Optional[float]
+    expected_latency_s: float
+    required_capabilities: List[str]
+    candidates: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class ModelRouter:
+    """
+    Picks a model per agent call from MODEL_SPECS.
+
+    Priorities:
+    - cost: cheapest qualifying model, cost inflated by its error rate
+    - speed: lowest expected latency
+    - quality/balanced: existing _select_by_priority rules over the
+      qualifying set (keeps the historical defaults)
+
+    Models with open circuit breakers, insufficient output token limits or a
+    high smoothed error rate are filtered out first; models expected to
+    exceed the latency budget are dropped next. If nothing survives the
+    budget, the fastest qualifying model is returned and flagged.
+    """
+
+    def __init__(self, alpha: float = 0.2, audit_size: int = 1000):
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._performance: Dict[str, ModelPerformance] = {}
+        self._decisions: Deque[RoutingDecision] = deque(maxlen=audit_size)
+        self._audit_path = os.getenv("MODEL_ROUTING_AUDIT_LOG")
+        # Accept either the MODEL_SPECS key or the provider model id
+        self._key_by_name = {spec.model_name: key for key, spec in MODEL_SPECS.items()}
+
+    def resolve_key(self, model: str) -> str:
+        """Map a provider model id (e.g. claude-sonnet-4-5-20250929) to its MODEL_SPECS key"""
+        return model if model in MODEL_SPECS else self._key_by_name.get(model, model)
+
+    def record_call(
+        self,
+        model: str,
+        latency_s: float,
+        success: bool = True,
+        output_tokens: int = 0
+    ) -> None:
+        """Feed an observed call into the model's EWMA statistics"""
+        key = self.resolve_key(model)
+        with self._lock:
+            perf = self._performance.setdefault(key, ModelPerformance(alpha=self.alpha))
+            perf.update(latency_s, success, output_tokens)
+
+    def expected_latency(self, key: str, expected_output_tokens: Optional[int] = None) -> float:
+        """Best estimate of call latency from EWMA stats, falling back to a capability prior"""
+        perf = self._performance.get(key)
+        spec = MODEL_SPECS.get(key)
+
+        if perf is None or perf.ewma_latency_s is None:
+            if spec and ModelCapability.SPEED in spec.capabilities:
+                return FAST_PRIOR_LATENCY_S
+            return DEFAULT_PRIOR_LATENCY_S
+
+        estimate = perf.ewma_latency_s
+        if expected_output_tokens and perf.ewma_tokens_per_s:
+            estimate = max(estimate, expected_output_tokens / perf.ewma_tokens_per_s)
+        return estimate
+
+    def route(
+        self,
+        agent: str,
+        template_config: Optional[Dict[str, Any]] = None,
+        priority: Optional[str] = None,
+        latency_budget_s: Optional[float] = None,
+        required_capabilities: Optional[Sequence[ModelCapability]] = None,
+        providers: Optional[Iterable[ModelProvider]] = None,
+        allowed_models: Optional[Iterable[str]] = None,
+        min_output_tokens: Optional[int] = None,
+        expected_output_tokens: Optional[int] = None,
+    ) -> ModelSpec:
+        """Select a model for an agent call and record the decision"""
+        template_config = template_config or {}
+        priority = priority or os.getenv("MODEL_ROUTING_PRIORITY", "balanced")
+        requirements = _analyze_task_requirements(agent, template_config)
+        if required_capabilities is not None:
+            requirements["capabilities"] = list(required_capabilities)
+
+        allowed = {self.resolve_key(m) for m in allowed_models} if allowed_models else None
+        provider_set = set(providers) if providers else None
+        circuit_breaker = get_circuit_breaker()
+
+        with self._lock:
+            candidates = [
+                (key, spec) for key, spec in MODEL_SPECS.items()
+                if (allowed is None or key in allowed)
+                and (provider_set is None or spec.provider in provider_set)
+                and spec.matches_requirements(requirements["capabilities"])
+            ]
+            if not candidates:
+                raise ValueError(
+                    f"ENTERPRISE: No models available for {agent} with capabilities "
+                    f"{[c.value for c in requirements['capabilities']]}"
+                )
+            if min_output_tokens:
+                candidates = [
+                    (key, spec) for key, spec in candidates if spec.max_tokens >= min_output_tokens
+                ] or candidates
+
+            healthy = [
+                (key, spec) for key, spec in candidates
+                if circuit_breaker.get_state(spec.provider.value) != CircuitState.OPEN
+                and not self._is_erroring(key)
+            ] or candidates
+
+            expected = {key: self.expected_latency(key, expected_output_tokens) for key, _ in healthy}
+            within_budget = [
+                (key, spec) for key, spec in healthy
+                if latency_budget_s is None or expected[key] <= latency_budget_s
+            ]
+
+            if within_budget:
+                key, spec = self._rank(within_budget, priority, requirements, expected)
+                reason = f"{priority} within budget" if latency_budget_s else priority
+            else:
+                key, spec = min(healthy, key=lambda c: expected[c[0]])
+                reason = "budget_unmet: fastest available"
+
+            decision = RoutingDecision(
+                timestamp=datetime.now().isoformat(),
+                agent=agent,
+                model_key=key,
+                model_name=spec.model_name,
+                provider=spec.provider.value,
+                priority=priority,
+                reason=reason,
+                latency_budget_s=latency_budget_s,
+                expected_latency_s=round(expected[key], 3),
+                required_capabilities=[c.value for c in requirements["capabilities"]],
+                candidates=[
+                    {
+                        "model": k,
+                        "cost_per_1k_tokens": s.cost_per_1k_tokens,
+                        "expected_latency_s": round(expected[k], 3),
+                        "error_rate": round(self._error_rate(k), 4),
+                    }
+                    for k, s in healthy
+                ],
+            )
+            self._decisions.append(decision)
+
+        self._write_audit(decision)
+        logger.info(
+            f"🔀 Routed {agent} -> {key} ({spec.provider.value}) "
+            f"[{reason}, expected {expected[key]:.1f}s]"
+        )
+        return spec
+
+    def _rank(
+        self,
+        candidates: List[tuple],
+        priority: str,
+        requirements: Dict[str, Any],
+        expected: Dict[str, float]
+    ) -> tuple:
+        if priority == "cost":
+            return min(
+                candidates,
+                key=lambda c: (c[1].cost_per_1k_tokens * (1 + self._error_rate(c[0])), expected[c[0]])
+            )
+        if priority == "speed":
+            return min(candidates, key=lambda c: (expected[c[0]], c[1].cost_per_1k_tokens))
+        return _select_by_priority(candidates, priority, requirements)
+
+    def _error_rate(self, key: str) -> float:
+        perf = self._performance.get(key)
+        return perf.ewma_error_rate if perf else 0.0
+
+    def _is_erroring(self, key: str) -> bool:
+        perf = self._performance.get(key)
+        return bool(
+            perf and perf.samples >= MIN_SAMPLES_FOR_ERROR_GATE
+            and perf.ewma_error_rate > MAX_ERROR_RATE
+        )
+
+    def _write_audit(self, decision: RoutingDecision) -> None:
+        if not self._audit_path:
+            return
+        try:
+            with open(self._audit_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(asdict(decision)) + "\n")
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write routing audit log: {e}")
+
+    def get_decisions(self, limit: int = 100, agent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent routing decisions, newest last"""
+        with self._lock:
+            decisions = [d for d in self._decisions if agent is None or d.agent == agent]
+        return [asdict(d) for d in decisions[-limit:]]
+
+    def get_performance(self) -> Dict[str, Dict[str, Any]]:
+        """EWMA stats per model"""
+        with self._lock:
+            return {key: asdict(perf) for key, perf in self._performance.items()}
+
+
+# Global model router instance (singleton pattern)
+_model_router: Optional[ModelRouter] = None
+
+
+def get_model_router() -> ModelRouter:
+    """Get or create global model router instance"""
+    global _model_router
+    if _model_router is None:
+        _model_router = ModelRouter()
+    return _model_router
@@ -0,0 +1,146 @@
+# langgraph_app/core/planner_metrics.py
+
+"""
+Planner Run Metrics and Template Confidence History
+
+Records LLM calls and wall time for every planner run, grouped by planner
+mode, so the speculative/structured mode can be compared with the
+sequential baseline. Also keeps an EWMA of self-critique confidence per
+template; templates whose plans are consistently accepted can skip the
+critique call, with a periodic re-check so the history does not go stale.
+
+Purpose: Cut planner latency and LLM spend while keeping the numbers that
+justify it visible.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+BASELINE_MODE = "sequential"
+
+# Critique is skipped when a template's smoothed confidence reaches this...
+CRITIQUE_SKIP_CONFIDENCE = float(os.getenv("PLANNER_CRITIQUE_SKIP_CONFIDENCE", "0.9"))
+# ...after at least this many critiques...
+MIN_CRITIQUE_SAMPLES = 3
+# ...and is forced again after this many consecutive skips
+MAX_CONSECUTIVE_SKIPS = 10
+
+
+@dataclass
+class PlannerRun:
+    """Counters for a single planner run"""
+    mode: str
+    template: str
+    llm_calls: int = 0
+    wall_time_s: float = 0.0
+    critique_skipped: bool = False
+    refined: bool = False
+
+
+@dataclass
+class TemplateConfidence:
+    """Smoothed critique confidence for one template"""
+    alpha: float = 0.3
+    samples: int = 0
+    ewma_confidence: Optional[float] = None
+    consecutive_skips: int = 0
+    last_updated: Optional[str] = None
+
+    def update(self, confidence: float) -> None:
+        self.samples += 1
+        self.ewma_confidence = confidence if self.ewma_confidence is None else (
+            self.alpha * confidence + (1 - self.alpha) * self.ewma_confidence
+        )
+        self.consecutive_skips = 0
+        self.last_updated = datetime.now().isoformat()
+
+
+class PlannerMetrics:
+    """Per-mode planner run totals and per-template critique confidence"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._modes: Dict[str, Dict[str, float]] = {}
+        self._templates: Dict[str, TemplateConfidence] = {}
+
+    def record_run(self, run: PlannerRun) -> None:
+        with self._lock:
+            totals = self._modes.setdefault(run.mode, {
+                "runs": 0, "llm_calls": 0, "wall_time_s": 0.0, "critique_skipped": 0, "refined": 0
+            })
+            totals["runs"] += 1
+            totals["llm_calls"] += run.llm_calls
+            totals["wall_time_s"] += run.wall_time_s
+            totals["critique_skipped"] += int(run.critique_skipped)
+            totals["refined"] += int(run.refined)
+
+        logger.info(
+            f"Planner run [{run.mode}] {run.template}: {run.llm_calls} LLM calls, "
+            f"{run.wall_time_s:.1f}s{' (critique skipped)' if run.critique_skipped else ''}"
+        )
+
+    def record_confidence(self, template: str, confidence: float) -> None:
+        with self._lock:
+            self._templates.setdefault(template, TemplateConfidence()).update(confidence)
+
+    def should_skip_critique(self, template: str) -> bool:
+        """True when the template's plans have consistently passed critique"""
+        with self._lock:
+            history = self._templates.get(template)
+            if (
+                history is None
+                or history.samples < MIN_CRITIQUE_SAMPLES
+                or history.ewma_confidence < CRITIQUE_SKIP_CONFIDENCE
+                or history.consecutive_skips >= MAX_CONSECUTIVE_SKIPS
+            ):
+                return False
+            history.consecutive_skips += 1
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Averages per mode plus the change relative to the sequential baseline"""
+        with self._lock:
+            modes = {}
+            for mode, totals in self._modes.items():
+                runs = totals["runs"] or 1
+                modes[mode] = {
+                    "runs": totals["runs"],
+                    "avg_llm_calls": round(totals["llm_calls"] / runs, 2),
+                    "avg_wall_time_s": round(totals["wall_time_s"] / runs, 3),
+                    "critique_skip_rate": round(totals["critique_skipped"] / runs, 3),
+                    "refinement_rate": round(totals["refined"] / runs, 3),
+                }
+            templates = {name: asdict(history) for name, history in self._templates.items()}
+
+        baseline = modes.get(BASELINE_MODE)
+        if baseline:
+            for mode, stats in modes.items():
+                if mode == BASELINE_MODE:
+                    continue
+                stats["vs_baseline"] = {
+                    "llm_calls_delta": round(stats["avg_llm_calls"] - baseline["avg_llm_calls"], 2),
+                    "wall_time_speedup": (
+                        round(baseline["avg_wall_time_s"] / stats["avg_wall_time_s"], 2)
+                        if stats["avg_wall_time_s"] else None
+                    ),
+                }
+
+        return {"modes": modes, "templates": templates}
+
+
+# Global planner metrics instance (singleton pattern)
+_planner_metrics: Optional[PlannerMetrics] = None
+
+
+def get_planner_metrics() -> PlannerMetrics:
+    """Get or create global planner metrics instance"""
+    global _planner_metrics
+    if _planner_metrics is None:
+        _planner_metrics = PlannerMetrics()
+    return _planner_metrics
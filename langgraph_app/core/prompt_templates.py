@@ -0,0 +1,103 @@
+# langgraph_app/core/prompt_templates.py
+
+"""
+Compiled Prompt Templates
+
+Template text from YAML (`prompt_schema`) is compiled once per distinct
+text and cached. A compiled prompt is a list of literal segments with
+named placeholder slots between them, so a run only fills its slots
+instead of scanning the whole prompt once per placeholder key.
+
+`{{name}}` placeholders are split out in a single pass at compile time.
+Slots without a value render back as their placeholder text, matching
+the old str.replace behaviour; values are inserted once and never
+re-scanned for placeholders.
+
+Compiled prompts are immutable and shared across concurrent runs. The
+cache is keyed on the template text itself, so an edited template (on
+disk or in memory) compiles afresh and stale entries age out of the LRU.
+
+Purpose: Shrink per-run prompt assembly for schema-driven templates.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Tuple, Union
+
+MAX_CACHED_PROMPTS = 512
+
+_PLACEHOLDER = re.compile(r"\{\{([^{}]*)\}\}")
+
+
+@dataclass(frozen=True)
+class Slot:
+    """A named hole in a compiled prompt"""
+    name: str
+
+    @property
+    def placeholder(self) -> str:
+        return f"{{{{{self.name}}}}}"
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """Literal segments interleaved with slots: literals[0] slots[0] literals[1] ..."""
+    literals: Tuple[str, ...]
+    slots: Tuple[Slot, ...]
+
+    def __post_init__(self):
+        # Joinable parts with the literals in place; slots are filled per render
+        parts = [self.literals[0]]
+        positions = []
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            positions.append((len(parts), slot.name))
+            parts.append(slot.placeholder)
+            parts.append(literal)
+        object.__setattr__(self, "_parts", tuple(parts))
+        object.__setattr__(self, "_positions", tuple(positions))
+
+    @classmethod
+    def from_parts(cls, *parts: Union[str, Slot]) -> "CompiledPrompt":
+        """Build from literal strings and Slot markers; adjacent literals are merged"""
+        literals, slots, pending = [], [], []
+        for part in parts:
+            if isinstance(part, Slot):
+                literals.append("".join(pending))
+                slots.append(part)
+                pending = []
+            else:
+                pending.append(str(part))
+        literals.append("".join(pending))
+        return cls(tuple(literals), tuple(slots))
+
+    @property
+    def slot_names(self) -> Tuple[str, ...]:
+        return tuple(dict.fromkeys(slot.name for slot in self.slots))
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        """Fill every slot; slots missing from values keep their placeholder"""
+        parts = list(self._parts)
+        for index, name in self._positions:
+            if name in values:
+                parts[index] = str(values[name])
+        return "".join(parts)
+
+
+@lru_cache(maxsize=MAX_CACHED_PROMPTS)
+def compile_template(text: str) -> CompiledPrompt:
+    """Split `{{name}}` placeholders out of template text in one pass"""
+    parts = []
+    position = 0
+    for match in _PLACEHOLDER.finditer(text):
+        parts.append(text[position:match.start()])
+        parts.append(Slot(match.group(1)))
+        position = match.end()
+    parts.append(text[position:])
+    return CompiledPrompt.from_parts(*parts)
+
+
+def get_prompt_template_stats() -> Dict[str, Any]:
+    """Compiled template counts and hits"""
+    info = compile_template.cache_info()
+    return {"prompts": info.currsize, "hits": info.hits, "misses": info.misses}
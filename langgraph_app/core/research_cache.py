@@ -0,0 +1,193 @@
+# langgraph_app/core/research_cache.py
+
+"""
+Freshness-Aware Research Cache
+
+Caches web search results under a normalized form of the query text
+(case, punctuation, stopwords and word order removed), so "{topic} market
+size growth" and "Growth in {topic} market size" share an entry.
+
+Each entry has a TTL derived from how perishable the data is: the request
+timeframe when there is one ("24h" -> 1h, "7d" -> 7h), otherwise the
+evidence type. Past its TTL an entry is still served for a further grace
+window while a background refresh replaces it (stale-while-revalidate);
+only entries past the grace window count as misses.
+
+Hits, stale hits, misses and refreshes are counted per source (the caller
+tag on each query, e.g. "priority", "market_data", "realtime").
+
+Configuration:
+- RESEARCH_CACHE_ENABLED: "false" disables the cache (default true)
+- RESEARCH_CACHE_MAX_ENTRIES: LRU bound (default 5000)
+
+Purpose: Let topic-clustered traffic reuse recent searches instead of
+paying for an external search on every request.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# TTL per evidence type when no timeframe is given
+EVIDENCE_TTL_S = {
+    "news": 1 * HOUR,
+    "market_data": 1 * DAY,
+    "financial_metrics": 1 * DAY,
+    "priority": 3 * DAY,
+}
+DEFAULT_TTL_S = 1 * DAY
+
+# A timeframe-bound search may be cached for this fraction of its window
+TIMEFRAME_TTL_FRACTION = 1 / 24
+MIN_TTL_S = 5 * 60
+
+# Stale entries are served (and refreshed in the background) for TTL * this factor
+STALE_GRACE_FACTOR = 1.0
+
+STOPWORDS = {"a", "an", "and", "for", "in", "of", "on", "the", "to", "with", "about", "vs"}
+_TOKEN = re.compile(r"[a-z0-9$%.:+#]+")
+
+
+def normalize_query(query: str) -> str:
+    """Order-insensitive normalized query text used as the cache key"""
+    tokens = {t.strip(".:") for t in _TOKEN.findall((query or "").lower())}
+    return " ".join(sorted(t for t in tokens if t and t not in STOPWORDS))
+
+
+def timeframe_seconds(timeframe: Optional[str]) -> Optional[int]:
+    """Seconds in a "24h"/"7d"/"2w" timeframe, None if absent or unparseable"""
+    match = re.fullmatch(r"\s*(\d+)\s*([hdw])\s*", timeframe or "")
+    if not match:
+        return None
+    return int(match.group(1)) * {"h": HOUR, "d": DAY, "w": 7 * DAY}[match.group(2)]
+
+
+def ttl_for(timeframe: Optional[str] = None, evidence_type: Optional[str] = None) -> float:
+    """TTL from the timeframe when present, otherwise from the evidence type"""
+    window = timeframe_seconds(timeframe)
+    if window:
+        return max(MIN_TTL_S, window * TIMEFRAME_TTL_FRACTION)
+    return EVIDENCE_TTL_S.get(evidence_type or "", DEFAULT_TTL_S)
+
+
+@dataclass
+class CacheEntry:
+    """Cached results for one normalized query"""
+    results: List[Dict[str, Any]]
+    max_results: int
+    ttl_s: float
+    stored_at: float = field(default_factory=time.time)
+
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def state(self) -> str:
+        age = self.age()
+        if age <= self.ttl_s:
+            return "fresh"
+        if age <= self.ttl_s * (1 + STALE_GRACE_FACTOR):
+            return "stale"
+        return "expired"
+
+
+class ResearchCache:
+    """Thread-safe LRU cache of search results with per-source metrics"""
+
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries or int(os.getenv("RESEARCH_CACHE_MAX_ENTRIES", "5000"))
+        self.enabled = os.getenv("RESEARCH_CACHE_ENABLED", "true").lower() != "false"
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._refreshing: set = set()
+        self._metrics: Dict[str, Dict[str, int]] = {}
+
+    def lookup(self, query: str, max_results: int, source: str) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+        """
+        Return (results, state) where state is fresh, stale or miss.
+
+        Entries cached with fewer results than requested count as misses.
+        """
+        if not self.enabled:
+            return None, "miss"
+
+        key = normalize_query(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            state = entry.state() if entry else "miss"
+            if entry and (state == "expired" or entry.max_results < max_results):
+                state = "miss"
+            if state != "miss":
+                self._entries.move_to_end(key)
+            self._count(source, {"fresh": "hits", "stale": "stale_hits", "miss": "misses"}[state])
+            return (list(entry.results[:max_results]) if state != "miss" else None), state
+
+    def store(self, query: str, results: List[Dict[str, Any]], max_results: int, ttl_s: float) -> None:
+        if not self.enabled:
+            return
+        key = normalize_query(query)
+        with self._lock:
+            self._entries[key] = CacheEntry(results=list(results), max_results=max_results, ttl_s=ttl_s)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def begin_refresh(self, query: str, source: str) -> bool:
+        """Claim the background refresh for a stale query; False if one is already running"""
+        key = normalize_query(query)
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self._count(source, "refreshes")
+            return True
+
+    def end_refresh(self, query: str) -> None:
+        with self._lock:
+            self._refreshing.discard(normalize_query(query))
+
+    def _count(self, source: str, metric: str) -> None:
+        counters = self._metrics.setdefault(source, {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0})
+        counters[metric] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            sources = {}
+            for source, counters in self._metrics.items():
+                lookups = counters["hits"] + counters["stale_hits"] + counters["misses"]
+                sources[source] = {
+                    **counters,
+                    "hit_ratio": round((counters["hits"] + counters["stale_hits"]) / lookups, 4) if lookups else 0.0
+                }
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "refreshing": len(self._refreshing),
+                "sources": sources
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Global research cache instance (singleton pattern)
+_research_cache: Optional[ResearchCache] = None
+
+
+def get_research_cache() -> ResearchCache:
+    """Get or create global research cache instance"""
+    global _research_cache
+    if _research_cache is None:
+        _research_cache = ResearchCache()
+    return _research_cache
@@ -0,0 +1,413 @@
+# langgraph_app/core/research_corpus.py
+
+"""
+Local Research Corpus (BM25)
+
+An in-process inverted index over everything the system has already
+researched or written:
+- research findings and source snippets from previous runs (appended to
+  storage/research_corpus/findings.jsonl so they survive restarts; the
+  log keeps the newest RESEARCH_CORPUS_MAX_FINDINGS records, and nothing
+  is persisted when LLM_PROVIDER=fake)
+- saved articles under generated_content/ and storage/, split into
+  passage-sized chunks (mock articles are skipped)
+
+Documents are added incrementally: files are re-indexed only when their
+mtime changes, new findings are indexed as the researcher produces them,
+and newly saved articles are added by path. Identical passages (e.g. the
+.json and .md copies of one article) are indexed once.
+
+Retrieval is Okapi BM25. `has_recall` decides whether local results are
+good enough to skip an external search: enough passages must cover most
+of the query's terms. Only web snippets carry a citable url; passages
+from our own articles are context, never a citation source.
+
+Configuration:
+- RESEARCH_CORPUS_ENABLED: "false" disables local recall (default true)
+- RESEARCH_CORPUS_MIN_HITS: passages needed to skip external search (default 2)
+- RESEARCH_CORPUS_MIN_COVERAGE: fraction of query terms a passage must contain (default 0.75)
+- RESEARCH_CORPUS_MAX_FINDINGS: records kept in the findings log (default 5000)
+
+Purpose: Stop starting every run's research from zero when prior runs
+already covered overlapping topics.
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from langgraph_app.enhanced_model_registry import fake_llm_enabled
+
+logger = logging.getLogger(__name__)
+
+CONTENT_DIRS = ("generated_content", "storage")
+FINDINGS_LOG = Path("storage/research_corpus/findings.jsonl")
+# Agent memory is strategy metadata, not content
+EXCLUDED_DIRS = {"agent_memory", "research_corpus"}
+# Placeholder articles written by the mock generator
+_MOCK_STEM = re.compile(r"(?:^|_)mock$", re.IGNORECASE)
+_MOCK_TITLE = "[MOCK]"
+
+CHUNK_MIN_WORDS = 60
+CHUNK_MAX_WORDS = 220
+
+STOPWORDS = {
+    "a", "about", "after", "all", "also", "an", "and", "any", "are", "as", "at", "be", "been", "but",
+    "by", "can", "do", "does", "for", "from", "has", "have", "how", "if", "in", "into", "is", "it",
+    "its", "more", "most", "not", "of", "on", "or", "our", "so", "such", "than", "that", "the",
+    "their", "them", "then", "there", "these", "they", "this", "to", "up", "was", "we", "were",
+    "what", "when", "which", "while", "who", "why", "will", "with", "you", "your", "vs"
+}
+_WORD = re.compile(r"[a-z0-9]+")
+_TAG = re.compile(r"<[^>]+>")
+_FRONT_MATTER = re.compile(r"\A---\s*\n.*?\n---\s*\n", re.DOTALL)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens without stopwords; trailing plural 's' folded"""
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        if word in STOPWORDS:
+            continue
+        if len(word) > 4 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.append(word)
+    return tokens
+
+
+def chunk_text(text: str) -> List[str]:
+    """Split an article into passages of roughly CHUNK_MIN_WORDS..CHUNK_MAX_WORDS words"""
+    chunks, current, words = [], [], 0
+    for paragraph in re.split(r"\n\s*\n", text or ""):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        count = len(paragraph.split())
+        if current and words + count > CHUNK_MAX_WORDS:
+            chunks.append("\n\n".join(current))
+            current, words = [], 0
+        current.append(paragraph)
+        words += count
+        if words >= CHUNK_MIN_WORDS:
+            chunks.append("\n\n".join(current))
+            current, words = [], 0
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+@dataclass
+class CorpusDocument:
+    """One indexed passage"""
+    doc_id: str
+    text: str
+    source: str
+    kind: str  # finding | snippet | article
+    title: str = ""
+    topic: str = ""
+    added_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class CorpusHit:
+    """A BM25 search result"""
+    document: CorpusDocument
+    score: float
+    coverage: float
+
+    @property
+    def citable(self) -> bool:
+        """Only web sources can be cited; local paths are not urls"""
+        return self.document.source.startswith(("http://", "https://"))
+
+    def to_search_result(self) -> Dict[str, Any]:
+        """Shape the hit like a web search result"""
+        return {
+            "title": self.document.title,
+            "url": self.document.source if self.citable else "",
+            "content": self.document.text,
+            "score": round(self.score, 4),
+            "local": True,
+            "kind": self.document.kind
+        }
+
+
+class ResearchCorpus:
+    """Incrementally updated BM25 index over prior research and content"""
+
+    def __init__(self, root: Optional[Path] = None, k1: float = 1.5, b: float = 0.75):
+        self.root = Path(root) if root else Path(".")
+        self.k1 = k1
+        self.b = b
+        self.enabled = os.getenv("RESEARCH_CORPUS_ENABLED", "true").lower() != "false"
+        self.min_hits = int(os.getenv("RESEARCH_CORPUS_MIN_HITS", "2"))
+        self.min_coverage = float(os.getenv("RESEARCH_CORPUS_MIN_COVERAGE", "0.75"))
+        self.max_findings = int(os.getenv("RESEARCH_CORPUS_MAX_FINDINGS", "5000"))
+        self._lock = threading.RLock()
+        self._documents: Dict[str, CorpusDocument] = {}
+        self._term_freqs: Dict[str, Counter] = {}
+        self._lengths: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._total_length = 0
+        self._content_hashes: Dict[str, str] = {}  # passage hash -> doc_id
+        self._doc_hashes: Dict[str, str] = {}
+        self._file_docs: Dict[str, List[str]] = {}
+        self._file_mtimes: Dict[str, float] = {}
+        self._logged_findings = 0
+        self._loaded = False
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def add_document(self, document: CorpusDocument) -> bool:
+        """Index a passage; returns False for duplicates of an indexed passage"""
+        terms = tokenize(document.text)
+        if not terms:
+            return False
+        digest = hashlib.sha1(" ".join(terms).encode("utf-8")).hexdigest()
+
+        with self._lock:
+            if digest in self._content_hashes or document.doc_id in self._documents:
+                return False
+            freqs = Counter(terms)
+            self._documents[document.doc_id] = document
+            self._term_freqs[document.doc_id] = freqs
+            self._content_hashes[digest] = document.doc_id
+            self._doc_hashes[document.doc_id] = digest
+            self._lengths[document.doc_id] = len(terms)
+            self._total_length += len(terms)
+            for term, tf in freqs.items():
+                self._postings.setdefault(term, {})[document.doc_id] = tf
+            return True
+
+    def remove_document(self, doc_id: str) -> None:
+        with self._lock:
+            document = self._documents.pop(doc_id, None)
+            freqs = self._term_freqs.pop(doc_id, None)
+            if document is None or freqs is None:
+                return
+            self._total_length -= self._lengths.pop(doc_id, 0)
+            self._content_hashes.pop(self._doc_hashes.pop(doc_id, ""), None)
+            for term in freqs:
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(doc_id, None)
+                    if not postings:
+                        del self._postings[term]
+
+    def add_file(self, path: Path) -> int:
+        """(Re)index a saved article if it is new or changed; returns passages added"""
+        path = Path(path)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return 0
+        key = str(path)
+
+        with self._lock:
+            if self._file_mtimes.get(key) == mtime:
+                return 0
+            for doc_id in self._file_docs.pop(key, []):
+                self.remove_document(doc_id)
+            self._file_mtimes[key] = mtime
+
+            title, topic, text = self._read_article(path)
+            added = []
+            for idx, chunk in enumerate(chunk_text(text)):
+                doc = CorpusDocument(
+                    doc_id=f"file:{key}#{idx}", text=chunk, source=key,
+                    kind="article", title=title, topic=topic
+                )
+                if self.add_document(doc):
+                    added.append(doc.doc_id)
+            self._file_docs[key] = added
+            return len(added)
+
+    def add_findings(self, topic: str, findings: Iterable[Dict[str, Any]], persist: bool = True) -> int:
+        """Index research findings/snippets ({"finding"/"content", "source"/"url", ...})"""
+        added = 0
+        records = []
+        for finding in findings:
+            text = finding.get("finding") or finding.get("content") or ""
+            source = finding.get("source") or finding.get("url") or ""
+            if not text.strip():
+                continue
+            digest = hashlib.sha1(f"{source}|{text}".encode("utf-8")).hexdigest()[:16]
+            doc = CorpusDocument(
+                doc_id=f"finding:{digest}", text=text, source=source,
+                kind="snippet" if source.startswith("http") else "finding",
+                title=finding.get("title", ""), topic=topic
+            )
+            if self.add_document(doc):
+                added += 1
+                records.append(asdict(doc))
+
+        if persist and records and not fake_llm_enabled():
+            self._append_findings_log(records)
+        return added
+
+    def refresh(self) -> int:
+        """Index new or modified files under the content directories"""
+        added = 0
+        for directory in CONTENT_DIRS:
+            base = self.root / directory
+            if not base.exists():
+                continue
+            for path in sorted(base.rglob("*")):
+                if path.suffix not in (".json", ".md") or EXCLUDED_DIRS.intersection(path.parts):
+                    continue
+                if _MOCK_STEM.search(path.stem):
+                    continue
+                added += self.add_file(path)
+        return added
+
+    def ensure_loaded(self) -> None:
+        """Load the findings log and scan content directories once"""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            started = time.time()
+            findings_path = self.root / FINDINGS_LOG
+            if findings_path.exists():
+                with open(findings_path, encoding="utf-8") as f:
+                    for line in f:
+                        self._logged_findings += 1
+                        try:
+                            self.add_document(CorpusDocument(**json.loads(line)))
+                        except (ValueError, TypeError):
+                            continue
+            self.refresh()
+            self._loaded = True
+            logger.info(
+                f"✅ Research corpus loaded: {len(self._documents)} passages, "
+                f"{len(self._postings)} terms in {time.time() - started:.2f}s"
+            )
+
+    # ------------------------------------------------------------------
+    # Retrieval
+    # ------------------------------------------------------------------
+
+    def search(self, query: str, k: int = 5) -> List[CorpusHit]:
+        """Top-k passages by BM25 score"""
+        self.ensure_loaded()
+        query_terms = list(dict.fromkeys(tokenize(query)))
+        if not query_terms:
+            return []
+
+        with self._lock:
+            n_docs = len(self._documents)
+            if not n_docs:
+                return []
+            avg_length = self._total_length / n_docs
+            scores: Dict[str, float] = {}
+            matched: Dict[str, int] = {}
+
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+                for doc_id, tf in postings.items():
+                    length = self._lengths[doc_id]
+                    norm = tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_length))
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * norm
+                    matched[doc_id] = matched.get(doc_id, 0) + 1
+
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:k]
+            return [
+                CorpusHit(self._documents[doc_id], score, matched[doc_id] / len(query_terms))
+                for doc_id, score in ranked
+            ]
+
+    def has_recall(self, hits: Sequence[CorpusHit]) -> bool:
+        """Enough passages covering most of the query to skip external search"""
+        if not self.enabled:
+            return False
+        return sum(1 for hit in hits if hit.coverage >= self.min_coverage) >= self.min_hits
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            kinds = Counter(doc.kind for doc in self._documents.values())
+            return {
+                "enabled": self.enabled,
+                "loaded": self._loaded,
+                "documents": len(self._documents),
+                "terms": len(self._postings),
+                "files": len(self._file_docs),
+                "by_kind": dict(kinds)
+            }
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _read_article(self, path: Path) -> tuple:
+        """(title, topic, plain text) for a saved .json or .md article"""
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return "", "", ""
+
+        if path.suffix == ".md":
+            text = _FRONT_MATTER.sub("", raw)
+            heading = re.search(r"^#\s+(.+)$", text, re.MULTILINE)
+            return (heading.group(1).strip() if heading else path.stem), "", text
+
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return "", "", ""
+        if not isinstance(data, dict) or str(data.get("title") or "").startswith(_MOCK_TITLE):
+            return "", "", ""
+        metadata = data.get("metadata") if isinstance(data.get("metadata"), dict) else {}
+        text = data.get("final_content") or data.get("content") or _TAG.sub("\n\n", data.get("contentHtml") or "")
+        return str(data.get("title") or path.stem), str(metadata.get("topic") or ""), str(text)
+
+    def _append_findings_log(self, records: List[Dict[str, Any]]) -> None:
+        path = self.root / FINDINGS_LOG
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                with open(path, "a", encoding="utf-8") as f:
+                    for record in records:
+                        f.write(json.dumps(record) + "\n")
+                self._logged_findings += len(records)
+                # Let the log grow to 1.25x the cap, then keep the newest records
+                if self._logged_findings > self.max_findings * 1.25:
+                    self._compact_findings_log(path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not persist research findings: {e}")
+
+    def _compact_findings_log(self, path: Path) -> None:
+        with open(path, encoding="utf-8") as f:
+            lines = f.readlines()[-self.max_findings:]
+        temp = path.with_suffix(".tmp")
+        with open(temp, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(temp, path)
+        self._logged_findings = len(lines)
+        logger.info(f"♻️ Research findings log compacted to {len(lines)} records")
+
+
+# Global research corpus instance (singleton pattern)
+_research_corpus: Optional[ResearchCorpus] = None
+
+
+def get_research_corpus() -> ResearchCorpus:
+    """Get or create global research corpus instance"""
+    global _research_corpus
+    if _research_corpus is None:
+        _research_corpus = ResearchCorpus()
+    return _research_corpus
@@ -0,0 +1,252 @@
+# langgraph_app/core/research_executor.py
+
+"""
+Concurrent Research Executor
+
+Issues a batch of web search queries concurrently over one shared search
+client. Concurrency is capped by a semaphore, each query has its own
+timeout, and results are deduplicated across the batch by canonical URL
+(the first query in batch order keeps a URL, so output is deterministic
+regardless of completion order).
+
+Queries are answered from the research cache first; stale entries are
+returned immediately and refreshed in the background. Synchronous callers
+share one long-lived event loop thread instead of starting a loop per call.
+
+Configuration:
+- RESEARCH_MAX_CONCURRENCY: simultaneous queries (default 4)
+- RESEARCH_QUERY_TIMEOUT_S: per-query timeout in seconds (default 15)
+
+Purpose: Make research latency that of the slowest query instead of the
+sum of all queries, without opening a new client per query.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from langgraph_app.core.circuit_breaker import get_circuit_breaker
+from langgraph_app.core.research_cache import get_research_cache, ttl_for
+from langgraph_app.enhanced_model_registry import create_search_client
+
+logger = logging.getLogger(__name__)
+
+SEARCH_PROVIDER = "tavily"
+
+# Query parameters that never change the page content
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src", "source"}
+
+
+def canonical_url(url: str) -> str:
+    """Normalize a URL for deduplication (scheme/host case, www., fragments, tracking params, trailing slash)"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    ))
+    path = parts.path.rstrip("/") or ""
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme, host, path, query, ""))
+
+
+@dataclass
+class SearchQuery:
+    """
+    One query in a research batch; `key` identifies it in the results.
+
+    `timeframe` / `evidence_type` set the cache TTL; `source` tags the
+    query in cache hit metrics.
+    """
+    key: str
+    query: str
+    max_results: int = 3
+    timeframe: Optional[str] = None
+    evidence_type: Optional[str] = None
+    source: str = "research"
+
+
+@dataclass
+class SearchOutcome:
+    """Results (after cross-query dedupe) for one query"""
+    key: str
+    query: str
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    latency_s: float = 0.0
+    duplicates_removed: int = 0
+    cache: str = "miss"  # fresh | stale | miss | local
+
+
+class ResearchExecutor:
+    """Runs search batches concurrently over a single pooled search client"""
+
+    def __init__(
+        self,
+        client: Any = None,
+        max_concurrency: Optional[int] = None,
+        timeout_s: Optional[float] = None
+    ):
+        self._client = client
+        self._client_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self.max_concurrency = max_concurrency or int(os.getenv("RESEARCH_MAX_CONCURRENCY", "4"))
+        self.timeout_s = timeout_s or float(os.getenv("RESEARCH_QUERY_TIMEOUT_S", "15"))
+        # Own pool: the loop's default executor is small and is joined when asyncio.run()
+        # returns; spare workers absorb calls that are still running after a timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrency * 2, thread_name_prefix="research-search"
+        )
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = create_search_client(os.getenv("TAVILY_API_KEY"))
+        return self._client
+
+    def run(self, queries: Sequence[SearchQuery]) -> Dict[str, SearchOutcome]:
+        """
+        Synchronous entry point for agents.
+
+        Batches run on the executor's own long-lived event loop, so the call
+        is safe with or without a running loop in the caller's thread and
+        costs no loop setup per batch.
+        """
+        if not queries:
+            return {}
+        return asyncio.run_coroutine_threadsafe(self.search_many(queries), self._event_loop()).result()
+
+    def search(self, query: SearchQuery) -> SearchOutcome:
+        """Single synchronous query (cache, circuit breaker and timeout as in a batch)"""
+        return self.run([query])[query.key]
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(target=loop.run_forever, name="research-executor", daemon=True).start()
+                    self._loop = loop
+        return self._loop
+
+    async def search_many(self, queries: Sequence[SearchQuery]) -> Dict[str, SearchOutcome]:
+        """Run all queries concurrently under the semaphore, then dedupe in batch order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        started = time.time()
+
+        outcomes = await asyncio.gather(*(self._search_one(q, semaphore) for q in queries))
+
+        seen = set()
+        for outcome in outcomes:
+            unique = []
+            for result in outcome.results:
+                url = canonical_url(result.get("url", ""))
+                if url and url in seen:
+                    outcome.duplicates_removed += 1
+                    continue
+                seen.add(url)
+                unique.append(result)
+            outcome.results = unique
+
+        failed = sum(1 for o in outcomes if o.error)
+        cached = sum(1 for o in outcomes if o.cache != "miss")
+        (logger.info if len(queries) > 1 else logger.debug)(
+            f"Research batch: {len(queries)} queries in {time.time() - started:.1f}s "
+            f"({cached} from cache, slowest {max(o.latency_s for o in outcomes):.1f}s, {failed} failed, "
+            f"{sum(o.duplicates_removed for o in outcomes)} duplicate URLs removed)"
+        )
+        return {o.key: o for o in outcomes}
+
+    async def _search_one(self, query: SearchQuery, semaphore: asyncio.Semaphore) -> SearchOutcome:
+        circuit_breaker = get_circuit_breaker()
+        outcome = SearchOutcome(key=query.key, query=query.query)
+
+        cache = get_research_cache()
+        cached_results, outcome.cache = cache.lookup(query.query, query.max_results, query.source)
+        if cached_results is not None:
+            outcome.results = cached_results
+            if outcome.cache == "stale" and cache.begin_refresh(query.query, query.source):
+                # On the executor's own loop so the refresh outlives a caller's asyncio.run()
+                asyncio.run_coroutine_threadsafe(self._refresh(query), self._event_loop())
+            return outcome
+
+        async with semaphore:
+            if not circuit_breaker.can_execute(SEARCH_PROVIDER):
+                outcome.error = "circuit_open"
+                return outcome
+
+            started = time.time()
+            try:
+                outcome.results = await self._fetch(query)
+            except asyncio.TimeoutError:
+                outcome.error = "timeout"
+                circuit_breaker.record_failure(SEARCH_PROVIDER, "timeout")
+                logger.warning(f"⚠️ Search timed out after {self.timeout_s:.0f}s: {query.query}")
+            except Exception as e:
+                outcome.error = type(e).__name__
+                circuit_breaker.record_failure(SEARCH_PROVIDER, type(e).__name__)
+                logger.error(f"Search failed for '{query.query}': {e}")
+            finally:
+                outcome.latency_s = time.time() - started
+
+        return outcome
+
+    async def _fetch(self, query: SearchQuery) -> List[Dict[str, Any]]:
+        """One client call under the per-query timeout; successful results are cached"""
+        # The client is synchronous; a timed-out call finishes in its thread and is discarded
+        loop = asyncio.get_running_loop()
+        response = await asyncio.wait_for(
+            loop.run_in_executor(
+                self._pool,
+                functools.partial(self.client.search, query=query.query, max_results=query.max_results)
+            ),
+            timeout=self.timeout_s
+        )
+        results = list(response.get("results", []))
+        get_circuit_breaker().record_success(SEARCH_PROVIDER)
+        get_research_cache().store(
+            query.query, results, query.max_results,
+            ttl_for(query.timeframe, query.evidence_type)
+        )
+        return results
+
+    async def _refresh(self, query: SearchQuery) -> None:
+        """Background revalidation of a stale cache entry"""
+        circuit_breaker = get_circuit_breaker()
+        try:
+            if not circuit_breaker.can_execute(SEARCH_PROVIDER):
+                return
+            await self._fetch(query)
+        except asyncio.TimeoutError:
+            circuit_breaker.record_failure(SEARCH_PROVIDER, "timeout")
+            logger.warning(f"⚠️ Background refresh timed out after {self.timeout_s:.0f}s: {query.query}")
+        except Exception as e:
+            circuit_breaker.record_failure(SEARCH_PROVIDER, type(e).__name__)
+            logger.warning(f"⚠️ Background refresh failed for '{query.query}': {e}")
+        finally:
+            get_research_cache().end_refresh(query.query)
+
+
+# Global research executor instance (singleton pattern)
+_research_executor: Optional[ResearchExecutor] = None
+
+
+def get_research_executor() -> ResearchExecutor:
+    """Get or create global research executor instance"""
+    global _research_executor
+    if _research_executor is None:
+        _research_executor = ResearchExecutor()
+    return _research_executor
@@ -74,6 +74,7 @@ class EnrichedContentState:
     status: GenerationStatus = GenerationStatus.INIT
     phase: ContentPhase = ContentPhase.INIT
     agent_execution_log: List[AgentExecutionEvent] = field(default_factory=list)
+    request_id: Optional[str] = None  # Links agents to the request's progress/stream channel
 
     # Legacy compatibility (kept temporarily; prefer planning_output)
     research_plan: Optional[PlanningOutput] = None
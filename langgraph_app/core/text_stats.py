@@ -0,0 +1,117 @@
+# langgraph_app/core/text_stats.py
+
+"""
+Shared Text Statistics
+
+One TextStats object per content version: word, sentence, character and
+syllable counts plus the readability formulas derived from them
+(Flesch Reading Ease, Flesch-Kincaid grade, ARI). Editor, SEO and
+publisher tools and the quality helpers in utils all read from it, so a
+document is tokenized once per version instead of once per metric.
+
+Counting is done with whole-text passes rather than per-word loops:
+syllables are vowel groups counted over the lowercased text in a single
+regex scan (groups never span whitespace, so this equals the per-word
+sum), and sentences are runs of text between terminators.
+
+Results are memoized by a hash of the content (LRU), so agents that
+analyze the same draft share one computation.
+
+Purpose: Make readability and quality metrics consistent across agents
+and cheap to recompute.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Dict
+
+_VOWEL_GROUP = re.compile(r"[aeiouy]+")
+_SENTENCE_SPLIT = re.compile(r"[.!?]+")
+
+MAX_CACHED_TEXTS = 512
+
+
+@dataclass(frozen=True)
+class TextStats:
+    """Counts for one piece of text; readability metrics are derived properties"""
+    word_count: int
+    sentence_count: int
+    char_count: int
+    syllable_count: int
+
+    @classmethod
+    def from_text(cls, text: str) -> "TextStats":
+        text = text or ""
+        words = text.split()
+        sentences = sum(1 for s in _SENTENCE_SPLIT.split(text) if s.strip())
+        return cls(
+            word_count=len(words),
+            sentence_count=max(1, sentences),
+            char_count=len("".join(words)),
+            syllable_count=len(_VOWEL_GROUP.findall(text.lower())),
+        )
+
+    @property
+    def avg_word_length(self) -> float:
+        return self.char_count / max(self.word_count, 1)
+
+    @property
+    def avg_sentence_length(self) -> float:
+        return self.word_count / self.sentence_count
+
+    @property
+    def avg_syllables_per_word(self) -> float:
+        return self.syllable_count / max(self.word_count, 1)
+
+    @property
+    def flesch_reading_ease(self) -> float:
+        """Unclamped Flesch Reading Ease"""
+        return 206.835 - 1.015 * self.avg_sentence_length - 84.6 * self.avg_syllables_per_word
+
+    @property
+    def flesch_score(self) -> float:
+        """Flesch Reading Ease clamped to 0-100"""
+        return max(0.0, min(100.0, self.flesch_reading_ease))
+
+    @property
+    def flesch_kincaid_grade(self) -> float:
+        return 0.39 * self.avg_sentence_length + 11.8 * self.avg_syllables_per_word - 15.59
+
+    @property
+    def automated_readability_index(self) -> float:
+        return 4.71 * self.avg_word_length + 0.5 * self.avg_sentence_length - 21.43
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **asdict(self),
+            "avg_word_length": round(self.avg_word_length, 2),
+            "avg_sentence_length": round(self.avg_sentence_length, 2),
+            "avg_syllables_per_word": round(self.avg_syllables_per_word, 3),
+            "flesch_score": round(self.flesch_score, 1),
+            "flesch_kincaid_grade": round(self.flesch_kincaid_grade, 1),
+            "automated_readability_index": round(self.automated_readability_index, 1),
+        }
+
+
+_cache: "OrderedDict[bytes, TextStats]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_text_stats(text: str) -> TextStats:
+    """TextStats for this exact content, computed once per content hash"""
+    key = hashlib.blake2b((text or "").encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _cache_lock:
+        stats = _cache.get(key)
+        if stats is not None:
+            _cache.move_to_end(key)
+            return stats
+
+    stats = TextStats.from_text(text)
+    with _cache_lock:
+        _cache[key] = stats
+        while len(_cache) > MAX_CACHED_TEXTS:
+            _cache.popitem(last=False)
+    return stats
@@ -0,0 +1,250 @@
+# langgraph_app/core/token_budget.py
+
+"""
+Token Budgeting Service
+
+Counts prompt tokens with cached tiktoken encoders (memoizing counts only
+for static sections such as the template/style system prompt), and fits
+prompts to a budget section by section. Required sections
+(template/style instructions, the request itself) are never touched;
+optional sections are trimmed item by item, lowest-value item first, and
+only dropped wholesale once they have no items left to give.
+
+tiktoken downloads its BPE files on first use. With LLM_PROVIDER=fake, or
+when an encoding cannot be loaded (offline), counts fall back to a
+~4 characters/token estimate. Pre-load encodings with TIKTOKEN_CACHE_DIR
+(the Docker image does) to avoid the download at request time.
+
+Purpose: Replace ad-hoc "keep the last N characters" truncation, which
+discarded the highest-signal context first, and avoid re-encoding the same
+template/style prompt text on every request.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "o200k_base"
+
+# Relative value of research items tagged with a qualitative relevance
+RELEVANCE_VALUES = {"high": 1.0, "medium": 0.6, "low": 0.3}
+
+
+def get_encoding(model_name: str) -> Optional["tiktoken.Encoding"]:
+    """Encoder for the model; None when offline (fake provider or encoding unavailable)"""
+    if os.getenv("LLM_PROVIDER", "").lower() == "fake":
+        return None
+    return _load_encoding(model_name)
+
+
+@lru_cache(maxsize=32)
+def _load_encoding(model_name: str) -> Optional["tiktoken.Encoding"]:
+    """Cached encoder per model; non-OpenAI or unknown models use o200k_base as an estimate"""
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"⚠️ tiktoken encoding for {model_name} unavailable ({e}); estimating token counts")
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) used when no encoder is available"""
+    return max(1, len(text) // 4) if text else 0
+
+
+def _encode_count(encoding: Optional["tiktoken.Encoding"], text: str) -> int:
+    if encoding is None:
+        return estimate_tokens(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+@lru_cache(maxsize=256)
+def _count_static(encoding: Optional["tiktoken.Encoding"], text: str) -> int:
+    return _encode_count(encoding, text)
+
+
+def count_tokens(text: str, model_name: str, cache: bool = False) -> int:
+    """
+    Token count for text under the model's encoding.
+
+    Pass cache=True only for text that repeats across requests (template/style
+    sections); per-request text would just fill the memo without hits.
+    """
+    if not text:
+        return 0
+    encoding = get_encoding(model_name)
+    return _count_static(encoding, text) if cache else _encode_count(encoding, text)
+
+
+@dataclass
+class BudgetItem:
+    """One droppable unit of a section (e.g. a single research insight)"""
+    text: str
+    value: float = 1.0
+
+
+@dataclass
+class BudgetSection:
+    """
+    A prompt section for budgeting.
+
+    `header` is always kept while the section is; `items` are appended below
+    it and may be dropped individually. Sections with lower `priority` are
+    trimmed first; `required` sections are never trimmed. `static` marks
+    text that repeats across requests, whose token count is memoized.
+    """
+    name: str
+    header: str = ""
+    items: List[BudgetItem] = field(default_factory=list)
+    required: bool = False
+    priority: int = 0
+    separator: str = "\n"
+    static: bool = False
+
+    def render(self) -> str:
+        parts = [self.header] if self.header else []
+        parts.extend(item.text for item in self.items)
+        return self.separator.join(parts)
+
+
+@dataclass
+class BudgetResult:
+    """Outcome of fitting sections to a budget"""
+    sections: Dict[str, str]
+    prompt_tokens: int
+    available_tokens: int
+    dropped: List[str] = field(default_factory=list)
+
+    @property
+    def trimmed(self) -> bool:
+        return bool(self.dropped)
+
+
+class TokenBudgetService:
+    """
+    Fits prompt sections into a token budget.
+
+    Configuration:
+    - headroom: fraction of target_max the prompt may use before trimming,
+      unless an explicit prompt_limit is passed to fit()
+    - min_available: floor for the completion token budget returned
+    """
+
+    def __init__(self, headroom: float = 0.9, min_available: int = 1000):
+        self.headroom = headroom
+        self.min_available = min_available
+
+    def count(self, text: str, model_name: str, cache: bool = False) -> int:
+        return count_tokens(text, model_name, cache)
+
+    def fit(
+        self,
+        sections: Sequence[BudgetSection],
+        model_name: str,
+        target_max: int = 24000,
+        prompt_limit: Optional[int] = None
+    ) -> BudgetResult:
+        """
+        Trim optional sections (lowest-value items first) until the prompt fits.
+
+        The prompt may use prompt_limit tokens (default: headroom x target_max);
+        target_max minus the prompt is returned as the completion budget.
+        """
+        limit = min(prompt_limit, target_max) if prompt_limit else int(target_max * self.headroom)
+        sep_tokens = 1  # Separator newline between parts
+
+        # Work on copies so callers can reuse their sections
+        working = [
+            BudgetSection(s.name, s.header, list(s.items), s.required, s.priority, s.separator, s.static)
+            for s in sections
+        ]
+
+        header_tokens = {s.name: self.count(s.header, model_name, s.static) for s in working}
+        item_tokens = {
+            (s.name, idx): self.count(item.text, model_name) + sep_tokens
+            for s in working for idx, item in enumerate(s.items)
+        }
+        total = sum(header_tokens.values()) + sum(item_tokens.values())
+        dropped: List[str] = []
+
+        if total > limit:
+            logger.warning(f"⚠️ Token budget exceeded ({total} > {limit}) - trimming lowest-value context")
+
+            # Phase 1: drop individual items, lowest value first (lower-priority sections break ties)
+            droppable = sorted(
+                (
+                    (item.value, s.priority, -idx, s.name, idx)
+                    for s in working if not s.required
+                    for idx, item in enumerate(s.items)
+                )
+            )
+            removed = set()
+            for _, _, _, name, idx in droppable:
+                if total <= limit:
+                    break
+                removed.add((name, idx))
+                total -= item_tokens[(name, idx)]
+                dropped.append(f"{name}[{idx}]")
+
+            remaining_tokens = {}
+            for s in working:
+                kept = [idx for idx in range(len(s.items)) if (s.name, idx) not in removed]
+                remaining_tokens[s.name] = sum(item_tokens[(s.name, idx)] for idx in kept)
+                if s.items and not kept and s.header:
+                    # A heading with nothing under it is noise
+                    total -= header_tokens[s.name]
+                    header_tokens[s.name] = 0
+                    s.header = ""
+                s.items = [s.items[idx] for idx in kept]
+
+            # Phase 2: drop whole optional sections by ascending priority
+            for s in sorted((s for s in working if not s.required), key=lambda s: s.priority):
+                if total <= limit:
+                    break
+                if not s.header and not s.items:
+                    continue
+                total -= header_tokens[s.name] + remaining_tokens[s.name]
+                dropped.append(s.name)
+                s.header, s.items = "", []
+
+            if total > limit:
+                logger.warning(f"⚠️ Required prompt sections alone use {total} tokens (limit {limit})")
+
+        available = max(self.min_available, target_max - total)
+        return BudgetResult(
+            sections={s.name: s.render() for s in working},
+            prompt_tokens=total,
+            available_tokens=available,
+            dropped=dropped
+        )
+
+
+def relevance_value(entry: Dict, position: int = 0) -> float:
+    """Value score for a research entry from its relevance/confidence, decaying with rank"""
+    relevance = entry.get("relevance", entry.get("confidence"))
+    if isinstance(relevance, (int, float)):
+        base = float(relevance)
+    else:
+        base = RELEVANCE_VALUES.get(str(relevance).lower(), 0.5) if relevance else 0.5
+    return base / (1 + 0.1 * position)
+
+
+# Global token budget service instance (singleton pattern)
+_token_budget_service: Optional[TokenBudgetService] = None
+
+
+def get_token_budget_service() -> TokenBudgetService:
+    """Get or create global token budget service instance"""
+    global _token_budget_service
+    if _token_budget_service is None:
+        _token_budget_service = TokenBudgetService()
+    return _token_budget_service
@@ -0,0 +1,92 @@
+# langgraph_app/core/tool_prepass.py
+
+"""
+Local Tool Pre-Pass
+
+Runs an agent's pure-Python analysis tools (grammar, readability, keyword
+density, ...) locally on a shared worker pool and formats their results
+for injection into a single LLM prompt. The model receives the analysis
+up front instead of requesting tools and waiting for a round trip that
+was never executed.
+
+Tools run on threads rather than processes: each tool takes
+milliseconds, so process start-up and pickling would cost more than the
+work itself.
+
+Configuration:
+- TOOL_PREPASS_WORKERS: worker threads shared by all agents (default 4)
+
+Purpose: Remove tool-call round trips and make the analysis the model
+sees deterministic.
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Each tool result is cut to this many characters in the prompt
+MAX_RESULT_CHARS = 2000
+
+
+def _tool_name(tool: Any) -> str:
+    return getattr(tool, "name", None) or getattr(tool, "__name__", str(tool))
+
+
+def _run_tool(tool: Any, args: Dict[str, Any]) -> Dict[str, Any]:
+    name = _tool_name(tool)
+    try:
+        # LangChain @tool objects keep the plain function on .func
+        func = getattr(tool, "func", None) or tool
+        return {"tool": name, "result": func(**args)}
+    except Exception as e:
+        logger.warning(f"⚠️ Local tool {name} failed: {e}")
+        return {"tool": name, "error": f"{type(e).__name__}: {e}"}
+
+
+def run_tools_locally(calls: Sequence[Tuple[Any, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Execute (tool, args) pairs concurrently and return results in call order.
+
+    Each entry is {"tool": name, "result": ...}, or {"tool": name, "error": ...}
+    when the tool raised.
+    """
+    if not calls:
+        return []
+    started = time.time()
+    futures = [get_tool_pool().submit(_run_tool, tool, args) for tool, args in calls]
+    results = [future.result() for future in futures]
+    logger.debug(f"Tool pre-pass: {len(results)} tools in {(time.time() - started) * 1000:.1f}ms")
+    return results
+
+
+def format_tool_results(results: List[Dict[str, Any]]) -> str:
+    """Render pre-pass results as a prompt block"""
+    lines = []
+    for entry in results:
+        if "error" in entry:
+            continue
+        rendered = json.dumps(entry["result"], default=str, sort_keys=True)
+        if len(rendered) > MAX_RESULT_CHARS:
+            rendered = rendered[:MAX_RESULT_CHARS] + "...(truncated)"
+        lines.append(f"- {entry['tool']}: {rendered}")
+    return "\n".join(lines) if lines else "- No analysis available"
+
+
+# Global tool worker pool (singleton pattern)
+_tool_pool: Optional[ThreadPoolExecutor] = None
+
+
+def get_tool_pool() -> ThreadPoolExecutor:
+    """Get or create the shared tool worker pool"""
+    global _tool_pool
+    if _tool_pool is None:
+        _tool_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("TOOL_PREPASS_WORKERS", "4")),
+            thread_name_prefix="tool-prepass"
+        )
+    return _tool_pool
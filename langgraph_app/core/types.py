@@ -131,6 +131,8 @@ class GeneratedImage:
     alt_text: str
     width: Optional[int] = None
     height: Optional[int] = None
+    asset_key: Optional[str] = None  # image pipeline cache key
+    placement: Optional[str] = None  # heading the image belongs under
 
 
 @dataclass
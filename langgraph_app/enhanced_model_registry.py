@@ -19,14 +19,51 @@ import anthropic
 from openai import AsyncOpenAI
 from anthropic import AsyncAnthropic
 
+from langgraph_app.core.model_registry import ModelProvider as RouterProvider
+from langgraph_app.core.model_router import get_model_router
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def get_model_name(agent_name: str) -> str:
+def fake_llm_enabled() -> bool:
+    """True when LLM_PROVIDER=fake - all agents use the deterministic offline provider"""
+    return os.getenv("LLM_PROVIDER", "").lower() == "fake"
+
+def create_openai_client(api_key: Optional[str] = None):
+    """OpenAI SDK client, or the fake provider's stand-in when LLM_PROVIDER=fake"""
+    if fake_llm_enabled():
+        from langgraph_app.fake_model_provider import FakeOpenAIClient
+        return FakeOpenAIClient()
+    return openai.OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+
+def create_anthropic_client(api_key: Optional[str] = None):
+    """Anthropic SDK client, or the fake provider's stand-in when LLM_PROVIDER=fake"""
+    if fake_llm_enabled():
+        from langgraph_app.fake_model_provider import FakeAnthropicClient
+        return FakeAnthropicClient()
+    return anthropic.Anthropic(api_key=api_key or os.getenv("ANTHROPIC_API_KEY"))
+
+def create_search_client(api_key: Optional[str] = None):
+    """Tavily search client, or the fake provider's stand-in when LLM_PROVIDER=fake"""
+    if fake_llm_enabled():
+        from langgraph_app.fake_model_provider import FakeTavilyClient
+        return FakeTavilyClient()
+    from tavily import TavilyClient
+    return TavilyClient(api_key=api_key or os.getenv("TAVILY_API_KEY"))
+
+# Agents whose model is chosen by the latency/cost-aware router when routing is configured
+ROUTED_AGENTS = {"writer", "editor", "seo", "code", "researcher"}
+
+def get_model_name(agent_name: str, settings: Optional[Dict[str, Any]] = None) -> str:
     """
     Returns the model name for a given agent.
-    Priority: Environment variable > NO default fallback
+    Priority: Environment variable > model router > static default
+
+    The router is only consulted when a routing priority (settings or
+    MODEL_ROUTING_PRIORITY) or a latency budget is configured; otherwise
+    the static default is kept. Routing is restricted to OpenAI models because callers of this function
+    (writer, editor, SEO) issue OpenAI requests directly.
     """
     default_models = {
         "writer": "gpt-5",
@@ -38,7 +75,31 @@ def get_model_name(agent_name: str) -> str:
     }
 
     env_key = f"{agent_name.upper()}_MODEL"
-    return os.getenv(env_key, default_models.get(agent_name, "gpt-5"))
+    if os.getenv(env_key):
+        return os.getenv(env_key)
+
+    default = default_models.get(agent_name, "gpt-5")
+    if agent_name not in ROUTED_AGENTS:
+        return default
+
+    settings = settings or {}
+    priority = settings.get("routing_priority") or os.getenv("MODEL_ROUTING_PRIORITY")
+    budget = settings.get("latency_budget_s") or os.getenv(f"{agent_name.upper()}_LATENCY_BUDGET_S")
+    if not priority and not budget:
+        return default
+
+    try:
+        spec = get_model_router().route(
+            agent_name,
+            priority=priority,
+            latency_budget_s=float(budget) if budget else None,
+            providers=[RouterProvider.OPENAI],
+            min_output_tokens=settings.get("max_tokens") or settings.get("max_completion_tokens"),
+        )
+        return spec.model_name
+    except ValueError as e:
+        logger.warning(f"Model routing failed for {agent_name}, using default {default}: {e}")
+        return default
 
 def get_model(agent_name: str, settings: Dict[str, Any] = None):
     """
@@ -46,7 +107,7 @@ def get_model(agent_name: str, settings: Dict[str, Any] = None):
     Enterprise-grade: Returns configured LLM object with user settings.
     """
     settings = settings or {}
-    model_name = get_model_name(agent_name)
+    model_name = get_model_name(agent_name, settings)
     
     # Extract settings - NO FALLBACKS
     temperature = settings.get("temperature")
@@ -55,6 +116,10 @@ def get_model(agent_name: str, settings: Dict[str, Any] = None):
     if temperature is None or max_tokens is None:
         raise ValueError(f"temperature and max_tokens required in settings, got: {settings}")
     
+    if fake_llm_enabled():
+        from langgraph_app.fake_model_provider import FakeChatModel
+        return FakeChatModel(model_name=model_name, temperature=temperature, max_tokens=max_tokens)
+    
     # Get API key
     openai_api_key = os.getenv("OPENAI_API_KEY")
     if not openai_api_key:
@@ -96,6 +161,7 @@ class ModelProvider(Enum):
     ANTHROPIC = "anthropic" 
     LOCAL = "local"
     OLLAMA = "ollama"
+    FAKE = "fake"  # Deterministic offline provider for load testing
 
 class ModelTier(Enum):
     """Model performance tiers for automatic selection"""
@@ -320,6 +386,9 @@ class EnhancedModelRegistry:
         
         # Initialize default model configurations
         self._initialize_default_models()
+        
+        if fake_llm_enabled():
+            self._register_fake_provider()
     
     def _initialize_default_models(self):
         """Initialize default model configurations"""
@@ -372,6 +441,20 @@ class EnhancedModelRegistry:
         for model in default_models:
             self.models[model.name] = model
     
+    def _register_fake_provider(self):
+        """Route every model to the fake provider (LLM_PROVIDER=fake)"""
+        from langgraph_app.fake_model_provider import FakeProvider, FakeOpenAIClient
+        
+        provider = FakeProvider({})
+        provider.client = FakeOpenAIClient()
+        self.providers[ModelProvider.FAKE] = provider
+        self.provider_health[ModelProvider.FAKE] = True
+        self.last_health_check[ModelProvider.FAKE] = time.time()
+        
+        for model in self.models.values():
+            model.provider = ModelProvider.FAKE
+        logger.info("Fake LLM provider registered for all models")
+    
     async def initialize_providers(self, provider_configs: Dict[str, Dict[str, Any]]):
         """Initialize all configured providers"""
         for provider_name, config in provider_configs.items():
@@ -382,6 +465,9 @@ class EnhancedModelRegistry:
                     provider = OpenAIProvider(config)
                 elif provider_enum == ModelProvider.ANTHROPIC:
                     provider = AnthropicProvider(config)
+                elif provider_enum == ModelProvider.FAKE:
+                    from langgraph_app.fake_model_provider import FakeProvider
+                    provider = FakeProvider(config)
                 else:
                     logger.warning(f"Unsupported provider: {provider_name}")
                     continue
@@ -0,0 +1,626 @@
+# langgraph_app/fake_model_provider.py
+"""
+Deterministic Fake LLM Provider for Load Testing
+
+Enabled with LLM_PROVIDER=fake. Provides drop-in stand-ins for every client
+the pipeline talks to (OpenAI SDK, Anthropic SDK, LangChain chat models,
+Tavily search) plus a BaseModelProvider for EnhancedModelRegistry, so the
+full graph can run offline with schema-valid outputs per agent:
+
+- planner: tool-discovery JSON array, PlanningOutput JSON, critique JSON
+- researcher: Tavily-shaped search results
+- writer: articles of a target length (streamed or not)
+- editor/SEO/publisher: tool calls plus edited content
+
+Outputs are a pure function of (seed, prompt). Latency and error
+injection are drawn from an RNG seeded by (seed, prompt, attempt), where
+attempt counts earlier calls with the same prompt, so results do not
+depend on how concurrent requests interleave and a retried prompt still
+gets a fresh roll. Injected 429/529s raised through the SDK stand-ins
+are the SDK's own error types (RateLimitError, OverloadedError,
+InternalServerError), so callers classify and retry them like real ones.
+
+Environment:
+- FAKE_LLM_SEED: RNG seed (default 42)
+- FAKE_LLM_LATENCY_MS: median time to first token (default 200)
+- FAKE_LLM_LATENCY_DIST: fixed | uniform | lognormal (default lognormal)
+- FAKE_LLM_LATENCY_SIGMA: lognormal sigma / uniform spread (default 0.5)
+- FAKE_LLM_TOKENS_PER_SEC: output token rate, 0 = instant (default 0)
+- FAKE_LLM_ERROR_RATE_429 / FAKE_LLM_ERROR_RATE_529: injected error rates
+- FAKE_LLM_ARTICLE_WORDS: article length (default 1200, capped by max tokens)
+- FAKE_LLM_MAX_TRACKED_PROMPTS: prompts remembered for attempt counts and prefix caching (default 10000)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import anthropic
+import httpx
+import openai
+from langchain_core.messages import AIMessage
+
+from langgraph_app.enhanced_model_registry import (
+    BaseModelProvider,
+    ModelConfig,
+    ModelProvider,
+    ModelResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+WORDS_PER_TOKEN = 0.75
+MAX_TRACKED_PROMPTS = int(os.getenv("FAKE_LLM_MAX_TRACKED_PROMPTS", "10000"))
+
+SENTENCE_TEMPLATES = [
+    "Teams working on {topic} are finding that small, measurable wins compound faster than big launches.",
+    "The practical question about {topic} is not whether it matters but where it pays off first.",
+    "Early adopters of {topic} report shorter feedback loops and clearer ownership across functions.",
+    "Most of the cost in {topic} hides in coordination rather than in tooling.",
+    "A useful way to evaluate {topic} is to compare the time from idea to verified result.",
+    "Leaders who treat {topic} as an operating habit rather than a project see steadier gains.",
+    "The data on {topic} points to a widening gap between teams that measure and teams that guess.",
+    "Done well, {topic} turns scattered effort into a repeatable system.",
+    "Critics of {topic} are right that hype outpaces evidence in several areas.",
+    "For most organizations the next step with {topic} is a narrow pilot with a clear success metric.",
+]
+
+SECTION_TITLES = [
+    "Why {topic} Matters Now",
+    "What the Evidence Shows",
+    "Where Teams Get Stuck",
+    "A Practical Playbook",
+    "Measuring Progress",
+    "Looking Ahead",
+]
+
+
+class FakeProviderError(Exception):
+    """Injected error for callers without an SDK error type (search, direct engine use)"""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"Error code: {status_code} - {message}")
+        self.status_code = status_code
+
+
+# (api, status) -> SDK error class raised by the matching client stand-in
+SDK_ERRORS = {
+    ("anthropic", 429): anthropic.RateLimitError,
+    ("anthropic", 529): anthropic.OverloadedError,
+    ("openai", 429): openai.RateLimitError,
+    ("openai", 529): openai.InternalServerError,
+}
+
+
+def injected_error(api: Optional[str], status_code: int, message: str) -> Exception:
+    """Build the error a real `api` client would raise; message mirrors the SDKs so keyword checks fire"""
+    error_class = SDK_ERRORS.get((api, status_code))
+    if error_class is None:
+        return FakeProviderError(status_code, message)
+    response = httpx.Response(status_code, request=httpx.Request("POST", "https://fake-llm.invalid"))
+    return error_class(f"Error code: {status_code} - {message}", response=response, body=None)
+
+
+@dataclass
+class FakeLLMConfig:
+    """Simulation settings for the fake provider"""
+    seed: int = 42
+    latency_ms: float = 200.0
+    latency_dist: str = "lognormal"
+    latency_sigma: float = 0.5
+    tokens_per_sec: float = 0.0
+    error_rate_429: float = 0.0
+    error_rate_529: float = 0.0
+    article_words: int = 1200
+
+    @classmethod
+    def from_env(cls) -> "FakeLLMConfig":
+        return cls(
+            seed=int(os.getenv("FAKE_LLM_SEED", "42")),
+            latency_ms=float(os.getenv("FAKE_LLM_LATENCY_MS", "200")),
+            latency_dist=os.getenv("FAKE_LLM_LATENCY_DIST", "lognormal").lower(),
+            latency_sigma=float(os.getenv("FAKE_LLM_LATENCY_SIGMA", "0.5")),
+            tokens_per_sec=float(os.getenv("FAKE_LLM_TOKENS_PER_SEC", "0")),
+            error_rate_429=float(os.getenv("FAKE_LLM_ERROR_RATE_429", "0")),
+            error_rate_529=float(os.getenv("FAKE_LLM_ERROR_RATE_529", "0")),
+            article_words=int(os.getenv("FAKE_LLM_ARTICLE_WORDS", "1200")),
+        )
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4) if text else 0
+
+
+class FakeLLMEngine:
+    """Shared deterministic generator behind all fake clients"""
+
+    def __init__(self, config: Optional[FakeLLMConfig] = None):
+        self.config = config or FakeLLMConfig.from_env()
+        self._lock = threading.Lock()
+        # LRU-bounded so long load tests with unique prompts do not grow without limit
+        self._attempts: "OrderedDict[str, int]" = OrderedDict()
+        self._seen_prefixes: "OrderedDict[str, None]" = OrderedDict()
+        self.stats = {"calls": 0, "errors_429": 0, "errors_529": 0}
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def _rng(self, *parts: Any) -> random.Random:
+        digest = hashlib.sha256("|".join(str(p) for p in (self.config.seed,) + parts).encode("utf-8")).hexdigest()
+        return random.Random(int(digest[:16], 16))
+
+    def _latency_s(self, rng: random.Random) -> float:
+        median = self.config.latency_ms / 1000.0
+        if self.config.latency_dist == "fixed":
+            return median
+        if self.config.latency_dist == "uniform":
+            spread = median * self.config.latency_sigma
+            return max(0.0, rng.uniform(median - spread, median + spread))
+        return rng.lognormvariate(0, self.config.latency_sigma) * median
+
+    @staticmethod
+    def _remember(entries: "OrderedDict[str, Any]", key: str, value: Any) -> None:
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > MAX_TRACKED_PROMPTS:
+            entries.popitem(last=False)
+
+    def simulate_call(self, prompt: str, api: Optional[str] = None) -> None:
+        """Sleep for the sampled latency and maybe raise an injected 429/529 as `api`'s error type"""
+        key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        with self._lock:
+            attempt = self._attempts.get(key, 0)
+            self._remember(self._attempts, key, attempt + 1)
+            self.stats["calls"] += 1
+        rng = self._rng(prompt, attempt)
+        time.sleep(self._latency_s(rng))
+
+        roll = rng.random()
+        if roll < self.config.error_rate_429:
+            self._count("errors_429")
+            raise injected_error(api, 429, "rate_limit_exceeded: Rate limit reached (simulated)")
+        if roll < self.config.error_rate_429 + self.config.error_rate_529:
+            self._count("errors_529")
+            raise injected_error(api, 529, "overloaded_error: Overloaded (simulated)")
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def stream_tokens(self, text: str) -> Iterator[str]:
+        """Split text into word-sized chunks, paced at the configured token rate"""
+        delay = 1.0 / self.config.tokens_per_sec if self.config.tokens_per_sec > 0 else 0.0
+        for chunk in re.findall(r"\S+\s*|\s+", text):
+            if delay:
+                time.sleep(delay)
+            yield chunk
+
+    def pace_completion(self, text: str) -> None:
+        """Non-streamed calls still take as long as generating every token"""
+        if self.config.tokens_per_sec > 0:
+            time.sleep(estimate_tokens(text) / self.config.tokens_per_sec)
+
+    def cached_prefix_tokens(self, system: str) -> int:
+        """Mimic provider prefix caching: repeat system prompts >=1024 tokens hit in 128-token blocks"""
+        tokens = estimate_tokens(system)
+        if tokens < 1024:
+            return 0
+        key = hashlib.sha256(system.encode("utf-8")).hexdigest()
+        with self._lock:
+            hit = key in self._seen_prefixes
+            self._remember(self._seen_prefixes, key, None)
+        return (tokens // 128) * 128 if hit else 0
+
+    # ------------------------------------------------------------------
+    # Content
+    # ------------------------------------------------------------------
+
+    def complete(
+        self,
+        system: str,
+        user: str,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Any]] = None
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Return (text, tool_calls) appropriate for the prompt"""
+        prompt = f"{system}\n{user}"
+        rng = self._rng(prompt)
+        topic = self._extract_topic(user) or self._extract_topic(system) or "the topic"
+
+        if "Output JSON array" in user and "tool_name" in user:
+            return self._planner_tools(rng), []
+        if "improvement_suggestions" in user and "Evaluate this plan" in user:
+            return self._critique(rng), []
+        if '"content_strategy"' in prompt:
+            return self._planning(topic, rng), []
+        if '"transitions"' in user:
+            return self._transitions(topic, user, rng), []
+        section = re.search(r'Write ONLY section \d+: "([^"]+)" \(about (\d+) words\)', user)
+        if section:
+            return self._section(topic, section.group(1), int(section.group(2)), rng), []
+
+        content_to_edit = self._extract_content_to_edit(user)
+        if tools:
+            tool_calls = self._tool_calls(tools, content_to_edit or user, rng)
+            return content_to_edit or self._article(topic, max_tokens, rng), tool_calls
+        if content_to_edit:
+            return content_to_edit, []
+
+        return self._article(topic, max_tokens, rng), []
+
+    def search(self, query: str, max_results: int = 5) -> Dict[str, Any]:
+        """Tavily-shaped search results"""
+        rng = self._rng("search", query)
+        slug = re.sub(r"[^a-z0-9]+", "-", query.lower()).strip("-")[:60] or "result"
+        results = []
+        for i in range(max_results):
+            sentence = rng.choice(SENTENCE_TEMPLATES).format(topic=query)
+            results.append({
+                "title": f"{query.title()} - Report {i + 1}",
+                "url": f"https://example.com/{slug}/{i + 1}",
+                "content": f"{sentence} Analysts cite a {rng.randint(5, 60)}% change year over year.",
+                "score": round(rng.uniform(0.5, 0.99), 3),
+                "published_date": time.strftime("%Y-%m-%d"),
+            })
+        return {"query": query, "results": results}
+
+    def _extract_topic(self, text: str) -> Optional[str]:
+        match = re.search(r"(?:TOPIC|Topic|Plan content for):\s*(.+)", text or "")
+        return match.group(1).strip()[:120] if match else None
+
+    def _extract_content_to_edit(self, text: str) -> Optional[str]:
+        match = re.search(r"\*\*Content to Edit:\*\*\s*(.+?)(?:\n\s*\*\*Instructions:\*\*|$)", text or "", re.DOTALL)
+        return match.group(1).strip() if match else None
+
+    def _section(self, topic: str, name: str, target_words: int, rng: random.Random) -> str:
+        parts: List[str] = [f"## {name}"]
+        words = 0
+        while words < target_words:
+            paragraph = " ".join(
+                rng.choice(SENTENCE_TEMPLATES).format(topic=topic) for _ in range(rng.randint(3, 5))
+            )
+            parts.append(paragraph)
+            words += len(paragraph.split())
+        return "\n\n".join(parts)
+
+    def _transitions(self, topic: str, user: str, rng: random.Random) -> str:
+        """Section-stitching output: a title and one sentence per BOUNDARY marker"""
+        nexts = re.findall(r'Next section: "([^"]+)"', user)
+        return json.dumps({
+            "title": f"{topic.title()}: A Practical Guide",
+            "transitions": [f"With that in place, we turn to {name.lower()}." for name in nexts],
+        })
+
+    def _planner_tools(self, rng: random.Random) -> str:
+        tools = ["analyze_similar_campaigns", "get_trending_topics", "analyze_competitor_content", "calculate_optimal_metrics"]
+        chosen = rng.sample(tools, k=2)
+        return json.dumps([
+            {"tool_name": name, "parameters": {}, "rationale": f"Ground the plan with {name.replace('_', ' ')}"}
+            for name in chosen
+        ])
+
+    def _critique(self, rng: random.Random) -> str:
+        return json.dumps({
+            "confidence": round(rng.uniform(0.8, 0.97), 2),
+            "strengths": ["Clear audience focus", "Concrete structure"],
+            "weaknesses": ["Limited quantitative evidence"],
+            "improvement_suggestions": ["Add one data-backed example per section"],
+        })
+
+    def _planning(self, topic: str, rng: random.Random) -> str:
+        sections = [
+            {"name": title.format(topic=topic), "estimated_words": rng.choice([200, 250, 300, 350])}
+            for title in SECTION_TITLES[:rng.randint(4, 6)]
+        ]
+        return json.dumps({
+            "content_strategy": f"Explain {topic} through evidence and practical steps",
+            "structure_approach": "Problem, evidence, playbook, measurement",
+            "key_messages": [f"{topic} rewards measured adoption", "Start narrow, measure, expand"],
+            "research_priorities": [f"{topic} adoption data", f"{topic} case studies", f"{topic} risks"],
+            "audience_insights": {
+                "primary_audience": "practitioners",
+                "complexity_level": "intermediate",
+                "platform": "web",
+            },
+            "competitive_positioning": "Evidence-first and practical",
+            "success_metrics": {"engagement_rate": round(rng.uniform(0.03, 0.1), 3)},
+            "estimated_sections": sections,
+            "planning_confidence": round(rng.uniform(0.85, 0.95), 2),
+        })
+
+    def _article(self, topic: str, max_tokens: Optional[int], rng: random.Random) -> str:
+        target_words = self.config.article_words
+        if max_tokens:
+            target_words = min(target_words, int(max_tokens * WORDS_PER_TOKEN))
+        target_words = max(target_words, 80)
+
+        parts: List[str] = [f"# {topic.title()}"]
+        words = 0
+        section = 0
+        while words < target_words:
+            title = SECTION_TITLES[section % len(SECTION_TITLES)].format(topic=topic)
+            parts.append(f"## {title}")
+            section += 1
+            for _ in range(2):
+                paragraph = " ".join(
+                    rng.choice(SENTENCE_TEMPLATES).format(topic=topic) for _ in range(rng.randint(3, 5))
+                )
+                parts.append(paragraph)
+                words += len(paragraph.split())
+                if words >= target_words:
+                    break
+        return "\n\n".join(parts)
+
+    def _tool_calls(self, tools: List[Any], text: str, rng: random.Random) -> List[Dict[str, Any]]:
+        calls = []
+        for idx, tool in enumerate(tools[:3]):
+            name = getattr(tool, "name", None) or (tool.get("name") if isinstance(tool, dict) else str(tool))
+            args = getattr(tool, "args", None) or {}
+            call_args = {}
+            for arg in args:
+                if arg in ("text", "content", "code"):
+                    call_args[arg] = text[:2000]
+                elif "keyword" in arg:
+                    call_args[arg] = ["example"]
+            calls.append({"name": name, "args": call_args, "id": f"call_fake_{idx}_{rng.randint(0, 99999)}"})
+        return calls
+
+
+# ----------------------------------------------------------------------
+# SDK-shaped clients
+# ----------------------------------------------------------------------
+
+def _messages_to_prompts(messages: List[Any]) -> Tuple[str, str]:
+    """Split OpenAI/LangChain style messages into (system, user) text"""
+    system, user = [], []
+    for message in messages or []:
+        if isinstance(message, dict):
+            role, content = message.get("role"), message.get("content", "")
+        else:
+            role, content = getattr(message, "type", "human"), getattr(message, "content", "")
+        if isinstance(content, list):
+            content = "\n".join(block.get("text", "") for block in content if isinstance(block, dict))
+        (system if role == "system" else user).append(str(content))
+    return "\n".join(system), "\n".join(user)
+
+
+def _conform_to_schema(text: str, schema: Optional[Dict[str, Any]]) -> Any:
+    """Parse JSON output for structured calls, wrapping a bare array into the schema's array property"""
+    data = json.loads(text)
+    if isinstance(data, list) and schema and schema.get("type") == "object":
+        for name, prop in schema.get("properties", {}).items():
+            if prop.get("type") == "array":
+                return {name: data}
+    return data
+
+
+class _FakeChatCompletions:
+    def __init__(self, engine: FakeLLMEngine):
+        self.engine = engine
+
+    def create(self, model: str = "fake-llm", messages: List[Dict] = None, stream: bool = False, **kwargs):
+        system, user = _messages_to_prompts(messages)
+        max_tokens = kwargs.get("max_completion_tokens") or kwargs.get("max_tokens")
+        self.engine.simulate_call(f"{system}\n{user}", api="openai")
+        text, _ = self.engine.complete(system, user, max_tokens)
+
+        response_format = kwargs.get("response_format") or {}
+        if response_format.get("type") == "json_schema":
+            text = json.dumps(_conform_to_schema(text, response_format["json_schema"].get("schema")))
+
+        prompt_tokens = estimate_tokens(system) + estimate_tokens(user)
+        usage = SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=estimate_tokens(text),
+            total_tokens=prompt_tokens + estimate_tokens(text),
+            prompt_tokens_details=SimpleNamespace(cached_tokens=self.engine.cached_prefix_tokens(system)),
+        )
+
+        if stream:
+            return self._stream(model, text, usage)
+
+        self.engine.pace_completion(text)
+        return SimpleNamespace(
+            id="chatcmpl-fake",
+            model=model,
+            choices=[SimpleNamespace(
+                index=0,
+                message=SimpleNamespace(role="assistant", content=text, tool_calls=None),
+                finish_reason="stop",
+            )],
+            usage=usage,
+        )
+
+    def _stream(self, model: str, text: str, usage: Any) -> Iterator[Any]:
+        for token in self.engine.stream_tokens(text):
+            yield SimpleNamespace(
+                model=model,
+                choices=[SimpleNamespace(index=0, delta=SimpleNamespace(content=token), finish_reason=None)],
+                usage=None,
+            )
+        yield SimpleNamespace(
+            model=model,
+            choices=[SimpleNamespace(index=0, delta=SimpleNamespace(content=None), finish_reason="stop")],
+            usage=None,
+        )
+        yield SimpleNamespace(model=model, choices=[], usage=usage)
+
+
+# 1x1 transparent PNG
+_FAKE_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+class _FakeImages:
+    def __init__(self, engine: FakeLLMEngine):
+        self.engine = engine
+
+    def generate(self, model: str = "fake-image", prompt: str = "", size: str = "1024x1024", n: int = 1,
+                 response_format: str = "url", **kwargs):
+        self.engine.simulate_call(prompt, api="openai")
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+        if response_format == "b64_json":
+            return SimpleNamespace(data=[
+                SimpleNamespace(b64_json=_FAKE_PNG_B64, url=None, revised_prompt=prompt) for _ in range(n)
+            ])
+        return SimpleNamespace(data=[
+            SimpleNamespace(url=f"https://placehold.co/{size}?text={digest}-{i}", revised_prompt=prompt)
+            for i in range(n)
+        ])
+
+
+class FakeOpenAIClient:
+    """Stand-in for openai.OpenAI: chat.completions.create (incl. stream=True) and images.generate"""
+
+    def __init__(self, engine: Optional[FakeLLMEngine] = None, **kwargs):
+        engine = engine or get_fake_engine()
+        self.chat = SimpleNamespace(completions=_FakeChatCompletions(engine))
+        self.images = _FakeImages(engine)
+
+
+class _FakeMessages:
+    def __init__(self, engine: FakeLLMEngine):
+        self.engine = engine
+
+    def create(self, model: str = "fake-llm", system: Any = None, messages: List[Dict] = None,
+               max_tokens: Optional[int] = None, **kwargs):
+        if isinstance(system, list):
+            system = "\n".join(block.get("text", "") for block in system if isinstance(block, dict))
+        system = system or ""
+        _, user = _messages_to_prompts(messages)
+        self.engine.simulate_call(f"{system}\n{user}", api="anthropic")
+        text, _ = self.engine.complete(system, user, max_tokens)
+        self.engine.pace_completion(text)
+
+        content = [SimpleNamespace(type="text", text=text)]
+        stop_reason = "end_turn"
+        tool_choice = kwargs.get("tool_choice") or {}
+        if tool_choice.get("type") == "tool":
+            tool = next(t for t in kwargs.get("tools", []) if t["name"] == tool_choice["name"])
+            content = [SimpleNamespace(
+                type="tool_use", id="toolu_fake", name=tool["name"],
+                input=_conform_to_schema(text, tool.get("input_schema"))
+            )]
+            stop_reason = "tool_use"
+
+        cached = self.engine.cached_prefix_tokens(system)
+        return SimpleNamespace(
+            id="msg_fake",
+            model=model,
+            content=content,
+            stop_reason=stop_reason,
+            usage=SimpleNamespace(
+                input_tokens=max(0, estimate_tokens(system) + estimate_tokens(user) - cached),
+                output_tokens=estimate_tokens(text),
+                cache_read_input_tokens=cached,
+                cache_creation_input_tokens=0,
+            ),
+        )
+
+
+class FakeAnthropicClient:
+    """Stand-in for anthropic.Anthropic: messages.create"""
+
+    def __init__(self, engine: Optional[FakeLLMEngine] = None, **kwargs):
+        self.messages = _FakeMessages(engine or get_fake_engine())
+
+
+class FakeChatModel:
+    """Stand-in for LangChain ChatOpenAI/ChatAnthropic: bind_tools + invoke/ainvoke"""
+
+    def __init__(self, model_name: str = "fake-llm", temperature: float = 0.7, max_tokens: Optional[int] = None,
+                 tools: Optional[List[Any]] = None, engine: Optional[FakeLLMEngine] = None):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.tools = tools or []
+        self.engine = engine or get_fake_engine()
+
+    def __str__(self) -> str:
+        return f"FakeChatModel(model_name={self.model_name})"
+
+    @property
+    def _api(self) -> str:
+        """SDK whose error types injected failures use, as ChatAnthropic/ChatOpenAI would surface"""
+        return "anthropic" if "claude" in self.model_name.lower() else "openai"
+
+    def bind_tools(self, tools: List[Any], **kwargs) -> "FakeChatModel":
+        return FakeChatModel(self.model_name, self.temperature, self.max_tokens, list(tools), self.engine)
+
+    def invoke(self, messages: Any, **kwargs) -> AIMessage:
+        if isinstance(messages, str):
+            messages = [{"role": "user", "content": messages}]
+        system, user = _messages_to_prompts(messages)
+        self.engine.simulate_call(f"{system}\n{user}", api=self._api)
+        text, tool_calls = self.engine.complete(system, user, self.max_tokens, self.tools)
+        self.engine.pace_completion(text)
+        return AIMessage(content=text, tool_calls=tool_calls)
+
+    async def ainvoke(self, messages: Any, **kwargs) -> AIMessage:
+        import asyncio
+        return await asyncio.to_thread(self.invoke, messages, **kwargs)
+
+
+class FakeTavilyClient:
+    """Stand-in for tavily.TavilyClient: search"""
+
+    def __init__(self, engine: Optional[FakeLLMEngine] = None, **kwargs):
+        self.engine = engine or get_fake_engine()
+
+    def search(self, query: str, max_results: int = 5, **kwargs) -> Dict[str, Any]:
+        self.engine.simulate_call(f"search:{query}")
+        return self.engine.search(query, max_results)
+
+
+class FakeProvider(BaseModelProvider):
+    """EnhancedModelRegistry provider backed by the fake engine"""
+
+    async def initialize(self) -> bool:
+        self.client = FakeOpenAIClient()
+        return True
+
+    async def generate(self, messages: List[Dict], model_config: ModelConfig) -> ModelResponse:
+        import asyncio
+        start_time = time.time()
+        response = await asyncio.to_thread(
+            self.client.chat.completions.create,
+            model=model_config.name,
+            messages=messages,
+            max_tokens=model_config.max_tokens,
+        )
+        return ModelResponse(
+            content=response.choices[0].message.content,
+            model_used=model_config.name,
+            provider=ModelProvider.FAKE,
+            tokens_used=response.usage.total_tokens,
+            cost=0.0,
+            latency=time.time() - start_time,
+            metadata={"finish_reason": response.choices[0].finish_reason, "simulated": True}
+        )
+
+    async def health_check(self) -> bool:
+        return True
+
+
+# Global fake engine instance (singleton pattern)
+_fake_engine: Optional[FakeLLMEngine] = None
+
+
+def get_fake_engine() -> FakeLLMEngine:
+    """Get or create the shared fake engine (settings read from env on first use)"""
+    global _fake_engine
+    if _fake_engine is None:
+        _fake_engine = FakeLLMEngine()
+        logger.info(f"🧪 Fake LLM provider active: {_fake_engine.config}")
+    return _fake_engine
@@ -17,6 +17,7 @@ from langgraph_app.agents.enhanced_researcher_integrated import EnhancedResearch
 from langgraph_app.agents.enhanced_call_writer_integrated import EnhancedCallWriterAgent
 from langgraph_app.agents.writer import WriterAgent
 from langgraph_app.agents.enhanced_editor_integrated import EnhancedEditorAgent
+from langgraph_app.agents.enhanced_image_agent_integrated import EnhancedImageAgent
 from langgraph_app.agents.enhanced_formatter_integrated import EnhancedFormatterAgent
 from langgraph_app.agents.enhanced_seo_agent_integrated import EnhancedSEOAgent
 from langgraph_app.agents.enhanced_publisher_integrated import EnhancedPublisherAgent
@@ -29,6 +30,7 @@ researcher_agent = EnhancedResearcherAgent()
 call_writer_agent = EnhancedCallWriterAgent()
 writer_agent = WriterAgent()
 editor_agent = EnhancedEditorAgent()
+image_agent = EnhancedImageAgent()
 formatter_agent = EnhancedFormatterAgent()
 seo_agent = EnhancedSEOAgent()
 publisher_agent = EnhancedPublisherAgent()
@@ -105,6 +107,20 @@ def run_editor(state: EnrichedContentState) -> EnrichedContentState:
     return updated_state
 
 
+# ---------------------------------------------------------
+# IMAGE GENERATOR
+# ---------------------------------------------------------
+def run_image_generator(state: EnrichedContentState) -> EnrichedContentState:
+    logger.info("🖼️ EXECUTING IMAGE GENERATOR")
+    state.update_phase(ContentPhase.IMAGE_GENERATION)
+
+    # Returns placeholders immediately; the publisher resolves them
+    updated_state = image_agent.execute(state)
+    logger.info("✅ Image generator completed")
+
+    return updated_state
+
+
 # ---------------------------------------------------------
 # FORMATTER
 # ---------------------------------------------------------
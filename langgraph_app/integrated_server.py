@@ -22,6 +22,7 @@ import uvicorn
 import frontmatter
 from fastapi import FastAPI, Request, BackgroundTasks, Depends, HTTPException, status, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, FileResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel, Field
 from sqlalchemy import func, select
@@ -34,6 +35,18 @@ from .core.schemas import Template, StyleProfile
 from .core.types import ContentSpec
 from .core.circuit_breaker import get_circuit_breaker
 from .core.provider_pool import get_provider_pool, initialize_provider_pool_from_env
+from .core.prompt_cache import get_prompt_cache_stats
+from .core.prompt_templates import get_prompt_template_stats
+from .core.model_router import get_model_router
+from .core.planner_metrics import get_planner_metrics
+from .core.research_cache import get_research_cache
+from .core.research_corpus import get_research_corpus
+from .core.markdown_renderer import render_markdown
+from .core.image_pipeline import get_image_pipeline
+from .core.coordination_bundles import get_bundle_cache
+from .core.config_registry import get_config_registry
+from .core.generation_stream import get_stream_registry, sse_events
+from .template_style_validator import validator as template_style_validator
 
 # Internal - Graph
 from .graph.workflow import get_compiled_graph
@@ -161,6 +174,10 @@ async def lifespan(app: FastAPI):
     except ConfigManagerError as e:
         logger.error(f"❌ CRITICAL: ConfigManager initialization failed - {e}")
         raise RuntimeError(f"Cannot start server: {e}") from e
+
+    # Hot reload: edited templates/profiles are re-parsed in the background
+    config_registry = get_config_registry(data_path)
+    config_registry.start_watching()
     
     # Initialize generation task registry
     app.state.generation_tasks = {}
@@ -175,6 +192,7 @@ async def lifespan(app: FastAPI):
     
     yield
     
+    config_registry.stop_watching()
     logger.info("Shutting down WriterzRoom API")
 
 # ====== FastAPI App Initialization ======
@@ -458,6 +476,163 @@ async def get_provider_pool_status():
     }
 
 
+@debug_router.get("/prompt-cache-stats")
+async def get_prompt_cache_status():
+    """
+    Get per-agent prompt cache usage (cached vs uncached input tokens).
+    
+    Returns:
+        Dict keyed by agent with calls, input/cached/uncached tokens and hit ratio,
+        plus compiled prompt template counts and hits
+    """
+    return {
+        "prompt_cache": get_prompt_cache_stats().get_all_stats(),
+        "prompt_templates": get_prompt_template_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@debug_router.get("/model-routing")
+async def get_model_routing_audit(limit: int = 100, agent: Optional[str] = None):
+    """
+    Get model router EWMA stats and recent routing decisions for audit.
+    
+    Args:
+        limit: Maximum number of decisions to return
+        agent: Optional agent filter (e.g. "planner", "writer")
+    
+    Returns:
+        Dict with per-model performance and routing decisions (newest last)
+    """
+    router = get_model_router()
+    
+    return {
+        "model_performance": router.get_performance(),
+        "decisions": router.get_decisions(limit=limit, agent=agent),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@debug_router.get("/planner-metrics")
+async def get_planner_run_metrics():
+    """
+    Get planner LLM calls and wall time per planner mode.
+    
+    Returns:
+        Dict with per-mode averages (compared against the sequential baseline)
+        and per-template critique confidence history
+    """
+    return {
+        "planner": get_planner_metrics().get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@debug_router.get("/research-cache")
+async def get_research_cache_status():
+    """
+    Get research cache size and hit metrics per query source.
+    
+    Returns:
+        Dict with entry counts and hits/stale hits/misses/refreshes per source
+    """
+    return {
+        "research_cache": get_research_cache().get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@debug_router.get("/research-corpus")
+async def get_research_corpus_status():
+    """
+    Get local research corpus (BM25 index) size.
+    
+    Returns:
+        Dict with indexed passages, terms and files
+    """
+    return {
+        "research_corpus": get_research_corpus().get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@debug_router.get("/coordination-bundles")
+async def get_coordination_bundle_status():
+    """
+    Get compiled coordination bundle count and cache hits.
+    
+    Returns:
+        Dict with cached bundles, hits and misses
+    """
+    return {
+        "coordination_bundles": get_bundle_cache().get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@debug_router.get("/config-registry")
+async def get_config_registry_status():
+    """
+    Get shared config registry counts, index sizes and load errors.
+    
+    Returns:
+        Dict with registry stats and validation errors
+    """
+    registry = get_config_registry()
+    return {
+        "config_registry": registry.get_stats(),
+        "errors": registry.errors,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@debug_router.post("/config-registry/reload")
+async def reload_config_registry():
+    """
+    Re-parse edited template and style profile files now.
+    
+    Returns:
+        Dict with the changed ids per kind and the new generation
+    """
+    registry = get_config_registry()
+    changed = registry.refresh()
+    return {
+        "changed": {kind: sorted(ids) for kind, ids in changed.items()},
+        "generation": registry.generation,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+@debug_router.get("/template-style-compatibility")
+async def get_template_style_compatibility(templates: Optional[str] = None, styles: Optional[str] = None):
+    """
+    Get the cached template/style compatibility report.
+    
+    Args:
+        templates: Comma-separated template types (default: all known)
+        styles: Comma-separated style profiles (default: all known)
+    
+    Returns:
+        Dict with grouped combinations, per-template recommendations and cache stats
+    """
+    template_types = templates.split(",") if templates else list(template_style_validator.template_characteristics)
+    style_profiles = styles.split(",") if styles else list(template_style_validator.style_characteristics)
+    report = template_style_validator.generate_compatibility_report(template_types, style_profiles)
+    return {
+        "total_combinations": report["total_combinations"],
+        "highly_compatible": [list(pair) for pair in report["highly_compatible"]],
+        "moderately_compatible": [list(pair) for pair in report["moderately_compatible"]],
+        "incompatible": [list(pair) for pair in report["incompatible"]],
+        "recommendations": report["recommendations"],
+        "scores": {
+            f"{template_type}|{style_profile}": {"level": result.level.value, "confidence": result.confidence}
+            for (template_type, style_profile), result in report["detailed_results"].items()
+        },
+        "cache": template_style_validator.get_stats(),
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @debug_router.post("/circuit-breaker/{provider}/force-close")
 async def force_close_circuit(provider: str):
     """
@@ -558,6 +733,20 @@ async def get_system_health():
     }
 
 
+# Progress reported after each graph node completes
+NODE_PROGRESS = {
+    "planner": 0.15,
+    "researcher": 0.3,
+    "call_writer": 0.35,
+    "writer": 0.6,
+    "editor": 0.75,
+    "image": 0.8,
+    "formatter": 0.85,
+    "seo": 0.9,
+    "publisher": 0.95,
+}
+
+
 async def run_generation_workflow(request_id: str, initial_state: EnrichedContentState):
     """Invokes the main LangGraph graph to run the content generation pipeline."""
     logger.info(f"[{request_id}] Starting background generation workflow.")
@@ -566,6 +755,8 @@ async def run_generation_workflow(request_id: str, initial_state: EnrichedConten
         "progress": 0.1, 
         "started_at": datetime.now().isoformat()
     }
+    stream_channel = get_stream_registry().open(request_id)
+    initial_state.request_id = request_id
 
     content = ""
     title = ""
@@ -576,6 +767,11 @@ async def run_generation_workflow(request_id: str, initial_state: EnrichedConten
         graph = get_compiled_graph()
         async for output in graph.astream(initial_state, {"recursion_limit": 100}):
             final_state = output
+            node = list(output.keys())[-1] if output else None
+            if node:
+                progress = NODE_PROGRESS.get(node, stream_channel.progress)
+                stream_channel.set_progress(node, progress)
+                app.state.generation_tasks[request_id].update({"current_agent": node, "progress": progress})
 
         if not final_state:
             raise RuntimeError("Graph execution finished without a final state.")
@@ -700,6 +896,12 @@ async def run_generation_workflow(request_id: str, initial_state: EnrichedConten
         
         logger.info(f"[{request_id}] Content saved to {output_file} - Title: {title} | Subtitle: {subtitle}")
 
+        # Make the new article available to local research recall
+        try:
+            get_research_corpus().add_file(output_file)
+        except Exception as corpus_error:
+            logger.warning(f"[{request_id}] Could not index saved content: {corpus_error}")
+
         # ✅ NEW: Sync to frontend database
         import requests
         import os
@@ -747,6 +949,8 @@ async def run_generation_workflow(request_id: str, initial_state: EnrichedConten
             logger.error(f"[{request_id}] Database sync exception: {sync_error}")
             # Don't fail generation if sync fails
 
+        stream_channel.set_progress("completed", 1.0)
+        stream_channel.close()
         app.state.generation_tasks[request_id] = {
             "status": "completed",
             "progress": 1.0,
@@ -763,6 +967,7 @@ async def run_generation_workflow(request_id: str, initial_state: EnrichedConten
 
     except Exception as e:
         logger.error(f"[{request_id}] Workflow failed: {e}", exc_info=True)
+        stream_channel.close(error=str(e))
         app.state.generation_tasks[request_id] = {
             "status": "error",
             "progress": 0,
@@ -839,6 +1044,15 @@ async def get_style_profile_details(profile_id: str):
         }
     except KeyError:
         raise HTTPException(status_code=404, detail=f"Style profile '{profile_id}' not found")
+
+
+@app.get("/api/images/{asset_key}")
+async def get_image_asset(asset_key: str):
+    """Serve a generated image from the image pipeline's disk cache"""
+    path = get_image_pipeline().cache.asset_path(asset_key)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    return FileResponse(path, media_type="image/png", headers={"Cache-Control": "public, max-age=31536000, immutable"})
     
 # Add this import near the top with other core imports
 from .core.types import ContentSpec 
@@ -912,6 +1126,7 @@ async def get_generation_status(request_id: str):
     task = app.state.generation_tasks.get(request_id)
     if not task:
         raise HTTPException(status_code=404, detail="Generation request not found.")
+    stream_channel = get_stream_registry().get(request_id)
     
     # DEBUG: Log what we're returning
     content_len = len(task.get("content", "")) if task.get("content") else 0
@@ -925,11 +1140,29 @@ async def get_generation_status(request_id: str):
             "progress": task.get("progress", 0),
             "current_agent": task.get("current_agent"),
             "content": task.get("content"),
+            "partial_content": stream_channel.partial_content if stream_channel else None,
+            "stream": stream_channel.get_status() if stream_channel else None,
             "error": task.get("error"),
             "metadata": task.get("metadata", {}),
         }
     }
 
+
+@app.get("/api/generate/stream/{request_id}")
+async def stream_generation(request_id: str, since: int = 0):
+    """
+    Server-sent events for a generation job: progress, raw tokens and
+    sanitized paragraphs as they complete, then a final done/error event.
+    
+    Args:
+        since: Resume from this event sequence number
+    """
+    stream_channel = get_stream_registry().get(request_id)
+    if not stream_channel:
+        raise HTTPException(status_code=404, detail="Generation stream not found.")
+
+    return StreamingResponse(sse_events(stream_channel, since), media_type="text/event-stream")
+
 # --- Templates & Style Profiles: LIST (enterprise format) ---
 
 @app.get("/api/templates")
@@ -1011,11 +1244,12 @@ async def get_content_detail(content_id: str):
             try:
                 with open(json_file, 'r') as f:
                     data = json.load(f)
+                content = data.get("final_content") or data.get("content")
                 return {
                     "id": data.get("id", content_id),
                     "title": data.get("title"),
-                    "content": data.get("final_content") or data.get("content"),
-                    "contentHtml": data.get("contentHtml"),
+                    "content": content,
+                    "contentHtml": data.get("contentHtml") or render_markdown(content or ""),
                     "status": data.get("status", "draft"),
                     "type": data.get("template_id", "article"),
                     "createdAt": data.get("timestamp"),
@@ -1083,10 +1317,11 @@ async def analyze_content(request: Request):
     
     # Invoke SEO agent for analysis
     try:
-        from agents.enhanced_seo_agent_integrated import invoke_seo_agent
+        from .agents.enhanced_seo_agent_integrated import invoke_seo_agent
         
         analysis_result = await invoke_seo_agent({
             "final_content": content,
+            "keywords": body.get("keywords", []),
             "template_type": body.get("template_type", "article"),
             "style_profile": body.get("style_profile", {}),
             "generation_id": generation_id
@@ -1109,6 +1344,7 @@ async def analyze_content(request: Request):
                 "viral_potential": 25,
                 "target_demographics": []
             }),
+            "text_stats": analysis_result.get("text_stats", {}),
             "analysis_timestamp": datetime.utcnow().isoformat(),
             "generation_id": generation_id
         }
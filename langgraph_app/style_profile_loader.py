@@ -1,13 +1,15 @@
 # langgraph_app/style_profile_loader.py
 
 import os
-from tomlkit import datetime
-import yaml
+from datetime import datetime
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 import re
+import heapq
+
+from langgraph_app.core.config_registry import STYLE_PROFILE, TEMPLATE, ConfigRecord, get_config_registry
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,15 @@ class DynamicStyleProfileLoader:
         self.profiles_path: Optional[Path] = None
         self.templates_path: Optional[Path] = None
         self.compatibility_matrix: Dict[str, Dict[str, float]] = {}
+
+        # Characteristics extracted once per item, as feature vectors:
+        # (domain, difficulty, audience, tag bitmask, technical level, formality)
+        self._template_features: Dict[str, Tuple] = {}
+        self._profile_features: Dict[str, Tuple] = {}
+        self._profile_columns: Optional[Tuple[List[str], List[Tuple]]] = None
+        self._tag_bits: Dict[str, int] = {}
+        # (factor, template value, profile value) -> weighted factor score
+        self._factor_scores: Dict[Tuple[str, Any, Any], float] = {}
         
         # Dynamic scoring weights - can be adjusted based on system learning
         self.scoring_weights = {
@@ -75,90 +86,50 @@ class DynamicStyleProfileLoader:
         self._build_compatibility_matrix()
         
         DynamicStyleProfileLoader._profiles_loaded = True
+
+        registry = self._get_registry()
+        if registry is not None:
+            registry.subscribe(self._on_config_change)
     
     def _load_style_profiles(self, base_path: Path):
-        """Load style profiles from multiple possible locations"""
-        
-        search_paths = [
-            base_path / "data" / "style_profiles",
-            base_path / "style_profiles", 
-            base_path / ".." / "data" / "style_profiles",
-            base_path / ".." / "style_profiles",
-        ]
-        
-        for path in search_paths:
-            resolved_path = path.resolve()
-            logger.debug(f"Checking style profiles path: {resolved_path}")
-            
-            if resolved_path.exists() and resolved_path.is_dir():
-                yaml_files = list(resolved_path.glob("*.yaml")) + list(resolved_path.glob("*.yml"))
-                
-                if yaml_files:
-                    logger.info(f"✅ Found style profiles directory: {resolved_path}")
-                    self.profiles_path = resolved_path
-                    self._load_yaml_files_to_cache(yaml_files, self.profiles_cache, "style profile")
-                    return
-        
-        logger.warning("❌ No style profiles directory found!")
+        """Load style profiles from the shared config registry"""
+        registry = self._get_registry()
+        if registry is None or not registry.dirs[STYLE_PROFILE].exists():
+            logger.warning("❌ No style profiles directory found!")
+            return
+
+        self.profiles_path = registry.dirs[STYLE_PROFILE]
+        logger.info(f"✅ Found style profiles directory: {self.profiles_path}")
+        self._load_records_to_cache(registry.style_profiles(), self.profiles_cache, "style profile")
     
     def _load_content_templates(self, base_path: Path):
         """Load content templates for analysis"""
-        
-        search_paths = [
-            base_path / "data" / "content_templates",
-            base_path / "content_templates",
-            base_path / ".." / "data" / "content_templates",
-            base_path / ".." / "content_templates",
-        ]
-        
-        for path in search_paths:
-            resolved_path = path.resolve()
-            logger.debug(f"Checking templates path: {resolved_path}")
-            
-            if resolved_path.exists() and resolved_path.is_dir():
-                yaml_files = list(resolved_path.glob("*.yaml")) + list(resolved_path.glob("*.yml"))
-                
-                if yaml_files:
-                    logger.info(f"✅ Found templates directory: {resolved_path}")
-                    self.templates_path = resolved_path
-                    self._load_yaml_files_to_cache(yaml_files, self.templates_cache, "template")
-                    return
-        
-        logger.warning("❌ No templates directory found!")
-    
-    def _load_yaml_files_to_cache(self, yaml_files: List[Path], cache: Dict[str, Dict[str, Any]], content_type: str):
-        """Load YAML files into the specified cache"""
-        
-        loaded_count = 0
-        for yaml_file in yaml_files:
-            try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    documents = list(yaml.safe_load_all(f))
-
-                    if not documents:
-                        logger.warning(f"Empty YAML file: {yaml_file.name}")
-                        continue
-                    
-                    content_data = documents[0]
-                    if content_data is None:
-                        logger.warning(f"Empty YAML document in file: {yaml_file.name}")
-                        continue
-                    
-                    if len(documents) > 1:
-                        logger.warning(f"Multiple documents found in {yaml_file.name}, using first document only")
-
-                # Use filename without extension as key, but prefer 'id' field if present
-                content_name = content_data.get('id', yaml_file.stem)
-                cache[content_name] = content_data
-                loaded_count += 1
-                logger.debug(f"✅ Loaded {content_type}: {content_name}")
-
-            except yaml.YAMLError as e:
-                logger.error(f"❌ YAML parsing error in {yaml_file.name}: {e}")
-            except Exception as e:
-                logger.error(f"❌ Error loading {content_type} {yaml_file.name}: {e}")
+        registry = self._get_registry()
+        if registry is None or not registry.dirs[TEMPLATE].exists():
+            logger.warning("❌ No templates directory found!")
+            return
+
+        self.templates_path = registry.dirs[TEMPLATE]
+        logger.info(f"✅ Found templates directory: {self.templates_path}")
+        self._load_records_to_cache(registry.templates(), self.templates_cache, "template")
+
+    @staticmethod
+    def _get_registry():
+        try:
+            return get_config_registry()
+        except FileNotFoundError as e:
+            logger.warning(f"❌ {e}")
+            return None
+    
+    def _load_records_to_cache(self, records: List[ConfigRecord], cache: Dict[str, Dict[str, Any]], content_type: str):
+        """Copy parsed registry records into the specified cache"""
+        
+        for record in records:
+            # Mutable copy: the registry's documents are shared and frozen
+            cache[record.id] = record.to_dict()
+            logger.debug(f"✅ Loaded {content_type}: {record.id}")
                 
-        logger.info(f"Successfully loaded {loaded_count} {content_type}s")
+        logger.info(f"Successfully loaded {len(records)} {content_type}s")
         logger.info(f"Available {content_type}s: {sorted(cache.keys())}")
     
     def _extract_content_characteristics(self, content: Dict[str, Any], content_type: str = "unknown") -> ContentCharacteristics:
@@ -308,60 +279,130 @@ class DynamicStyleProfileLoader:
         """✅ DYNAMIC: Build compatibility matrix between all templates and profiles"""
         
         logger.info("Building dynamic compatibility matrix...")
-        
-        for template_id, template_data in self.templates_cache.items():
-            self.compatibility_matrix[template_id] = {}
-            template_chars = self._extract_content_characteristics(template_data, 'template')
-            
-            for profile_id, profile_data in self.profiles_cache.items():
-                profile_chars = self._extract_content_characteristics(profile_data, 'profile')
-                compatibility_score = self._calculate_compatibility_score(template_chars, profile_chars)
-                self.compatibility_matrix[template_id][profile_id] = compatibility_score
-                
-                logger.debug(f"Compatibility: {template_id} -> {profile_id} = {compatibility_score:.3f}")
+
+        # One feature extraction per item instead of one per template x profile pair
+        self._template_features = {
+            template_id: self._content_features(template_data, 'template')
+            for template_id, template_data in self.templates_cache.items()
+        }
+        self._profile_features = {
+            profile_id: self._content_features(profile_data, 'profile')
+            for profile_id, profile_data in self.profiles_cache.items()
+        }
+        self._profile_columns = None
+        # Weights may have been adjusted since the last build
+        self._factor_scores.clear()
+
+        for template_id, features in self._template_features.items():
+            self.compatibility_matrix[template_id] = self._score_row(features)
         
         logger.info(f"Built compatibility matrix for {len(self.templates_cache)} templates and {len(self.profiles_cache)} profiles")
+
+    def _content_features(self, content: Dict[str, Any], content_type: str) -> Tuple:
+        return self._features_from_characteristics(self._extract_content_characteristics(content, content_type))
+
+    def _features_from_characteristics(self, chars: ContentCharacteristics) -> Tuple:
+        tag_mask = 0
+        for tag in set(chars.tags):
+            tag_mask |= 1 << self._tag_bits.setdefault(tag, len(self._tag_bits))
+        return (chars.domain_focus, chars.difficulty, chars.target_audience, tag_mask,
+                chars.technical_level, chars.formality_level)
+
+    def _get_profile_columns(self) -> Tuple[List[str], List[Tuple]]:
+        """Profile ids plus one column per feature, rebuilt only after profiles change"""
+        if self._profile_columns is None:
+            ids = list(self._profile_features)
+            columns = list(zip(*self._profile_features.values())) or [()] * 6
+            self._profile_columns = (ids, columns)
+        return self._profile_columns
+
+    def _score_row(self, template_features: Tuple) -> Dict[str, float]:
+        """Scores of one template against every profile, one feature column at a time"""
+        ids, columns = self._get_profile_columns()
+        domain, difficulty, audience, tag_mask, technical, formality = template_features
+
+        # Categorical factors: score each distinct profile value once, then look it up per profile
+        partials = []
+        for factor, value, column in (
+            ('domain', domain, columns[0]),
+            ('difficulty', difficulty, columns[1]),
+            ('audience', audience, columns[2]),
+        ):
+            table = {v: self._factor_score(factor, value, v) for v in set(column)}
+            partials.append([table[v] for v in column])
+
+        tag_weight = self.scoring_weights['tag_overlap']
+        partials.append([
+            tag_weight * ((tag_mask & mask).bit_count() / (tag_mask | mask).bit_count()) if tag_mask and mask else 0.0
+            for mask in columns[3]
+        ])
+
+        for factor, value, column in (
+            ('technical', technical, columns[4]),
+            ('formality', formality, columns[5]),
+        ):
+            table = {v: self._factor_score(factor, value, v) for v in set(column)}
+            partials.append([table[v] for v in column])
+
+        # Summed in the same order as the scalar scorer, so scores are identical
+        return {
+            profile_id: min(0.0 + d + df + a + t + tl + f, 1.0)
+            for profile_id, d, df, a, t, tl, f in zip(ids, *partials)
+        }
+
+    def _score_pair(self, template_features: Tuple, profile_features: Tuple) -> float:
+        score = 0.0
+        for factor, index in (('domain', 0), ('difficulty', 1), ('audience', 2)):
+            score += self._factor_score(factor, template_features[index], profile_features[index])
+        tag_mask, mask = template_features[3], profile_features[3]
+        if tag_mask and mask:
+            score += self.scoring_weights['tag_overlap'] * ((tag_mask & mask).bit_count() / (tag_mask | mask).bit_count())
+        for factor, index in (('technical', 4), ('formality', 5)):
+            score += self._factor_score(factor, template_features[index], profile_features[index])
+        return min(score, 1.0)
+
+    def _factor_score(self, factor: str, template_value: Any, profile_value: Any) -> float:
+        """Weighted score of one factor, memoized per value pair"""
+        key = (factor, template_value, profile_value)
+        score = self._factor_scores.get(key)
+        if score is not None:
+            return score
+
+        weights = self.scoring_weights
+        score = 0.0
+        if factor == 'domain':
+            # Category/Domain match
+            if template_value and profile_value:
+                if template_value == profile_value:
+                    score = weights['category_match']
+                elif self._are_related_domains(template_value, profile_value):
+                    score = weights['category_match'] * 0.5
+        elif factor == 'difficulty':
+            if template_value and profile_value:
+                score = weights['difficulty_compatibility'] * self._calculate_difficulty_compatibility(template_value, profile_value)
+        elif factor == 'audience':
+            if template_value and profile_value:
+                score = weights['audience_alignment'] * self._calculate_audience_alignment(template_value, profile_value)
+        elif factor == 'technical':
+            if template_value == profile_value:
+                score = weights['technical_level_match']
+            elif self._are_compatible_technical_levels(template_value, profile_value):
+                score = weights['technical_level_match'] * 0.5
+        elif factor == 'formality':
+            if template_value == profile_value:
+                score = weights['formality_match']
+            elif template_value == 'neutral' or profile_value == 'neutral':
+                score = weights['formality_match'] * 0.5
+
+        self._factor_scores[key] = score
+        return score
     
     def _calculate_compatibility_score(self, template_chars: ContentCharacteristics, profile_chars: ContentCharacteristics) -> float:
-        """Calculate compatibility score between template and profile characteristics"""
-        
-        score = 0.0
-        
-        # Category/Domain match
-        if template_chars.domain_focus and profile_chars.domain_focus:
-            if template_chars.domain_focus == profile_chars.domain_focus:
-                score += self.scoring_weights['category_match']
-            elif self._are_related_domains(template_chars.domain_focus, profile_chars.domain_focus):
-                score += self.scoring_weights['category_match'] * 0.5
-        
-        # Difficulty compatibility
-        if template_chars.difficulty and profile_chars.difficulty:
-            difficulty_score = self._calculate_difficulty_compatibility(template_chars.difficulty, profile_chars.difficulty)
-            score += self.scoring_weights['difficulty_compatibility'] * difficulty_score
-        
-        # Audience alignment
-        if template_chars.target_audience and profile_chars.target_audience:
-            audience_score = self._calculate_audience_alignment(template_chars.target_audience, profile_chars.target_audience)
-            score += self.scoring_weights['audience_alignment'] * audience_score
-        
-        # Tag overlap
-        if template_chars.tags and profile_chars.tags:
-            tag_overlap = len(set(template_chars.tags) & set(profile_chars.tags)) / len(set(template_chars.tags) | set(profile_chars.tags))
-            score += self.scoring_weights['tag_overlap'] * tag_overlap
-        
-        # Technical level match
-        if template_chars.technical_level == profile_chars.technical_level:
-            score += self.scoring_weights['technical_level_match']
-        elif self._are_compatible_technical_levels(template_chars.technical_level, profile_chars.technical_level):
-            score += self.scoring_weights['technical_level_match'] * 0.5
-        
-        # Formality match
-        if template_chars.formality_level == profile_chars.formality_level:
-            score += self.scoring_weights['formality_match']
-        elif template_chars.formality_level == 'neutral' or profile_chars.formality_level == 'neutral':
-            score += self.scoring_weights['formality_match'] * 0.5
-        
-        return min(score, 1.0)  # Cap at 1.0
+        """Compatibility of one template/profile pair (the matrix uses the same factor scores)"""
+        return self._score_pair(
+            self._features_from_characteristics(template_chars),
+            self._features_from_characteristics(profile_chars)
+        )
     
     def _are_related_domains(self, domain1: str, domain2: str) -> bool:
         """Check if two domains are related"""
@@ -457,21 +498,22 @@ class DynamicStyleProfileLoader:
         # Get compatibility scores for this template
         template_scores = self.compatibility_matrix[template_id]
         
-        # Sort profiles by compatibility score
-        sorted_profiles = sorted(template_scores.items(), key=lambda x: x[1], reverse=True)
-        
-        # Filter out profiles with zero compatibility
-        compatible_profiles = [(profile, score) for profile, score in sorted_profiles if score > 0.0]
+        # Top-k profiles with non-zero compatibility, without sorting the whole row
+        compatible_profiles = heapq.nlargest(
+            max_recommendations,
+            ((profile, score) for profile, score in template_scores.items() if score > 0.0),
+            key=lambda x: x[1]
+        )
         
         if not compatible_profiles:
             logger.info(f"No compatible profiles found for template '{template_id}'")
             return []  # ✅ NO FALLBACKS - return empty list
         
         # Return top recommendations
-        recommendations = [profile for profile, score in compatible_profiles[:max_recommendations]]
+        recommendations = [profile for profile, score in compatible_profiles]
         
         logger.info(f"✅ Dynamic recommendations for '{template_id}': {recommendations}")
-        for profile, score in compatible_profiles[:max_recommendations]:
+        for profile, score in compatible_profiles:
             logger.debug(f"  {profile}: {score:.3f} compatibility")
         
         return recommendations
@@ -544,14 +586,56 @@ class DynamicStyleProfileLoader:
         return None  # ✅ NO FALLBACKS
     
     def reload_all_content(self):
-        """Force reload all profiles and templates"""
-        self.profiles_cache.clear()
-        self.templates_cache.clear()
-        self.compatibility_matrix.clear()
-        self.profiles_path = None
-        self.templates_path = None
-        DynamicStyleProfileLoader._profiles_loaded = False
-        self._find_and_load_all_content()
+        """Pick up edited profiles and templates; only changed files are re-parsed and re-scored"""
+        if not self._profiles_loaded:
+            self._find_and_load_all_content()
+            return
+        registry = self._get_registry()
+        if registry is not None:
+            registry.refresh()
+
+    def _on_config_change(self, changed: Dict[str, Any]):
+        """Apply a registry reload: refresh changed entries and their compatibility scores"""
+        registry = self._get_registry()
+        if registry is None:
+            return
+        for kind, cache in ((STYLE_PROFILE, self.profiles_cache), (TEMPLATE, self.templates_cache)):
+            for content_id in changed.get(kind, ()):
+                record = registry.get(kind, content_id, by_stem=False)
+                if record is None:
+                    cache.pop(content_id, None)
+                else:
+                    cache[content_id] = record.to_dict()
+
+        # Re-extract features only for the changed items
+        for kind, cache, features in (
+            (STYLE_PROFILE, self.profiles_cache, self._profile_features),
+            (TEMPLATE, self.templates_cache, self._template_features),
+        ):
+            for content_id in changed.get(kind, ()):
+                if content_id in cache:
+                    features[content_id] = self._content_features(cache[content_id], 'profile' if kind == STYLE_PROFILE else 'template')
+                else:
+                    features.pop(content_id, None)
+        if STYLE_PROFILE in changed:
+            self._profile_columns = None
+
+        # Changed templates get a new row; changed profiles only their column in other rows
+        changed_templates = set(changed.get(TEMPLATE, ()))
+        for template_id in changed_templates - self._template_features.keys():
+            self.compatibility_matrix.pop(template_id, None)
+        for template_id, template_features in self._template_features.items():
+            if template_id in changed_templates or template_id not in self.compatibility_matrix:
+                self.compatibility_matrix[template_id] = self._score_row(template_features)
+                continue
+            row = self.compatibility_matrix[template_id]
+            for profile_id in changed.get(STYLE_PROFILE, ()):
+                if profile_id in self._profile_features:
+                    row[profile_id] = self._score_pair(template_features, self._profile_features[profile_id])
+                else:
+                    row.pop(profile_id, None)
+
+        logger.info(f"♻️ Reloaded style content: {dict((k, sorted(v)) for k, v in changed.items())}")
     
     def get_debug_info(self) -> Dict[str, Any]:
         """Get comprehensive debug information"""
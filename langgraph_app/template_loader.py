@@ -3,11 +3,12 @@
 # RELEVANT FILES: mcp_enhanced_graph.py, integrated_server.py, data/content_templates/
 
 import os
-import yaml
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+from langgraph_app.core.config_registry import TEMPLATE, get_config_registry
+
 logger = logging.getLogger(__name__)
 
 class TemplateValidationError(Exception):
@@ -32,33 +33,18 @@ class TemplateLoader:
             logger.info(f"Template loader initialized with {len(self.templates_cache)} templates")
     
     def _find_and_load_templates(self):
-        """Find the templates directory and load all templates"""
-        cwd = Path.cwd()
-        logger.info(f"Current working directory: {cwd}")
-        
-        search_paths = [
-            cwd / "data" / "content_templates",
-            cwd / "content_templates", 
-            cwd / ".." / "data" / "content_templates",
-            cwd / ".." / "content_templates",
-        ]
-        
-        for path in search_paths:
-            resolved_path = path.resolve()
-            logger.debug(f"Checking templates path: {resolved_path}")
-            
-            if resolved_path.exists() and resolved_path.is_dir():
-                yaml_files = list(resolved_path.glob("*.yaml")) + list(resolved_path.glob("*.yml"))
-                
-                if yaml_files:
-                    logger.info(f"Found templates directory: {resolved_path}")
-                    logger.info(f"Found {len(yaml_files)} YAML files")
-                    
-                    self.templates_path = resolved_path
-                    self._load_templates_from_directory(resolved_path)
-                    return
-        
-        logger.error("No templates directory found!")
+        """Load all templates from the shared config registry"""
+        try:
+            registry = get_config_registry()
+        except FileNotFoundError as e:
+            logger.error(f"No templates directory found! {e}")
+            return
+
+        templates_dir = registry.dirs[TEMPLATE]
+        if templates_dir.exists():
+            logger.info(f"Found templates directory: {templates_dir}")
+            self.templates_path = templates_dir
+            self._load_templates_from_registry(registry)
 
     def normalize_v2_template(self, template_data: Dict[str, Any]) -> Dict[str, Any]:
         """ENTERPRISE: Use YAML metadata directly - no fallback overrides"""
@@ -153,39 +139,38 @@ class TemplateLoader:
             return 'textarea'
         return 'text'
 
-    def _load_templates_from_directory(self, directory: Path):
-        """Load all YAML templates from directory with proper normalization"""
-        yaml_files = list(directory.glob("*.yaml")) + list(directory.glob("*.yml"))
-        loaded_count = 0
+    def _load_templates_from_registry(self, registry):
+        """Copy registry templates into the cache with proper normalization"""
+        loaded_count = sum(1 for record in registry.templates() if self._cache_record(record))
+        logger.info(f"Successfully loaded {loaded_count} templates")
+        registry.subscribe(self._on_config_change)
 
-        for yaml_file in yaml_files:
-            try:
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    documents = list(yaml.safe_load_all(f))
+    def _cache_record(self, record) -> bool:
+        try:
+            # Mutable copy: the registry's documents are shared and frozen
+            template_data = record.to_dict()
+            template_data['id'] = record.id
 
-                if not documents or documents[0] is None:
-                    logger.warning(f"Empty YAML file: {yaml_file.name}")
-                    continue
+            # Apply normalization
+            template_data = self.normalize_v2_template(template_data)
 
-                template_data = documents[0]
-                
-                # Set ID if missing
-                if 'id' not in template_data:
-                    template_data['id'] = yaml_file.stem
+            template_name = template_data['id']
+            self.templates_cache[template_name] = template_data
 
-                # Apply normalization
-                template_data = self.normalize_v2_template(template_data)
+            logger.info(f"Loaded: {template_name} | Type: {template_data.get('template_type')} | Images: {template_data.get('image_agent_enabled', False)}")
+            return True
 
-                template_name = template_data['id']
-                self.templates_cache[template_name] = template_data
-                loaded_count += 1
+        except Exception as e:
+            logger.error(f"Error loading template {record.path.name}: {e}")
+            return False
 
-                logger.info(f"Loaded: {template_name} | Type: {template_data.get('template_type')} | Images: {template_data.get('image_agent_enabled', False)}")
-
-            except Exception as e:
-                logger.error(f"Error loading template {yaml_file.name}: {e}")
-        
-        logger.info(f"Successfully loaded {loaded_count} templates")
+    def _on_config_change(self, changed):
+        """Re-load only the templates a registry reload touched"""
+        registry = get_config_registry()
+        for template_id in changed.get(TEMPLATE, ()):
+            record = registry.get(TEMPLATE, template_id, by_stem=False)
+            if record is None or not self._cache_record(record):
+                self.templates_cache.pop(template_id, None)
 
     def get_template(self, template_name: str) -> Optional[Dict[str, Any]]:
         """Get template with logging for debugging"""
@@ -238,8 +223,6 @@ def list_available_templates() -> List[str]:
     return template_loader.list_templates()
 
 def reload_templates():
-    """Force reload all templates"""
-    global template_loader
-    TemplateLoader._instance = None
-    template_loader = get_template_loader()
+    """Pick up edited template files (only changed files are re-parsed)"""
+    get_config_registry().refresh()
     return template_loader
\ No newline at end of file
@@ -3,6 +3,7 @@
 # Prevents content generation mismatches by validating template-style combinations
 # RELEVANT FILES: template_loader.py, mcp_enhanced_graph.py, integrated_server.py
 
+import hashlib
 import logging
 from typing import Dict, Any, List, Tuple, Optional
 from dataclasses import dataclass
@@ -10,6 +11,51 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Alignment tables shared by the per-pair helpers and the batch scorer
+_CONTENT_ALIGNMENTS = {
+    ('analytical', 'data_driven_analysis'): 1.0,
+    ('analytical', 'strategic_analysis'): 0.8,
+    ('analytical', 'technical_analysis'): 0.7,
+    ('executive', 'strategic_analysis'): 1.0,
+    ('executive', 'high_level_overview'): 1.0,
+    ('professional', 'strategic_analysis'): 0.8,
+    ('informational', 'engagement_focused'): 0.7,
+    ('analytical', 'engagement_focused'): 0.2,
+    ('executive', 'engagement_focused'): 0.1,
+}
+
+_AUDIENCE_ALIGNMENTS = {
+    ('business_analysts', 'professional'): 1.0,
+    ('executives', 'executive'): 1.0,
+    ('analysts', 'professional'): 0.9,
+    ('analysts', 'technical_experts'): 0.8,
+    ('business_stakeholders', 'executive'): 0.8,
+    ('business_stakeholders', 'professional'): 0.9,
+    ('general', 'general'): 1.0,
+    ('executives', 'general'): 0.3,
+    ('business_analysts', 'general'): 0.4,
+}
+
+_COMPLEXITY_SCORES = {
+    'beginner': 1, 'beginner_to_intermediate': 2, 'intermediate': 3,
+    'intermediate_to_expert': 4, 'expert': 5
+}
+
+_TONE_MATCHES = {
+    'professional': ['business_analytical', 'authoritative_professional', 'executive_professional', 'technical_professional'],
+    'analytical': ['business_analytical', 'technical_professional'],
+    'authoritative': ['authoritative_professional', 'executive_professional'],
+    'objective': ['business_analytical', 'technical_professional'],
+    'engaging': ['casual_engaging'],
+    'technical': ['technical_professional'],
+    'formal': ['authoritative_professional', 'executive_professional']
+}
+
+_PARTIAL_TONES = ('professional', 'analytical')
+
+# Cached reports kept per config version
+_MAX_CACHED_REPORTS = 32
+
 class CompatibilityLevel(Enum):
     """Compatibility levels between templates and style profiles"""
     HIGH = "high"
@@ -28,8 +74,26 @@ class CompatibilityResult:
     suggestions: List[str]
     warnings: List[str]
 
+@dataclass
+class _ScoreCache:
+    """Tokenized characteristics and scored results for one config version"""
+    version: str
+    template_tokens: Dict[str, Tuple]
+    style_tokens: Dict[str, Tuple]
+    results: Dict[Tuple[str, str], CompatibilityResult]
+    reports: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Dict[str, Any]]
+
 class TemplateStyleValidator:
-    """Validates template-style profile compatibility to prevent content mismatches"""
+    """
+    Validates template-style profile compatibility to prevent content mismatches.
+
+    Each template and style is tokenized once per config version and pairs
+    are scored in bulk. Results and reports are cached until the
+    characteristic tables change and are shared between callers, so treat
+    them as read-only. Only pairs the tables know are cached; scoring an
+    unknown name is cheap and callers can send arbitrary ones. After editing
+    the tables in place, call refresh_config_version().
+    """
     
     def __init__(self):
         # Template category characteristics
@@ -128,6 +192,10 @@ class TemplateStyleValidator:
             ('business_document', 'conversational_mentor'): 'Formal business content incompatible with casual mentoring tone'
         }
 
+        self._cache: Optional[_ScoreCache] = None
+        self._config_version = self._digest_tables()
+        self._stats = {'scored': 0, 'result_hits': 0, 'report_hits': 0, 'rebuilds': 0}
+
     def validate_compatibility(self, template_type: str, style_profile: str) -> CompatibilityResult:
         """
         Validate compatibility between template type and style profile
@@ -140,6 +208,129 @@ class TemplateStyleValidator:
             CompatibilityResult with validation details
         """
         
+        pair = (template_type, style_profile)
+        return self._score_pairs(self._current_cache(), [pair])[pair]
+
+    @property
+    def config_version(self) -> str:
+        """Digest of the characteristic tables; cached results are keyed by it"""
+        return self._config_version
+
+    def refresh_config_version(self) -> str:
+        """Re-digest the tables after an in-place edit so cached results are rebuilt"""
+        self._config_version = self._digest_tables()
+        return self._config_version
+
+    def _digest_tables(self) -> str:
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(repr((
+            self.template_characteristics,
+            self.style_characteristics,
+            self.incompatible_combinations
+        )).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _current_cache(self) -> _ScoreCache:
+        """Cache for the current config version, rebuilt when the version changes"""
+        version = self.config_version
+        cache = self._cache
+        if cache is None or cache.version != version:
+            cache = _ScoreCache(
+                version=version,
+                template_tokens={name: self._tokenize_template(chars) for name, chars in self.template_characteristics.items()},
+                style_tokens={name: self._tokenize_style(chars) for name, chars in self.style_characteristics.items()},
+                results={},
+                reports={}
+            )
+            self._cache = cache
+            self._stats['rebuilds'] += 1
+        return cache
+
+    @staticmethod
+    def _tokenize_template(template_chars: Dict) -> Tuple:
+        """(content_type, audience, complexity rank, matching style tones, has tones, formats)"""
+        tones = template_chars['tone_requirements']
+        matching_tones = frozenset(style_tone for tone in tones for style_tone in _TONE_MATCHES.get(tone, ()))
+        return (
+            template_chars['content_type'],
+            template_chars['audience'],
+            _COMPLEXITY_SCORES.get(template_chars['complexity'], 3),
+            matching_tones,
+            bool(tones),
+            frozenset(template_chars['format_needs'])
+        )
+
+    @staticmethod
+    def _tokenize_style(style_chars: Dict) -> Tuple:
+        """(content_focus, audience_level, complexity rank, tone, partial tone match, formats)"""
+        tone = style_chars['tone']
+        return (
+            style_chars['content_focus'],
+            style_chars['audience_level'],
+            _COMPLEXITY_SCORES.get(style_chars['complexity_match'], 3),
+            tone,
+            any(partial in tone for partial in _PARTIAL_TONES),
+            frozenset(style_chars['format_requirements'])
+        )
+
+    def _score_tokens(self, template_tokens: Tuple, style_tokens: Tuple) -> Tuple[float, Dict]:
+        """Weighted score of one tokenized pair, same arithmetic as the per-pair helpers"""
+        content_type, audience, complexity, matching_tones, has_tones, template_formats = template_tokens
+        content_focus, audience_level, style_complexity, tone, partial_tone, style_formats = style_tokens
+
+        content_alignment = _CONTENT_ALIGNMENTS.get((content_type, content_focus), 0.5)
+        audience_alignment = _AUDIENCE_ALIGNMENTS.get((audience, audience_level), 0.5)
+        complexity_alignment = max(0.0, 1.0 - (abs(complexity - style_complexity) * 0.2))
+        if has_tones and tone in matching_tones:
+            tone_compatibility = 1.0
+        elif has_tones and partial_tone:
+            tone_compatibility = 0.6
+        else:
+            tone_compatibility = 0.0
+        if template_formats and style_formats:
+            format_alignment = len(template_formats & style_formats) / len(template_formats | style_formats)
+        else:
+            format_alignment = 0.5
+
+        total_score = 0.0
+        total_score += content_alignment * 0.3
+        total_score += audience_alignment * 0.25
+        total_score += complexity_alignment * 0.2
+        total_score += tone_compatibility * 0.15
+        total_score += format_alignment * 0.1
+        details = {
+            'content_alignment': content_alignment,
+            'audience_alignment': audience_alignment,
+            'complexity_alignment': complexity_alignment,
+            'tone_compatibility': tone_compatibility,
+            'format_alignment': format_alignment
+        }
+        return total_score / (0.3 + 0.25 + 0.2 + 0.15 + 0.1), details
+
+    def _score_pairs(self, cache: _ScoreCache, pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], CompatibilityResult]:
+        """Results for the given pairs, scoring those not yet cached for this config version"""
+        template_tokens = cache.template_tokens
+        style_tokens = cache.style_tokens
+        results = cache.results
+        scored = {}
+        for pair in pairs:
+            result = results.get(pair)
+            if result is not None:
+                self._stats['result_hits'] += 1
+                scored[pair] = result
+                continue
+            template_type, style_profile = pair
+            tokens = (template_tokens.get(template_type), style_tokens.get(style_profile))
+            result = self._build_result(template_type, style_profile, *tokens)
+            # Unknown names would let callers grow the cache without bound
+            if None not in tokens or pair in self.incompatible_combinations:
+                results[pair] = result
+            scored[pair] = result
+            self._stats['scored'] += 1
+        return scored
+
+    def _build_result(self, template_type: str, style_profile: str,
+                      template_tokens: Optional[Tuple], style_tokens: Optional[Tuple]) -> CompatibilityResult:
         # Check for explicit incompatibilities
         if (template_type, style_profile) in self.incompatible_combinations:
             return CompatibilityResult(
@@ -151,11 +342,7 @@ class TemplateStyleValidator:
                 warnings=[f"This combination will produce confused content"]
             )
         
-        # Get characteristics
-        template_chars = self.template_characteristics.get(template_type)
-        style_chars = self.style_characteristics.get(style_profile)
-        
-        if not template_chars or not style_chars:
+        if template_tokens is None or style_tokens is None:
             return CompatibilityResult(
                 compatible=True,
                 level=CompatibilityLevel.UNKNOWN,
@@ -166,7 +353,7 @@ class TemplateStyleValidator:
             )
         
         # Calculate compatibility score
-        score, details = self._calculate_compatibility_score(template_chars, style_chars)
+        score, details = self._score_tokens(template_tokens, style_tokens)
         
         # Determine compatibility level
         if score >= 0.8:
@@ -197,120 +384,32 @@ class TemplateStyleValidator:
 
     def _calculate_compatibility_score(self, template_chars: Dict, style_chars: Dict) -> Tuple[float, Dict]:
         """Calculate compatibility score based on characteristics alignment"""
-        
-        details = {}
-        total_score = 0.0
-        weight_sum = 0.0
-        
-        # Content type alignment (weight: 0.3)
-        content_alignment = self._check_content_alignment(
-            template_chars['content_type'], 
-            style_chars['content_focus']
-        )
-        total_score += content_alignment * 0.3
-        weight_sum += 0.3
-        details['content_alignment'] = content_alignment
-        
-        # Audience level alignment (weight: 0.25)
-        audience_alignment = self._check_audience_alignment(
-            template_chars['audience'],
-            style_chars['audience_level']
-        )
-        total_score += audience_alignment * 0.25
-        weight_sum += 0.25
-        details['audience_alignment'] = audience_alignment
-        
-        # Complexity alignment (weight: 0.2)
-        complexity_alignment = self._check_complexity_alignment(
-            template_chars['complexity'],
-            style_chars['complexity_match']
-        )
-        total_score += complexity_alignment * 0.2
-        weight_sum += 0.2
-        details['complexity_alignment'] = complexity_alignment
-        
-        # Tone compatibility (weight: 0.15)
-        tone_compatibility = self._check_tone_compatibility(
-            template_chars['tone_requirements'],
-            style_chars['tone']
-        )
-        total_score += tone_compatibility * 0.15
-        weight_sum += 0.15
-        details['tone_compatibility'] = tone_compatibility
-        
-        # Format requirements alignment (weight: 0.1)
-        format_alignment = self._check_format_alignment(
-            template_chars['format_needs'],
-            style_chars['format_requirements']
-        )
-        total_score += format_alignment * 0.1
-        weight_sum += 0.1
-        details['format_alignment'] = format_alignment
-        
-        final_score = total_score / weight_sum if weight_sum > 0 else 0.0
-        return final_score, details
+        return self._score_tokens(self._tokenize_template(template_chars), self._tokenize_style(style_chars))
 
     def _check_content_alignment(self, template_content: str, style_focus: str) -> float:
         """Check alignment between template content type and style focus"""
-        alignments = {
-            ('analytical', 'data_driven_analysis'): 1.0,
-            ('analytical', 'strategic_analysis'): 0.8,
-            ('analytical', 'technical_analysis'): 0.7,
-            ('executive', 'strategic_analysis'): 1.0,
-            ('executive', 'high_level_overview'): 1.0,
-            ('professional', 'strategic_analysis'): 0.8,
-            ('informational', 'engagement_focused'): 0.7,
-            ('analytical', 'engagement_focused'): 0.2,
-            ('executive', 'engagement_focused'): 0.1,
-        }
-        return alignments.get((template_content, style_focus), 0.5)
+        return _CONTENT_ALIGNMENTS.get((template_content, style_focus), 0.5)
 
     def _check_audience_alignment(self, template_audience: str, style_audience: str) -> float:
         """Check alignment between target audiences"""
-        alignments = {
-            ('business_analysts', 'professional'): 1.0,
-            ('executives', 'executive'): 1.0,
-            ('analysts', 'professional'): 0.9,
-            ('analysts', 'technical_experts'): 0.8,
-            ('business_stakeholders', 'executive'): 0.8,
-            ('business_stakeholders', 'professional'): 0.9,
-            ('general', 'general'): 1.0,
-            ('executives', 'general'): 0.3,
-            ('business_analysts', 'general'): 0.4,
-        }
-        return alignments.get((template_audience, style_audience), 0.5)
+        return _AUDIENCE_ALIGNMENTS.get((template_audience, style_audience), 0.5)
 
     def _check_complexity_alignment(self, template_complexity: str, style_complexity: str) -> float:
         """Check alignment between complexity levels"""
-        complexity_scores = {
-            'beginner': 1, 'beginner_to_intermediate': 2, 'intermediate': 3,
-            'intermediate_to_expert': 4, 'expert': 5
-        }
-        
-        template_score = complexity_scores.get(template_complexity, 3)
-        style_score = complexity_scores.get(style_complexity, 3)
+        template_score = _COMPLEXITY_SCORES.get(template_complexity, 3)
+        style_score = _COMPLEXITY_SCORES.get(style_complexity, 3)
         
         diff = abs(template_score - style_score)
         return max(0.0, 1.0 - (diff * 0.2))
 
     def _check_tone_compatibility(self, template_tones: List[str], style_tone: str) -> float:
         """Check compatibility between tone requirements"""
-        tone_matches = {
-            'professional': ['business_analytical', 'authoritative_professional', 'executive_professional', 'technical_professional'],
-            'analytical': ['business_analytical', 'technical_professional'],
-            'authoritative': ['authoritative_professional', 'executive_professional'],
-            'objective': ['business_analytical', 'technical_professional'],
-            'engaging': ['casual_engaging'],
-            'technical': ['technical_professional'],
-            'formal': ['authoritative_professional', 'executive_professional']
-        }
-        
         max_compatibility = 0.0
         for tone in template_tones:
-            compatible_styles = tone_matches.get(tone, [])
+            compatible_styles = _TONE_MATCHES.get(tone, [])
             if style_tone in compatible_styles:
                 max_compatibility = max(max_compatibility, 1.0)
-            elif any(partial in style_tone for partial in ['professional', 'analytical']):
+            elif any(partial in style_tone for partial in _PARTIAL_TONES):
                 max_compatibility = max(max_compatibility, 0.6)
         
         return max_compatibility
@@ -398,13 +497,22 @@ class TemplateStyleValidator:
 
     def batch_validate_templates(self, template_style_pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], CompatibilityResult]:
         """Validate multiple template-style combinations at once"""
-        results = {}
-        for template_type, style_profile in template_style_pairs:
-            results[(template_type, style_profile)] = self.validate_compatibility(template_type, style_profile)
-        return results
+        return self._score_pairs(self._current_cache(), template_style_pairs)
 
     def generate_compatibility_report(self, template_types: List[str], style_profiles: List[str]) -> Dict[str, Any]:
-        """Generate comprehensive compatibility report"""
+        """Generate comprehensive compatibility report (cached per config version)"""
+        cache = self._current_cache()
+        key = (tuple(template_types), tuple(style_profiles))
+        report = cache.reports.get(key)
+        if report is not None:
+            self._stats['report_hits'] += 1
+            return report
+
+        results = self._score_pairs(cache, [
+            (template_type, style_profile)
+            for template_type in template_types
+            for style_profile in style_profiles
+        ])
         
         report = {
             'total_combinations': len(template_types) * len(style_profiles),
@@ -416,33 +524,41 @@ class TemplateStyleValidator:
         }
         
         for template_type in template_types:
+            best_styles = []
             for style_profile in style_profiles:
-                result = self.validate_compatibility(template_type, style_profile)
-                
                 combination = (template_type, style_profile)
+                result = results[combination]
                 report['detailed_results'][combination] = result
                 
                 if result.level == CompatibilityLevel.HIGH:
                     report['highly_compatible'].append(combination)
+                    best_styles.append((style_profile, result.confidence))
                 elif result.level == CompatibilityLevel.MODERATE:
                     report['moderately_compatible'].append(combination)
+                    best_styles.append((style_profile, result.confidence))
                 elif result.level == CompatibilityLevel.INCOMPATIBLE:
                     report['incompatible'].append(combination)
-        
-        # Generate recommendations
-        for template_type in template_types:
-            best_styles = []
-            for style_profile in style_profiles:
-                result = report['detailed_results'][(template_type, style_profile)]
-                if result.level in [CompatibilityLevel.HIGH, CompatibilityLevel.MODERATE]:
-                    best_styles.append((style_profile, result.confidence))
             
             # Sort by confidence and take top 3
             best_styles.sort(key=lambda x: x[1], reverse=True)
             report['recommendations'][template_type] = [style for style, _ in best_styles[:3]]
         
+        if len(cache.reports) >= _MAX_CACHED_REPORTS:
+            cache.reports.pop(next(iter(cache.reports)))
+        cache.reports[key] = report
         return report
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache state and hit counts for debugging"""
+        cache = self._cache
+        return {
+            'config_version': cache.version if cache else None,
+            'templates': len(cache.template_tokens) if cache else 0,
+            'style_profiles': len(cache.style_tokens) if cache else 0,
+            'cached_results': len(cache.results) if cache else 0,
+            'cached_reports': len(cache.reports) if cache else 0,
+            **self._stats
+        }
 
 # Global validator instance
 validator = TemplateStyleValidator()
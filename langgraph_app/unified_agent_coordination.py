@@ -3,6 +3,9 @@
 
 from typing import Dict, Any, List, Optional
 from langgraph_app.core.state import EnrichedContentState, AgentType
+from langgraph_app.core.coordination_bundles import (
+    CoordinationBundle, config_version, freeze, get_bundle_cache, thaw
+)
 import logging
 
 logger = logging.getLogger(__name__)
@@ -11,47 +14,91 @@ class UnifiedAgentCoordination:
     """Unified coordination system ensuring all agents use template+style context"""
     
     def __init__(self):
-        self.coordination_cache = {}
+        self.bundle_cache = get_bundle_cache()
+        self.agent_builders = {
+            AgentType.RESEARCHER: self._get_researcher_coordination,
+            AgentType.WRITER: self._get_writer_coordination,
+            AgentType.EDITOR: self._get_editor_coordination,
+            AgentType.FORMATTER: self._get_formatter_coordination,
+            AgentType.CODE: self._get_code_coordination,
+            AgentType.IMAGE: self._get_image_coordination,
+            AgentType.SEO: self._get_seo_coordination,
+            AgentType.PLANNER: lambda t, s, state: {'planning_coordination': self._get_planner_coordination(t, s, state)},
+            AgentType.PUBLISHER: self._get_publisher_coordination,
+        }
     
     def get_coordinated_context(self, state: EnrichedContentState, agent_type: AgentType) -> Dict[str, Any]:
-        """Get unified template+style context for any agent"""
+        """Get unified template+style context for any agent (plain dicts/lists, safe to mutate or serialize)"""
         
         # Extract template and style configs
         template_config = getattr(state, 'template_config', {}) or {}
         style_config = getattr(state, 'style_config', {}) or {}
         
-        # Create coordinated context
+        # Config-derived parts come precompiled; only state-dependent parts are built here
+        bundle = self.get_bundle(template_config, style_config)
+        
         context = {
             'template_config': template_config,
             'style_config': style_config,
             'agent_type': agent_type,
-            'coordination_rules': self._get_coordination_rules(template_config, style_config),
+            'coordination_rules': thaw(bundle.coordination_rules),
             'cross_agent_context': self._build_cross_agent_context(state),
-            'template_style_requirements': self._merge_template_style_requirements(template_config, style_config)
+            'template_style_requirements': thaw(bundle.template_style_requirements)
         }
-        
-        # Agent-specific coordination
-        if agent_type == AgentType.RESEARCHER:
-            context.update(self._get_researcher_coordination(template_config, style_config, state))
-        elif agent_type == AgentType.WRITER:
-            context.update(self._get_writer_coordination(template_config, style_config, state))
-        elif agent_type == AgentType.EDITOR:
-            context.update(self._get_editor_coordination(template_config, style_config, state))
-        elif agent_type == AgentType.FORMATTER:
-            context.update(self._get_formatter_coordination(template_config, style_config, state))
-        elif agent_type == AgentType.CODE:
-            context.update(self._get_code_coordination(template_config, style_config, state))
-        elif agent_type == AgentType.IMAGE:
-            context.update(self._get_image_coordination(template_config, style_config, state))
-        elif agent_type == AgentType.SEO:
-            context.update(self._get_seo_coordination(template_config, style_config, state))
-        elif agent_type == AgentType.PLANNER:
-            context.update({'planning_coordination': self._get_planner_coordination(template_config, style_config, state)})
-        elif agent_type == AgentType.PUBLISHER:
-            context.update(self._get_publisher_coordination(template_config, style_config, state))
+        # Thawed copies keep the public shape unchanged; the shared bundle stays frozen
+        context.update(thaw(bundle.for_agent(agent_type)))
+        context.update(self._get_state_coordination(agent_type, state))
         
         return context
     
+    def get_bundle(
+        self,
+        template_config: Dict,
+        style_config: Dict,
+        version: Optional[str] = None
+    ) -> CoordinationBundle:
+        """Compiled bundle for this template/style pair, built once per config version"""
+        
+        key = (
+            str(template_config.get('id', '')),
+            str(style_config.get('id', '')),
+            version or config_version(template_config, style_config)
+        )
+        return self.bundle_cache.get_or_build(
+            key, lambda: self._compile_bundle(key, template_config, style_config)
+        )
+    
+    def _compile_bundle(self, key, template_config: Dict, style_config: Dict) -> CoordinationBundle:
+        """Run every config-only builder once and freeze the results"""
+        
+        return CoordinationBundle(
+            template_id=key[0],
+            style_id=key[1],
+            version=key[2],
+            coordination_rules=freeze(self._get_coordination_rules(template_config, style_config)),
+            template_style_requirements=freeze(self._merge_template_style_requirements(template_config, style_config)),
+            agent_contexts=freeze({
+                agent_type: build(template_config, style_config, None)
+                for agent_type, build in self.agent_builders.items()
+            })
+        )
+    
+    def _get_state_coordination(self, agent_type: AgentType, state: EnrichedContentState) -> Dict[str, Any]:
+        """Coordination that depends on earlier agents' outputs, not on config"""
+        
+        coordination = {}
+        
+        # Integration with previous agents
+        if agent_type == AgentType.WRITER and state.research_findings:
+            coordination['research_integration'] = {
+                'use_primary_insights': True,
+                'cite_evidence': True,
+                'integrate_statistics': True,
+                'reference_industry_context': True
+            }
+        
+        return coordination
+    
     def _get_coordination_rules(self, template_config: Dict, style_config: Dict) -> Dict[str, Any]:
         """Extract coordination rules from template and style configurations"""
         
@@ -236,15 +283,6 @@ class UnifiedAgentCoordination:
             'style_voice': style_config.get('voice_characteristics', [])
         }
         
-        # Integration with previous agents
-        if state.research_findings:
-            coordination['research_integration'] = {
-                'use_primary_insights': True,
-                'cite_evidence': True,
-                'integrate_statistics': True,
-                'reference_industry_context': True
-            }
-        
         return coordination
     
     def _get_editor_coordination(self, template_config: Dict, style_config: Dict, state: EnrichedContentState) -> Dict[str, Any]:
@@ -378,8 +416,10 @@ class UnifiedAgentCoordination:
         
         # Template tone (takes precedence)
         template_tone = template_config.get('tone', {})
-        if template_tone:
+        if isinstance(template_tone, dict):
             tone_guidance.update(template_tone)
+        elif template_tone:
+            tone_guidance['template_tone'] = template_tone
         
         # Style tone (enhances template)
         style_tone = style_config.get('tone')
@@ -422,27 +462,27 @@ class UnifiedAgentCoordination:
         
         return adaptations
     
-#    def _determine_editing_priorities(self, template_config: Dict, style_config: Dict) -> List[str]:
-#        """Determine editing priorities based on template and style"""
-#        
-#        priorities = ['template_compliance', 'style_consistency', 'content_quality']
-#        
-#        template_type = template_config.get('template_type')
-#        if template_type == 'venture_capital_pitch':
-#            priorities.extend(['financial_accuracy', 'investor_language', 'metric_validation'])
-#        elif template_type == 'business_proposal':
-#            priorities.extend(['roi_clarity', 'implementation_feasibility', 'executive_appeal'])
-#        elif template_type == 'technical_documentation':
-#            priorities.extend(['technical_accuracy', 'code_validation', 'implementation_clarity'])
-#        
-#        style_tone = style_config.get('tone')
-#        if style_tone == 'formal':
-#            priorities.append('formality_enforcement')
-#        elif style_tone == 'academic':
-#            priorities.append('academic_rigor')
-#        
-#        return priorities
-#    
+    def _determine_editing_priorities(self, template_config: Dict, style_config: Dict) -> List[str]:
+        """Determine editing priorities based on template and style"""
+        
+        priorities = ['template_compliance', 'style_consistency', 'content_quality']
+        
+        template_type = template_config.get('template_type')
+        if template_type == 'venture_capital_pitch':
+            priorities.extend(['financial_accuracy', 'investor_language', 'metric_validation'])
+        elif template_type == 'business_proposal':
+            priorities.extend(['roi_clarity', 'implementation_feasibility', 'executive_appeal'])
+        elif template_type == 'technical_documentation':
+            priorities.extend(['technical_accuracy', 'code_validation', 'implementation_clarity'])
+        
+        style_tone = style_config.get('tone')
+        if style_tone == 'formal':
+            priorities.append('formality_enforcement')
+        elif style_tone == 'academic':
+            priorities.append('academic_rigor')
+        
+        return priorities
+    
     def _get_template_compliance_checks(self, template_config: Dict) -> List[str]:
         """Get template compliance checks"""
         
@@ -519,19 +559,19 @@ class UnifiedAgentCoordination:
                 'emphasis': 'comprehension_support'
             }
     
-#    def _determine_search_intent(self, template_config: Dict, style_config: Dict) -> str:
-#        """Determine primary search intent"""
-#        
-#        template_type = template_config.get('template_type')
-#        
-#        if template_type == 'venture_capital_pitch':
-#            return 'commercial_funding'
-#        elif template_type == 'business_proposal':
-#            return 'commercial_solution'
-#        elif template_type == 'technical_documentation':
-#            return 'informational_implementation'
-#        else:
-#            return 'informational_educational'
+    def _determine_search_intent(self, template_config: Dict, style_config: Dict) -> str:
+        """Determine primary search intent"""
+        
+        template_type = template_config.get('template_type')
+        
+        if template_type == 'venture_capital_pitch':
+            return 'commercial_funding'
+        elif template_type == 'business_proposal':
+            return 'commercial_solution'
+        elif template_type == 'technical_documentation':
+            return 'informational_implementation'
+        else:
+            return 'informational_educational'
     
     def _get_seo_structure_requirements(self, template_config: Dict) -> Dict[str, Any]:
         """Get SEO structure requirements from template"""
@@ -579,24 +619,24 @@ class UnifiedAgentCoordination:
         
         return standards
     
-#    def _get_compliance_checks(self, template_config: Dict, style_config: Dict) -> List[str]:
-#        """Get compliance checks list"""
-#        
-#        checks = [
-#            'template_structure_compliance',
-#            'style_pattern_compliance',
-#            'content_quality_compliance',
-#            'audience_appropriateness',
-#            'technical_accuracy'
-#        ]
-#        
-#        template_type = template_config.get('template_type')
-#        if template_type == 'venture_capital_pitch':
-#            checks.extend(['financial_accuracy', 'investor_standards'])
-#        elif template_type == 'business_proposal':
-#            checks.extend(['business_accuracy', 'executive_standards'])
-#        
-#        return checks
+    def _get_compliance_checks(self, template_config: Dict, style_config: Dict) -> List[str]:
+        """Get compliance checks list"""
+        
+        checks = [
+            'template_structure_compliance',
+            'style_pattern_compliance',
+            'content_quality_compliance',
+            'audience_appropriateness',
+            'technical_accuracy'
+        ]
+        
+        template_type = template_config.get('template_type')
+        if template_type == 'venture_capital_pitch':
+            checks.extend(['financial_accuracy', 'investor_standards'])
+        elif template_type == 'business_proposal':
+            checks.extend(['business_accuracy', 'executive_standards'])
+        
+        return checks
     
     def _get_publication_criteria(self, template_config: Dict, style_config: Dict) -> Dict[str, Any]:
         """Get publication readiness criteria"""
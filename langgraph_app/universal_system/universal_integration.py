@@ -8,7 +8,6 @@ import asyncio
 import json
 import os
 from typing import Dict, List, Any, Optional
-from pathlib import Path
 
 # Import your existing components
 try:
@@ -156,17 +155,13 @@ class WriterzRoomUniversalAdapter:
     def _load_existing_template(self, template_id: str) -> Optional[Dict[str, Any]]:
         """Load existing YAML template if it exists"""
         
-        template_path = Path(f"data/content_templates/{template_id}.yaml")
-        if not template_path.exists():
-            return None
-        
         try:
-            import yaml
-            with open(template_path, 'r') as f:
-                return yaml.safe_load(f)
-        except Exception as e:
+            from ..core.config_registry import get_config_registry
+            record = get_config_registry().template(template_id)
+        except FileNotFoundError as e:
             print(f"Error loading template {template_id}: {e}")
             return None
+        return record.to_dict() if record else None
     
     def _extract_instructions_from_yaml(self, yaml_content: str) -> str:
         """Extract instructions from generated YAML"""
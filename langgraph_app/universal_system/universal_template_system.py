@@ -6,6 +6,7 @@ from typing import Dict, List, Any, Optional
 from pathlib import Path
 from dataclasses import dataclass
 
+from ..core.config_registry import STYLE_PROFILE, get_config_registry
 from .universal_dynamic_generator import TrulyDynamicContentSystem
 
 @dataclass
@@ -24,8 +25,9 @@ class UniversalTemplateManager:
     Integrates with your existing LangGraph workflow
     """
     
-    def __init__(self, templates_dir: str = "data/content_templates"):
-        self.templates_dir = Path(templates_dir)
+    def __init__(self, templates_dir: Optional[str] = None):
+        # None: use the shared config registry's templates
+        self.templates_dir = Path(templates_dir) if templates_dir else None
         self.dynamic_system = TrulyDynamicContentSystem()
         self.static_templates = {}
         self.generated_templates_cache = {}
@@ -35,6 +37,17 @@ class UniversalTemplateManager:
     
     def _load_existing_templates(self):
         """Load existing templates as fallbacks"""
+        if self.templates_dir is None:
+            try:
+                registry = get_config_registry()
+            except FileNotFoundError as e:
+                print(f"Error loading templates: {e}")
+                return
+            for record in registry.templates():
+                if 'id' in record.data:
+                    self.static_templates[record.id] = record.to_dict()
+            return
+
         if self.templates_dir.exists():
             for template_file in self.templates_dir.glob("*.yaml"):
                 try:
@@ -137,15 +150,10 @@ class UniversalTemplateManager:
     def _get_available_style_profiles(self) -> List[str]:
         """Get actual available style profiles from the system"""
         try:
-            from ..integrated_server import load_style_profiles
-            profiles = load_style_profiles()
-            return [p.id for p in profiles]
-        except:
-            # Fallback to scanning data directory
-            profiles_dir = Path("data/style_profiles")
-            if profiles_dir.exists():
-                return [f.stem for f in profiles_dir.glob("*.yaml")]
-            return ["social_media_voice"]  # Safe fallback
+            profile_ids = get_config_registry().ids(STYLE_PROFILE)
+        except FileNotFoundError:
+            profile_ids = []
+        return profile_ids or ["social_media_voice"]  # Safe fallback
     
     async def _select_optimal_style_llm(
         self, 
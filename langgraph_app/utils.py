@@ -1,7 +1,6 @@
 # langgraph_app/utils.py
 
 import os
-import yaml
 import json
 import hashlib
 import time
@@ -11,7 +10,8 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 import re
 import aiofiles
-from textstat import flesch_reading_ease, flesch_kincaid_grade, automated_readability_index
+from langgraph_app.core.config_registry import get_config_registry
+from langgraph_app.core.text_stats import get_text_stats
 from sqlalchemy import create_engine, Column, Integer, String, Float, Text, DateTime
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -401,10 +401,11 @@ def calculate_readability_score(content: str) -> Dict[str, float]:
     if not content or len(content.strip()) < 10:
         return {"flesch_score": 0, "grade_level": 0, "readability_score": 0}
     
-    flesch_score = flesch_reading_ease(content)
-    grade_level = flesch_kincaid_grade(content)
-    ari_score = automated_readability_index(content)
-    readability_score = max(0, min(100, flesch_score))
+    stats = get_text_stats(content)
+    flesch_score = stats.flesch_reading_ease
+    grade_level = stats.flesch_kincaid_grade
+    ari_score = stats.automated_readability_index
+    readability_score = stats.flesch_score
     
     return {
         "flesch_score": flesch_score,
@@ -419,7 +420,7 @@ def calculate_seo_score(content: str, target_keywords: List[str] = None) -> Dict
         return {"seo_score": 0, "keyword_density": {}, "issues": []}
     
     target_keywords = target_keywords or []
-    word_count = len(content.split())
+    word_count = get_text_stats(content).word_count
     issues = []
     
     has_title = bool(re.search(r'^#\s+.+', content, re.MULTILINE))
@@ -479,7 +480,7 @@ def calculate_engagement_score(content: str) -> float:
     if not content:
         return 0.0
     
-    word_count = len(content.split())
+    word_count = get_text_stats(content).word_count
     if word_count == 0:
         return 0.0
     
@@ -529,7 +530,7 @@ def assess_content_quality(content: str, target_keywords: List[str] = None) -> D
     engagement_score = calculate_engagement_score(content)
     coherence_score = calculate_coherence_score(content)
     
-    word_count = len(content.split())
+    word_count = get_text_stats(content).word_count
     if 300 <= word_count <= 2000:
         length_score = 100
     elif word_count < 300:
@@ -599,23 +600,23 @@ def load_system_prompt(prompt_name: str) -> str:
 
 def load_style_profile(name: str) -> Dict[str, Any]:
     """Load style profile with caching"""
-    cache_key = f"style_profile_{name}"
-    cached_profile = global_cache.get(cache_key)
-    
-    if cached_profile:
-        return cached_profile
-    
     try:
-        with open(f"data/style_profiles/{name}.yaml", "r", encoding="utf-8") as f:
-            profile = yaml.safe_load(f)
-        profile = validate_style_profile(profile, name)
+        record = get_config_registry().style_profile(name)
+        if record is None:
+            raise FileNotFoundError(name)
+
+        # Keyed by content version, so an edited file is picked up after a registry reload
+        cache_key = f"style_profile_{name}_{record.version}"
+        cached_profile = global_cache.get(cache_key)
+        if cached_profile:
+            return cached_profile
+
+        profile = validate_style_profile(record.to_dict(), name)
         global_cache.set(cache_key, profile, ttl=1800)
         return profile
     except FileNotFoundError:
         logger.warning(f"Style profile not found: {name}.yaml, using default")
-        default_profile = get_default_style_profile()
-        global_cache.set(cache_key, default_profile, ttl=1800)
-        return default_profile
+        return get_default_style_profile()
     except Exception as e:
         logger.error(f"Error loading style profile {name}: {e}")
         return get_default_style_profile()
@@ -652,23 +653,23 @@ def get_default_style_profile() -> Dict[str, Any]:
 
 def load_content_template(name: str) -> Dict[str, Any]:
     """Load content template with caching"""
-    cache_key = f"content_template_{name}"
-    cached_template = global_cache.get(cache_key)
-    
-    if cached_template:
-        return cached_template
-    
     try:
-        with open(f"data/content_templates/{name}.yaml", "r", encoding="utf-8") as f:
-            template = yaml.safe_load(f)
-        template = validate_content_template(template, name)
+        record = get_config_registry().template(name)
+        if record is None:
+            raise FileNotFoundError(name)
+
+        # Keyed by content version, so an edited file is picked up after a registry reload
+        cache_key = f"content_template_{name}_{record.version}"
+        cached_template = global_cache.get(cache_key)
+        if cached_template:
+            return cached_template
+
+        template = validate_content_template(record.to_dict(), name)
         global_cache.set(cache_key, template, ttl=1800)
         return template
     except FileNotFoundError:
         logger.warning(f"Template not found: {name}.yaml")
-        default_template = get_default_content_template()
-        global_cache.set(cache_key, default_template, ttl=1800)
-        return default_template
+        return get_default_content_template()
     except Exception as e:
         logger.error(f"Error loading template {name}: {e}")
         return get_default_content_template()
@@ -0,0 +1,87 @@
+# scripts/benchmark_config_boot.py
+"""
+Benchmark config loading at boot.
+
+Loads a temporary copy of the data directory (templates + style profiles)
+four ways:
+- legacy_safe_load: pure-Python yaml.safe_load + pydantic validation per
+  file (the old ConfigManager path)
+- registry_cold: shared registry, CSafeLoader when available, no snapshot
+- registry_snapshot: registry booting from a fresh binary snapshot
+- snapshot_one_changed: snapshot boot after one style profile was edited
+
+Usage: python scripts/benchmark_config_boot.py [--data-dir data] [--runs 5]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yaml
+
+from langgraph_app.core.config_registry import ConfigRegistry
+from langgraph_app.core.schemas import StyleProfile, Template
+
+
+def legacy_safe_load(data_root):
+    for subdir, schema in (("content_templates", Template), ("style_profiles", StyleProfile)):
+        for path in sorted((data_root / subdir).glob("*.y*ml")):
+            with path.open("r", encoding="utf-8") as f:
+                data = yaml.load(f, Loader=yaml.SafeLoader) or {}
+            try:
+                schema.model_validate(data).model_dump(mode="python")
+            except Exception:
+                pass
+
+
+def registry_cold(data_root):
+    os.environ["CONFIG_SNAPSHOT_DIR"] = ""
+    ConfigRegistry(data_root)
+
+
+def registry_snapshot(data_root):
+    ConfigRegistry(data_root)
+
+
+def snapshot_one_changed(data_root):
+    profile = sorted((data_root / "style_profiles").glob("*.yaml"))[0]
+    profile.write_text(profile.read_text() + f"\n# edited {time.perf_counter_ns()}\n")
+    ConfigRegistry(data_root)
+
+
+def timed(fn, data_root, snapshot_dir, runs):
+    best = float("inf")
+    for _ in range(runs):
+        os.environ["CONFIG_SNAPSHOT_DIR"] = str(snapshot_dir)
+        ConfigRegistry(data_root)  # make sure a fresh snapshot exists
+        started = time.perf_counter()
+        fn(data_root)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--data-dir", default=str(Path(__file__).resolve().parent.parent / "data"))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_root = Path(tmp) / "data"
+        shutil.copytree(args.data_dir, data_root)
+        snapshot_dir = Path(tmp) / "snapshot"
+        files = sum(1 for _ in data_root.glob("*/*.y*ml"))
+
+        print(f"{files} YAML files, libyaml: {hasattr(yaml, 'CSafeLoader')}, best of {args.runs} runs")
+        for fn in (legacy_safe_load, registry_cold, registry_snapshot, snapshot_one_changed):
+            best = timed(fn, data_root, snapshot_dir, args.runs)
+            print(f"  {fn.__name__:<22} {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
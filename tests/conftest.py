@@ -0,0 +1,14 @@
+# tests/conftest.py
+
+import os
+
+import pytest
+
+# Set before collection: some agent modules build their clients at import time
+os.environ["LLM_PROVIDER"] = "fake"
+
+
+@pytest.fixture(autouse=True)
+def isolated_config_snapshot(tmp_path, monkeypatch):
+    """Keep config registry snapshots out of the working tree"""
+    monkeypatch.setenv("CONFIG_SNAPSHOT_DIR", str(tmp_path / "config_snapshot"))
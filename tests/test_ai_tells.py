@@ -0,0 +1,30 @@
+# tests/test_ai_tells.py
+
+from langgraph_app.core.ai_tells import TellMatcher, get_forbidden_matcher, get_tell_matcher
+
+
+def test_scan_prefers_longest_phrase_and_matches_curly_apostrophes():
+    hits = get_tell_matcher().scan("We Delve into caching. It’s worth noting that we delve   into it twice.")
+
+    assert [(hit.phrase, hit.count) for hit in hits] == [("delve into", 2), ("it's worth noting that", 1)]
+    assert hits[0].found == "Delve into" and hits[1].replacement == "notably"
+
+
+def test_replace_keeps_capitalization_and_counts():
+    matcher = TellMatcher({"delve into": "examine", "delve": "examine", "leverage": "use"})
+
+    text, counts = matcher.replace("Delve into data. We delve deeper and leverage caches; leverages stay.")
+
+    assert text == "Examine data. We examine deeper and use caches; leverages stay."
+    assert counts == {"delve into": 1, "delve": 1, "leverage": 1}
+
+
+def test_forbidden_tells_reported_and_writer_matcher_skips_shared_tells():
+    style = {"forbidden_patterns": ["crucial", "synergy"]}
+    hits = {hit.phrase: hit for hit in get_tell_matcher(style).scan("A crucial synergy.")}
+
+    assert hits["crucial"].forbidden and hits["crucial"].replacement == "important"
+    assert hits["synergy"].forbidden and hits["synergy"].replacement is None
+
+    text, _ = get_forbidden_matcher(style).replace("We leverage a Crucial synergy.", forbidden_replacement="[x]")
+    assert text == "We leverage a [x] [x]."
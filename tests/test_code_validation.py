@@ -0,0 +1,87 @@
+# tests/test_code_validation.py
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from langgraph_app.agents.enhanced_code_agent_integrated import EnhancedCodeAgent
+from langgraph_app.core import code_validation
+from langgraph_app.core.code_validation import CodeValidator, check_code_syntax
+from langgraph_app.core.state import EnrichedContentState
+from langgraph_app.core.types import CodeGenerationContext
+
+
+def test_syntax_checks_per_language():
+    assert check_code_syntax("def f(x):\n    return x\n", "python")["is_valid"]
+    assert not check_code_syntax("def broken(:\n    pass", "python")["is_valid"]
+    assert not check_code_syntax('{"a": 1,}', "json")["is_valid"]
+    assert check_code_syntax("const f = () => { return [1, 2]; };", "javascript")["is_valid"]
+    assert check_code_syntax("function a() { return (1; }", "js")["issues"] == ["Mismatched '}'"]
+    assert check_code_syntax('console.log(":)"); // ]\n/* { */ f(`(${x}`);', "ts")["is_valid"]
+
+
+def test_pool_results_in_order_and_cached():
+    validator = CodeValidator(workers=2, timeout_s=10)
+    blocks = [
+        {"language": "python", "code": "x = 1"},
+        {"language": "python", "code": "x = ("},
+        {"language": "json", "code": "[1, 2]"},
+        {"language": "python", "code": "x = 1"},
+    ]
+    results = validator.validate_blocks(blocks)
+    assert [r["is_valid"] for r in results] == [True, False, True, True]
+    assert validator.stats["validated"] == 3
+
+    assert validator.validate_blocks(blocks) == results
+    assert validator.stats["cache_hits"] == 4
+
+
+def test_time_limit_runs_per_block_from_start(monkeypatch):
+    release = threading.Event()
+
+    def check(code, language):
+        if code == "stuck":
+            release.wait(5)
+        return check_code_syntax(code, language)
+
+    validator = CodeValidator(workers=1, timeout_s=0.2)
+    pools = []
+
+    def thread_pool():
+        if validator._pool is None:
+            validator._pool = ThreadPoolExecutor(max_workers=1)
+            pools.append(validator._pool)
+        return validator._pool
+
+    monkeypatch.setattr(code_validation, "check_code_syntax", check)
+    monkeypatch.setattr(validator, "_get_pool", thread_pool)
+    blocks = [{"language": "python", "code": "stuck"}] + [
+        {"language": "python", "code": f"x = {i}"} for i in range(4)
+    ]
+    try:
+        results = validator.validate_blocks(blocks)
+    finally:
+        release.set()
+
+    assert results[0]["timed_out"] and [r["is_valid"] for r in results[1:]] == [True] * 4
+    assert validator.stats["timeouts"] == 1 and validator.stats["validated"] == 4
+    assert len(pools) == 2
+
+
+def test_enhancement_key_covers_style_and_generation_settings(monkeypatch):
+    agent = EnhancedCodeAgent.__new__(EnhancedCodeAgent)
+    context = CodeGenerationContext(programming_languages=["python"], documentation_style="technical")
+    template = {"template_type": "api_documentation"}
+
+    def key(style=None, settings=None):
+        state = EnrichedContentState(
+            template_config=template, style_config=style or {},
+            dynamic_parameters={"generation_settings": settings or {}}
+        )
+        return agent._enhancement_key("body", context, template, state)
+
+    base = key()
+    assert key() == base
+    assert key({"tone": "formal"}) != base
+    assert key(settings={"temperature": 0.2}) != base
+    monkeypatch.setattr(agent, "_select_model", lambda: "gpt-5")
+    assert key() != base
@@ -0,0 +1,38 @@
+# tests/test_compatibility_matrix.py
+
+from langgraph_app.style_profile_loader import DynamicStyleProfileLoader
+
+TEMPLATES = {
+    "api_docs": {"name": "API Reference", "description": "Technical API documentation", "difficulty": "advanced",
+                 "targetAudience": "developers", "tags": ["api", "code"]},
+    "pitch": {"name": "Investor Pitch", "description": "Business pitch for executives", "tags": ["startup"]},
+}
+PROFILES = {
+    "dev_guide": {"name": "Developer Guide", "tone": "technical", "difficulty": "expert",
+                  "target_audience": "engineers", "tags": ["api", "sdk"]},
+    "boardroom": {"name": "Executive Brief", "tone": "formal", "description": "Corporate board updates",
+                  "tags": ["startup", "finance"]},
+    "casual_blog": {"name": "Friendly Blog", "tone": "conversational"},
+}
+
+
+def _loader():
+    loader = DynamicStyleProfileLoader()
+    loader.templates_cache = {k: dict(v) for k, v in TEMPLATES.items()}
+    loader.profiles_cache = {k: dict(v) for k, v in PROFILES.items()}
+    loader._build_compatibility_matrix()
+    return loader
+
+
+def test_matrix_matches_pairwise_scores():
+    loader = _loader()
+
+    for template_id, template in loader.templates_cache.items():
+        template_chars = loader._extract_content_characteristics(template, 'template')
+        for profile_id, profile in loader.profiles_cache.items():
+            profile_chars = loader._extract_content_characteristics(profile, 'profile')
+            expected = loader._calculate_compatibility_score(template_chars, profile_chars)
+            assert loader.compatibility_matrix[template_id][profile_id] == expected
+
+    assert loader.get_profile_recommendations("api_docs", 1) == ["dev_guide"]
+    assert loader.get_profile_recommendations("pitch", 1) == ["boardroom"]
@@ -0,0 +1,80 @@
+# tests/test_config_registry.py
+
+import pytest
+
+from langgraph_app.core.config_registry import STYLE_PROFILE, TEMPLATE, ConfigRegistry
+
+STYLE = """id: linkedin_pro
+name: LinkedIn Pro
+system_prompt: Write for LinkedIn.
+tone: professional
+voice: confident
+platform: LinkedIn
+audience: executives
+category: business
+"""
+
+
+def _data_root(tmp_path):
+    templates = tmp_path / "data" / "content_templates"
+    styles = tmp_path / "data" / "style_profiles"
+    templates.mkdir(parents=True)
+    styles.mkdir()
+    (templates / "brief.yaml").write_text("name: Brief\ntemplate_type: strategic_brief\ncategory: Business\n")
+    (styles / "linkedin_pro.yaml").write_text(STYLE)
+    (styles / "broken.yaml").write_text("id: broken\nname: Broken\n")
+    return tmp_path / "data"
+
+
+def test_records_indexed_and_frozen(tmp_path):
+    registry = ConfigRegistry(_data_root(tmp_path))
+
+    brief = registry.template("brief")
+    assert brief.id == "brief" and brief.validated["template_type"] == "strategic_brief"
+    assert [r.id for r in registry.find(TEMPLATE, category="business")] == ["brief"]
+    assert [r.id for r in registry.find(STYLE_PROFILE, platform="linkedin", audience="Executives")] == ["linkedin_pro"]
+    with pytest.raises(TypeError):
+        brief.data["name"] = "Changed"
+    copy = brief.to_dict()
+    copy["name"] = "Changed"
+    assert brief.data["name"] == "Brief"
+
+
+def test_invalid_files_reported_but_served_raw(tmp_path):
+    registry = ConfigRegistry(_data_root(tmp_path))
+
+    broken = registry.style_profile("broken")
+    assert broken.validated is None and broken.error
+    assert [r.id for r in registry.style_profiles(valid_only=True)] == ["linkedin_pro"]
+    assert len(registry.errors) == 1 and registry.errors[0].startswith("[STYLE] broken.yaml")
+
+
+def test_refresh_reparses_only_changed_files(tmp_path):
+    root = _data_root(tmp_path)
+    registry = ConfigRegistry(root)
+    brief = registry.template("brief")
+    seen = []
+    registry.subscribe(seen.append)
+
+    assert registry.refresh() == {}
+    (root / "style_profiles" / "linkedin_pro.yaml").write_text(STYLE.replace("executives", "founders"))
+    changed = registry.refresh()
+
+    assert changed == {STYLE_PROFILE: frozenset({"linkedin_pro"})} and seen == [changed]
+    assert registry.generation == 2
+    assert registry.template("brief") is brief
+    assert [r.id for r in registry.find(STYLE_PROFILE, audience="founders")] == ["linkedin_pro"]
+
+
+def test_boot_reuses_snapshot_for_unchanged_files(tmp_path):
+    root = _data_root(tmp_path)
+    first = ConfigRegistry(root)
+    (root / "content_templates" / "brief.yaml").write_text("name: Brief v2\ntemplate_type: strategic_brief\n")
+
+    second = ConfigRegistry(root)
+
+    assert first.snapshot_stats == {"reused": 0, "parsed": 3, "written": True}
+    assert second.snapshot_stats == {"reused": 2, "parsed": 1, "written": True}
+    assert second.template("brief").data["name"] == "Brief v2"
+    assert second.style_profile("linkedin_pro").validated == first.style_profile("linkedin_pro").validated
+    assert second.errors == first.errors
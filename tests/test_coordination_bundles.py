@@ -0,0 +1,53 @@
+# tests/test_coordination_bundles.py
+
+import json
+
+import pytest
+
+from langgraph_app.core.state import EnrichedContentState
+from langgraph_app.core.types import AgentType
+from langgraph_app.unified_agent_coordination import UnifiedAgentCoordination
+
+TEMPLATE = {"id": "tech_doc", "template_type": "technical_documentation", "section_order": ["Intro", "Setup"]}
+STYLE = {"id": "formal", "tone": "formal", "forbidden_patterns": ["delve"]}
+
+
+def test_bundle_compiled_once_and_frozen():
+    coordination = UnifiedAgentCoordination()
+    state = EnrichedContentState(template_config=TEMPLATE, style_config=STYLE)
+
+    writer = coordination.get_coordinated_context(state, AgentType.WRITER)
+    editor = coordination.get_coordinated_context(state, AgentType.EDITOR)
+
+    assert writer["coordination_rules"]["code_examples"] is True
+    assert writer["structure_requirements"] == ["Intro", "Setup"]
+    assert "technical_accuracy" in editor["editing_priorities"]
+    json.dumps(writer)
+
+    bundle = coordination.get_bundle(TEMPLATE, STYLE)
+    writer["coordination_rules"]["code_examples"] = False
+    assert bundle.coordination_rules["code_examples"] is True
+    with pytest.raises(TypeError):
+        bundle.coordination_rules["code_examples"] = False
+
+
+def test_changed_config_gets_new_bundle():
+    coordination = UnifiedAgentCoordination()
+    first = coordination.get_bundle(TEMPLATE, STYLE)
+    assert coordination.get_bundle(TEMPLATE, STYLE) is first
+
+    edited = {**TEMPLATE, "template_type": "business_proposal"}
+    second = coordination.get_bundle(edited, STYLE)
+    assert second is not first
+    assert second.coordination_rules["roi_emphasis"] is True
+
+
+def test_in_place_edit_gets_new_bundle():
+    coordination = UnifiedAgentCoordination()
+    template = dict(TEMPLATE)
+    first = coordination.get_bundle(template, STYLE)
+
+    template.update({"template_type": "business_proposal"})
+
+    assert coordination.get_bundle(template, STYLE).coordination_rules["roi_emphasis"] is True
+    assert coordination.get_bundle(dict(TEMPLATE), STYLE) is first
@@ -0,0 +1,93 @@
+# tests/test_editor_sections.py
+
+import threading
+import time
+from types import SimpleNamespace
+
+from langgraph_app.agents import enhanced_editor_integrated as editor_module
+from langgraph_app.agents.enhanced_editor_integrated import (
+    EDIT_CHUNK_MAX_WORDS,
+    EDIT_SECTION_MIN_READABILITY,
+    EnhancedEditorAgent,
+    split_sections
+)
+
+PLAIN_TECHNICAL = (
+    "Teams often run services on several machines so one failure does not stop the system. "
+    "Each machine keeps a copy of the data and they agree on changes through a leader. "
+    "When the leader fails, the others hold an election and pick a new one within a few seconds. "
+    "Careful timeout settings keep the cluster stable under normal network delays. "
+)
+DENSE = (
+    "Distributed consensus protocols coordinate replicated state machines across unreliable networks. "
+    "Leader election, log replication and membership reconfiguration determine availability characteristics. "
+    "Operators configure election timeouts conservatively because aggressive configurations destabilize clusters. "
+    "Quorum intersection guarantees linearizable reads without additional coordination overhead. "
+    "Implementations additionally require deterministic serialization. "
+)
+
+
+def _article():
+    long_body = "\n\n".join(["word " * 120] * 12)
+    return (
+        "# Title\n\nIntro paragraph.\n\n"
+        "## Setup\n\nInstall it.\n\n```bash\n# not a heading\npip install thing\n```\n\n"
+        f"## Long\n\n{long_body}\n\n"
+        "### Last\nDone.\n"
+    )
+
+
+def test_split_sections_round_trip():
+    article = _article()
+    sections = split_sections(article)
+
+    assert "".join(sections) == article
+    assert sections[0].startswith("# Title") and sections[1].startswith("## Setup")
+    assert "# not a heading" in sections[1]
+    assert all(len(s.split()) <= EDIT_CHUNK_MAX_WORDS for s in sections)
+    assert sections[-1] == "### Last\nDone.\n"
+
+
+def test_chunked_edit_merges_in_section_order(monkeypatch):
+    editor = EnhancedEditorAgent()
+    sections = [f"## Part {i}\n\nBody {i}.\n\n" for i in range(6)]
+    lock = threading.Lock()
+    finished = []
+
+    def fake_edit(model, provider, system_prompt, section, issues):
+        idx = int(section.split()[2])
+        time.sleep(0.01 * (6 - idx))  # later sections finish first
+        with lock:
+            finished.append(idx)
+        return section.replace("Body", "Edited")
+
+    monkeypatch.setattr(editor_module, "get_model", lambda *args: "model")
+    monkeypatch.setattr(editor, "_section_issues", lambda section, style: ["issue"] if "Part 0" not in section else [])
+    monkeypatch.setattr(editor, "_edit_section", fake_edit)
+    monkeypatch.setattr(editor, "_build_editing_system_prompt", lambda *args: "system")
+
+    merged, _ = editor._chunked_edit(sections, {}, {}, {})
+
+    assert finished != sorted(finished)
+    assert merged == sections[0] + "".join(s.replace("Body", "Edited") for s in sections[1:])
+
+
+def test_section_readability_alone_needs_a_low_score():
+    editor = EnhancedEditorAgent()
+    plain = editor._local_checks(PLAIN_TECHNICAL, {})["analyze_readability"]["flesch_score"]
+
+    assert EDIT_SECTION_MIN_READABILITY < plain < editor.min_readability
+    assert editor._section_issues(PLAIN_TECHNICAL, {}) == []
+    with_tell = PLAIN_TECHNICAL + "Operators should delve into the configuration documentation before changing production timeouts. "
+    assert editor._section_issues(with_tell, {})[-1].startswith(f"Readability 43 is below {editor.min_readability:.0f}")
+    assert editor._section_issues(DENSE, {})[0].startswith(f"Readability 0 is below {EDIT_SECTION_MIN_READABILITY:.0f}")
+    assert editor._section_issues(DENSE + "\n```python\nx = 1\n```\n", {}) == []
+
+
+def test_edit_section_keeps_original_for_block_content(monkeypatch):
+    editor = EnhancedEditorAgent()
+    section = "## Part\n\n" + DENSE + "\n\n"
+    blocks = SimpleNamespace(content=[{"type": "text", "text": "Edited"}])
+    monkeypatch.setattr(editor, "_invoke_with_retries", lambda *args: (blocks, None))
+
+    assert editor._edit_section("model", "anthropic", "system", section, ["issue"]) == section
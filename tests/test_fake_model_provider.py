@@ -0,0 +1,116 @@
+# tests/test_fake_model_provider.py
+
+import json
+
+import anthropic
+import openai
+import pytest
+
+from langgraph_app import fake_model_provider
+from langgraph_app.fake_model_provider import (
+    FakeAnthropicClient,
+    FakeLLMConfig,
+    FakeLLMEngine,
+    FakeOpenAIClient,
+    FakeProviderError,
+    FakeTavilyClient,
+)
+
+
+@pytest.fixture
+def engine():
+    return FakeLLMEngine(FakeLLMConfig(latency_ms=0, latency_dist="fixed", article_words=300))
+
+
+def test_planner_outputs_are_schema_valid(engine):
+    client = FakeOpenAIClient(engine=engine)
+    response = client.chat.completions.create(
+        model="gpt-4o",
+        messages=[
+            {"role": "system", "content": "You are a planner"},
+            {"role": "user", "content": 'TOPIC: Edge AI\nOutput ONLY valid JSON: {"content_strategy": "string"}'},
+        ],
+    )
+    plan = json.loads(response.choices[0].message.content)
+    for key in ("content_strategy", "key_messages", "research_priorities", "estimated_sections"):
+        assert key in plan
+
+    tools = FakeAnthropicClient(engine=engine).messages.create(
+        model="claude-haiku-4-5-20251015",
+        system="Decide which tools you need.",
+        messages=[{"role": "user", "content": 'Plan content for: Edge AI\nOutput JSON array: [{"tool_name": "name"}]'}],
+    )
+    assert all("tool_name" in t for t in json.loads(tools.content[0].text))
+
+
+def test_outputs_are_deterministic_and_streams_match(engine):
+    client = FakeOpenAIClient(engine=engine)
+    messages = [{"role": "user", "content": "Topic: Edge AI"}]
+
+    first = client.chat.completions.create(model="gpt-5", messages=messages).choices[0].message.content
+    second = client.chat.completions.create(model="gpt-5", messages=messages).choices[0].message.content
+    streamed = "".join(
+        chunk.choices[0].delta.content or ""
+        for chunk in client.chat.completions.create(model="gpt-5", messages=messages, stream=True)
+        if chunk.choices
+    )
+
+    assert first == second == streamed
+    assert len(first.split()) >= 300
+
+
+def test_error_injection_uses_sdk_error_types_and_search():
+    engine = FakeLLMEngine(FakeLLMConfig(latency_ms=0, latency_dist="fixed", error_rate_529=1.0))
+    with pytest.raises(openai.InternalServerError, match="529") as excinfo:
+        FakeOpenAIClient(engine=engine).chat.completions.create(model="gpt-5", messages=[])
+    assert excinfo.value.status_code == 529
+    with pytest.raises(anthropic.OverloadedError, match="overloaded_error"):
+        FakeAnthropicClient(engine=engine).messages.create(model="claude-sonnet-4", messages=[])
+    with pytest.raises(FakeProviderError, match="529"):
+        FakeTavilyClient(engine=engine).search("edge ai")
+
+    engine.config.error_rate_529, engine.config.error_rate_429 = 0.0, 1.0
+    with pytest.raises(anthropic.RateLimitError, match="429"):
+        FakeAnthropicClient(engine=engine).messages.create(model="claude-sonnet-4", messages=[])
+    with pytest.raises(openai.RateLimitError, match="rate_limit_exceeded"):
+        FakeOpenAIClient(engine=engine).chat.completions.create(model="gpt-5", messages=[])
+
+    engine.config.error_rate_429 = 0.0
+    results = FakeTavilyClient(engine=engine).search("edge ai", max_results=2)["results"]
+    assert len(results) == 2 and results[0]["url"].startswith("https://")
+
+
+def test_error_rolls_depend_on_prompt_not_call_order():
+    def outcomes(prompts):
+        engine = FakeLLMEngine(FakeLLMConfig(latency_ms=0, latency_dist="fixed", error_rate_429=0.5))
+        results = {}
+        for prompt in prompts:
+            try:
+                engine.simulate_call(prompt)
+                results.setdefault(prompt, []).append("ok")
+            except FakeProviderError:
+                results.setdefault(prompt, []).append("429")
+        return results, engine.stats
+
+    prompts = [f"prompt {i}" for i in range(20)] * 3
+    forward, stats = outcomes(prompts)
+    backward, _ = outcomes(list(reversed(prompts)))
+
+    assert forward == backward
+    assert any(len(set(r)) > 1 for r in forward.values())
+    assert stats["calls"] == 60 and stats["errors_429"] == sum(r.count("429") for r in forward.values())
+
+
+def test_prompt_tracking_is_bounded(monkeypatch):
+    monkeypatch.setattr(fake_model_provider, "MAX_TRACKED_PROMPTS", 2)
+    engine = FakeLLMEngine(FakeLLMConfig(latency_ms=0, latency_dist="fixed"))
+    system = "x" * 4096
+
+    for prompt in ("a", "b", "a", "c"):
+        engine.simulate_call(prompt)
+    for prefix in (system, system + "b", system, system + "c"):
+        engine.cached_prefix_tokens(prefix)
+
+    assert list(engine._attempts.values()) == [2, 1]  # "b" evicted, "a" kept its count
+    assert len(engine._seen_prefixes) == 2
+    assert engine.cached_prefix_tokens(system) > 0 and engine.cached_prefix_tokens(system + "b") == 0
@@ -0,0 +1,75 @@
+# tests/test_generation_stream.py
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from langgraph_app.agents.writer import TemplateAwareWriterAgent
+from langgraph_app.core.generation_stream import GenerationStream, ParagraphAccumulator, sse_events
+
+ARTICLE = (
+    "---\ntitle: Caching\n\ntags: [perf]\n---\n\n"
+    "Caches trade memory for latency.\n\n"
+    "```python\ncache = {}\n\nprint(cache)\n```\n\n"
+    "Evict entries you no longer need."
+)
+
+
+def _paragraphs(text, chunk_size):
+    accumulator = ParagraphAccumulator()
+    paragraphs = []
+    for start in range(0, len(text), chunk_size):
+        paragraphs.extend(accumulator.feed(text[start:start + chunk_size]))
+    paragraphs.extend(accumulator.flush())
+    return paragraphs
+
+
+def test_paragraphs_keep_front_matter_and_fences_whole():
+    expected = [
+        "---\ntitle: Caching\n\ntags: [perf]\n---",
+        "Caches trade memory for latency.",
+        "```python\ncache = {}\n\nprint(cache)\n```",
+        "Evict entries you no longer need."
+    ]
+
+    assert _paragraphs(ARTICLE, len(ARTICLE)) == expected
+    assert _paragraphs(ARTICLE, 3) == expected
+    assert _paragraphs("Intro.\n\n---\nnot front matter\n\nlater", 5) == [
+        "Intro.", "---\nnot front matter", "later"
+    ]
+
+
+def test_sse_events_resume_and_stop_after_close():
+    stream = GenerationStream("req")
+    stream.publish_token("Hel", agent="writer")
+    stream.publish_paragraph("Hello.", agent="writer")
+    stream.close()
+
+    async def collect(since):
+        return [frame async for frame in sse_events(stream, since, poll_interval=0)]
+
+    frames = asyncio.run(collect(0))
+    assert [frame.split("\n")[1] for frame in frames] == ["event: token", "event: paragraph", "event: done"]
+    assert frames[1].startswith("id: 1\n") and frames[1].endswith("\n\n")
+    assert json.loads(frames[1].split("data: ", 1)[1])["data"] == "Hello."
+    assert len(asyncio.run(collect(2))) == 1
+
+
+def test_streamed_blog_matches_full_text_sanitize(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "fake")
+    writer = TemplateAwareWriterAgent()
+    # A mid-article `---` pair spans paragraphs, so only a full-text pass removes it
+    raw = "Opening line.\n\n---\n\nDraft notes -- drop me.\n\n---\n\nBody text -- here.\n\nSecond paragraph."
+
+    def fake_stream(on_text, **kwargs):
+        for start in range(0, len(raw), 4):
+            on_text(raw[start:start + 4])
+        return raw, "stop"
+
+    monkeypatch.setattr(writer, "_call_openai_stream", fake_stream)
+    state = SimpleNamespace(template_config={"template_type": "blog_article"})
+
+    streamed_raw, final = writer._stream_and_sanitize(state, None)
+
+    assert streamed_raw == raw and "drop me" not in final
+    assert final == writer._sanitize_and_enforce(raw, template_config=state.template_config, state=state)
@@ -0,0 +1,101 @@
+# tests/test_image_pipeline.py
+
+import threading
+import time
+from types import SimpleNamespace
+
+from langgraph_app.core.image_pipeline import (
+    ImageAssetCache, ImagePipeline, ImageRequest, PLACEHOLDER_PREFIX, embed_images
+)
+
+
+class CountingImages:
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def generate(self, prompt, size, **kwargs):
+        with self.lock:
+            self.calls += 1
+        return SimpleNamespace(data=[SimpleNamespace(url=f"https://img.example/{len(prompt)}", b64_json=None)])
+
+
+def test_placeholders_resolve_and_cache_by_normalized_prompt(tmp_path):
+    images = CountingImages()
+    pipeline = ImagePipeline(client=SimpleNamespace(images=images), cache=ImageAssetCache(str(tmp_path)))
+    requests = [
+        ImageRequest(prompt="System diagram.", alt_text="diagram", style="technical", placement="## Design"),
+        ImageRequest(prompt="Team photo", alt_text="team", style="technical"),
+    ]
+
+    placeholders = pipeline.submit(requests)
+    assert all(img.url.startswith(PLACEHOLDER_PREFIX) for img in placeholders)
+
+    resolved = pipeline.resolve(placeholders, timeout_s=10)
+    assert [img.url for img in resolved] == ["https://img.example/15", "https://img.example/10"]
+    assert embed_images("# T\n\n## Design\n\nBody", resolved) == (
+        "# T\n\n![team](https://img.example/10)\n\n## Design\n\n![diagram](https://img.example/15)\n\nBody"
+    )
+
+    again = pipeline.submit([ImageRequest(prompt="  system   DIAGRAM ", alt_text="d", style="technical")])
+    assert again[0].url == "https://img.example/15"
+    assert images.calls == 2
+
+
+class SlowImages(CountingImages):
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.peak = 0
+
+    def generate(self, prompt, size, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        return super().generate(prompt, size, **kwargs)
+
+
+def test_provider_limit_shared_across_articles(tmp_path):
+    images = SlowImages()
+    pipeline = ImagePipeline(client=SimpleNamespace(images=images), max_concurrency=2,
+                             cache=ImageAssetCache(str(tmp_path)))
+
+    articles = [
+        pipeline.submit([ImageRequest(prompt=f"article {a} image {i}", alt_text="x") for i in range(3)])
+        for a in range(3)
+    ]
+    resolved = [pipeline.resolve(placeholders, timeout_s=10) for placeholders in articles]
+
+    assert [len(r) for r in resolved] == [3, 3, 3]
+    assert images.calls == 9 and images.peak == 2
+
+
+def test_image_agent_runs_on_catalog_templates(tmp_path, monkeypatch):
+    from langgraph_app.agents.enhanced_image_agent_integrated import EnhancedImageAgent
+    from langgraph_app.core import image_pipeline
+    from langgraph_app.core.config_manager import ConfigManager
+    from langgraph_app.core.state import EnrichedContentState
+    from langgraph_app.core.types import ContentSpec
+
+    monkeypatch.setenv("CONFIG_SNAPSHOT_DIR", str(tmp_path / "snapshot"))
+    images = CountingImages()
+    pipeline = ImagePipeline(client=SimpleNamespace(images=images), cache=ImageAssetCache(str(tmp_path / "images")))
+    monkeypatch.setattr(image_pipeline, "_image_pipeline", pipeline)
+    manager = ConfigManager()
+    agent = EnhancedImageAgent()
+
+    queued = {}
+    for template_id in manager.list_templates():
+        state = EnrichedContentState(
+            template_config=manager.get_template(template_id),
+            style_config=manager.get_style_profile("beginner_tutorial"),
+            content_spec=ContentSpec(topic="Edge caching", platform="web"),
+            content="# Edge caching\n\n## Why\n\nA diagram helps.\n\n## How\n\nSteps."
+        )
+        queued[template_id] = len(agent.execute(state).generated_images)
+
+    assert queued["blog_article_generator"] == 0
+    assert queued["business_proposal"] > 0
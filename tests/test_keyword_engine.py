@@ -0,0 +1,20 @@
+# tests/test_keyword_engine.py
+
+from langgraph_app.core.keyword_engine import analyze_keywords, get_keyword_automaton
+
+
+def test_counts_positions_and_word_boundaries():
+    text = "Edge AI said: edge-AI beats cloud AI. Edge AI inference, edge ai edge ai."
+    analysis = analyze_keywords(text, ["edge ai", "AI", "ai inference", "edge ai edge", "missing"])
+    keywords = analysis["keywords"]
+
+    assert analysis["total_words"] == 15
+    assert keywords["edge ai"]["count"] == 5
+    assert keywords["AI"]["count"] == 6  # not inside "said"
+    assert keywords["ai inference"]["positions"] == [text.index("AI inference")]
+    assert keywords["edge ai edge"]["count"] == 1
+    assert keywords["missing"] == {"count": 0, "density": 0.0, "optimal": False, "positions": []}
+
+
+def test_automaton_cached_by_keyword_set():
+    assert get_keyword_automaton(["Edge AI", "cloud"]) is get_keyword_automaton(["cloud", "edge  ai"])
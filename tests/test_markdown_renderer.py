@@ -0,0 +1,46 @@
+# tests/test_markdown_renderer.py
+
+from langgraph_app.core.markdown_renderer import iter_html, render_inline, render_markdown
+
+DOC = """# Title
+
+Text with **bold**, *em*, `a < b` and [link](https://example.com).
+
+- one
+- two
+  - nested
+
+| A | B |
+|---|---|
+| 1 | 2 |
+
+```python
+x = "**not bold**"
+```
+"""
+
+
+def test_blocks_and_inline_spans():
+    html = render_markdown(DOC)
+
+    assert "<h1>Title</h1>" in html
+    assert "<strong>bold</strong>" in html and "<em>em</em>" in html
+    assert "<code>a &lt; b</code>" in html
+    assert '<a href="https://example.com">link</a>' in html
+    assert "<ul><li>one</li><li>two<ul><li>nested</li></ul></li></ul>" in html
+    assert "<th>A</th>" in html and "<td>2</td>" in html
+    assert '<pre><code class="language-python">x = "**not bold**"</code></pre>' in html
+
+
+def test_streamed_chunks_match_full_render():
+    chunks = [DOC[i:i + 7] for i in range(0, len(DOC), 7)]
+    assert "".join(iter_html(chunks)) == render_markdown(DOC)
+    assert render_markdown('[x](javascript:alert)') == '<p><a href="#">x</a></p>\n'
+
+
+def test_short_spans_close_at_first_marker_and_hrefs_keep_parentheses():
+    assert render_inline("**a** text **b**") == "<strong>a</strong> text <strong>b</strong>"
+    assert render_inline("*a* and *b*") == "<em>a</em> and <em>b</em>"
+    assert render_inline("__a__ and _b_") == "<strong>a</strong> and <em>b</em>"
+    assert render_inline("[x](javascript:alert(1)) done") == '<a href="#">x</a> done'
+    assert render_inline("[w](https://example.com/Foo_(bar))") == '<a href="https://example.com/Foo_(bar)">w</a>'
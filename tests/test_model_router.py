@@ -0,0 +1,68 @@
+# tests/test_model_router.py
+
+from langgraph_app.agents.enhanced_planner_integrated import EnhancedPlannerAgent
+from langgraph_app.core import model_router
+from langgraph_app.core.model_registry import ModelCapability
+from langgraph_app.core.model_router import ModelPerformance, ModelRouter
+from langgraph_app.core.state import EnrichedContentState
+from langgraph_app.enhanced_model_registry import get_model_name
+
+CANDIDATES = ("gpt-4o", "gpt-4o-mini", "claude-haiku-4.5")
+REQUIRED = [ModelCapability.REASONING, ModelCapability.STRUCTURED_OUTPUT]
+
+
+def test_ewma_updates():
+    perf = ModelPerformance(alpha=0.5)
+
+    perf.update(10.0, True, output_tokens=100)
+    assert (perf.ewma_latency_s, perf.ewma_tokens_per_s, perf.ewma_error_rate) == (10.0, 10.0, 0.0)
+
+    perf.update(2.0, True, output_tokens=100)
+    assert (perf.ewma_latency_s, perf.ewma_tokens_per_s) == (6.0, 30.0)
+
+    perf.update(50.0, False)
+    assert perf.ewma_latency_s == 6.0 and perf.ewma_error_rate == 0.5 and perf.samples == 3
+
+
+def test_route_by_speed_cost_and_budget():
+    router = ModelRouter(alpha=1.0)
+    router.record_call("gpt-4o", 4.0)
+    router.record_call("gpt-4o-mini", 9.0)
+    router.record_call("claude-haiku-4-5-20251015", 2.0)
+
+    def route(priority, budget=None):
+        return router.route(
+            "planner", priority=priority, latency_budget_s=budget,
+            required_capabilities=REQUIRED, allowed_models=CANDIDATES
+        ).model_name
+
+    assert route("speed") == "claude-haiku-4-5-20251015"
+    assert route("cost") == "gpt-4o-mini"
+    assert route("cost", budget=5.0) == "gpt-4o"
+    assert route("cost", budget=1.0) == "claude-haiku-4-5-20251015"
+    assert router.get_decisions(limit=1)[0]["reason"] == "budget_unmet: fastest available"
+
+    for _ in range(3):
+        router.record_call("gpt-4o", 1.0, success=False)
+    assert route("cost", budget=5.0) == "claude-haiku-4-5-20251015"
+
+
+def test_defaults_kept_until_routing_configured(monkeypatch):
+    router = ModelRouter(alpha=1.0)
+    monkeypatch.setattr(model_router, "_model_router", router)
+    for name in ("PLANNER_MODEL", "PLANNER_ROUTING_PRIORITY", "PLANNER_LATENCY_BUDGET_S",
+                 "MODEL_ROUTING_PRIORITY", "WRITER_MODEL", "WRITER_LATENCY_BUDGET_S"):
+        monkeypatch.delenv(name, raising=False)
+    planner = EnhancedPlannerAgent.__new__(EnhancedPlannerAgent)
+    simple = EnrichedContentState(template_config={"metadata": {"complexity": 3}})
+    complex_ = EnrichedContentState(template_config={"metadata": {"complexity": 8}})
+
+    assert planner._select_model(simple) == "gpt-4o"
+    assert planner._select_model(complex_) == "gpt-4o-mini"
+    assert get_model_name("writer") == "gpt-5"
+    assert router.get_decisions() == []
+
+    monkeypatch.setenv("PLANNER_ROUTING_PRIORITY", "speed")
+    router.record_call("claude-haiku-4-5-20251015", 1.0)
+    assert planner._select_model(simple) == "claude-haiku-4-5-20251015"
+    assert get_model_name("writer", {"routing_priority": "cost"}) == "gpt-4o"
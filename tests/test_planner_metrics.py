@@ -0,0 +1,56 @@
+# tests/test_planner_metrics.py
+
+from langgraph_app.agents.enhanced_planner_integrated import EnhancedPlannerAgent
+from langgraph_app.core import planner_metrics
+from langgraph_app.core.planner_metrics import MAX_CONSECUTIVE_SKIPS, MIN_CRITIQUE_SAMPLES, PlannerMetrics
+from langgraph_app.core.state import EnrichedContentState
+from langgraph_app.core.types import ContentSpec
+
+
+def test_critique_skipped_only_after_consistent_confidence():
+    metrics = PlannerMetrics()
+    assert not metrics.should_skip_critique("brief")
+
+    for _ in range(MIN_CRITIQUE_SAMPLES - 1):
+        metrics.record_confidence("brief", 0.95)
+    assert not metrics.should_skip_critique("brief")
+
+    metrics.record_confidence("brief", 0.95)
+    metrics.record_confidence("weak", 0.95)
+    metrics.record_confidence("weak", 0.95)
+    metrics.record_confidence("weak", 0.4)
+    assert metrics.should_skip_critique("brief")
+    assert not metrics.should_skip_critique("weak")
+
+    skips = 1 + sum(metrics.should_skip_critique("brief") for _ in range(MAX_CONSECUTIVE_SKIPS))
+    assert skips == MAX_CONSECUTIVE_SKIPS
+    assert not metrics.should_skip_critique("brief")
+
+    metrics.record_confidence("brief", 0.95)
+    assert metrics.should_skip_critique("brief")
+
+
+def test_speculative_run_skips_tools_with_critique(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "fake")
+    monkeypatch.setenv("FAKE_LLM_LATENCY_MS", "0")
+    monkeypatch.delenv("PLANNER_MODEL", raising=False)
+    metrics = PlannerMetrics()
+    monkeypatch.setattr(planner_metrics, "_planner_metrics", metrics)
+    for _ in range(MIN_CRITIQUE_SAMPLES):
+        metrics.record_confidence("brief", 0.99)
+
+    planner = EnhancedPlannerAgent()
+    tool_runs = []
+    monkeypatch.setattr(planner, "_discover_and_execute_tools", lambda *args: tool_runs.append(args) or ([], {}))
+    state = EnrichedContentState(
+        template_config={"id": "brief", "template_type": "strategic_brief"},
+        style_config={"id": "pro", "tone": "formal"},
+        content_spec=ContentSpec(topic="Edge AI adoption"),
+        dynamic_parameters={"planner_mode": "speculative"}
+    )
+
+    planner.execute(state)
+
+    assert state.planning_output is not None
+    assert tool_runs == []
+    assert metrics.get_stats()["modes"]["speculative"]["avg_llm_calls"] == 1
@@ -0,0 +1,52 @@
+# tests/test_prompt_cache.py
+
+from types import SimpleNamespace
+
+from langgraph_app.core.prompt_cache import MAX_CACHE_BREAKPOINTS, PromptBuilder, PromptCacheStats
+
+
+def test_static_segments_first_whatever_the_call_order():
+    builder = PromptBuilder()
+    builder.add_dynamic("topic", "Topic: Edge AI")
+    builder.add_static("template", "  Template rules  ")
+    builder.add_dynamic("research", "")
+    builder.add_static("style", "Style rules")
+    builder.add_dynamic("params", "Length: 900")
+
+    assert builder.build() == ("Template rules\n\nStyle rules", "Topic: Edge AI\n\nLength: 900")
+    assert builder.to_openai_messages()[0] == {"role": "system", "content": "Template rules\n\nStyle rules"}
+
+    other = PromptBuilder().add_static("template", "Template rules").add_static("style", "Style rules")
+    other.add_dynamic("topic", "Topic: Quantum")
+    assert other.prefix_hash() == builder.prefix_hash()
+
+
+def test_anthropic_system_blocks_and_breakpoints():
+    builder = PromptBuilder().add_static("a", "A", cache_breakpoint=True).add_static("b", "B")
+    builder.add_dynamic("topic", "Topic")
+    assert builder.to_anthropic_system() == [
+        {"type": "text", "text": "A", "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "B", "cache_control": {"type": "ephemeral"}},
+    ]
+
+    many = PromptBuilder()
+    for idx in range(MAX_CACHE_BREAKPOINTS + 2):
+        many.add_static(f"s{idx}", f"S{idx}", cache_breakpoint=True)
+    blocks = many.to_anthropic_system()
+    assert sum("cache_control" in block for block in blocks) == MAX_CACHE_BREAKPOINTS
+    assert "cache_control" in blocks[-1]
+    assert PromptBuilder().add_dynamic("topic", "Topic").to_anthropic_system() == []
+
+
+def test_usage_shapes_per_provider():
+    stats = PromptCacheStats()
+    stats.record_usage("writer", "openai", SimpleNamespace(
+        prompt_tokens=2000, prompt_tokens_details=SimpleNamespace(cached_tokens=1536)
+    ), prefix_hash="p1")
+    stats.record_usage("planner", "anthropic", {
+        "input_tokens": 100, "cache_read_input_tokens": 1200, "cache_creation_input_tokens": 0
+    })
+
+    assert stats.get_agent_stats("writer")["uncached_tokens"] == 464
+    assert stats.get_agent_stats("planner")["input_tokens"] == 1300
+    assert stats.get_agent_stats("planner")["hit_ratio"] == round(1200 / 1300, 4)
@@ -0,0 +1,39 @@
+# tests/test_prompt_templates.py
+
+from langgraph_app.core.prompt_templates import CompiledPrompt, Slot, compile_template, get_prompt_template_stats
+
+
+def _replace_each(text, values):
+    for key, value in values.items():
+        text = text.replace(f"{{{{{key}}}}}", str(value))
+    return text
+
+
+def test_compiled_render_matches_str_replace():
+    text = "Write a {{newsletter_type}} about {{topic}}.\n{{ spaced }} {{{topic}}} {{unknown}} {x} {{topic}}"
+    values = {"newsletter_type": "digest", "topic": "AI", " spaced ": 3}
+
+    compiled = compile_template(text)
+
+    assert compiled.render(values) == _replace_each(text, values)
+    assert compiled.slot_names == ("newsletter_type", "topic", " spaced ", "unknown")
+    assert compile_template(text) is compiled
+
+
+def test_from_parts_inserts_values_once():
+    compiled = CompiledPrompt.from_parts("Topic: ", Slot("topic"), "\n", "Audience: ", Slot("audience"))
+
+    assert compiled.literals == ("Topic: ", "\nAudience: ", "")
+    assert compiled.render({"topic": "{{audience}}", "audience": "CTOs"}) == "Topic: {{audience}}\nAudience: CTOs"
+
+
+def test_edited_template_text_compiles_afresh():
+    template = {"prompt_schema": {"content_template": "Write about {{topic}}."}}
+    first = compile_template(template["prompt_schema"]["content_template"])
+
+    template["prompt_schema"]["content_template"] = "Summarise {{topic}}."
+    edited = compile_template(template["prompt_schema"]["content_template"])
+
+    assert edited is not first
+    assert edited.render({"topic": "AI"}) == "Summarise AI."
+    assert get_prompt_template_stats()["prompts"] >= 2
@@ -0,0 +1,98 @@
+# tests/test_research_cache.py
+
+import time
+
+import pytest
+
+from langgraph_app.core import circuit_breaker, research_cache
+from langgraph_app.core.circuit_breaker import ProviderCircuitBreaker
+from langgraph_app.core.research_cache import HOUR, MIN_TTL_S, ResearchCache, ttl_for
+from langgraph_app.core.research_executor import SEARCH_PROVIDER, ResearchExecutor, SearchQuery
+
+RESULTS = [{"url": f"https://example.com/{i}", "content": f"result {i}"} for i in range(3)]
+
+
+class SlowRefreshClient:
+    """Answers the first search at once; later searches take `delay` seconds"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    def search(self, query, max_results=5, **kwargs):
+        self.calls += 1
+        if self.calls > 1:
+            time.sleep(self.delay)
+        return {"results": [{"url": f"https://example.com/{self.calls}", "content": query}]}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    fresh = ResearchCache(max_entries=10)
+    monkeypatch.setattr(research_cache, "_research_cache", fresh)
+    monkeypatch.setattr(circuit_breaker, "_circuit_breaker", ProviderCircuitBreaker())
+    return fresh
+
+
+def _age(cache, query, seconds):
+    entry = cache._entries[research_cache.normalize_query(query)]
+    entry.stored_at -= seconds
+
+
+def _wait_for_refresh(cache, timeout=2.0):
+    deadline = time.time() + timeout
+    while cache.get_stats()["refreshing"] and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_ttl_from_timeframe_or_evidence_type():
+    assert ttl_for("24h") == HOUR
+    assert ttl_for("1h", "market_data") == MIN_TTL_S
+    assert ttl_for(None, "news") == HOUR
+    assert ttl_for("soon", "unknown") == ttl_for()
+
+
+def test_fresh_stale_expired_and_max_results(cache):
+    cache.store("Edge AI market size", RESULTS, max_results=3, ttl_s=100)
+
+    assert cache.lookup("market size for edge ai", 2, "priority") == (RESULTS[:2], "fresh")
+    assert cache.lookup("edge ai market size", 5, "priority") == (None, "miss")
+
+    _age(cache, "edge ai market size", 150)
+    assert cache.lookup("edge ai market size", 3, "priority") == (RESULTS, "stale")
+
+    _age(cache, "edge ai market size", 100)
+    assert cache.lookup("edge ai market size", 3, "priority") == (None, "miss")
+    assert cache.get_stats()["sources"]["priority"]["hits"] == 1
+    assert cache.get_stats()["sources"]["priority"]["misses"] == 2
+
+
+def test_stale_served_while_refreshed(cache):
+    client = SlowRefreshClient(delay=0)
+    executor = ResearchExecutor(client=client, timeout_s=5)
+    query = SearchQuery(key="q", query="edge ai", max_results=1)
+
+    first = executor.search(query)
+    _age(cache, "edge ai", 36 * HOUR)
+    stale = executor.search(query)
+    _wait_for_refresh(cache)
+
+    assert stale.cache == "stale" and stale.results == first.results
+    assert executor.search(query).results == [{"url": "https://example.com/2", "content": "edge ai"}]
+    assert cache.get_stats()["sources"]["research"]["refreshes"] == 1
+
+
+def test_background_refresh_times_out(cache):
+    client = SlowRefreshClient(delay=0.5)
+    executor = ResearchExecutor(client=client, timeout_s=0.05)
+    query = SearchQuery(key="q", query="edge ai", max_results=1)
+
+    first = executor.search(query)
+    _age(cache, "edge ai", 36 * HOUR)
+    started = time.time()
+    executor.search(query)
+    _wait_for_refresh(cache)
+
+    assert time.time() - started < 0.4
+    assert cache.lookup("edge ai", 1, "research") == (first.results, "stale")
+    assert circuit_breaker.get_circuit_breaker()._failure_counts[SEARCH_PROVIDER] == 1
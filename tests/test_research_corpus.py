@@ -0,0 +1,99 @@
+# tests/test_research_corpus.py
+
+import json
+
+import pytest
+
+from langgraph_app.core.research_corpus import FINDINGS_LOG, CorpusDocument, ResearchCorpus
+
+ARTICLE = (
+    "Vector databases store embeddings for semantic retrieval. Retrieval augmented generation "
+    "pairs a language model with a vector index so answers cite fresh documents. "
+) * 6
+
+
+@pytest.fixture(autouse=True)
+def real_provider(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "openai")
+
+
+def _corpus(tmp_path, **settings):
+    corpus = ResearchCorpus(root=tmp_path)
+    for name, value in settings.items():
+        setattr(corpus, name, value)
+    return corpus
+
+
+def test_bm25_ranks_rarer_and_denser_matches_first(tmp_path):
+    corpus = _corpus(tmp_path)
+    corpus.add_document(CorpusDocument("a", "kubernetes autoscaling for kubernetes clusters", "https://a.example", "snippet"))
+    corpus.add_document(CorpusDocument("b", "kubernetes clusters and general cloud notes", "https://b.example", "snippet"))
+    corpus.add_document(CorpusDocument("c", "cloud cost notes for finance teams", "https://c.example", "snippet"))
+
+    hits = corpus.search("kubernetes autoscaling", k=3)
+
+    assert [hit.document.doc_id for hit in hits] == ["a", "b"]
+    assert hits[0].coverage == 1.0 and hits[1].coverage == 0.5
+    assert hits[0].score > hits[1].score > 0
+
+
+def test_duplicate_passages_indexed_once(tmp_path):
+    week = tmp_path / "generated_content" / "week_1"
+    week.mkdir(parents=True)
+    (week / "rag.md").write_text(f"# RAG\n\n{ARTICLE}")
+    (week / "rag.json").write_text(json.dumps({"title": "RAG", "content": f"# RAG\n\n{ARTICLE}"}))
+    corpus = _corpus(tmp_path)
+
+    corpus.ensure_loaded()
+    assert corpus.get_stats()["documents"] == 1
+
+    findings = [{"content": "Vector index latency fell 40% in 2025.", "url": "https://x.example"}]
+    assert corpus.add_findings("rag", findings) == 1
+    assert corpus.add_findings("rag", findings) == 0
+    assert len((tmp_path / FINDINGS_LOG).read_text().splitlines()) == 1
+
+
+def test_has_recall_needs_enough_covering_hits(tmp_path):
+    corpus = _corpus(tmp_path, min_hits=2, min_coverage=0.75)
+    corpus.add_document(CorpusDocument("a", "vector database retrieval benchmarks", "https://a.example", "snippet"))
+
+    assert not corpus.has_recall(corpus.search("vector database retrieval"))
+
+    corpus.add_document(CorpusDocument("b", "retrieval with a vector database at scale", "https://b.example", "snippet"))
+    corpus.add_document(CorpusDocument("c", "vector art tutorials", "https://c.example", "snippet"))
+    hits = corpus.search("vector database retrieval")
+
+    assert corpus.has_recall(hits)
+    assert sorted(hit.document.doc_id for hit in hits if hit.coverage >= 0.75) == ["a", "b"]
+
+    corpus.enabled = False
+    assert not corpus.has_recall(hits)
+
+
+def test_mock_articles_skipped_and_local_paths_not_cited(tmp_path):
+    mock_dir = tmp_path / "storage" / "ai"
+    mock_dir.mkdir(parents=True)
+    (mock_dir / "artificial_intelligence_mock.md").write_text(f"# AI\n\n{ARTICLE}")
+    (mock_dir / "placeholder.json").write_text(json.dumps({"title": "[MOCK] AI", "content": ARTICLE}))
+    (mock_dir / "rag.md").write_text(f"# RAG\n\n{ARTICLE}")
+    corpus = _corpus(tmp_path)
+
+    hits = corpus.search("vector retrieval")
+
+    assert {hit.document.source for hit in hits} == {str(mock_dir / "rag.md")}
+    assert hits[0].to_search_result()["url"] == ""
+
+
+def test_findings_log_capped_and_skipped_for_fake_provider(tmp_path, monkeypatch):
+    corpus = _corpus(tmp_path, max_findings=4)
+    corpus.ensure_loaded()
+    for idx in range(6):
+        corpus.add_findings("t", [{"content": f"finding number {idx} about caching", "url": f"https://{idx}.example"}])
+
+    lines = (tmp_path / FINDINGS_LOG).read_text().splitlines()
+    assert len(lines) == 4
+    assert json.loads(lines[-1])["source"] == "https://5.example"
+
+    monkeypatch.setenv("LLM_PROVIDER", "fake")
+    assert corpus.add_findings("t", [{"content": "fake snippet text", "url": "https://fake.example"}]) == 1
+    assert len((tmp_path / FINDINGS_LOG).read_text().splitlines()) == 4
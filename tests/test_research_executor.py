@@ -0,0 +1,64 @@
+# tests/test_research_executor.py
+
+import asyncio
+import time
+
+import pytest
+
+from langgraph_app.core import research_cache
+from langgraph_app.core.research_cache import ResearchCache
+from langgraph_app.core.research_executor import ResearchExecutor, SearchQuery, canonical_url
+from langgraph_app.fake_model_provider import FakeLLMConfig, FakeLLMEngine, FakeTavilyClient
+
+
+class MirrorClient(FakeTavilyClient):
+    """Every query returns the same pages; "late" answers last, "mirror" with URL variants"""
+
+    def search(self, query, max_results=5, **kwargs):
+        if query == "late":
+            time.sleep(0.05)
+        response = super().search("shared topic", max_results)
+        if query == "mirror":
+            for result in response["results"]:
+                result["url"] = result["url"].replace("https://", "http://WWW.") + "/?utm_source=x#top"
+        return response
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(research_cache, "_research_cache", ResearchCache())
+
+
+def _executor():
+    engine = FakeLLMEngine(FakeLLMConfig(latency_ms=0, latency_dist="fixed"))
+    return ResearchExecutor(client=MirrorClient(engine=engine), max_concurrency=4, timeout_s=5)
+
+
+def test_canonical_url():
+    assert canonical_url("HTTP://www.Example.com/a/?b=2&utm_medium=x&a=1#frag") == "https://example.com/a?a=1&b=2"
+    assert canonical_url("https://example.com/a?fbclid=1") == canonical_url("https://example.com/a/")
+    assert canonical_url("https://example.com/a?page=2") != canonical_url("https://example.com/a")
+
+
+def test_batch_dedupes_by_canonical_url_first_query_wins():
+    queries = [SearchQuery(key=key, query=key, max_results=3) for key in ("late", "mirror", "other")]
+
+    outcomes = _executor().run(queries)
+
+    assert [o.key for o in outcomes.values()] == ["late", "mirror", "other"]
+    assert [r["url"] for r in outcomes["late"].results] == [
+        f"https://example.com/shared-topic/{i}" for i in (1, 2, 3)
+    ]
+    assert outcomes["mirror"].results == [] and outcomes["mirror"].duplicates_removed == 3
+    assert outcomes["other"].results == [] and outcomes["other"].duplicates_removed == 3
+
+
+def test_sync_calls_work_inside_a_running_loop():
+    executor = _executor()
+
+    async def caller():
+        return executor.search(SearchQuery(key="q", query="other", max_results=2))
+
+    outcome = asyncio.run(caller())
+    assert len(outcome.results) == 2 and outcome.error is None
+    assert executor.search(SearchQuery(key="q", query="other", max_results=2)).cache == "fresh"
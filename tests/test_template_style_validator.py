@@ -0,0 +1,47 @@
+# tests/test_template_style_validator.py
+
+from langgraph_app.template_style_validator import CompatibilityLevel, TemplateStyleValidator
+
+
+def test_batch_scores_match_pairwise_helpers():
+    validator = TemplateStyleValidator()
+
+    for template_type, template_chars in validator.template_characteristics.items():
+        for style_profile, style_chars in validator.style_characteristics.items():
+            score, details = validator._calculate_compatibility_score(template_chars, style_chars)
+            assert details == {
+                'content_alignment': validator._check_content_alignment(template_chars['content_type'], style_chars['content_focus']),
+                'audience_alignment': validator._check_audience_alignment(template_chars['audience'], style_chars['audience_level']),
+                'complexity_alignment': validator._check_complexity_alignment(template_chars['complexity'], style_chars['complexity_match']),
+                'tone_compatibility': validator._check_tone_compatibility(template_chars['tone_requirements'], style_chars['tone']),
+                'format_alignment': validator._check_format_alignment(template_chars['format_needs'], style_chars['format_requirements'])
+            }
+
+    results = validator.batch_validate_templates([('market_analysis', 'social_media_voice'), ('blog_article', 'unknown')])
+    assert results[('market_analysis', 'social_media_voice')].level == CompatibilityLevel.INCOMPATIBLE
+    assert results[('blog_article', 'unknown')].level == CompatibilityLevel.UNKNOWN
+
+    validator.validate_compatibility('made_up', 'strategic_planning')
+    assert ('blog_article', 'unknown') not in validator._cache.results
+    assert ('made_up', 'strategic_planning') not in validator._cache.results
+    assert ('market_analysis', 'social_media_voice') in validator._cache.results
+
+
+def test_report_cached_until_characteristics_change():
+    validator = TemplateStyleValidator()
+    templates = list(validator.template_characteristics)
+    styles = list(validator.style_characteristics)
+
+    report = validator.generate_compatibility_report(templates, styles)
+    assert validator.generate_compatibility_report(templates, styles) is report
+    assert validator.validate_compatibility('strategic_brief', 'strategic_planning') is report['detailed_results'][('strategic_brief', 'strategic_planning')]
+    assert 'strategic_planning' in report['recommendations']['strategic_brief']
+
+    version = validator.config_version
+    validator.style_characteristics['strategic_planning']['tone'] = 'casual_engaging'
+    assert validator.config_version == version
+    assert validator.refresh_config_version() != version
+    updated = validator.generate_compatibility_report(templates, styles)
+
+    assert updated is not report and validator.get_stats()['rebuilds'] == 2
+    assert updated['detailed_results'][('strategic_brief', 'strategic_planning')].confidence < report['detailed_results'][('strategic_brief', 'strategic_planning')].confidence
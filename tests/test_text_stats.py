@@ -0,0 +1,50 @@
+# tests/test_text_stats.py
+
+import pytest
+
+from langgraph_app.core import text_stats
+from langgraph_app.core.text_stats import TextStats, get_text_stats
+
+
+def test_formulas_on_known_texts():
+    simple = TextStats.from_text("The cat sat on the mat.")
+    assert (simple.word_count, simple.sentence_count, simple.char_count, simple.syllable_count) == (6, 1, 18, 6)
+    assert simple.flesch_reading_ease == pytest.approx(116.145)
+    assert simple.flesch_score == 100.0
+    assert simple.flesch_kincaid_grade == pytest.approx(-1.45)
+    assert simple.automated_readability_index == pytest.approx(-4.3)
+
+    # reading 2, is 1, enjoyable 3, computers 3, calculate 4, quickly 2
+    dense = TextStats.from_text("Reading is enjoyable. Computers calculate quickly!")
+    assert (dense.word_count, dense.sentence_count, dense.syllable_count) == (6, 2, 15)
+    assert dense.flesch_reading_ease == pytest.approx(-7.71)
+    assert dense.flesch_score == 0.0
+    assert dense.flesch_kincaid_grade == pytest.approx(15.08)
+    assert dense.to_dict()["avg_syllables_per_word"] == 2.5
+
+
+def test_empty_text_is_safe():
+    empty = TextStats.from_text("")
+    assert (empty.word_count, empty.sentence_count) == (0, 1)
+    assert empty.avg_word_length == 0 and empty.flesch_score == 100.0
+
+
+def test_cached_per_content(monkeypatch):
+    monkeypatch.setattr(text_stats, "_cache", type(text_stats._cache)())
+    monkeypatch.setattr(text_stats, "MAX_CACHED_TEXTS", 2)
+    computed = []
+    original = TextStats.from_text.__func__
+
+    def counting(cls, text):
+        computed.append(text)
+        return original(cls, text)
+
+    monkeypatch.setattr(TextStats, "from_text", classmethod(counting))
+
+    first = get_text_stats("One draft.")
+    assert get_text_stats("One draft.") is first
+    get_text_stats("Two drafts.")
+    get_text_stats("Three drafts.")
+    get_text_stats("One draft.")
+
+    assert computed == ["One draft.", "Two drafts.", "Three drafts.", "One draft."]
@@ -0,0 +1,53 @@
+# tests/test_token_budget.py
+
+import pytest
+
+from langgraph_app.core.token_budget import BudgetItem, BudgetSection, TokenBudgetService, count_tokens
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    # Estimated counts: 4 characters per token
+    monkeypatch.setenv("LLM_PROVIDER", "fake")
+
+
+def _sections():
+    return [
+        BudgetSection("system", "s" * 400, required=True, static=True),
+        BudgetSection("user", "u" * 200, required=True),
+        BudgetSection("insights", "## INSIGHTS", [
+            BudgetItem("a" * 80, value=1.0),
+            BudgetItem("b" * 80, value=0.2),
+            BudgetItem("c" * 80, value=0.6),
+        ], priority=1),
+        BudgetSection("priorities", "## PRIORITIES", [BudgetItem("p" * 80, value=0.9)], priority=2),
+    ]
+
+
+def test_offline_counts_are_estimated():
+    assert count_tokens("x" * 40, "gpt-4o") == 10
+    assert count_tokens("x" * 40, "gpt-4o", cache=True) == 10
+
+
+def test_everything_kept_under_limit():
+    result = TokenBudgetService().fit(_sections(), "gpt-4o", target_max=2000, prompt_limit=1000)
+
+    assert not result.trimmed
+    assert result.available_tokens == 2000 - result.prompt_tokens
+
+
+def test_lowest_value_items_dropped_first():
+    result = TokenBudgetService().fit(_sections(), "gpt-4o", target_max=2000, prompt_limit=210)
+
+    assert result.dropped == ["insights[1]", "insights[2]"]
+    assert result.sections["insights"] == "## INSIGHTS\n" + "a" * 80
+    assert result.sections["priorities"].endswith("p" * 80)
+    assert result.prompt_tokens <= 210
+
+
+def test_sections_dropped_but_required_kept():
+    result = TokenBudgetService().fit(_sections(), "gpt-4o", target_max=2000, prompt_limit=100)
+
+    assert result.sections["insights"] == "" and result.sections["priorities"] == ""
+    assert result.sections["system"] == "s" * 400 and result.sections["user"] == "u" * 200
+    assert result.prompt_tokens == 150
@@ -0,0 +1,56 @@
+# tests/test_tool_prepass.py
+
+import json
+import threading
+import time
+
+from langchain_core.tools import tool
+
+from langgraph_app.core.tool_prepass import MAX_RESULT_CHARS, format_tool_results, run_tools_locally
+
+
+@tool
+def count_words(text: str) -> dict:
+    """Count the words in text."""
+    return {"words": len(text.split())}
+
+
+def test_results_in_call_order_and_errors_isolated():
+    started = threading.Barrier(2, timeout=2)
+
+    def slow(text):
+        started.wait()
+        time.sleep(0.02)
+        return text.upper()
+
+    def fast(text):
+        started.wait()
+        return text
+
+    def broken(text):
+        raise ValueError("bad input")
+
+    results = run_tools_locally([(slow, {"text": "a"}), (fast, {"text": "b"}), (broken, {"text": "c"}),
+                                 (count_words, {"text": "one two"})])
+
+    assert results == [
+        {"tool": "slow", "result": "A"},
+        {"tool": "fast", "result": "b"},
+        {"tool": "broken", "error": "ValueError: bad input"},
+        {"tool": "count_words", "result": {"words": 2}},
+    ]
+    assert run_tools_locally([]) == []
+
+
+def test_format_skips_errors_and_truncates():
+    block = format_tool_results([
+        {"tool": "stats", "result": {"b": 1, "a": 2}},
+        {"tool": "broken", "error": "ValueError: bad input"},
+        {"tool": "dump", "result": "x" * (MAX_RESULT_CHARS + 50)},
+    ])
+
+    lines = block.split("\n")
+    assert lines[0] == f"- stats: {json.dumps({'a': 2, 'b': 1})}"
+    assert len(lines) == 2 and lines[1].endswith("...(truncated)")
+    assert len(lines[1]) == len("- dump: ") + MAX_RESULT_CHARS + len("...(truncated)")
+    assert format_tool_results([{"tool": "broken", "error": "x"}]) == "- No analysis available"
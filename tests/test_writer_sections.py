@@ -0,0 +1,119 @@
+# tests/test_writer_sections.py
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from langgraph_app.agents.writer import SECTIONAL_MIN_WORDS, TemplateAwareWriterAgent
+from langgraph_app.core.config_manager import ConfigManager
+from langgraph_app.core.state import EnrichedContentState
+from langgraph_app.core.types import ContentSpec, PlanningOutput
+
+OUTLINE = [{"name": "Why", "estimated_words": 300}, {"name": "How", "estimated_words": 300},
+           {"name": "Next", "estimated_words": 300}]
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "fake")
+    monkeypatch.setenv("FAKE_LLM_LATENCY_MS", "0")
+    return TemplateAwareWriterAgent()
+
+
+def _plan(sections):
+    return PlanningOutput(
+        content_strategy="s", structure_approach="a", key_messages=[], research_priorities=[],
+        estimated_sections=sections
+    )
+
+
+def _response(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text), finish_reason="stop")])
+
+
+def test_sectional_outline_threshold_and_overrides(writer):
+    state = EnrichedContentState(planning_output=_plan(OUTLINE + ["junk", {"estimated_words": 50}]))
+
+    assert writer._sectional_outline(state, {}) == []
+    assert writer._sectional_outline(state, {"sectional": True}) == OUTLINE
+
+    long_words = SECTIONAL_MIN_WORDS // 2 + 1
+    state.planning_output = _plan([{"name": "A", "estimated_words": long_words}, {"name": "B", "estimated_words": long_words}])
+    assert [s["name"] for s in writer._sectional_outline(state, {})] == ["A", "B"]
+    assert writer._sectional_outline(state, {"sectional": False}) == []
+
+    state.planning_output = _plan(OUTLINE[:1])
+    assert writer._sectional_outline(state, {"sectional": True}) == []
+
+
+def test_sections_written_concurrently_stitched_in_order(writer, monkeypatch):
+    state = EnrichedContentState(content_spec=ContentSpec(topic="Edge caching"))
+    lock = threading.Lock()
+    finished = []
+
+    def fake_call(user_content, **kwargs):
+        if "BOUNDARY" in user_content:
+            return _response(json.dumps({"title": "Edge Caching", "transitions": ["On to how.", "Then next."]}))
+        idx = int(user_content.split("Write ONLY section ")[1].split(":")[0])
+        time.sleep(0.02 * (4 - idx))  # later sections finish first
+        with lock:
+            finished.append(idx)
+        body = "- a list item" if idx == 2 else f"Body {idx}."
+        return _response(f"# Stray title\n\n{body}")
+
+    monkeypatch.setattr(writer, "_call_openai", fake_call)
+
+    raw, _ = writer._write_sections(
+        state, None, OUTLINE, model_name="gpt-4o", system_content="system", user_content="request",
+        max_tokens=4000, temperature=0.7, generation_settings={}
+    )
+
+    assert finished != sorted(finished)
+    assert raw == (
+        "# Edge Caching\n\n## Why\n\nBody 1. On to how.\n\n"
+        "## How\n\n- a list item\n\nThen next.\n\n## Next\n\nBody 3."
+    )
+
+
+def test_stitch_joins_as_written_when_smoothing_fails(writer, monkeypatch):
+    state = EnrichedContentState(content_spec=ContentSpec(topic="Edge caching"))
+
+    def failing_call(**kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(writer, "_call_openai", failing_call)
+
+    stitched = writer._stitch_sections(state, OUTLINE[:2], ["## Why\n\nA.", "## How\n\nB."], "gpt-4o", "s", 4000, {})
+
+    assert stitched == "## Why\n\nA.\n\n## How\n\nB."
+
+
+def test_failed_section_falls_back_to_single_completion(writer, monkeypatch):
+    configs = ConfigManager()
+    state = EnrichedContentState(
+        template_config=configs.get_template("blog_article_generator"),
+        style_config=configs.get_style_profile("beginner_tutorial"),
+        content_spec=ContentSpec(topic="Edge caching", platform="web"),
+        planning_output=_plan(OUTLINE),
+        dynamic_parameters={"generation_settings": {"max_tokens": 2000, "temperature": 0.7, "sectional": True}}
+    )
+    create = writer.client.chat.completions.create
+    prompts = []
+
+    def failing_create(**kwargs):
+        user = kwargs["messages"][-1]["content"]
+        prompts.append(user)
+        if "Write ONLY section 2" in user:
+            raise ValueError("invalid_request_error")
+        return create(**kwargs)
+
+    monkeypatch.setattr(writer.client.chat.completions, "create", failing_create)
+
+    writer.execute(state)
+
+    assert any("Write ONLY section 2" in p for p in prompts)
+    assert "Write ONLY section" not in prompts[-1] and "BOUNDARY" not in prompts[-1]
+    assert len(state.content.split()) > 100